@@ -0,0 +1,63 @@
+"""Add sales rollup tables for /reports/sales
+
+Revision ID: 003_sales_rollup
+Revises: 002_add_client_id
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '003_sales_rollup'
+down_revision = '002_add_client_id'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create sales_daily and the dirty-day queue, and queue every existing order day"""
+
+    # Step 1: Rollup of units and revenue per (day, product, payment type)
+    op.create_table(
+        'sales_daily',
+        sa.Column('id_key', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('payment_type', sa.Integer(), nullable=True),  # Same type as bills.payment_type
+        sa.Column('quantity', sa.Integer(), nullable=False),
+        sa.Column('revenue', sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(['product_id'], ['products.id_key']),
+        sa.PrimaryKeyConstraint('id_key')
+    )
+    op.create_index(op.f('ix_sales_daily_id_key'), 'sales_daily', ['id_key'], unique=False)
+    op.create_index(op.f('ix_sales_daily_product_id'), 'sales_daily', ['product_id'], unique=False)
+    op.create_index('ix_sales_daily_day_product', 'sales_daily', ['day', 'product_id'], unique=False)
+
+    # Step 2: Days whose rollup rows must be recomputed
+    op.create_table(
+        'sales_rollup_dirty_days',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day')
+    )
+
+    # Step 3: Backfill - queue every day with orders; the app's refresher
+    # builds the rollup from them in batches after the deploy
+    op.execute("""
+        INSERT INTO sales_rollup_dirty_days (day, version)
+        SELECT DISTINCT DATE(date), 1
+        FROM orders
+        WHERE date IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    """Drop the sales rollup tables"""
+
+    op.drop_table('sales_rollup_dirty_days')
+    op.drop_index('ix_sales_daily_day_product', table_name='sales_daily')
+    op.drop_index(op.f('ix_sales_daily_product_id'), table_name='sales_daily')
+    op.drop_index(op.f('ix_sales_daily_id_key'), table_name='sales_daily')
+    op.drop_table('sales_daily')
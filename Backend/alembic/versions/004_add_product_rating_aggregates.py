@@ -0,0 +1,53 @@
+"""Add rating aggregates to products table
+
+Revision ID: 004_rating_aggregates
+Revises: 003_sales_rollup
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004_rating_aggregates'
+down_revision = '003_sales_rollup'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add rating_count/rating_sum to products, backfill them and index the average"""
+
+    # Step 1: Add the aggregate columns (existing rows start at zero)
+    op.add_column('products', sa.Column('rating_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('products', sa.Column('rating_sum', sa.Float(), server_default='0', nullable=False))
+
+    # Step 2: Backfill from the existing reviews
+    op.execute("""
+        UPDATE products
+        SET rating_count = stats.rating_count,
+            rating_sum = stats.rating_sum
+        FROM (
+            SELECT product_id, COUNT(*) AS rating_count, SUM(rating) AS rating_sum
+            FROM reviews
+            WHERE product_id IS NOT NULL
+            GROUP BY product_id
+        ) AS stats
+        WHERE products.id_key = stats.product_id
+    """)
+
+    # Step 3: Index the average rating for top-rated listings. The expression
+    # must match models.product.RATING_AVERAGE as rendered by SQLAlchemy.
+    op.execute("""
+        CREATE INDEX ix_products_rating_average
+        ON products ((rating_sum / CAST(nullif(rating_count, 0) AS FLOAT)), id_key)
+    """)
+
+
+def downgrade() -> None:
+    """Remove the rating aggregates from products table"""
+
+    op.drop_index('ix_products_rating_average', table_name='products')
+    op.drop_column('products', 'rating_sum')
+    op.drop_column('products', 'rating_count')
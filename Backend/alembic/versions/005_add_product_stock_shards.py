@@ -0,0 +1,51 @@
+"""Add stock shards for hot products
+
+Revision ID: 005_stock_shards
+Revises: 004_rating_aggregates
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '005_stock_shards'
+down_revision = '004_rating_aggregates'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add products.stock_shards and the product_stock_shards table"""
+
+    # Step 1: Every existing product stays unsharded
+    op.add_column('products', sa.Column('stock_shards', sa.Integer(), server_default='0', nullable=False))
+
+    # Step 2: Shard rows; (product_id, shard) is also the lookup index
+    op.create_table(
+        'product_stock_shards',
+        sa.Column('id_key', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('product_id', sa.Integer(), sa.ForeignKey('products.id_key', ondelete='CASCADE'), nullable=False),
+        sa.Column('shard', sa.Integer(), nullable=False),
+        sa.Column('stock', sa.Integer(), nullable=False),
+        sa.UniqueConstraint('product_id', 'shard', name='uq_product_stock_shards_product_shard'),
+        sa.CheckConstraint('stock >= 0', name='check_product_stock_shard_non_negative'),
+    )
+
+
+def downgrade() -> None:
+    """Merge shard stock back into products and drop the shards"""
+
+    op.execute("""
+        UPDATE products
+        SET stock = products.stock + shards.stock
+        FROM (
+            SELECT product_id, SUM(stock) AS stock
+            FROM product_stock_shards
+            GROUP BY product_id
+        ) AS shards
+        WHERE products.id_key = shards.product_id
+    """)
+    op.drop_table('product_stock_shards')
+    op.drop_column('products', 'stock_shards')
@@ -0,0 +1,33 @@
+"""Replace the products category_id index with (category_id, id_key)
+
+Revision ID: 006_category_products_index
+Revises: 005_stock_shards
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '006_category_products_index'
+down_revision = '005_stock_shards'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index products by (category_id, id_key) for keyset-paginated category listings"""
+
+    # Step 1: The composite index serves GET /categories/{id}/products pages
+    # as a single range scan, already in id_key order
+    op.create_index('ix_products_category_id_id_key', 'products', ['category_id', 'id_key'], unique=False)
+
+    # Step 2: Plain category_id lookups use the composite index's prefix
+    op.drop_index('ix_products_category_id', table_name='products')
+
+
+def downgrade() -> None:
+    """Restore the single-column category_id index"""
+
+    op.create_index('ix_products_category_id', 'products', ['category_id'], unique=False)
+    op.drop_index('ix_products_category_id_id_key', table_name='products')
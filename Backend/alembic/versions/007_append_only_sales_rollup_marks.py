@@ -0,0 +1,50 @@
+"""Make sales rollup dirty-day marks append-only
+
+Revision ID: 007_append_only_rollup_marks
+Revises: 006_category_products_index
+Create Date: 2026-10-20 09:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '007_append_only_rollup_marks'
+down_revision = '006_category_products_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the one-row-per-day queue (upserted by every write) with one row per mark"""
+
+    # Step 1: New queue; writers only INSERT, the refresher de-duplicates days
+    op.rename_table('sales_rollup_dirty_days', 'sales_rollup_dirty_days_old')
+    op.create_table(
+        'sales_rollup_dirty_days',
+        sa.Column('id_key', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('day', sa.Date(), nullable=False),
+    )
+    op.create_index('ix_sales_rollup_dirty_days_day', 'sales_rollup_dirty_days', ['day'], unique=False)
+
+    # Step 2: Carry over the pending days
+    op.execute("INSERT INTO sales_rollup_dirty_days (day) SELECT day FROM sales_rollup_dirty_days_old")
+    op.drop_table('sales_rollup_dirty_days_old')
+
+
+def downgrade() -> None:
+    """Restore the one-row-per-day queue"""
+
+    op.rename_table('sales_rollup_dirty_days', 'sales_rollup_dirty_days_new')
+    op.create_table(
+        'sales_rollup_dirty_days',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('day')
+    )
+    op.execute("""
+        INSERT INTO sales_rollup_dirty_days (day, version)
+        SELECT DISTINCT day, 1 FROM sales_rollup_dirty_days_new
+    """)
+    op.drop_table('sales_rollup_dirty_days_new')
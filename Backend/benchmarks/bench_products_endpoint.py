@@ -0,0 +1,151 @@
+"""
+/products Response Rendering Benchmark
+
+Compares GET /products?limit=1000 with:
+- legacy:  JSONResponse + response_model revalidation + jsonable_encoder
+- orjson:  ORJSONResponse as default class (still revalidates)
+- fast:    SchemaJSONResponse, schemas serialized directly by pydantic-core
+- fields:  fast, with the storefront grid's ?fields=id_key,name,price,stock
+
+Runs in-process against a seeded SQLite database with Redis caching disabled,
+so every request pays the same query cost and only rendering differs.
+
+Usage:
+    cd Backend
+    python benchmarks/bench_products_endpoint.py
+    python benchmarks/bench_products_endpoint.py --requests 500 --products 1000
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('REDIS_ENABLED', 'false')
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from config.database import get_db  # noqa: E402
+from controllers.base_controller_impl import BaseControllerImpl  # noqa: E402
+from models.base_model import base  # noqa: E402
+from models.category import CategoryModel  # noqa: E402
+from models.product import ProductModel  # noqa: E402
+from schemas import ProductSchema  # noqa: E402
+from services.product_service import ProductService  # noqa: E402
+
+
+def build_session_factory(product_count: int) -> sessionmaker:
+    """In-memory SQLite database seeded with products across 10 categories"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    with session_factory() as session:
+        categories = [CategoryModel(name=f"Category {i}") for i in range(10)]
+        session.add_all(categories)
+        session.flush()
+        session.add_all([
+            ProductModel(
+                name=f"Product {i}",
+                price=round(10 + i * 0.37, 2),
+                stock=i % 100,
+                category_id=categories[i % 10].id_key,
+            )
+            for i in range(product_count)
+        ])
+        session.commit()
+
+    return session_factory
+
+
+def build_app(session_factory: sessionmaker, default_response_class, fast_response: bool) -> FastAPI:
+    app = FastAPI(default_response_class=default_response_class)
+    controller = BaseControllerImpl(
+        schema=ProductSchema,
+        service_factory=lambda db: ProductService(db),
+        tags=["Products"],
+        fast_response=fast_response,
+    )
+    app.include_router(controller.router, prefix="/products")
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    return app
+
+
+def measure(app: FastAPI, requests: int, limit: int, query: str = "") -> dict:
+    client = TestClient(app)
+    url = f"/products?limit={limit}{query}"
+
+    for _ in range(min(20, requests)):  # Warm-up
+        client.get(url)
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(requests):
+        request_start = time.perf_counter()
+        response = client.get(url)
+        latencies.append((time.perf_counter() - request_start) * 1000)
+        assert response.status_code == 200
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "bytes": len(response.content),
+    }
+
+
+def run(requests: int, products: int, limit: int):
+    session_factory = build_session_factory(products)
+    variants = [
+        ("legacy (JSONResponse)", JSONResponse, False, ""),
+        ("orjson default class", ORJSONResponse, False, ""),
+        ("fast schema response", ORJSONResponse, True, ""),
+        ("fast + sparse fields", ORJSONResponse, True, "&fields=id_key,name,price,stock"),
+    ]
+
+    print(f"GET /products?limit={limit} ({products} products, {requests} requests)\n")
+    print(f"{'variant':<24} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'bytes':>9}")
+    print("-" * 61)
+    results = {}
+    for name, response_class, fast_response, query in variants:
+        app = build_app(session_factory, response_class, fast_response)
+        result = results[name] = measure(app, requests, limit, query)
+        print(
+            f"{name:<24} {result['rps']:>8.1f} {result['p50']:>8.2f} "
+            f"{result['p99']:>8.2f} {result['bytes']:>9,}"
+        )
+    legacy, fast, sparse = (results[name] for name, *_ in (variants[0], variants[2], variants[3]))
+    print(f"\nspeedup (fast vs legacy): {fast['rps'] / legacy['rps']:.2f}x throughput")
+    print(
+        f"sparse fields vs fast: {sparse['rps'] / fast['rps']:.2f}x throughput, "
+        f"{sparse['bytes'] / fast['bytes']:.0%} of the payload"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--products", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.requests, args.products, args.limit)
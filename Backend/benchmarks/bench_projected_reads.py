@@ -0,0 +1,110 @@
+"""
+Projected Read Path Benchmark
+
+Compares the two ways find_all() can build a page of response schemas:
+- orm:        select(model) -> ORM objects -> schema.model_validate()
+- projected:  select(columns) -> row tuples -> schema.model_construct()
+
+Reports rows per second and the peak memory allocated per page
+(tracemalloc) for products (with their category) and for categories.
+Runs in-process against seeded SQLite, so the numbers isolate the
+Python-side cost of materialising ORM objects and validating them.
+
+Usage:
+    cd Backend
+    python benchmarks/bench_projected_reads.py
+    python benchmarks/bench_projected_reads.py --page-size 1000 --repeat 20
+"""
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import config.database  # noqa: E402,F401  (registers every mapped model)
+from config.constants import RepositoryConfig  # noqa: E402
+from models.base_model import base  # noqa: E402
+from models.category import CategoryModel  # noqa: E402
+from models.product import ProductModel  # noqa: E402
+from repositories.category_repository import CategoryRepository  # noqa: E402
+from repositories.product_repository import ProductRepository  # noqa: E402
+
+ROW_COUNT = 1000
+
+
+def build_session() -> Session:
+    """In-memory SQLite session seeded with categories and products"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    base.metadata.create_all(engine)
+    session = Session(engine)
+    categories = [CategoryModel(name=f"Category {i}") for i in range(ROW_COUNT)]
+    session.add_all(categories)
+    session.flush()
+    session.add_all([
+        ProductModel(
+            name=f"Product {i}", price=10 + i, stock=100,
+            category_id=categories[i % 20].id_key,
+        )
+        for i in range(ROW_COUNT)
+    ])
+    session.commit()
+    return session
+
+
+def read_page(session: Session, repository, page_size: int, projected: bool):
+    """One find_all() page on a clean session (no identity-map reuse)"""
+    RepositoryConfig.PROJECTED_READS = projected
+    session.expunge_all()
+    return repository.find_all(skip=0, limit=page_size)
+
+
+def peak_kib(func) -> float:
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def run(page_size: int, repeat: int):
+    session = build_session()
+    repositories = [
+        ("products", ProductRepository(session)),
+        ("categories", CategoryRepository(session)),
+    ]
+
+    print(f"find_all() pages of {page_size} rows, best of {repeat}\n")
+    print(f"{'entity':<12} {'path':<10} {'rows/s':>12} {'peak KiB/page':>15} {'speedup':>9}")
+    print("-" * 62)
+    for name, repository in repositories:
+        rates = {}
+        for projected in (False, True):
+            def page():
+                return read_page(session, repository, page_size, projected)
+
+            seconds = min(timeit.repeat(page, number=1, repeat=repeat))
+            rates[projected] = page_size / seconds
+            path = "projected" if projected else "orm"
+            speedup = f"{rates[True] / rates[False]:>8.2f}x" if projected else ""
+            print(
+                f"{name:<12} {path:<10} {rates[projected]:>12,.0f} "
+                f"{peak_kib(page):>15,.1f} {speedup:>9}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    run(args.page_size, args.repeat)
@@ -0,0 +1,104 @@
+"""
+Repository find() Statement Throughput Benchmark
+
+Measures statements per second for primary-key lookups:
+- legacy:  select(model).where(model.id_key == id_key) built on every call
+- cached:  statement built once per model with a bound :id_key parameter
+
+Both are measured for the bare statement execution and for the full
+repository find() (including schema validation). Runs in-process against
+seeded SQLite, so the numbers isolate Python-side statement overhead; on
+PostgreSQL, DB_DRIVER=psycopg additionally saves server-side parse/plan.
+
+Usage:
+    cd Backend
+    python benchmarks/bench_repository_find.py
+    python benchmarks/bench_repository_find.py --iterations 50000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+import config.database  # noqa: E402,F401  (registers every mapped model)
+from models.base_model import base  # noqa: E402
+from models.category import CategoryModel  # noqa: E402
+from models.product import ProductModel  # noqa: E402
+from repositories.product_repository import ProductRepository  # noqa: E402
+from schemas import ProductSchema  # noqa: E402
+
+PRODUCT_COUNT = 1000
+
+
+def build_session() -> Session:
+    """In-memory SQLite session seeded with products"""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    base.metadata.create_all(engine)
+    session = Session(engine)
+    category = CategoryModel(name="Bench")
+    session.add(category)
+    session.flush()
+    session.add_all([
+        ProductModel(name=f"Product {i}", price=10 + i, stock=100, category_id=category.id_key)
+        for i in range(PRODUCT_COUNT)
+    ])
+    session.commit()
+    return session
+
+
+def legacy_find(session: Session, id_key: int) -> ProductSchema:
+    """Previous BaseRepositoryImpl.find(): new select() per call"""
+    stmt = select(ProductModel).where(ProductModel.id_key == id_key)
+    return ProductSchema.model_validate(session.scalars(stmt).first())
+
+
+def run(iterations: int):
+    session = build_session()
+    repository = ProductRepository(session)
+    cached_stmt = repository._statements.find
+    ids = [(i % PRODUCT_COUNT) + 1 for i in range(iterations)]
+
+    def counter(func):
+        it = iter(ids * 4)  # timeit.repeat runs each case several times
+        return lambda: func(next(it))
+
+    cases = [
+        (
+            "statement only",
+            counter(lambda i: session.scalars(
+                select(ProductModel).where(ProductModel.id_key == i)).first()),
+            counter(lambda i: session.scalars(cached_stmt, {"id_key": i}).first()),
+        ),
+        (
+            "repository find()",
+            counter(lambda i: legacy_find(session, i)),
+            counter(repository.find),
+        ),
+    ]
+
+    print(f"Primary-key lookups on {PRODUCT_COUNT} products, {iterations} iterations\n")
+    print(f"{'case':<20} {'legacy stmt/s':>15} {'cached stmt/s':>15} {'speedup':>9}")
+    print("-" * 62)
+    for name, legacy_call, cached_call in cases:
+        legacy_rate = iterations / min(timeit.repeat(legacy_call, number=iterations, repeat=3))
+        cached_rate = iterations / min(timeit.repeat(cached_call, number=iterations, repeat=3))
+        print(
+            f"{name:<20} {legacy_rate:>15,.0f} {cached_rate:>15,.0f} "
+            f"{cached_rate / legacy_rate:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--iterations", type=int, default=10000)
+    run(parser.parse_args().iterations)
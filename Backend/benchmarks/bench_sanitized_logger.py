@@ -0,0 +1,100 @@
+"""
+SanitizedLogger Micro-benchmark
+
+Measures messages per second through SanitizedLogger for the common cases:
+- debug call while DEBUG is disabled (production cache HIT/MISS logging)
+- enabled info call with a clean message
+- enabled info call with sensitive data to redact
+
+Each case is compared against the previous implementation (seven uncompiled
+re.sub passes run before the level check).
+
+Usage:
+    cd Backend
+    python benchmarks/bench_sanitized_logger.py
+    python benchmarks/bench_sanitized_logger.py --iterations 500000
+"""
+import argparse
+import logging
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.logging_utils import SENSITIVE_PATTERNS, SanitizedLogger  # noqa: E402
+
+
+def legacy_sanitize_string(text: str) -> str:
+    """Previous sanitizer: one uncompiled re.sub per pattern"""
+    if not isinstance(text, str):
+        return str(text)
+
+    sanitized = text
+    for pattern, replacement in SENSITIVE_PATTERNS:
+        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+    return sanitized
+
+
+class LegacySanitizedLogger:
+    """Previous wrapper: sanitizes eagerly, before the level check"""
+
+    def __init__(self, logger_instance: logging.Logger):
+        self._logger = logger_instance
+
+    def debug(self, message: str, *args, **kwargs):
+        self._logger.debug(legacy_sanitize_string(message), *args, **kwargs)
+
+    def info(self, message: str, *args, **kwargs):
+        self._logger.info(legacy_sanitize_string(message), *args, **kwargs)
+
+
+def build_logger() -> logging.Logger:
+    """INFO-level logger with a no-op handler, so only logging overhead is measured"""
+    logger = logging.getLogger("bench.sanitized_logger")
+    logger.handlers = [logging.NullHandler()]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+def run(iterations: int):
+    base_logger = build_logger()
+    legacy = LegacySanitizedLogger(base_logger)
+    current = SanitizedLogger(base_logger)
+    cache_key = "products:list:limit:100:skip:0"
+
+    cases = [
+        (
+            "debug disabled (cache HIT)",
+            lambda: legacy.debug(f"Cache HIT: {cache_key}"),
+            lambda: current.debug("Cache HIT: %s", cache_key),
+        ),
+        (
+            "info, clean message",
+            lambda: legacy.info(f"Creating order detail for order {42}"),
+            lambda: current.info("Creating order detail for order %s", 42),
+        ),
+        (
+            "info, redacted message",
+            lambda: legacy.info("Login failed password=hunter2 card 4532-1234-5678-9010"),
+            lambda: current.info("Login failed password=hunter2 card 4532-1234-5678-9010"),
+        ),
+    ]
+
+    print(f"{'case':<30} {'legacy msg/s':>15} {'current msg/s':>15} {'speedup':>9}")
+    print("-" * 72)
+    for name, legacy_call, current_call in cases:
+        legacy_rate = iterations / min(timeit.repeat(legacy_call, number=iterations, repeat=3))
+        current_rate = iterations / min(timeit.repeat(current_call, number=iterations, repeat=3))
+        print(
+            f"{name:<30} {legacy_rate:>15,.0f} {current_rate:>15,.0f} "
+            f"{current_rate / legacy_rate:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--iterations", type=int, default=100000)
+    run(parser.parse_args().iterations)
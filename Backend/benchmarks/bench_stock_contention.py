@@ -0,0 +1,124 @@
+"""
+Hot Product Checkout Contention Benchmark
+
+Many concurrent checkouts of ONE product, each a transaction that takes
+stock (ProductRepository.take_stock) and then does --work-ms of other work
+before committing, like inserting the order detail and updating totals.
+Compares:
+- single row:  the product row holds all stock; every checkout queues on its lock
+- N shards:    stock split over N product_stock_shards rows (products.stock_shards = N)
+
+Throughput on the single row stays flat as concurrency grows. With shards
+it scales until concurrency reaches the shard count.
+
+Needs PostgreSQL (SQLite serializes every write, whatever the row). Uses
+DATABASE_URL like the app and creates its own category and product, which
+it deletes at the end.
+
+Usage:
+    cd Backend
+    python benchmarks/bench_stock_contention.py
+    python benchmarks/bench_stock_contention.py --shards 16 --concurrency 1,4,16,32 --seconds 5
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('REDIS_ENABLED', 'false')
+
+from sqlalchemy import delete  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from config.database import engine  # noqa: E402
+from models.category import CategoryModel  # noqa: E402
+from models.product import ProductModel  # noqa: E402
+from repositories.product_repository import ProductRepository  # noqa: E402
+
+STOCK = 10_000_000
+
+
+def setup(session_factory: sessionmaker) -> int:
+    """Create the benchmark's product (unsharded) and return its id"""
+    with session_factory() as session:
+        category = CategoryModel(name="bench_stock_contention")
+        session.add(category)
+        session.flush()
+        product = ProductModel(name="Hot product", price=9.99, stock=STOCK, category_id=category.id_key)
+        session.add(product)
+        session.commit()
+        return product.id_key
+
+
+def teardown(session_factory: sessionmaker, product_id: int):
+    with session_factory() as session:
+        category_id = session.get(ProductModel, product_id).category_id
+        session.execute(delete(ProductModel).where(ProductModel.id_key == product_id))
+        session.execute(delete(CategoryModel).where(CategoryModel.id_key == category_id))
+        session.commit()
+
+
+def set_shards(session_factory: sessionmaker, product_id: int, shards: int):
+    with session_factory() as session:
+        ProductRepository(session).shard_stock(product_id, shards, total=STOCK)
+        session.commit()
+
+
+def measure(session_factory: sessionmaker, product_id: int, concurrency: int, seconds: float, work_ms: float) -> dict:
+    """Checkouts per second with `concurrency` threads taking 1 unit each"""
+    deadline = time.perf_counter() + seconds
+    counts = [0] * concurrency
+    start = threading.Barrier(concurrency)
+
+    def worker(index: int):
+        start.wait()
+        with session_factory() as session:
+            repository = ProductRepository(session)
+            while time.perf_counter() < deadline:
+                assert repository.take_stock(product_id, 1) is not None
+                time.sleep(work_ms / 1000)  # Rest of the checkout transaction
+                session.commit()
+                counts[index] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return {"checkouts_per_sec": sum(counts) / (time.perf_counter() - started)}
+
+
+def run(shards: int, concurrency_levels, seconds: float, work_ms: float):
+    if engine.dialect.name != "postgresql":
+        sys.exit("This benchmark needs PostgreSQL (set DATABASE_URL)")
+
+    session_factory = sessionmaker(bind=engine)
+    product_id = setup(session_factory)
+    try:
+        variants = [("single row", 0), (f"{shards} shards", shards)]
+        print(f"Checkouts of one product, {work_ms:g} ms of work per transaction, {seconds:g}s per cell\n")
+        print(f"{'concurrency':>11} " + " ".join(f"{name + ' /s':>16}" for name, _ in variants) + f" {'speedup':>8}")
+        print("-" * (12 + 17 * len(variants) + 9))
+        for concurrency in concurrency_levels:
+            results = []
+            for _, variant_shards in variants:
+                set_shards(session_factory, product_id, variant_shards)
+                results.append(measure(session_factory, product_id, concurrency, seconds, work_ms))
+            rates = [result["checkouts_per_sec"] for result in results]
+            print(f"{concurrency:>11} " + " ".join(f"{rate:>16.1f}" for rate in rates)
+                  + f" {rates[1] / rates[0]:>7.2f}x")
+    finally:
+        teardown(session_factory, product_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--concurrency", default="1,2,4,8,16")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--work-ms", type=float, default=2.0)
+    args = parser.parse_args()
+    run(args.shards, [int(level) for level in args.concurrency.split(",")], args.seconds, args.work_ms)
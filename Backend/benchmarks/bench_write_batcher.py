@@ -0,0 +1,77 @@
+"""
+Group Commit Insert Benchmark
+
+Concurrent POST /clients-style creates (ClientService.save) with:
+- per-row:  one INSERT + COMMIT per client (WRITE_BATCH_ENABLED=false)
+- batched:  concurrent creates share one multi-row INSERT + COMMIT (WriteBatcher)
+
+Runs against a file SQLite database in a temporary directory (every commit
+is fsynced), or against DATABASE_URL with --use-database-url.
+
+Usage:
+    cd Backend
+    python benchmarks/bench_write_batcher.py
+    python benchmarks/bench_write_batcher.py --inserts 4000 --concurrency 64
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('REDIS_ENABLED', 'false')
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import config.database  # noqa: E402
+from config.constants import WriteBatchConfig  # noqa: E402
+from models.base_model import base  # noqa: E402
+from schemas import ClientSchema  # noqa: E402
+from services.client_service import ClientService  # noqa: E402
+
+
+def measure(session_factory: sessionmaker, inserts: int, concurrency: int, batched: bool) -> dict:
+    WriteBatchConfig.ENABLED = batched
+
+    def create(i: int):
+        with session_factory() as session:
+            email = f"bench{i}-{'batched' if batched else 'row'}@example.com"  # clients.email is unique
+            ClientService(session).save(ClientSchema(name=f"Bench {i}", email=email))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(create, range(inserts)))
+    elapsed = time.perf_counter() - started
+    return {"inserts_per_sec": inserts / elapsed}
+
+
+def run(inserts: int, concurrency: int, use_database_url: bool):
+    if use_database_url:
+        engine = config.database.engine
+    else:
+        directory = tempfile.mkdtemp()
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}",
+                               connect_args={"timeout": 60}, pool_size=concurrency)
+        base.metadata.create_all(engine)
+    session_factory = config.database.SessionLocal = sessionmaker(bind=engine)
+
+    print(f"{inserts} client creates, {concurrency} concurrent ({engine.dialect.name})\n")
+    print(f"{'variant':<10} {'inserts/s':>10}")
+    print("-" * 21)
+    results = {}
+    for name, batched in (("per-row", False), ("batched", True)):
+        results[name] = measure(session_factory, inserts, concurrency, batched)
+        print(f"{name:<10} {results[name]['inserts_per_sec']:>10.1f}")
+    print(f"\nspeedup: {results['batched']['inserts_per_sec'] / results['per-row']['inserts_per_sec']:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--inserts", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--use-database-url", action="store_true")
+    args = parser.parse_args()
+    run(args.inserts, args.concurrency, args.use_database_url)
@@ -0,0 +1,310 @@
+"""
+Repository and Service Micro-Benchmark Suite
+
+Times single calls on the data path, one case at a time:
+- repository.find / find_all / save / update   (BaseRepositoryImpl, on clients)
+- product_service.get_all[miss] / [hit]        (cache dropped / filled first)
+- cache_service.get_or_set[miss] / [hit]
+- order_detail_service.save                     (stock lock, totals, commit)
+
+Each case runs --repeat rounds of --number calls, each round on a fresh
+session, against a database seeded at every --scales size (N clients, N
+products over N/10 categories). The median time per call is reported and,
+with --output, written as JSON keyed "{dialect}/{scale}/{case}".
+
+With --baseline, the medians are compared against a stored results file
+and the run exits 1 if any case is slower than the baseline by more than
+--threshold (0.25 = 25%). Baselines are machine specific: regenerate them
+with --output on the machine that runs the comparison.
+
+Runs against a file SQLite database in a temporary directory by default.
+With --database-url (PostgreSQL) the tables are created in a throwaway
+schema, dropped at the end. Cache cases need Redis (REDIS_URL); without it
+they are reported as skipped, and get_all[miss] measures the uncached path.
+
+Usage:
+    cd Backend
+    python benchmarks/microbench.py
+    python benchmarks/microbench.py --scales 1000,10000 --output results.json
+    python benchmarks/microbench.py --baseline benchmarks/baselines/microbench_sqlite.json
+    python benchmarks/microbench.py --database-url postgresql://localhost/ecommerce_bench
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, NamedTuple, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+import config.database  # noqa: E402,F401  (registers every mapped model)
+from models.base_model import base  # noqa: E402
+from models.bill import BillModel  # noqa: E402
+from models.category import CategoryModel  # noqa: E402
+from models.client import ClientModel  # noqa: E402
+from models.enums import DeliveryMethod, PaymentType, Status  # noqa: E402
+from models.order import OrderModel  # noqa: E402
+from models.product import ProductModel  # noqa: E402
+from repositories.client_repository import ClientRepository  # noqa: E402
+from schemas import OrderDetailSchema  # noqa: E402
+from services.cache_service import cache_service  # noqa: E402
+from services.order_detail_service import OrderDetailService  # noqa: E402
+from services.product_service import ProductService  # noqa: E402
+
+PAGE_SIZE = 100
+SCHEMA = "microbench"
+
+
+class Case(NamedTuple):
+    """A benchmark case: build(session, scale) returns the call to time, given the call number"""
+    name: str
+    build: Callable[[Session, int], Callable[[int], object]]
+    needs_cache: bool = False
+
+
+def _find(session: Session, scale: int):
+    repository = ClientRepository(session)
+    return lambda i: repository.find(i % scale + 1)
+
+
+def _find_all(session: Session, scale: int):
+    repository = ClientRepository(session)
+    pages = max(scale // PAGE_SIZE, 1)
+    return lambda i: repository.find_all(skip=i % pages * PAGE_SIZE, limit=PAGE_SIZE)
+
+
+def _save(session: Session, scale: int):
+    repository = ClientRepository(session)
+    return lambda i: repository.save(ClientModel(name=f"Bench {i}"))
+
+
+def _update(session: Session, scale: int):
+    repository = ClientRepository(session)
+    return lambda i: repository.update(i % scale + 1, {"name": f"Updated {i}"})
+
+
+def _get_all(hit: bool):
+    def build(session: Session, scale: int):
+        service = ProductService(session)
+        key = cache_service.build_key("products", "list", skip=0, limit=PAGE_SIZE)
+        if hit:
+            service.get_all(skip=0, limit=PAGE_SIZE)
+            return lambda i: service.get_all(skip=0, limit=PAGE_SIZE)
+
+        def miss(i):
+            cache_service.delete(key)
+            return service.get_all(skip=0, limit=PAGE_SIZE)
+        return miss
+    return build
+
+
+def _get_or_set(hit: bool):
+    def build(session: Session, scale: int):
+        value = [{"id_key": i, "name": f"Product {i}", "price": 9.99} for i in range(PAGE_SIZE)]
+        key = cache_service.build_key("microbench", "get_or_set")
+        if hit:
+            cache_service.set(key, value)
+            return lambda i: cache_service.get_or_set(key, lambda: value)
+
+        def miss(i):
+            cache_service.delete(key)
+            return cache_service.get_or_set(key, lambda: value)
+        return miss
+    return build
+
+
+def _order_detail_save(session: Session, scale: int):
+    service = OrderDetailService(session)
+    return lambda i: service.save(OrderDetailSchema(quantity=1, order_id=1, product_id=i % scale + 1))
+
+
+CASES = [
+    Case("repository.find", _find),
+    Case("repository.find_all", _find_all),
+    Case("repository.save", _save),
+    Case("repository.update", _update),
+    Case("product_service.get_all[miss]", _get_all(hit=False)),
+    Case("product_service.get_all[hit]", _get_all(hit=True), needs_cache=True),
+    Case("cache_service.get_or_set[miss]", _get_or_set(hit=False), needs_cache=True),
+    Case("cache_service.get_or_set[hit]", _get_or_set(hit=True), needs_cache=True),
+    Case("order_detail_service.save", _order_detail_save),
+]
+
+
+@contextmanager
+def bench_engine(database_url: Optional[str]) -> Iterator[Engine]:
+    """A SQLite file database, or a throwaway schema on --database-url"""
+    if database_url is None:
+        with tempfile.TemporaryDirectory() as directory:
+            engine = create_engine(f"sqlite:///{os.path.join(directory, 'microbench.db')}")
+            try:
+                yield engine
+            finally:
+                engine.dispose()
+        return
+
+    admin = create_engine(database_url)
+    with admin.begin() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    engine = create_engine(database_url, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+        with admin.begin() as connection:
+            connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+        admin.dispose()
+
+
+def seed(engine: Engine, scale: int):
+    """Recreate the tables with N clients, N products over N/10 categories and one open order"""
+    base.metadata.drop_all(engine)
+    base.metadata.create_all(engine)
+    with Session(engine) as session:
+        categories = [CategoryModel(name=f"Category {i}") for i in range(max(scale // 10, 1))]
+        session.add_all(categories)
+        session.add_all([ClientModel(name=f"Client {i}", email=f"client{i}@example.com") for i in range(scale)])
+        session.flush()
+        session.add_all([
+            ProductModel(name=f"Product {i}", price=10 + i % 90, stock=1_000_000,
+                         category_id=categories[i % len(categories)].id_key)
+            for i in range(scale)
+        ])
+        bill = BillModel(bill_number="MB-1", date=datetime.date.today(), total=0,
+                         payment_type=PaymentType.CARD, client_id=1)
+        session.add(bill)
+        session.flush()
+        session.add(OrderModel(date=datetime.datetime.utcnow(), total=0, status=Status.PENDING,
+                               delivery_method=DeliveryMethod.ON_HAND, client_id=1, bill_id=bill.id_key))
+        session.commit()
+
+
+def measure(session_factory: sessionmaker, case: Case, scale: int, number: int, repeat: int) -> dict:
+    """Median and best time per call over `repeat` rounds of `number` calls"""
+    per_call = []
+    for _ in range(repeat):
+        with session_factory() as session:
+            call = case.build(session, scale)
+            started = time.perf_counter()
+            for i in range(number):
+                call(i)
+            per_call.append((time.perf_counter() - started) / number)
+    median = statistics.median(per_call)
+    return {
+        "median_us": round(median * 1e6, 2),
+        "min_us": round(min(per_call) * 1e6, 2),
+        "ops_per_sec": round(1 / median, 1),
+    }
+
+
+def run_suite(
+    scales: List[int], number: int, repeat: int, database_url: Optional[str] = None,
+    cases: List[Case] = CASES,
+) -> dict:
+    """
+    Run every case at every scale and return the results document
+
+    config.database.SessionLocal points at the benchmark database while the
+    suite runs (services that open their own sessions use it), and is
+    restored afterwards.
+    """
+    results = {}
+    previous_session_local = config.database.SessionLocal
+    with bench_engine(database_url) as engine:
+        session_factory = config.database.SessionLocal = sessionmaker(bind=engine)
+        try:
+            for scale in scales:
+                seed(engine, scale)
+                for case in cases:
+                    key = f"{engine.dialect.name}/{scale}/{case.name}"
+                    if case.needs_cache and not cache_service.is_available():
+                        results[key] = {"skipped": "needs Redis"}
+                    else:
+                        results[key] = measure(session_factory, case, scale, number, repeat)
+                    print(_format_result(key, results[key]), flush=True)
+        finally:
+            config.database.SessionLocal = previous_session_local
+    return {
+        "meta": {
+            "dialect": engine.dialect.name,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "created": datetime.datetime.utcnow().isoformat(timespec="seconds"),
+            "number": number,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """
+    Print each case's change against the baseline
+
+    Returns:
+        The keys of the cases slower than the baseline by more than threshold
+    """
+    regressions = []
+    print(f"\n{'case':<52} {'baseline us':>12} {'current us':>12} {'change':>8}")
+    print("-" * 87)
+    for key, result in current["results"].items():
+        before = baseline["results"].get(key, {}).get("median_us")
+        now = result.get("median_us")
+        if before is None or now is None:
+            print(f"{key:<52} {'-':>12} {now if now is not None else '-':>12} {'n/a':>8}")
+            continue
+        change = now / before - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<52} {before:>12.1f} {now:>12.1f} {change:>+8.0%}{flag}")
+    return regressions
+
+
+def _format_result(key: str, result: dict) -> str:
+    if "skipped" in result:
+        return f"{key:<52} skipped ({result['skipped']})"
+    return f"{key:<52} {result['median_us']:>10.1f} us/call {result['ops_per_sec']:>12,.0f} /s"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scales", default="1000,10000", help="Comma-separated seed sizes")
+    parser.add_argument("--number", type=int, default=200, help="Calls per round")
+    parser.add_argument("--repeat", type=int, default=5, help="Rounds per case")
+    parser.add_argument("--database-url", help="PostgreSQL URL (tables go in a throwaway schema)")
+    parser.add_argument("--output", help="Write the results as JSON")
+    parser.add_argument("--baseline", help="Results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    document = run_suite([int(scale) for scale in args.scales.split(",")], args.number, args.repeat,
+                         args.database_url)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(json.load(f), document, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
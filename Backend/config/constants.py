@@ -15,6 +15,77 @@ class PaginationConfig:
     MIN_LIMIT = 1
 
 
+class ResponseConfig:
+    """Response serialization constants"""
+    # Serialize already-validated schemas directly instead of revalidating
+    # them against response_model and running jsonable_encoder
+    FAST_SCHEMA_RESPONSE = os.getenv('FAST_SCHEMA_RESPONSE', 'true').lower() == 'true'
+
+
+class StartupConfig:
+    """Worker startup constants"""
+    # Fast boot: no create_all (schema is managed by Alembic only) and Redis
+    # connects in the background instead of blocking import with a ping
+    FAST_BOOT = os.getenv('FAST_BOOT', 'false').lower() == 'true'
+
+
+class RepositoryConfig:
+    """Repository read path constants"""
+    # List reads of column-only schemas select just the columns and build
+    # schemas from the rows (no ORM objects, no per-row validation)
+    PROJECTED_READS = os.getenv('PROJECTED_READS', 'true').lower() == 'true'
+
+
+class ExportConfig:
+    """Streaming export constants"""
+    # Rows fetched from the server-side cursor (and written) per chunk
+    BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', '1000'))
+
+
+class ReportConfig:
+    """Sales report rollup constants"""
+    # Background refresh of the sales_daily rollup (dirty days only)
+    ROLLUP_REFRESH_ENABLED = os.getenv('REPORT_ROLLUP_REFRESH_ENABLED', 'true').lower() == 'true'
+    ROLLUP_REFRESH_SECONDS = float(os.getenv('REPORT_ROLLUP_REFRESH_SECONDS', '60'))
+    # Days recomputed per transaction
+    ROLLUP_REFRESH_MAX_DAYS = int(os.getenv('REPORT_ROLLUP_REFRESH_MAX_DAYS', '31'))
+    DEFAULT_LIMIT = 50
+
+
+class ReservationConfig:
+    """Cart stock reservation constants"""
+    # Units held for a cart expire this long after its last change
+    TTL_SECONDS = int(os.getenv('RESERVATION_TTL_SECONDS', '900'))
+    # Checkouts not completed within this time are released by the reconciler
+    CHECKOUT_TIMEOUT_SECONDS = int(os.getenv('RESERVATION_CHECKOUT_TIMEOUT_SECONDS', '300'))
+    # Background release of expired carts and repair of the Redis stock mirror
+    RECONCILE_ENABLED = os.getenv('RESERVATION_RECONCILE_ENABLED', 'true').lower() == 'true'
+    RECONCILE_SECONDS = float(os.getenv('RESERVATION_RECONCILE_SECONDS', '30'))
+    # Carts released / products repaired per Redis round trip
+    BATCH_SIZE = int(os.getenv('RESERVATION_BATCH_SIZE', '500'))
+
+
+class WriteBatchConfig:
+    """Group commit of concurrent inserts (reviews, clients)"""
+    ENABLED = os.getenv('WRITE_BATCH_ENABLED', 'false').lower() == 'true'
+    # A batch is written when it has this many rows or its first row has
+    # waited this long, whichever comes first
+    MAX_ROWS = int(os.getenv('WRITE_BATCH_MAX_ROWS', '100'))
+    MAX_DELAY_MS = float(os.getenv('WRITE_BATCH_MAX_DELAY_MS', '5'))
+
+
+class IdempotencyConfig:
+    """Idempotency-Key handling for POST create endpoints"""
+    # Stored responses are replayed for retries within this window
+    TTL_SECONDS = int(os.getenv('IDEMPOTENCY_TTL_SECONDS', '86400'))
+    # In-progress markers outlive a crashed worker by at most this long
+    IN_PROGRESS_TTL_SECONDS = int(os.getenv('IDEMPOTENCY_IN_PROGRESS_TTL_SECONDS', '60'))
+    # How long a concurrent duplicate waits for the first request (then 409)
+    WAIT_SECONDS = float(os.getenv('IDEMPOTENCY_WAIT_SECONDS', '10'))
+    POLL_SECONDS = 0.05
+    MAX_KEY_LENGTH = 255
+
+
 class CacheConfig:
     """Cache TTL and configuration constants"""
     # Default TTLs in seconds
@@ -23,6 +94,8 @@ class CacheConfig:
     PRODUCT_ITEM_TTL = 300  # 5 minutes
     CATEGORY_LIST_TTL = 3600  # 1 hour (rarely changes)
     CATEGORY_ITEM_TTL = 3600  # 1 hour
+    ORDER_HISTORY_TTL = 300  # 5 minutes (dropped when the client's orders change)
+    CATEGORY_PRODUCTS_TTL = 300  # 5 minutes (dropped when a product of the category changes)
 
 
 class LogConfig:
@@ -31,6 +104,12 @@ class LogConfig:
     LOG_BACKUP_COUNT = 5
     DEFAULT_LOG_LEVEL = 'INFO'
 
+    # Non-blocking pipeline: records are queued and written by a background thread
+    QUEUE_ENABLED = os.getenv('LOG_QUEUE_ENABLED', 'true').lower() == 'true'
+    QUEUE_MAX_SIZE = int(os.getenv('LOG_QUEUE_MAX_SIZE', '10000'))
+    QUEUE_FULL_POLICY = os.getenv('LOG_QUEUE_FULL_POLICY', 'drop').lower()  # 'drop' or 'block'
+    QUEUE_BLOCK_TIMEOUT = float(os.getenv('LOG_QUEUE_BLOCK_TIMEOUT', '1.0'))  # seconds
+
 
 class RateLimitConfig:
     """Rate limiting constants"""
@@ -48,6 +127,51 @@ class RateLimitConfig:
     REVIEW_CREATE_PERIOD = 60
 
 
+class CompressionConfig:
+    """Response compression constants (for deployments without nginx gzip)"""
+    ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+    MIN_SIZE_BYTES = int(os.getenv('COMPRESSION_MIN_SIZE', '1024'))  # Smaller bodies aren't worth it
+    GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', '6'))
+    BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', '4'))  # 4-5: fast, better than gzip 6
+
+    # Pre-compressed variants of hot GET responses, kept per worker
+    VARIANT_CACHE_PATHS = tuple(
+        p for p in os.getenv('COMPRESSION_CACHE_PATHS', '/products,/categories').split(',') if p
+    )
+    VARIANT_CACHE_MAX_ENTRIES = int(os.getenv('COMPRESSION_CACHE_MAX_ENTRIES', '256'))
+
+    COMPRESSIBLE_TYPES = (
+        'application/json',
+        'application/x-ndjson',
+        'application/javascript',
+        'application/xml',
+        'text/',
+    )
+
+
+class AdmissionConfig:
+    """Admission control / load shedding constants (thresholds: utils/health_thresholds.py)"""
+    ENABLED = os.getenv('ADMISSION_CONTROL_ENABLED', 'true').lower() == 'true'
+    MAX_IN_FLIGHT = int(os.getenv('ADMISSION_MAX_IN_FLIGHT', '400'))  # Hard cap, even for high priority
+    RETRY_AFTER_SECONDS = int(os.getenv('ADMISSION_RETRY_AFTER', '2'))
+    LATENCY_WINDOW_SECONDS = float(os.getenv('ADMISSION_LATENCY_WINDOW', '10'))  # Older samples are ignored
+
+    # Writes under these prefixes (checkout) are admitted until the hard cap
+    HIGH_PRIORITY_PATHS = tuple(
+        p for p in os.getenv('ADMISSION_HIGH_PRIORITY_PATHS', '/orders,/order_details,/bills').split(',') if p
+    )
+    # Reads under these prefixes (catalog browsing, reports) are shed first
+    LOW_PRIORITY_PATHS = tuple(
+        p for p in os.getenv('ADMISSION_LOW_PRIORITY_PATHS', '/products,/categories,/reviews,/reports').split(',') if p
+    )
+    # Bulk reads (streaming exports) under any prefix are shed first too
+    LOW_PRIORITY_SUFFIXES = ('/export',)
+    # Health probes (exact paths) are shed with catalog browsing
+    PROBE_PATHS = ('/', '/health_check', '/ready')
+    # Never shed: a rejected liveness probe would get the worker restarted
+    EXEMPT_PATHS = ('/live',)
+
+
 class DatabaseConfig:
     """Database connection constants"""
     DEFAULT_POOL_SIZE = 50
@@ -55,6 +179,15 @@ class DatabaseConfig:
     DEFAULT_POOL_TIMEOUT = 10  # seconds (fail fast for high concurrency)
     DEFAULT_POOL_RECYCLE = 3600  # 1 hour
 
+    # Checkouts waiting longer than this are counted as slow in /health_check
+    POOL_SLOW_CHECKOUT_MS = float(os.getenv('DB_POOL_SLOW_CHECKOUT_MS', '100'))
+
+    # Capacity planner (run_production.py): connections kept free for
+    # migrations, psql sessions and monitoring, and whether to shrink the
+    # per-worker pools to fit the server's max_connections
+    RESERVED_CONNECTIONS = int(os.getenv('DB_RESERVED_CONNECTIONS', '5'))
+    POOL_AUTOSIZE = os.getenv('DB_POOL_AUTOSIZE', 'false').lower() == 'true'
+
 
 class ValidationConfig:
     """Validation-related constants"""
@@ -65,6 +198,7 @@ class ValidationConfig:
     # Stock validation
     MIN_STOCK = 0  # Minimum stock (non-negative)
     MAX_STOCK = 999999  # Maximum reasonable stock
+    MAX_STOCK_SHARDS = 64  # Stock shard rows per hot product
 
     # String length limits
     MIN_NAME_LENGTH = 1
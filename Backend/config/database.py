@@ -1,11 +1,17 @@
 import os
+import time
 import logging
-from typing import Generator
+import threading
+from itertools import cycle
+from typing import Generator, List, Optional, Tuple
 
-from dotenv import load_dotenv
+from fastapi import Depends, Request
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 
+from config.database_url import normalize_url as _normalize_url, resolve_database_uri
+from config.pool_monitor import InstrumentedQueuePool
 from models.address import AddressModel  # noqa
 from models.base_model import base
 from models.bill import BillModel  # noqa
@@ -14,34 +20,15 @@ from models.client import ClientModel  # noqa
 from models.order import OrderModel  # noqa
 from models.order_detail import OrderDetailModel  # noqa
 from models.product import ProductModel  # noqa
+from models.product_stock_shard import ProductStockShardModel  # noqa
 from models.review import ReviewModel  # noqa
+from models.sales_rollup import SalesDailyModel, SalesRollupDirtyDayModel  # noqa
 
 # Get logger (logging is configured in main.py)
 logger = logging.getLogger(__name__)
 
-# Load environment variables only if not in production
-# In production (like Render), environment variables are set directly.
-if os.getenv('APP_ENV') != 'production':
-    env_path = os.path.join(os.path.dirname(__file__), '../.env')
-    load_dotenv(env_path)
-
-# Database configuration with defaults
-DATABASE_URL_ENV = os.getenv('DATABASE_URL')
-
-if DATABASE_URL_ENV:
-    logger.info("Connecting to database using DATABASE_URL environment variable.")
-    # Heroku/Render use 'postgres://', SQLAlchemy prefers 'postgresql://'
-    if DATABASE_URL_ENV.startswith("postgres://"):
-        DATABASE_URL_ENV = DATABASE_URL_ENV.replace("postgres://", "postgresql://", 1)
-    DATABASE_URI = DATABASE_URL_ENV
-else:
-    logger.info("DATABASE_URL not found. Building from individual PG variables.")
-    POSTGRES_HOST = os.getenv('POSTGRES_HOST', 'localhost')
-    POSTGRES_PORT = os.getenv('POSTGRES_PORT', '5432')
-    POSTGRES_DB = os.getenv('POSTGRES_DB', 'postgres')
-    POSTGRES_USER = os.getenv('POSTGRES_USER', 'postgres')
-    POSTGRES_PASSWORD = os.getenv('POSTGRES_PASSWORD', 'postgres')
-    DATABASE_URI = f'postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}'
+# Connection URL (shared with run_production.py's pool capacity planner)
+DATABASE_URI = resolve_database_uri()
 
 
 # High-performance connection pool configuration
@@ -52,20 +39,201 @@ MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '100'))  # Additional connection
 POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', '10'))  # Wait time for connection (reduced for production)
 POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '3600'))  # Recycle connections after 1 hour
 
-# Create engine with optimized connection pooling for high concurrency
-engine = create_engine(
-    DATABASE_URI,
-    pool_pre_ping=True,  # Verify connections before using (prevents stale connections)
-    pool_size=POOL_SIZE,  # Minimum number of connections in pool
-    max_overflow=MAX_OVERFLOW,  # Additional connections beyond pool_size
-    pool_timeout=POOL_TIMEOUT,  # Seconds to wait before giving up on connection
-    pool_recycle=POOL_RECYCLE,  # Recycle connections to prevent stale connections
-    echo=False,  # Disable SQL logging in production for performance
-    future=True,  # Use SQLAlchemy 2.0 style
-)
+# Driver: 'psycopg2' (default) or 'psycopg' (psycopg 3), which prepares hot
+# statements server-side after DB_PREPARE_THRESHOLD executions so Postgres
+# skips parse/plan for them. Not compatible with PgBouncer transaction pooling.
+DB_DRIVER = os.getenv('DB_DRIVER', 'psycopg2').lower()
+PREPARE_THRESHOLD = int(os.getenv('DB_PREPARE_THRESHOLD', '5'))
+
+
+def _driver_options(url: str) -> Tuple[str, dict]:
+    """
+    URL and connect_args for the configured PostgreSQL driver
+
+    Args:
+        url: Database URL ('postgresql://...')
+
+    Returns:
+        (url, connect_args) to pass to create_engine
+    """
+    if DB_DRIVER == 'psycopg' and url.startswith('postgresql://'):
+        return url.replace('postgresql://', 'postgresql+psycopg://', 1), {'prepare_threshold': PREPARE_THRESHOLD}
+    return url, {}
+
+
+def _create_engine(url: str, pool_size: int = POOL_SIZE, max_overflow: int = MAX_OVERFLOW) -> Engine:
+    """Create an engine with optimized connection pooling for high concurrency"""
+    url, connect_args = _driver_options(url)
+    return create_engine(
+        url,
+        connect_args=connect_args,
+        poolclass=InstrumentedQueuePool,  # Times checkouts (see config/pool_monitor.py)
+        pool_pre_ping=True,  # Verify connections before using (prevents stale connections)
+        pool_size=pool_size,  # Minimum number of connections in pool
+        max_overflow=max_overflow,  # Additional connections beyond pool_size
+        pool_timeout=POOL_TIMEOUT,  # Seconds to wait before giving up on connection
+        pool_recycle=POOL_RECYCLE,  # Recycle connections to prevent stale connections
+        echo=False,  # Disable SQL logging in production for performance
+        future=True,  # Use SQLAlchemy 2.0 style
+    )
+
+
+# Primary engine: all writes, and reads when no healthy replica is available
+engine = _create_engine(DATABASE_URI)
+
+
+# =============================================================================
+# READ REPLICAS (optional)
+# =============================================================================
+# Comma-separated replica URLs. GET endpoints read from a replica unless the
+# client wrote recently (read-your-writes stickiness) or every replica lags.
+REPLICA_URLS = [
+    _normalize_url(url.strip())
+    for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',')
+    if url.strip()
+]
+REPLICA_POOL_SIZE = int(os.getenv('DB_REPLICA_POOL_SIZE', str(POOL_SIZE)))
+REPLICA_MAX_OVERFLOW = int(os.getenv('DB_REPLICA_MAX_OVERFLOW', str(MAX_OVERFLOW)))
+REPLICA_MAX_LAG_SECONDS = float(os.getenv('DB_REPLICA_MAX_LAG_SECONDS', '2'))
+REPLICA_CHECK_INTERVAL = float(os.getenv('DB_REPLICA_CHECK_INTERVAL', '5'))  # seconds
+STICKY_WINDOW_SECONDS = int(os.getenv('DB_STICKY_WINDOW_SECONDS', '5'))
+
+# Lag is 0 when everything received has been replayed (idle primary), and
+# NULL-safe when run against a server that is not in recovery
+POSTGRES_REPLICA_LAG_SQL = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaState:
+    """Health of a single replica, refreshed at most every check interval"""
+
+    def __init__(self, replica_engine: Engine):
+        self.engine = replica_engine
+        self.healthy = True
+        self.lag_seconds: Optional[float] = None
+        self.checked_at = 0.0
+        self.error: Optional[str] = None
+
+
+class ReplicaRouter:
+    """
+    Chooses a replica engine for read-only sessions
+
+    Replicas are used round-robin. Each replica's lag is measured lazily
+    (at most once per check interval); a replica that lags more than
+    max_lag_seconds or cannot be reached is skipped until the next check.
+    When no replica is usable, callers fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        replica_engines: List[Engine],
+        max_lag_seconds: float = REPLICA_MAX_LAG_SECONDS,
+        check_interval: float = REPLICA_CHECK_INTERVAL
+    ):
+        self.replicas = [ReplicaState(replica_engine) for replica_engine in replica_engines]
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval = check_interval
+        self._order = cycle(range(len(self.replicas))) if self.replicas else None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.replicas)
+
+    def choose(self) -> Optional[Engine]:
+        """
+        Get the next healthy replica engine
+
+        Returns:
+            Replica engine, or None to use the primary
+        """
+        for _ in range(len(self.replicas)):
+            with self._lock:
+                state = self.replicas[next(self._order)]
+            if self._is_usable(state):
+                return state.engine
+        return None
+
+    def _is_usable(self, state: ReplicaState) -> bool:
+        if time.monotonic() - state.checked_at >= self.check_interval:
+            self._check(state)
+        return state.healthy
+
+    def _check(self, state: ReplicaState):
+        """Measure replica lag and update its health"""
+        state.checked_at = time.monotonic()
+        try:
+            with state.engine.connect() as connection:
+                if connection.dialect.name == 'postgresql':
+                    lag = float(connection.execute(POSTGRES_REPLICA_LAG_SQL).scalar() or 0)
+                else:
+                    # Local stand-ins (e.g. SQLite) have no replication lag
+                    connection.execute(text("SELECT 1"))
+                    lag = 0.0
+
+            state.lag_seconds = round(lag, 3)
+            state.error = None
+            state.healthy = lag <= self.max_lag_seconds
+            if not state.healthy:
+                logger.warning(
+                    f"Replica {state.engine.url.host} lagging {lag:.2f}s "
+                    f"(max {self.max_lag_seconds}s), reading from primary"
+                )
+        except Exception as e:
+            state.healthy = False
+            state.lag_seconds = None
+            state.error = str(e)
+            logger.error(f"Replica {state.engine.url.host} unavailable, reading from primary: {e}")
+
+    def status(self) -> List[dict]:
+        """Replica health for monitoring"""
+        return [
+            {
+                "host": state.engine.url.host or state.engine.url.database,
+                "healthy": state.healthy,
+                "lag_seconds": state.lag_seconds,
+                "error": state.error,
+            }
+            for state in self.replicas
+        ]
+
+    def dispose(self):
+        for state in self.replicas:
+            state.engine.dispose()
+
+
+replica_router = ReplicaRouter([
+    _create_engine(url, REPLICA_POOL_SIZE, REPLICA_MAX_OVERFLOW) for url in REPLICA_URLS
+])
+if replica_router.enabled:
+    logger.info(f"Read replicas configured: {len(REPLICA_URLS)}")
+
+
+class RoutingSession(Session):
+    """
+    Session that sends read-only work to a replica
+
+    Sessions flagged with info['use_replica'] (see get_read_db) bind every
+    statement to one replica chosen at first use; writes, flushes and all
+    other sessions go to the primary engine.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.info.get('use_replica') and not self._flushing:
+            if 'replica_engine' not in self.info:
+                self.info['replica_engine'] = replica_router.choose()
+            if self.info['replica_engine'] is not None:
+                return self.info['replica_engine']
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
 
 # SessionLocal class for creating new sessions
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=RoutingSession, autocommit=False, autoflush=False, bind=engine)
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -85,6 +253,25 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db(request: Request, db: Session = Depends(get_db)) -> Session:
+    """
+    Dependency injection for read-only endpoints.
+
+    Returns the request's session flagged to read from a replica, unless
+    replicas are not configured or the client is inside its post-write
+    stickiness window (see ReadConsistencyMiddleware), in which case the
+    session stays on the primary so users always see their own writes.
+
+    Usage:
+        @app.get("/items")
+        def get_items(db: Session = Depends(get_read_db)):
+            return db.query(Item).all()
+    """
+    if replica_router.enabled and not getattr(request.state, 'read_from_primary', False):
+        db.info['use_replica'] = True
+    return db
+
+
 def create_tables():
     """Create all tables in the database."""
     try:
@@ -110,7 +297,7 @@ def check_connection() -> bool:
     try:
         with engine.connect() as connection:
             connection.execute(text("SELECT 1"))
-        logger.info("Database connection established.")
+        logger.debug("Database connection established.")
         return True
     except Exception as e:
         logger.error(f"Error connecting to database: {e}")
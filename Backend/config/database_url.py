@@ -0,0 +1,42 @@
+"""
+Database URL resolution
+
+Kept apart from config/database.py so the production runner can read the
+URL (for the pool capacity planner) before any engine is created.
+"""
+import os
+import logging
+
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+# Load environment variables only if not in production
+# In production (like Render), environment variables are set directly.
+if os.getenv('APP_ENV') != 'production':
+    env_path = os.path.join(os.path.dirname(__file__), '../.env')
+    load_dotenv(env_path)
+
+
+def normalize_url(url: str) -> str:
+    """Heroku/Render use 'postgres://', SQLAlchemy prefers 'postgresql://'"""
+    if url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+def resolve_database_uri() -> str:
+    """Primary database URL from DATABASE_URL or the individual PG variables"""
+    database_url_env = os.getenv('DATABASE_URL')
+
+    if database_url_env:
+        logger.info("Connecting to database using DATABASE_URL environment variable.")
+        return normalize_url(database_url_env)
+
+    logger.info("DATABASE_URL not found. Building from individual PG variables.")
+    postgres_host = os.getenv('POSTGRES_HOST', 'localhost')
+    postgres_port = os.getenv('POSTGRES_PORT', '5432')
+    postgres_db = os.getenv('POSTGRES_DB', 'postgres')
+    postgres_user = os.getenv('POSTGRES_USER', 'postgres')
+    postgres_password = os.getenv('POSTGRES_PASSWORD', 'postgres')
+    return f'postgresql://{postgres_user}:{postgres_password}@{postgres_host}:{postgres_port}/{postgres_db}'
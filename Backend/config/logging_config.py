@@ -2,11 +2,22 @@
 Centralized Logging Configuration
 
 Provides consistent logging configuration across the entire application.
+
+Handlers declared in LOGGING_CONFIG are not called on the request path:
+setup_logging() moves them behind a bounded queue that a single background
+thread drains, so slow disks or log rotation never stall the event loop.
 """
 import os
+import atexit
+import queue
 import logging
 import logging.config
+import logging.handlers
+import threading
 from pathlib import Path
+from typing import Dict, List, Optional
+
+from config.constants import LogConfig
 
 
 # Create logs directory if it doesn't exist
@@ -82,17 +93,187 @@ LOGGING_CONFIG = {
 }
 
 
+class _DroppedRecordCounter:
+    """Thread-safe counter of log records discarded because the queue was full"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def increment(self):
+        with self._lock:
+            self._count += 1
+
+    def reset(self):
+        with self._lock:
+            self._count = 0
+
+    @property
+    def value(self) -> int:
+        return self._count
+
+
+dropped_records = _DroppedRecordCounter()
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that never performs I/O on the calling thread
+
+    Each handler is bound to a route (the logger it replaced the handlers of),
+    so a single listener can dispatch records to the right set of handlers.
+
+    When the queue is full the record is either dropped immediately ('drop')
+    or the caller waits up to block_timeout seconds for space ('block').
+    Records that cannot be queued are counted in dropped_records.
+    """
+
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        route: str,
+        policy: str = 'drop',
+        block_timeout: float = 1.0
+    ):
+        super().__init__(log_queue)
+        self.route = route
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge args and traceback into the message and tag the record with its route"""
+        record = super().prepare(record)
+        record.log_route = self.route
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        """Queue the record according to the configured full-queue policy"""
+        try:
+            if self.policy == 'block':
+                self.queue.put(record, block=True, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            dropped_records.increment()
+
+
+class RoutingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that dispatches each record to the handlers of its route
+
+    This preserves the per-logger handler layout of LOGGING_CONFIG
+    (e.g. uvicorn.access only writes to console) with a single writer thread.
+    """
+
+    def __init__(self, log_queue: queue.Queue, routes: Dict[str, List[logging.Handler]]):
+        super().__init__(log_queue, respect_handler_level=True)
+        self.routes = routes
+
+    def handle(self, record: logging.LogRecord):
+        for handler in self.routes.get(getattr(record, 'log_route', ''), ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def enqueue_sentinel(self):
+        # Wait for space instead of raising queue.Full on a saturated queue
+        self.queue.put(self._sentinel)
+
+
+_listener: Optional[RoutingQueueListener] = None
+
+
+def _install_queue_handlers():
+    """Replace the configured handlers with queue handlers and start the listener"""
+    global _listener
+
+    log_queue = queue.Queue(maxsize=LogConfig.QUEUE_MAX_SIZE)
+    routes: Dict[str, List[logging.Handler]] = {}
+
+    for name in [''] + list(LOGGING_CONFIG.get('loggers', {})):
+        target = logging.getLogger(name or None)
+        if not target.handlers:
+            continue
+
+        routes[name] = list(target.handlers)
+        target.handlers = [
+            BoundedQueueHandler(
+                log_queue,
+                route=name,
+                policy=LogConfig.QUEUE_FULL_POLICY,
+                block_timeout=LogConfig.QUEUE_BLOCK_TIMEOUT
+            )
+        ]
+
+    _listener = RoutingQueueListener(log_queue, routes)
+    _listener.start()
+
+
+def shutdown_logging():
+    """
+    Flush queued records and stop the background writer thread
+
+    Safe to call more than once; registered with atexit by setup_logging().
+    """
+    global _listener
+
+    if _listener is None:
+        return
+
+    if dropped_records.value:
+        logging.getLogger(__name__).warning(
+            f"⚠️  {dropped_records.value} log records were dropped (queue full)"
+        )
+
+    listener, _listener = _listener, None
+    listener.stop()
+
+    for handlers in listener.routes.values():
+        for handler in handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # Stream already closed (e.g. stdout at interpreter exit)
+                pass
+
+
+def get_logging_stats() -> dict:
+    """
+    Get queue pipeline statistics
+
+    Returns:
+        Dictionary with queue state, depth and dropped record count
+    """
+    listener = _listener
+    return {
+        "queued": listener is not None,
+        "queue_size": listener.queue.qsize() if listener else 0,
+        "queue_max_size": LogConfig.QUEUE_MAX_SIZE,
+        "full_policy": LogConfig.QUEUE_FULL_POLICY,
+        "dropped_records": dropped_records.value,
+    }
+
+
 def setup_logging():
     """
     Setup centralized logging configuration
 
     Call this function once at application startup in main.py
     """
+    # Reconfiguring: drain the previous pipeline before dictConfig closes its handlers
+    shutdown_logging()
+
     logging.config.dictConfig(LOGGING_CONFIG)
+
+    if LogConfig.QUEUE_ENABLED:
+        _install_queue_handlers()
+
     logger = logging.getLogger(__name__)
     logger.info("✅ Logging configured successfully")
 
 
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance
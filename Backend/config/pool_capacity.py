@@ -0,0 +1,157 @@
+"""
+Connection Pool Capacity Planner
+
+Every Uvicorn worker builds its own engine, so the server sees up to
+WORKERS x (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections. With the defaults
+(8 workers x 150) that is far above a typical Postgres max_connections of 100.
+
+run_production.py calls plan_pool_capacity() before starting the workers:
+it reads max_connections from the server, splits it across workers and
+either warns or, with DB_POOL_AUTOSIZE=true, rewrites DB_POOL_SIZE and
+DB_MAX_OVERFLOW so the workers (which read them on import) fit.
+"""
+import os
+import logging
+from typing import Dict, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from config.constants import DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+POSTGRES_MAX_CONNECTIONS_SQL = text("""
+    SELECT current_setting('max_connections')::int,
+           current_setting('superuser_reserved_connections')::int
+""")
+
+
+def read_max_connections(url: str) -> Optional[int]:
+    """
+    Connections available to the application role on the server
+
+    Args:
+        url: Database URL
+
+    Returns:
+        max_connections minus superuser_reserved_connections, or None when
+        the server cannot be reached or is not PostgreSQL
+    """
+    if not url.startswith("postgresql"):
+        return None
+
+    probe = create_engine(url, poolclass=NullPool)
+    try:
+        with probe.connect() as conn:
+            max_connections, superuser_reserved = conn.execute(POSTGRES_MAX_CONNECTIONS_SQL).one()
+        return max_connections - superuser_reserved
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read max_connections: {e}")
+        return None
+    finally:
+        probe.dispose()
+
+
+def plan_pool_sizes(
+    max_connections: Optional[int],
+    workers: int,
+    pool_size: int,
+    max_overflow: int,
+    reserved: int = DatabaseConfig.RESERVED_CONNECTIONS,
+    autosize: bool = False
+) -> Dict:
+    """
+    Split the server's connection budget across workers
+
+    Args:
+        max_connections: Connections the server allows (None if unknown)
+        workers: Number of Uvicorn worker processes
+        pool_size: Configured pool size per worker
+        max_overflow: Configured overflow per worker
+        reserved: Connections left free for migrations/admin sessions
+        autosize: Shrink pool_size/max_overflow to fit, keeping their ratio
+
+    Returns:
+        Plan dict with the pool sizes to use, the totals and any warnings
+    """
+    requested_per_worker = pool_size + max_overflow
+    plan = {
+        "max_connections": max_connections,
+        "workers": workers,
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "per_worker_budget": None,
+        "total_connections": workers * requested_per_worker,
+        "autosized": False,
+        "warnings": [],
+    }
+
+    if max_connections is None:
+        plan["warnings"].append(
+            "Server max_connections unknown: pool sizes were not checked"
+        )
+        return plan
+
+    available = max_connections - reserved
+    per_worker_budget = available // workers if workers else available
+    plan["per_worker_budget"] = per_worker_budget
+
+    if plan["total_connections"] <= available:
+        return plan
+
+    if per_worker_budget < 1:
+        plan["warnings"].append(
+            f"{workers} workers cannot each get a connection from "
+            f"{available} available: reduce UVICORN_WORKERS"
+        )
+        return plan
+
+    if not autosize:
+        plan["warnings"].append(
+            f"{workers} workers x {requested_per_worker} connections = "
+            f"{plan['total_connections']} exceeds the {available} available "
+            f"(max_connections {max_connections} - {reserved} reserved). "
+            f"Set DB_POOL_AUTOSIZE=true or lower DB_POOL_SIZE/DB_MAX_OVERFLOW "
+            f"to {per_worker_budget} per worker"
+        )
+        return plan
+
+    new_pool_size = max(1, round(per_worker_budget * pool_size / requested_per_worker))
+    plan.update(
+        pool_size=new_pool_size,
+        max_overflow=per_worker_budget - new_pool_size,
+        total_connections=workers * per_worker_budget,
+        autosized=True,
+    )
+    return plan
+
+
+def plan_pool_capacity(url: str, workers: int, autosize: bool = DatabaseConfig.POOL_AUTOSIZE) -> Dict:
+    """
+    Plan pool sizes for the production runner and apply them if autosizing
+
+    Must run before the workers import config.database: the adjusted sizes
+    are handed over through the DB_POOL_SIZE/DB_MAX_OVERFLOW variables.
+
+    Args:
+        url: Primary database URL
+        workers: Number of Uvicorn worker processes
+        autosize: Rewrite the pool size variables to fit the server
+
+    Returns:
+        Plan dict (see plan_pool_sizes)
+    """
+    plan = plan_pool_sizes(
+        read_max_connections(url),
+        workers,
+        int(os.getenv('DB_POOL_SIZE', str(DatabaseConfig.DEFAULT_POOL_SIZE))),
+        int(os.getenv('DB_MAX_OVERFLOW', str(DatabaseConfig.DEFAULT_MAX_OVERFLOW))),
+        autosize=autosize,
+    )
+
+    if plan["autosized"]:
+        os.environ['DB_POOL_SIZE'] = str(plan["pool_size"])
+        os.environ['DB_MAX_OVERFLOW'] = str(plan["max_overflow"])
+
+    return plan
@@ -0,0 +1,162 @@
+"""
+Connection Pool Checkout Instrumentation
+
+Measures how long requests wait to get a connection out of the QueuePool,
+so pool exhaustion shows up as a rising wait metric instead of only as
+pool_timeout errors after DB_POOL_TIMEOUT seconds.
+
+- Process-wide counters (checkouts, wait time, slow checkouts, timeouts)
+  are reported by /health_check
+- The wait accumulated by the current request is exposed through a
+  ContextVar; RequestIDMiddleware returns it as X-DB-Pool-Wait
+"""
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from sqlalchemy import exc
+from sqlalchemy.pool import QueuePool
+
+from config.constants import DatabaseConfig
+
+
+class PoolWaitStats:
+    """Thread-safe checkout wait counters for one worker process"""
+
+    def __init__(self, slow_threshold_ms: float = DatabaseConfig.POOL_SLOW_CHECKOUT_MS):
+        self.slow_threshold_ms = slow_threshold_ms
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.total_wait_ms = 0.0
+            self.max_wait_ms = 0.0
+            self.slow_checkouts = 0
+            self.timeouts = 0
+
+    def record(self, wait_ms: float, timed_out: bool = False):
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_ms += wait_ms
+            if wait_ms > self.max_wait_ms:
+                self.max_wait_ms = wait_ms
+            if wait_ms >= self.slow_threshold_ms:
+                self.slow_checkouts += 1
+            if timed_out:
+                self.timeouts += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "avg_wait_ms": round(self.total_wait_ms / self.checkouts, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait_ms, 3),
+                "slow_checkouts": self.slow_checkouts,
+                "slow_threshold_ms": self.slow_threshold_ms,
+                "timeouts": self.timeouts,
+            }
+
+
+# Global stats for this worker process
+pool_wait_stats = PoolWaitStats()
+
+# Per-request accumulator: a one-element list so threadpool copies of the
+# context (sync route handlers) still add to the request's own total
+_request_wait_ms: ContextVar[Optional[List[float]]] = ContextVar('db_pool_request_wait_ms', default=None)
+
+_reentry = threading.local()
+
+
+def start_request_tracking():
+    """Start accumulating checkout wait for the current request"""
+    return _request_wait_ms.set([0.0])
+
+
+def stop_request_tracking(token) -> float:
+    """Stop tracking and return the request's total checkout wait in ms"""
+    accumulator = _request_wait_ms.get()
+    _request_wait_ms.reset(token)
+    return accumulator[0] if accumulator else 0.0
+
+
+def pool_utilization(pool) -> Dict:
+    """
+    Current occupancy of a QueuePool
+
+    Args:
+        pool: engine.pool
+
+    Returns:
+        Dict with size, checked in/out, overflow, capacity and utilization %
+    """
+    checked_out = pool.checkedout()
+    overflow = pool.overflow()
+    size = pool.size()
+
+    # Total capacity logic
+    total_capacity = size + (overflow if overflow > 0 else 0)
+    utilization = (checked_out / total_capacity * 100) if total_capacity else 0
+
+    return {
+        "size": size,
+        "checked_in": pool.checkedin(),
+        "checked_out": checked_out,
+        "overflow": overflow,
+        "total_capacity": total_capacity,
+        "utilization_percent": round(utilization, 1),
+    }
+
+
+def pool_saturation(pool) -> float:
+    """
+    Checked-out share, in %, of every connection the pool may open
+
+    Unlike pool_utilization (informational, measured against the
+    connections opened so far), overflow counts as headroom here: a single
+    overflow connection is not a full pool. Pools without an overflow limit
+    never make callers wait, so they report 0.
+
+    Args:
+        pool: engine.pool
+
+    Returns:
+        checked_out / (size + max_overflow) * 100
+    """
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    if max_overflow < 0:
+        return 0.0
+    capacity = pool.size() + max_overflow
+    return round(pool.checkedout() / capacity * 100, 1) if capacity else 0.0
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that times every checkout
+
+    The measured time covers waiting for a free connection and, when the
+    pool has to grow into overflow, opening the new connection.
+    """
+
+    def _do_get(self):
+        # QueuePool._do_get retries by calling itself: only time the outer call
+        if getattr(_reentry, 'active', False):
+            return super()._do_get()
+
+        _reentry.active = True
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timed_out = True
+            raise
+        finally:
+            _reentry.active = False
+            wait_ms = (time.perf_counter() - start) * 1000
+            pool_wait_stats.record(wait_ms, timed_out)
+            accumulator = _request_wait_ms.get()
+            if accumulator is not None:
+                accumulator[0] += wait_ms
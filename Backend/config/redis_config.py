@@ -6,11 +6,14 @@ sessions, and rate limiting.
 """
 import os
 import logging
+import threading
 from typing import Optional
 import redis
 from redis.connection import ConnectionPool
 from dotenv import load_dotenv
 
+from config.constants import StartupConfig
+
 logger = logging.getLogger(__name__)
 
 # If running in a managed environment (like Render), REDIS_URL should already be set.
@@ -33,15 +36,30 @@ class RedisConfig:
     _client: Optional[redis.Redis] = None
     _pool: Optional[ConnectionPool] = None
 
-    def __new__(cls):
+    def __new__(cls, *args, **kwargs):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        if self._client is None:
+    def __init__(self, lazy: bool = False):
+        """
+        Args:
+            lazy: Don't connect now; call connect_in_background() later (fast boot)
+        """
+        if self._client is None and not lazy:
             self._initialize_client()
 
+    def connect_in_background(self) -> threading.Thread:
+        """
+        Connect from a daemon thread so startup doesn't wait on Redis
+
+        Until the connection succeeds get_client() returns None and the
+        cache and rate limiter behave as when Redis is unavailable.
+        """
+        thread = threading.Thread(target=self._initialize_client, name="redis-connect", daemon=True)
+        thread.start()
+        return thread
+
     def _initialize_client(self):
         """Initialize Redis client with connection pool"""
         redis_url = os.getenv('REDIS_URL')
@@ -86,11 +104,11 @@ class RedisConfig:
                 )
                 logger.info(f"✅ Redis connected successfully: {redis_host}:{redis_port} (DB: {redis_db})")
 
-            # Create Redis client from the pool
-            self._client = redis.Redis(connection_pool=self._pool)
-
-            # Test the connection
-            self._client.ping()
+            # Create Redis client from the pool and test the connection
+            # before publishing it, so nobody uses a client that can't connect
+            client = redis.Redis(connection_pool=self._pool)
+            client.ping()
+            self._client = client
 
         except redis.ConnectionError as e:
             logger.warning(f"⚠️  Redis connection failed: {e}")
@@ -136,8 +154,8 @@ class RedisConfig:
             logger.info("Redis connection pool disconnected")
 
 
-# Global Redis instance
-redis_config = RedisConfig()
+# Global Redis instance (connected later, in the background, in fast boot mode)
+redis_config = RedisConfig(lazy=StartupConfig.FAST_BOOT)
 
 
 def get_redis_client() -> Optional[redis.Redis]:
@@ -1,11 +1,18 @@
 """Base controller implementation module with FastAPI dependency injection."""
-from typing import Type, List, Callable
-from fastapi import APIRouter, Depends, status
+from typing import Any, Type, List, Callable, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from controllers.base_controller import BaseController
 from schemas.base_schema import BaseSchema
-from config.database import get_db
+from config.constants import ResponseConfig
+from config.database import get_db, get_read_db
+from controllers.idempotency import IDEMPOTENCY_KEY, create_idempotently
+from repositories.fieldsets import parse_fields
+from repositories.relationship_loading import parse_include, relationship_fields
+from utils.export import EXPORT_FORMATS
+from utils.responses import SchemaJSONResponse
 
 
 class BaseControllerImpl(BaseController):
@@ -19,7 +26,8 @@ class BaseControllerImpl(BaseController):
         self,
         schema: Type[BaseSchema],
         service_factory: Callable[[Session], 'BaseService'],
-        tags: List[str] = None
+        tags: List[str] = None,
+        fast_response: bool = ResponseConfig.FAST_SCHEMA_RESPONSE
     ):
         """
         Initialize the controller with dependency injection support.
@@ -28,46 +36,137 @@ class BaseControllerImpl(BaseController):
             schema: The Pydantic schema class for validation
             service_factory: A callable that creates a service instance given a DB session
             tags: Optional list of tags for API documentation
+            fast_response: Serialize the service's validated schemas directly,
+                skipping response_model revalidation (response_model is still
+                used for the OpenAPI docs)
         """
         self.schema = schema
         self.service_factory = service_factory
+        self.fast_response = fast_response
         self.router = APIRouter(tags=tags or [])
 
         # Register all CRUD endpoints with proper dependency injection
         self._register_routes()
 
+    def _respond(self, result: Any, status_code: int = status.HTTP_200_OK, partial: bool = False) -> Any:
+        """
+        Wrap a service result for the response
+
+        With fast_response the result is rendered directly from the schema
+        objects; otherwise it is returned as-is for FastAPI to validate.
+        Partial (sparse fieldset) results are always rendered directly, as
+        they would fail response_model validation.
+        """
+        if self.fast_response or partial:
+            return SchemaJSONResponse(result, status_code=status_code)
+        return result
+
+    def _parse_include(self, include: Optional[str]) -> Tuple[str, ...]:
+        """Validate ?include= against the schema's relationships (400 if unknown)"""
+        try:
+            return parse_include(include, self.schema)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    def _parse_fields(self, fields: Optional[str], model: Type, includes: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Validate ?fields= against the model's columns (400 if unknown)"""
+        try:
+            parsed = parse_fields(fields, model, self.schema)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        if parsed and includes:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="fields and include cannot be combined",
+            )
+        return parsed
+
     def _register_routes(self):
         """Register all CRUD routes with proper dependency injection."""
 
-        @self.router.get("", response_model=List[self.schema], status_code=status.HTTP_200_OK)
+        include_description = (
+            "Comma separated relationships to load: "
+            f"{', '.join(relationship_fields(self.schema)) or 'none'}. "
+            "Relationships that are not loaded are omitted from the response."
+        )
+        columns = [name for name in self.schema.model_fields if name not in relationship_fields(self.schema)]
+        fields_description = (
+            f"Comma separated columns to return (id_key is always included): {', '.join(columns)}. "
+            "Only these columns are selected; cannot be combined with include."
+        )
+
+        # Relationships that were not loaded are left unset on the schemas,
+        # so responses exclude unset fields rather than emitting defaults
+        @self.router.get("", response_model=List[self.schema], status_code=status.HTTP_200_OK,
+                         response_model_exclude_unset=True)
         def get_all(
             skip: int = 0,
             limit: int = 100,
-            db: Session = Depends(get_db)
+            include: Optional[str] = Query(None, description=include_description),
+            fields: Optional[str] = Query(None, description=fields_description),
+            db: Session = Depends(get_read_db)
         ):
             """Get all records with pagination."""
+            includes = self._parse_include(include)
+            service = self.service_factory(db)
+            columns = self._parse_fields(fields, service.model, includes)
+            return self._respond(
+                service.get_all(skip=skip, limit=limit, include=includes, fields=columns),
+                partial=bool(columns),
+            )
+
+        # Registered before /{id_key} so "export" is not taken for an id
+        @self.router.get("/export", response_class=StreamingResponse, status_code=status.HTTP_200_OK)
+        def export(
+            format: str = Query("ndjson", pattern=f"^({'|'.join(EXPORT_FORMATS)})$"),
+            fields: Optional[str] = Query(None, description=fields_description),
+            db: Session = Depends(get_read_db)
+        ):
+            """Stream every record as NDJSON or CSV (constant memory, no pagination)."""
             service = self.service_factory(db)
-            return service.get_all(skip=skip, limit=limit)
+            columns, batches = service.export(self._parse_fields(fields, service.model, ()))
+            media_type, writer = EXPORT_FORMATS[format]
+            filename = f"{service.model.__tablename__}.{format}"
+            return StreamingResponse(
+                writer(columns, batches),
+                media_type=media_type,
+                headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            )
 
-        @self.router.get("/{id_key}", response_model=self.schema, status_code=status.HTTP_200_OK)
+        @self.router.get("/{id_key}", response_model=self.schema, status_code=status.HTTP_200_OK,
+                         response_model_exclude_unset=True)
         def get_one(
             id_key: int,
-            db: Session = Depends(get_db)
+            include: Optional[str] = Query(None, description=include_description),
+            fields: Optional[str] = Query(None, description=fields_description),
+            db: Session = Depends(get_read_db)
         ):
             """Get a single record by ID."""
+            includes = self._parse_include(include)
             service = self.service_factory(db)
-            return service.get_one(id_key)
+            columns = self._parse_fields(fields, service.model, includes)
+            return self._respond(
+                service.get_one(id_key, include=includes, fields=columns),
+                partial=bool(columns),
+            )
 
-        @self.router.post("", response_model=self.schema, status_code=status.HTTP_201_CREATED)
+        @self.router.post("", response_model=self.schema, status_code=status.HTTP_201_CREATED,
+                          response_model_exclude_unset=True)
         def create(
+            request: Request,
             schema_in: self.schema,
+            idempotency_key: Optional[str] = IDEMPOTENCY_KEY,
             db: Session = Depends(get_db)
         ):
-            """Create a new record."""
+            """Create a new record (retries with the same Idempotency-Key replay the first response)."""
             service = self.service_factory(db)
-            return service.save(schema_in)
+            return create_idempotently(
+                request, idempotency_key, schema_in,
+                lambda: self._respond(service.save(schema_in), status.HTTP_201_CREATED),
+            )
 
-        @self.router.put("/{id_key}", response_model=self.schema, status_code=status.HTTP_200_OK)
+        @self.router.put("/{id_key}", response_model=self.schema, status_code=status.HTTP_200_OK,
+                         response_model_exclude_unset=True)
         def update(
             id_key: int,
             schema_in: self.schema,
@@ -75,7 +174,7 @@ class BaseControllerImpl(BaseController):
         ):
             """Update an existing record."""
             service = self.service_factory(db)
-            return service.update(id_key, schema_in)
+            return self._respond(service.update(id_key, schema_in))
 
         @self.router.delete("/{id_key}", status_code=status.HTTP_204_NO_CONTENT)
         def delete(
@@ -0,0 +1,91 @@
+"""Cart controller: stock reservations and reservation checkout."""
+from contextlib import contextmanager
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Request, status
+from sqlalchemy.orm import Session
+
+from config.database import get_db
+from controllers.idempotency import IDEMPOTENCY_KEY, create_idempotently
+from schemas import CartSchema, CheckoutRequest, OrderDetailSchema, ReservationRequest
+from services.cart_service import CartService
+from services.reservation_store import (
+    CheckoutInProgressError, InsufficientStockError, ReservationUnavailableError
+)
+from utils.responses import SchemaJSONResponse
+
+CART_ID = Path(..., pattern=r"^[A-Za-z0-9_-]{1,64}$", description="Client-generated cart id (e.g. a UUID)")
+
+
+@contextmanager
+def _reservation_errors():
+    """Map reservation failures to HTTP errors"""
+    try:
+        yield
+    except InsufficientStockError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except CheckoutInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except ReservationUnavailableError as e:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+class CartController:
+    """
+    Carts hold product units for ReservationConfig.TTL_SECONDS after their
+    last change; checkout turns them into the order's details
+    """
+
+    def __init__(self):
+        self.router = APIRouter(tags=["Carts"])
+        self._register_routes()
+
+    def _register_routes(self):
+        @self.router.get("/{cart_id}", response_model=CartSchema)
+        def get_cart(cart_id: str = CART_ID, db: Session = Depends(get_db)):
+            """Get a cart's reservations."""
+            with _reservation_errors():
+                return SchemaJSONResponse(CartService(db).get(cart_id))
+
+        @self.router.put("/{cart_id}/items/{product_id}", response_model=CartSchema)
+        def reserve(
+            product_id: int,
+            request: ReservationRequest,
+            cart_id: str = CART_ID,
+            db: Session = Depends(get_db)
+        ):
+            """Hold units of a product for the cart (409 if not enough are left)."""
+            with _reservation_errors():
+                return SchemaJSONResponse(CartService(db).reserve(cart_id, product_id, request.quantity))
+
+        @self.router.delete("/{cart_id}/items/{product_id}", response_model=CartSchema)
+        def release(product_id: int, cart_id: str = CART_ID, db: Session = Depends(get_db)):
+            """Release the cart's units of a product."""
+            with _reservation_errors():
+                return SchemaJSONResponse(CartService(db).reserve(cart_id, product_id, 0))
+
+        @self.router.delete("/{cart_id}", status_code=status.HTTP_204_NO_CONTENT)
+        def clear(cart_id: str = CART_ID, db: Session = Depends(get_db)):
+            """Release all of the cart's reservations."""
+            with _reservation_errors():
+                CartService(db).clear(cart_id)
+            return None
+
+        @self.router.post("/{cart_id}/checkout", response_model=List[OrderDetailSchema],
+                          status_code=status.HTTP_201_CREATED, response_model_exclude_unset=True)
+        def checkout(
+            request: Request,
+            checkout_in: CheckoutRequest,
+            cart_id: str = CART_ID,
+            idempotency_key: Optional[str] = IDEMPOTENCY_KEY,
+            db: Session = Depends(get_db)
+        ):
+            """Turn the cart's reservations into details of an existing order."""
+            def run_checkout():
+                with _reservation_errors():
+                    details = CartService(db).checkout(cart_id, checkout_in.order_id)
+                return SchemaJSONResponse(details, status_code=status.HTTP_201_CREATED)
+
+            return create_idempotently(request, idempotency_key, checkout_in, run_checkout)
@@ -1,7 +1,15 @@
 """Category controller with proper dependency injection."""
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from config.database import get_read_db
 from controllers.base_controller_impl import BaseControllerImpl
-from schemas import CategorySchema
+from schemas import CategoryProducts, CategorySchema
 from services.category_service import CategoryService
+from services.product_service import ProductService
+from utils.responses import SchemaJSONResponse
 
 
 class CategoryController(BaseControllerImpl):
@@ -12,4 +20,22 @@ class CategoryController(BaseControllerImpl):
             schema=CategorySchema,
             service_factory=lambda db: CategoryService(db),
             tags=["Categories"]
-        )
\ No newline at end of file
+        )
+
+    def _register_routes(self):
+        """Register the CRUD routes, then the category's products."""
+        super()._register_routes()
+
+        @self.router.get("/{id_key}/products", response_model=CategoryProducts, status_code=status.HTTP_200_OK)
+        def get_products(
+            id_key: int,
+            cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+            limit: int = Query(20, ge=1, le=100),
+            db: Session = Depends(get_read_db)
+        ):
+            """Get a category's products by id, keyset paginated."""
+            try:
+                page = ProductService(db).get_by_category(id_key, cursor=cursor, limit=limit)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+            return SchemaJSONResponse(page)
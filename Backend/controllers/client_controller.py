@@ -1,7 +1,14 @@
 """Client controller with proper dependency injection."""
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from config.database import get_read_db
 from controllers.base_controller_impl import BaseControllerImpl
-from schemas import ClientSchema
+from schemas import ClientOrderHistory, ClientSchema
 from services.client_service import ClientService
+from utils.responses import SchemaJSONResponse
 
 
 class ClientController(BaseControllerImpl):
@@ -18,3 +25,21 @@ class ClientController(BaseControllerImpl):
             service_factory=lambda db: ClientService(db),
             tags=["Clients"]
         )
+
+    def _register_routes(self):
+        """Register the CRUD routes, then the client's order history."""
+        super()._register_routes()
+
+        @self.router.get("/{id_key}/orders", response_model=ClientOrderHistory, status_code=status.HTTP_200_OK)
+        def get_orders(
+            id_key: int,
+            cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+            limit: int = Query(20, ge=1, le=100),
+            db: Session = Depends(get_read_db)
+        ):
+            """Get a client's orders with their details and product names, newest first."""
+            try:
+                history = self.service_factory(db).get_order_history(id_key, cursor=cursor, limit=limit)
+            except ValueError as e:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+            return SchemaJSONResponse(history)
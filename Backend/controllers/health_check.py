@@ -4,58 +4,125 @@ Health Check Controller with Threshold-Based Monitoring
 Provides comprehensive health check including:
 - Database latency monitoring (with warning/critical thresholds)
 - Redis availability
-- Database connection pool utilization percentage
+- Database connection pool utilization percentage and checkout wait times
 - Overall system health classification
+
+Database and Redis are probed by a background task per worker, so the
+endpoint itself only reads the latest snapshot. /live and /ready are the
+cheap probes for orchestrators.
 """
 
+import asyncio
+import logging
+import os
 import time
 from datetime import datetime
-from fastapi import APIRouter
+from typing import Dict, Optional
+
+from fastapi import APIRouter, status
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from config.database import check_connection, engine
+from config.database import check_connection, engine, replica_router
 from config.redis_config import check_redis_connection
+from config.logging_config import get_logging_stats
+from config.pool_monitor import pool_utilization, pool_wait_stats
+from middleware.admission_control import admission_controller
+from utils.health_thresholds import THRESHOLDS, evaluate_health_level, threshold_level
+from utils.startup_timer import startup_timer
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
+probe_router = APIRouter()
+
+PROBE_INTERVAL_SECONDS = float(os.getenv('HEALTH_PROBE_INTERVAL', '5'))
+# A snapshot older than this (prober stalled or not started) is not served
+SNAPSHOT_MAX_AGE_SECONDS = PROBE_INTERVAL_SECONDS * 3
+
+
+def probe_dependencies() -> Dict:
+    """
+    Probe the network dependencies (database SELECT 1 and Redis PING)
+
+    Returns:
+        Dict with db_status, db_latency_ms and redis_status
+    """
+    start = time.time()
+    db_status = check_connection()
+    db_latency_ms = round((time.time() - start) * 1000, 2)
 
-# Health check thresholds
-THRESHOLDS = {
-    "db_latency": {
-        "warning": 100.0,   # ms
-        "critical": 500.0   # ms
-    },
-    "db_pool_utilization": {
-        "warning": 70.0,    # %
-        "critical": 90.0    # %
+    return {
+        "db_status": db_status,
+        "db_latency_ms": db_latency_ms,
+        "redis_status": check_redis_connection(),
+        "probed_at": time.monotonic(),
     }
-}
 
 
-def evaluate_health_level(*statuses):
+class HealthProber:
     """
-    Determine overall system health.
+    Background task refreshing the dependency probe every few seconds
 
-    Priority:
-    critical > degraded > warning > healthy
+    One per worker, started in the app lifespan. /health_check and /ready
+    read the latest result instead of probing on every request.
     """
-    if "critical" in statuses:
-        return "critical"
-    if "degraded" in statuses:
-        return "degraded"
-    if "warning" in statuses:
-        return "warning"
-    return "healthy"
 
+    def __init__(self, interval_seconds: float = PROBE_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._latest: Optional[Dict] = None
+        self._task: Optional[asyncio.Task] = None
 
-@router.get("")
-def health_check():
+    async def _run(self):
+        while True:
+            try:
+                self._latest = await run_in_threadpool(probe_dependencies)
+            except Exception as e:
+                logger.error(f"❌ Health probe failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self._latest = None
+
+    def latest(self) -> Optional[Dict]:
+        """Most recent probe, or None if there is none fresh enough to serve"""
+        probe = self._latest
+        if probe is None or time.monotonic() - probe["probed_at"] > SNAPSHOT_MAX_AGE_SECONDS:
+            return None
+        return probe
+
+
+health_prober = HealthProber()
+
+
+async def _current_probe(deep: bool = False) -> Dict:
+    """Latest background probe, or a fresh one when asked for or unavailable"""
+    probe = None if deep else health_prober.latest()
+    if probe is None:
+        probe = await run_in_threadpool(probe_dependencies)
+    return probe
+
+
+def build_health_report(probe: Dict) -> Dict:
     """
-    FULL SYSTEM HEALTH CHECK
-    ------------------------
-    Evaluates:
-    - Database: up/down + latency + threshold health
-    - Redis: up/down
-    - DB Pool: size, checked out, utilization %, thresholds
-    - Overall system health level
+    Health report from a dependency probe plus live in-process metrics
+
+    Args:
+        probe: Result of probe_dependencies()
+
+    Returns:
+        Report with overall status and per-component checks
     """
     checks = {}
     component_statuses = []
@@ -63,22 +130,11 @@ def health_check():
     # -----------------------
     # Database connection + latency
     # -----------------------
-    start = time.time()
-    db_status = check_connection()
-    db_latency_ms = round((time.time() - start) * 1000, 2)
+    db_status = probe["db_status"]
+    db_latency_ms = probe["db_latency_ms"]
 
-    if not db_status:
-        db_health = "critical"
-        component_statuses.append("critical")
-    elif db_latency_ms >= THRESHOLDS["db_latency"]["critical"]:
-        db_health = "critical"
-        component_statuses.append("critical")
-    elif db_latency_ms >= THRESHOLDS["db_latency"]["warning"]:
-        db_health = "warning"
-        component_statuses.append("warning")
-    else:
-        db_health = "healthy"
-        component_statuses.append("healthy")
+    db_health = threshold_level(db_latency_ms, "db_latency") if db_status else "critical"
+    component_statuses.append(db_health)
 
     checks["database"] = {
         "status": "up" if db_status else "down",
@@ -90,7 +146,7 @@ def health_check():
     # -----------------------
     # Redis
     # -----------------------
-    redis_status = check_redis_connection()
+    redis_status = probe["redis_status"]
     redis_health = "healthy" if redis_status else "degraded"
 
     component_statuses.append(redis_health)
@@ -104,37 +160,16 @@ def health_check():
     # Database connection pool metrics
     # -----------------------
     try:
-        pool = engine.pool
-        checked_out = pool.checkedout()
-        checked_in = pool.checkedin()
-        overflow = pool.overflow()
-        size = pool.size()
-
-        # Total capacity logic
-        total_capacity = size + (overflow if overflow > 0 else 0)
-        utilization = (checked_out / total_capacity * 100) if total_capacity else 0
-        utilization = round(utilization, 1)
-
-        # Determine pool health
-        if utilization >= THRESHOLDS["db_pool_utilization"]["critical"]:
-            pool_health = "critical"
-            component_statuses.append("critical")
-        elif utilization >= THRESHOLDS["db_pool_utilization"]["warning"]:
-            pool_health = "warning"
-            component_statuses.append("warning")
-        else:
-            pool_health = "healthy"
-            component_statuses.append("healthy")
+        pool_metrics = pool_utilization(engine.pool)
+        pool_health = threshold_level(pool_metrics["utilization_percent"], "db_pool_utilization")
+        component_statuses.append(pool_health)
 
         checks["db_pool"] = {
             "health": pool_health,
-            "size": size,
-            "checked_in": checked_in,
-            "checked_out": checked_out,
-            "overflow": overflow,
-            "total_capacity": total_capacity,
-            "utilization_percent": utilization,
-            "thresholds": THRESHOLDS["db_pool_utilization"]
+            **pool_metrics,
+            "thresholds": THRESHOLDS["db_pool_utilization"],
+            # Time spent waiting for a connection since worker start
+            "checkout_wait": pool_wait_stats.snapshot()
         }
 
     except Exception as e:
@@ -145,6 +180,34 @@ def health_check():
         }
         component_statuses.append("critical")
 
+    # -----------------------
+    # Read replicas (reads fall back to the primary, so only degraded)
+    # -----------------------
+    if replica_router.enabled:
+        replicas = replica_router.status()
+        replicas_health = "healthy" if all(r["healthy"] for r in replicas) else "degraded"
+        component_statuses.append(replicas_health)
+        checks["replicas"] = {
+            "health": replicas_health,
+            "max_lag_seconds": replica_router.max_lag_seconds,
+            "replicas": replicas
+        }
+
+    # -----------------------
+    # Admission control (informational: shed load is visible, not a failure)
+    # -----------------------
+    checks["admission"] = admission_controller.snapshot()
+
+    # -----------------------
+    # Logging pipeline (informational, does not affect overall health)
+    # -----------------------
+    checks["logging"] = get_logging_stats()
+
+    # -----------------------
+    # Worker startup time per phase (informational)
+    # -----------------------
+    checks["startup"] = startup_timer.as_dict()
+
     # -----------------------
     # Overall health
     # -----------------------
@@ -153,5 +216,51 @@ def health_check():
     return {
         "status": overall_health,
         "timestamp": datetime.utcnow().isoformat(),
+        "probe_age_seconds": round(time.monotonic() - probe["probed_at"], 3),
         "checks": checks
     }
+
+
+@router.get("")
+async def health_check(deep: bool = False):
+    """
+    FULL SYSTEM HEALTH CHECK
+    ------------------------
+    Evaluates:
+    - Database: up/down + latency + threshold health
+    - Redis: up/down
+    - DB Pool: size, checked out, utilization %, thresholds
+    - Overall system health level
+
+    Database and Redis results come from the background probe (refreshed
+    every HEALTH_PROBE_INTERVAL seconds); ?deep=true probes them now.
+    """
+    probe = await _current_probe(deep)
+    return build_health_report(probe)
+
+
+# =============================================================================
+# LIVENESS / READINESS (mounted at the root: /live, /ready)
+# =============================================================================
+
+@probe_router.get("/live")
+async def live():
+    """Liveness: the worker's event loop is responding. No I/O."""
+    return {"status": "alive"}
+
+
+@probe_router.get("/ready")
+async def ready():
+    """
+    Readiness: the database answered the latest probe
+
+    Redis is optional (the cache degrades gracefully), so it does not
+    affect readiness.
+    """
+    probe = await _current_probe()
+    if not probe["db_status"]:
+        return ORJSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "not_ready", "database": "down"}
+        )
+    return {"status": "ready", "database": "up"}
@@ -0,0 +1,70 @@
+"""Idempotency-Key handling shared by the create (POST) routes."""
+import hashlib
+from typing import Any, Callable, Optional
+
+from fastapi import Header, HTTPException, Request, status
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from config.constants import IdempotencyConfig
+from services.idempotency_store import (
+    IdempotencyInProgressError, IdempotencyKeyReusedError, StoredResponse, idempotency_store
+)
+from utils.responses import SchemaJSONResponse
+
+IDEMPOTENCY_KEY = Header(
+    None,
+    max_length=IdempotencyConfig.MAX_KEY_LENGTH,
+    description="Client-generated key (e.g. a UUID); retries with the same key and body replay the first response",
+)
+
+
+def create_idempotently(
+    request: Request,
+    idempotency_key: Optional[str],
+    payload: BaseModel,
+    create: Callable[[], Any],
+) -> Any:
+    """
+    Run a create once per Idempotency-Key
+
+    Without a key the create just runs. With one, the first successful
+    response is stored (see idempotency_store) and replayed, with an
+    Idempotent-Replayed header, for retries with the same key and body.
+    Failed creates are not stored, so their retries run again.
+
+    Args:
+        request: The request (its method and path scope the key)
+        idempotency_key: The Idempotency-Key header, if sent
+        payload: The request body (its set fields are hashed to detect reused keys)
+        create: Runs the create and returns the route's result
+    """
+    if not idempotency_key:
+        return create()
+
+    scope = f"{request.method}:{request.url.path}"
+    # Only what the client sent: defaults like OrderSchema.date change per request
+    fingerprint = hashlib.sha256(payload.model_dump_json(exclude_unset=True).encode("utf-8")).hexdigest()
+    try:
+        stored = idempotency_store.begin(scope, idempotency_key, fingerprint)
+    except IdempotencyKeyReusedError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    except IdempotencyInProgressError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    if stored is not None:
+        return Response(stored.body, status_code=stored.status_code, media_type=stored.media_type,
+                        headers={"Idempotent-Replayed": "true"})
+
+    try:
+        result = create()
+    except Exception:
+        idempotency_store.release(scope, idempotency_key)
+        raise
+    response = result if isinstance(result, Response) else SchemaJSONResponse(
+        result, status_code=status.HTTP_201_CREATED
+    )
+    idempotency_store.complete(
+        scope, idempotency_key, fingerprint,
+        StoredResponse(response.status_code, bytes(response.body), response.media_type),
+    )
+    return response
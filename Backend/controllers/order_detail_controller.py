@@ -1,9 +1,10 @@
 """OrderDetail controller with proper dependency injection and rate limiting."""
 from fastapi import Depends, Request, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from controllers.base_controller_impl import BaseControllerImpl
+from controllers.idempotency import IDEMPOTENCY_KEY, create_idempotently
 from schemas import OrderDetailSchema
 from services.order_detail_service import OrderDetailService
 from config.database import get_db
@@ -37,13 +38,18 @@ class OrderDetailController(BaseControllerImpl):
         def create_with_rate_limit(
             request: Request,
             schema_in: OrderDetailSchema,
+            idempotency_key: Optional[str] = IDEMPOTENCY_KEY,
             db: Session = Depends(get_db)
         ):
             """
             Create a new order detail with rate limiting.
 
             This endpoint is rate-limited to 10 requests per minute per IP address
-            to prevent order spam and abuse.
+            to prevent order spam and abuse. Retries with the same
+            Idempotency-Key replay the first response.
             """
             service = self.service_factory(db)
-            return service.save(schema_in)
\ No newline at end of file
+            return create_idempotently(
+                request, idempotency_key, schema_in,
+                lambda: self._respond(service.save(schema_in), status.HTTP_201_CREATED),
+            )
\ No newline at end of file
@@ -1,7 +1,14 @@
 """Product controller with proper dependency injection."""
+from typing import List
+
+from fastapi import Depends, Query, status
+from sqlalchemy.orm import Session
+
+from config.database import get_db, get_read_db
 from controllers.base_controller_impl import BaseControllerImpl
-from schemas import ProductSchema
+from schemas import ProductSchema, ReviewSchema, StockShardsRequest
 from services.product_service import ProductService
+from services.review_service import ReviewService
 
 
 class ProductController(BaseControllerImpl):
@@ -12,4 +19,37 @@ class ProductController(BaseControllerImpl):
             schema=ProductSchema,
             service_factory=lambda db: ProductService(db),
             tags=["Products"]
-        )
\ No newline at end of file
+        )
+
+    def _register_routes(self):
+        """Register the product-only reads, then the CRUD routes."""
+
+        # Registered before /{id_key} so "top-rated" is not taken for an id
+        @self.router.get("/top-rated", response_model=List[ProductSchema], status_code=status.HTTP_200_OK)
+        def get_top_rated(
+            skip: int = Query(0, ge=0),
+            limit: int = Query(100, ge=1),
+            min_reviews: int = Query(1, ge=1, description="Only products with at least this many reviews"),
+            db: Session = Depends(get_read_db)
+        ):
+            """Get products by average rating (rating_sum / rating_count), best first."""
+            service = self.service_factory(db)
+            return self._respond(service.get_top_rated(skip=skip, limit=limit, min_reviews=min_reviews))
+
+        @self.router.get("/{id_key}/reviews", response_model=List[ReviewSchema], status_code=status.HTTP_200_OK,
+                         response_model_exclude_unset=True)
+        def get_reviews(
+            id_key: int,
+            skip: int = Query(0, ge=0),
+            limit: int = Query(100, ge=1),
+            db: Session = Depends(get_read_db)
+        ):
+            """Get a product's reviews with pagination, newest first."""
+            return self._respond(ReviewService(db).get_by_product(id_key, skip=skip, limit=limit))
+
+        @self.router.put("/{id_key}/stock-shards", response_model=ProductSchema, status_code=status.HTTP_200_OK)
+        def set_stock_shards(id_key: int, request: StockShardsRequest, db: Session = Depends(get_db)):
+            """Split a hot product's stock over N shard rows so purchases don't queue on one row (0 undoes it)."""
+            return self._respond(self.service_factory(db).set_stock_shards(id_key, request.shards))
+
+        super()._register_routes()
@@ -0,0 +1,68 @@
+"""Sales report controller (revenue by product, category, day and payment type)."""
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from config.constants import PaginationConfig, ReportConfig
+from config.database import get_read_db
+from schemas import CategorySales, DailySales, PaymentTypeSales, ProductSales, SalesReport
+from services.sales_report_service import SalesReportService
+from utils.responses import SchemaJSONResponse
+
+
+class SalesReportController:
+    """
+    Read-only sales reports served from the sales_daily rollup
+
+    Every report takes an optional inclusive [start, end] day range and
+    reports pending_days: days changed since the last rollup refresh.
+    """
+
+    def __init__(self):
+        self.router = APIRouter(tags=["Reports"])
+        self._register_routes()
+
+    def _register_routes(self):
+        start_query = Query(None, description="First day (inclusive)")
+        end_query = Query(None, description="Last day (inclusive)")
+        limit_query = Query(ReportConfig.DEFAULT_LIMIT, ge=1, le=PaginationConfig.MAX_LIMIT)
+
+        @self.router.get("/by-product", response_model=SalesReport[ProductSales])
+        def sales_by_product(
+            start: Optional[date] = start_query,
+            end: Optional[date] = end_query,
+            limit: int = limit_query,
+            db: Session = Depends(get_read_db)
+        ):
+            """Best-selling products by revenue."""
+            return SchemaJSONResponse(SalesReportService(db).by_product(start, end, limit))
+
+        @self.router.get("/by-category", response_model=SalesReport[CategorySales])
+        def sales_by_category(
+            start: Optional[date] = start_query,
+            end: Optional[date] = end_query,
+            limit: int = limit_query,
+            db: Session = Depends(get_read_db)
+        ):
+            """Best-selling categories by revenue."""
+            return SchemaJSONResponse(SalesReportService(db).by_category(start, end, limit))
+
+        @self.router.get("/by-day", response_model=SalesReport[DailySales])
+        def sales_by_day(
+            start: Optional[date] = start_query,
+            end: Optional[date] = end_query,
+            db: Session = Depends(get_read_db)
+        ):
+            """Units and revenue per day."""
+            return SchemaJSONResponse(SalesReportService(db).by_day(start, end))
+
+        @self.router.get("/by-payment-type", response_model=SalesReport[PaymentTypeSales])
+        def sales_by_payment_type(
+            start: Optional[date] = start_query,
+            end: Optional[date] = end_query,
+            db: Session = Depends(get_read_db)
+        ):
+            """Units and revenue per payment type."""
+            return SchemaJSONResponse(SalesReportService(db).by_payment_type(start, end))
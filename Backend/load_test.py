@@ -1,124 +1,310 @@
 """
 Load Testing Script for FastAPI E-commerce API
 
-Tests the API's ability to handle 400 concurrent requests.
+Scenario-based load test that checks its results against SLOs.
+
+Users follow weighted journeys instead of independent random requests:
+- BrowseJourney:    categories -> a category's products -> product -> reviews
+- CheckoutJourney:  browse, reserve items in a cart, bill + order, then an
+                    atomic cart checkout (Idempotency-Key, retried once on
+                    a timeout)
+- AdminUser:        sales reports, top-rated products, a client's orders
+
+Ids come from the data actually in the database (DataPool, loaded once when
+the test starts), so requests don't hit missing rows. Expected business
+outcomes (409 out of stock) are not counted as failures.
+
+When the test stops, the overall and per-request p50/p95/p99, RPS and
+error rate are checked against --slo-p95-ms, --slo-p99-ms and
+--slo-error-rate, and optionally written to --results-json. Any breach
+makes locust exit with code 1, so runs can gate capacity changes.
+
 Requires: pip install locust
 """
+import json
 import random
-from locust import HttpUser, task, between, events
-from locust.runners import MasterRunner
+import threading
+import uuid
+from datetime import date, datetime
+from typing import Dict, List, Optional
+
+import requests
+from locust import HttpUser, SequentialTaskSet, between, events, task
+from locust.runners import MasterRunner, WorkerRunner
+
+# Rows read per page when loading the DataPool, and the most rows kept per entity
+POOL_PAGE_SIZE = 1000
+POOL_MAX_ROWS = 10_000
+
+PAYMENT_CARD = 2
+DELIVERY_HOME = 3
+
+
+class DataPool:
+    """Ids of existing rows, loaded from the API once per process at test start"""
+
+    lock = threading.Lock()
+    category_ids: List[int] = []
+    client_ids: List[int] = []
+    # Products with stock, for carts; all products, for browsing
+    in_stock_ids: List[int] = []
+    product_ids: List[int] = []
+
+    @classmethod
+    def load(cls, host: str):
+        with cls.lock:
+            session = requests.Session()
+            session.verify = False
+            cls.category_ids = [row["id_key"] for row in cls._rows(session, host, "/categories", "id_key")]
+            cls.client_ids = [row["id_key"] for row in cls._rows(session, host, "/clients", "id_key")]
+            products = cls._rows(session, host, "/products", "id_key,stock")
+            cls.product_ids = [row["id_key"] for row in products]
+            cls.in_stock_ids = [row["id_key"] for row in products if row.get("stock", 0) > 0]
+        print(f"DataPool: {len(cls.category_ids)} categories, {len(cls.client_ids)} clients, "
+              f"{len(cls.product_ids)} products ({len(cls.in_stock_ids)} in stock)")
+
+    @staticmethod
+    def _rows(session: requests.Session, host: str, path: str, fields: str) -> List[dict]:
+        rows = []
+        while len(rows) < POOL_MAX_ROWS:
+            response = session.get(f"{host}{path}", params={
+                "skip": len(rows), "limit": POOL_PAGE_SIZE, "fields": fields,
+            }, timeout=30)
+            response.raise_for_status()
+            page = response.json()
+            rows.extend(page)
+            if len(page) < POOL_PAGE_SIZE:
+                break
+        return rows
+
+    @classmethod
+    def pick(cls, ids: List[int]) -> Optional[int]:
+        return random.choice(ids) if ids else None
+
+
+# ============================================================================
+# JOURNEYS
+# ============================================================================
+
+class BrowseJourney(SequentialTaskSet):
+    """Categories, one category's products, one product and its reviews"""
+
+    def on_start(self):
+        self.category_id = DataPool.pick(DataPool.category_ids)
+        self.product_id = DataPool.pick(DataPool.product_ids)
+
+    @task
+    def list_categories(self):
+        self.client.get("/categories")
+
+    @task
+    def category_products(self):
+        if self.category_id is None:
+            return
+        response = self.client.get(f"/categories/{self.category_id}/products?limit=20",
+                                   name="/categories/[id]/products")
+        if response.ok and response.json()["products"]:
+            self.product_id = random.choice(response.json()["products"])["id_key"]
 
+    @task
+    def product(self):
+        if self.product_id is not None:
+            self.client.get(f"/products/{self.product_id}", name="/products/[id]")
 
-class EcommerceUser(HttpUser):
-    """
-    Simulates a user interacting with the e-commerce API.
-    """
-    # Wait between 1-3 seconds between requests (simulate real user behavior)
+    @task
+    def reviews(self):
+        if self.product_id is not None:
+            self.client.get(f"/products/{self.product_id}/reviews", name="/products/[id]/reviews")
+        self.interrupt()
+
+
+class CheckoutJourney(SequentialTaskSet):
+    """Browse, fill a cart, open a bill and an order, then check the cart out"""
+
+    def on_start(self):
+        self.cart_id = uuid.uuid4().hex
+        self.client_id = DataPool.pick(DataPool.client_ids)
+        self.order_id = None
+
+    @task
+    def browse(self):
+        self.client.get("/products?skip=0&limit=20", name="/products")
+
+    @task
+    def fill_cart(self):
+        if self.client_id is None or not DataPool.in_stock_ids:
+            self.interrupt()
+            return
+        for product_id in random.sample(DataPool.in_stock_ids, min(random.randint(1, 3), len(DataPool.in_stock_ids))):
+            with self.client.put(f"/carts/{self.cart_id}/items/{product_id}", json={"quantity": random.randint(1, 2)},
+                                 name="/carts/[id]/items/[id]", catch_response=True) as response:
+                if response.status_code == 409:
+                    response.success()  # Out of stock: an expected outcome
+        self.client.get(f"/carts/{self.cart_id}", name="/carts/[id]")
+
+    @task
+    def open_order(self):
+        bill = self.client.post("/bills", json={
+            "bill_number": f"LT-{uuid.uuid4().hex[:20]}", "date": date.today().isoformat(),
+            "payment_type": PAYMENT_CARD, "client_id": self.client_id,
+        })
+        if not bill.ok:
+            return self._abandon()
+        order = self.client.post("/orders", json={
+            "date": datetime.utcnow().isoformat(), "delivery_method": DELIVERY_HOME,
+            "client_id": self.client_id, "bill_id": bill.json()["id_key"],
+        })
+        if not order.ok:
+            return self._abandon()
+        self.order_id = order.json()["id_key"]
+
+    @task
+    def checkout(self):
+        headers = {"Idempotency-Key": uuid.uuid4().hex}
+        for attempt in range(2):
+            with self.client.post(f"/carts/{self.cart_id}/checkout", json={"order_id": self.order_id},
+                                  headers=headers, name="/carts/[id]/checkout", catch_response=True) as response:
+                if response.status_code == 400 and "no reservations" in response.text:
+                    response.success()  # Every item was out of stock
+                if response.status_code != 0:  # 0: no response (timeout), retry with the same key
+                    break
+        self.interrupt()
+
+    def _abandon(self):
+        self.client.delete(f"/carts/{self.cart_id}", name="/carts/[id]")
+        self.interrupt()
+
+
+# ============================================================================
+# USERS
+# ============================================================================
+
+class ShopperUser(HttpUser):
+    """Shoppers: mostly browsing, some checking out"""
+
+    weight = 9
     wait_time = between(1, 3)
+    tasks = {BrowseJourney: 7, CheckoutJourney: 3}
 
     def on_start(self):
-        """Called when a user starts."""
         self.client.verify = False  # Disable SSL verification for testing
 
-    @task(10)
-    def list_products(self):
-        """List products with pagination (most common operation)."""
-        skip = random.randint(0, 100)
-        limit = random.randint(10, 50)
-        self.client.get(f"/products?skip={skip}&limit={limit}")
-
-    @task(8)
-    def get_product(self):
-        """Get a specific product by ID."""
-        product_id = random.randint(1, 100)
-        self.client.get(f"/products/{product_id}")
-
-    @task(10)
-    def list_clients(self):
-        """List clients with pagination."""
-        skip = random.randint(0, 50)
-        limit = random.randint(10, 30)
-        self.client.get(f"/clients?skip={skip}&limit={limit}")
-
-    @task(6)
-    def get_client(self):
-        """Get a specific client by ID."""
-        client_id = random.randint(1, 50)
-        self.client.get(f"/clients/{client_id}")
-
-    @task(8)
-    def list_categories(self):
-        """List all categories."""
-        self.client.get("/categories")
 
-    @task(5)
-    def list_orders(self):
-        """List orders with pagination."""
-        skip = random.randint(0, 50)
-        limit = random.randint(10, 20)
-        self.client.get(f"/orders?skip={skip}&limit={limit}")
+class AdminUser(HttpUser):
+    """Back office: sales reports, top-rated products and client order histories"""
+
+    weight = 1
+    wait_time = between(2, 5)
+
+    def on_start(self):
+        self.client.verify = False
 
     @task(3)
-    def create_client(self):
-        """Create a new client."""
-        client_data = {
-            "name": f"TestUser{random.randint(1000, 9999)}",
-            "lastname": f"Lastname{random.randint(1000, 9999)}",
-            "email": f"test{random.randint(1000, 9999)}@example.com",
-            "telephone": f"+1{random.randint(1000000000, 9999999999)}"
-        }
-        self.client.post("/clients", json=client_data)
+    def sales_by_day(self):
+        self.client.get("/reports/sales/by-day")
 
     @task(2)
-    def create_product(self):
-        """Create a new product."""
-        product_data = {
-            "name": f"Product{random.randint(1000, 9999)}",
-            "price": round(random.uniform(10.0, 500.0), 2),
-            "stock": random.randint(0, 100),
-            "category_id": random.randint(1, 10)
-        }
-        self.client.post("/products", json=product_data)
+    def sales_by_category(self):
+        self.client.get("/reports/sales/by-category")
 
-    @task(15)
-    def health_check(self):
-        """Check API health (lightest operation)."""
-        self.client.get("/health_check")
+    @task(2)
+    def sales_by_product(self):
+        self.client.get("/reports/sales/by-product?limit=20")
 
+    @task(2)
+    def top_rated(self):
+        self.client.get("/products/top-rated?limit=20")
 
-@events.init.add_listener
-def on_locust_init(environment, **kwargs):
-    """Print configuration when Locust starts."""
-    if isinstance(environment.runner, MasterRunner):
-        print("""
-╔══════════════════════════════════════════════════════════════╗
-║          🔥 E-commerce API Load Test - Master Node         ║
-╚══════════════════════════════════════════════════════════════╝
-        """)
+    @task(3)
+    def client_orders(self):
+        client_id = DataPool.pick(DataPool.client_ids)
+        if client_id is not None:
+            self.client.get(f"/clients/{client_id}/orders?limit=20", name="/clients/[id]/orders")
 
 
-@events.test_start.add_listener
-def on_test_start(environment, **kwargs):
-    """Print when test starts."""
-    print("""
-📊 Load Test Started
-Target: 400 concurrent users
-Ramp-up: Gradual increase to simulate real traffic
-        """)
+# ============================================================================
+# SLO CHECK AND RESULTS
+# ============================================================================
 
+@events.init_command_line_parser.add_listener
+def on_init_parser(parser):
+    """SLO thresholds and the results file"""
+    parser.add_argument("--slo-p95-ms", type=float, default=200, help="Max overall p95 response time")
+    parser.add_argument("--slo-p99-ms", type=float, default=500, help="Max overall p99 response time")
+    parser.add_argument("--slo-error-rate", type=float, default=0.01, help="Max share of failed requests")
+    parser.add_argument("--results-json", default="", help="Write percentiles and SLO results to this file")
 
-@events.test_stop.add_listener
-def on_test_stop(environment, **kwargs):
-    """Print summary when test completes."""
-    print("""
-✅ Load Test Completed
 
-Review the statistics above for:
-  • Response times (50th, 95th, 99th percentile)
-  • Requests per second (RPS)
-  • Failure rate (should be < 1%)
-  • Database connection pool usage
-        """)
+@events.test_start.add_listener
+def on_test_start(environment, **kwargs):
+    """Load the ids the journeys pick from (on each process that runs users)"""
+    if not isinstance(environment.runner, MasterRunner):
+        DataPool.load(environment.host)
+
+
+def summarize(entry) -> Dict[str, float]:
+    """Percentiles, throughput and error rate of a locust StatsEntry"""
+    return {
+        "requests": entry.num_requests,
+        "failures": entry.num_failures,
+        "error_rate": round(entry.fail_ratio, 4),
+        "rps": round(entry.total_rps, 2),
+        "p50_ms": entry.get_response_time_percentile(0.50),
+        "p95_ms": entry.get_response_time_percentile(0.95),
+        "p99_ms": entry.get_response_time_percentile(0.99),
+        "max_ms": entry.max_response_time,
+    }
+
+
+def check_slos(total: Dict[str, float], options) -> List[str]:
+    """The SLOs the overall results breach, as messages"""
+    breaches = []
+    if total["requests"] == 0:
+        breaches.append("no requests were made")
+    if total["p95_ms"] > options.slo_p95_ms:
+        breaches.append(f"p95 {total['p95_ms']:.0f} ms > {options.slo_p95_ms:.0f} ms")
+    if total["p99_ms"] > options.slo_p99_ms:
+        breaches.append(f"p99 {total['p99_ms']:.0f} ms > {options.slo_p99_ms:.0f} ms")
+    if total["error_rate"] > options.slo_error_rate:
+        breaches.append(f"error rate {total['error_rate']:.2%} > {options.slo_error_rate:.2%}")
+    return breaches
+
+
+@events.quitting.add_listener
+def on_quitting(environment, **kwargs):
+    """Check the SLOs, write the results and fail the run on a breach"""
+    if isinstance(environment.runner, WorkerRunner):
+        return  # The master holds the aggregated stats
+
+    options = environment.parsed_options
+    total = summarize(environment.stats.total)
+    breaches = check_slos(total, options)
+
+    if options.results_json:
+        results = {
+            "host": environment.host,
+            "finished": datetime.utcnow().isoformat(timespec="seconds"),
+            "slo": {"p95_ms": options.slo_p95_ms, "p99_ms": options.slo_p99_ms,
+                    "error_rate": options.slo_error_rate},
+            "passed": not breaches,
+            "breaches": breaches,
+            "total": total,
+            "requests": {
+                f"{method} {name}": summarize(entry)
+                for (name, method), entry in sorted(environment.stats.entries.items())
+            },
+        }
+        with open(options.results_json, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+
+    print(f"\nOverall: {total['requests']} requests, {total['rps']:.1f} RPS, p50 {total['p50_ms']:.0f} ms, "
+          f"p95 {total['p95_ms']:.0f} ms, p99 {total['p99_ms']:.0f} ms, errors {total['error_rate']:.2%}")
+    if breaches:
+        print("SLO BREACHED: " + "; ".join(breaches))
+        environment.process_exit_code = 1
+    else:
+        print("SLOs met")
 
 
 if __name__ == "__main__":
@@ -133,40 +319,38 @@ USAGE:
 1. Install Locust:
    pip install locust
 
-2. Start your API server:
+2. Start your API server (with seeded categories, clients and products):
    python run_production.py
 
 3. Run load test (Web UI):
    locust -f load_test.py --host=http://localhost:8000
 
    Then open: http://localhost:8089
-   Configure:
-     • Number of users: 400
-     • Spawn rate: 50 users/second
-     • Host: http://localhost:8000
 
-4. Run load test (Headless - 400 users):
+4. Run load test (Headless - 400 users, SLO checked, results to JSON):
    locust -f load_test.py \\
      --host=http://localhost:8000 \\
      --users 400 \\
      --spawn-rate 50 \\
      --run-time 5m \\
-     --headless
+     --headless \\
+     --slo-p95-ms 200 --slo-p99-ms 500 --slo-error-rate 0.01 \\
+     --results-json results/run.json
+
+   Exits 1 if an SLO is breached. Compare results/*.json across runs.
 
 5. Run distributed load test (multiple machines):
-   # Master:
-   locust -f load_test.py --master --host=http://your-api-url
+   # Master (checks the SLOs on the aggregated stats):
+   locust -f load_test.py --master --host=http://your-api-url --headless \\
+     --users 400 --spawn-rate 50 --run-time 5m --results-json run.json
 
    # Workers (run on multiple machines):
    locust -f load_test.py --worker --master-host=<master-ip>
 
-METRICS TO MONITOR:
--------------------
-✓ Response Time p95 < 200ms (good)
-✓ Response Time p99 < 500ms (acceptable)
-✓ Requests/sec > 100 RPS
-✓ Failure rate < 1%
-✓ Database connections < max_connections
+JOURNEYS:
+---------
+  • ShopperUser (90%): BrowseJourney 70% / CheckoutJourney 30%
+  • AdminUser (10%): sales reports, top-rated, client order histories
 
 DATABASE MONITORING (while testing):
 ------------------------------------
@@ -183,14 +367,4 @@ docker-compose -f docker-compose.production.yaml logs -f api
 
 # Monitor container stats
 docker stats ecommerce_api_prod
-
-EXPECTED RESULTS:
------------------
-With proper configuration:
-  • 400 concurrent users ✓
-  • ~100-200 RPS sustained ✓
-  • p95 response time < 200ms ✓
-  • 0% error rate ✓
-  • Database pool < 600 connections ✓
-
-    """)
\ No newline at end of file
+    """)
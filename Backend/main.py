@@ -4,19 +4,28 @@ Main application module for FastAPI e-commerce REST API.
 Initializes the FastAPI application, registers routers,
 configures CORS, logging, rate limiting, and health checks.
 """
+# First import: the startup timer's clock starts here
+from utils.startup_timer import startup_timer
+
 import os
+import time
 import uvicorn
 import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from starlette import status
 from starlette.responses import JSONResponse
 
 from config.logging_config import setup_logging
-from config.database import create_tables, engine
+from config.database import create_tables, engine, replica_router
 from config.redis_config import redis_config, check_redis_connection
 
+from config.constants import AdmissionConfig, CompressionConfig, StartupConfig
+from middleware.admission_control import AdmissionControlMiddleware
+from middleware.compression_middleware import CompressionMiddleware
 from middleware.rate_limiter import RateLimiterMiddleware
+from middleware.read_consistency_middleware import ReadConsistencyMiddleware
 from middleware.request_id_middleware import RequestIDMiddleware
 
 # Setup centralized logging FIRST
@@ -26,15 +35,21 @@ logger = logging.getLogger(__name__)
 # Controllers
 from controllers.address_controller import AddressController
 from controllers.bill_controller import BillController
+from controllers.cart_controller import CartController
 from controllers.category_controller import CategoryController
 from controllers.client_controller import ClientController
 from controllers.order_controller import OrderController
 from controllers.order_detail_controller import OrderDetailController
 from controllers.product_controller import ProductController
+from controllers.report_controller import SalesReportController
 from controllers.review_controller import ReviewController
-from controllers.health_check import router as health_check_controller
+from controllers.health_check import health_prober, probe_router, router as health_check_controller
 
 from repositories.base_repository_impl import InstanceNotFoundError
+from services.cart_service import reservation_reconciler
+from services.sales_report_service import sales_rollup_refresher
+
+startup_timer.record("imports", since=startup_timer.started_at)
 
 
 from contextlib import asynccontextmanager
@@ -47,24 +62,44 @@ async def lifespan(app: FastAPI):
     """
     logger.info("🚀 Starting FastAPI E-commerce API...")
 
-    # Create database tables on startup
-    logger.info("📦 Creating database tables...")
-    try:
-        create_tables()
-        logger.info("✅ Database tables created successfully")
-    except Exception as e:
-        logger.error(f"❌ Error creating database tables: {e}")
-        # Optionally, you might want to prevent startup on DB error
-        # raise e 
-
-    if check_redis_connection():
-        logger.info("✅ Redis cache available")
-    else:
-        logger.warning("⚠️ Redis NOT available")
+    with startup_timer.phase("schema"):
+        if StartupConfig.FAST_BOOT:
+            # Schema is managed by Alembic only (alembic upgrade head before deploy)
+            logger.info("⏭️ Fast boot: skipping create_tables()")
+        else:
+            # Create database tables on startup
+            logger.info("📦 Creating database tables...")
+            try:
+                create_tables()
+                logger.info("✅ Database tables created successfully")
+            except Exception as e:
+                logger.error(f"❌ Error creating database tables: {e}")
+                # Optionally, you might want to prevent startup on DB error
+                # raise e
+
+    with startup_timer.phase("redis"):
+        if StartupConfig.FAST_BOOT:
+            redis_config.connect_in_background()
+            logger.info("⏭️ Fast boot: connecting to Redis in the background")
+        elif check_redis_connection():
+            logger.info("✅ Redis cache available")
+        else:
+            logger.warning("⚠️ Redis NOT available")
+
+    # Background DB/Redis probe feeding /health_check and /ready
+    health_prober.start()
+    # Applies order changes to the sales report rollup (dirty days only)
+    sales_rollup_refresher.start()
+    # Releases expired cart reservations and repairs the Redis stock mirror
+    reservation_reconciler.start()
+    startup_timer.complete()
     
     yield
     
     logger.info("👋 Shutting down API...")
+    await health_prober.stop()
+    await sales_rollup_refresher.stop()
+    await reservation_reconciler.stop()
     try:
         redis_config.close()
         logger.info("✅ Redis connection closed")
@@ -73,6 +108,7 @@ async def lifespan(app: FastAPI):
 
     try:
         engine.dispose()
+        replica_router.dispose()
         logger.info("✅ DB engine disposed")
     except Exception as e:
         logger.error(f"❌ DB dispose error: {e}")
@@ -80,6 +116,7 @@ async def lifespan(app: FastAPI):
 
 
 def create_fastapi_app() -> FastAPI:
+    app_build_started = time.perf_counter()
 
     fastapi_app = FastAPI(
         title="E-commerce REST API",
@@ -89,6 +126,8 @@ def create_fastapi_app() -> FastAPI:
         redoc_url="/redoc",
         # 👉 Si NO querés redirección 307 por la barra final, descomentá esto:
         redirect_slashes=False,
+        # orjson rendering for every route that doesn't return a Response itself
+        default_response_class=ORJSONResponse,
         lifespan=lifespan
     )
 
@@ -138,14 +177,29 @@ def create_fastapi_app() -> FastAPI:
     fastapi_app.include_router(OrderDetailController().router, prefix="/order_details")
     fastapi_app.include_router(ReviewController().router, prefix="/reviews")
     fastapi_app.include_router(CategoryController().router, prefix="/categories")
+    fastapi_app.include_router(SalesReportController().router, prefix="/reports/sales")
+    fastapi_app.include_router(CartController().router, prefix="/carts")
 
     # Health Check — SOLO UNA VEZ ❗
     fastapi_app.include_router(health_check_controller, prefix="/health_check")
+    fastapi_app.include_router(probe_router, tags=["Health"])
 
     # Middleware
+    if CompressionConfig.ENABLED:
+        fastapi_app.add_middleware(CompressionMiddleware, minimum_size=CompressionConfig.MIN_SIZE_BYTES)
+        logger.info(f"✅ Response compression enabled (>= {CompressionConfig.MIN_SIZE_BYTES} bytes)")
+
+    if replica_router.enabled:
+        fastapi_app.add_middleware(ReadConsistencyMiddleware)
+        logger.info("✅ Read replicas enabled with read-your-writes stickiness")
+
     fastapi_app.add_middleware(RequestIDMiddleware)
     logger.info("✅ Request ID middleware enabled")
 
+    if AdmissionConfig.ENABLED:
+        fastapi_app.add_middleware(AdmissionControlMiddleware)
+        logger.info(f"✅ Admission control enabled (max {AdmissionConfig.MAX_IN_FLIGHT} in flight)")
+
     cors_origins = os.getenv("CORS_ORIGINS", "*").split(",")
     fastapi_app.add_middleware(
         CORSMiddleware,
@@ -159,6 +213,7 @@ def create_fastapi_app() -> FastAPI:
     fastapi_app.add_middleware(RateLimiterMiddleware, calls=1000, period=60)
     logger.info("✅ Rate limiting enabled (1000 req / 60s)")
 
+    startup_timer.record("create_app", since=app_build_started)
     return fastapi_app
 
 
@@ -0,0 +1,231 @@
+"""
+Admission Control Middleware
+
+Rejects requests quickly with 503 + Retry-After when the worker is
+overloaded, instead of letting every request queue in the threadpool and
+the connection pool until DB_POOL_TIMEOUT expires.
+
+Overload is judged from the same signals and thresholds as /health_check
+(utils/health_thresholds.py):
+- in-flight requests in this worker
+- connection pool saturation (checked out / (pool size + max overflow))
+- recent request latency (moving average)
+
+Requests are admitted by priority class:
+- high:   checkout writes (orders, order_details, bills), shed only at the hard in-flight cap
+- normal: everything else, shed when any signal is critical
+- low:    catalog browsing and health probes, shed when any signal reaches warning
+"""
+import logging
+import time
+from typing import Callable, Dict
+
+from fastapi.responses import JSONResponse
+from starlette import status
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from config.constants import AdmissionConfig
+from config.database import engine
+from config.pool_monitor import pool_saturation
+from utils.health_thresholds import evaluate_health_level, threshold_level
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = "high"
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Lowest overload level at which each priority class is rejected
+SHED_LEVELS = {
+    PRIORITY_LOW: ("warning", "critical"),
+    PRIORITY_NORMAL: ("critical",),
+    PRIORITY_HIGH: (),
+}
+
+
+def classify_request(method: str, path: str) -> str:
+    """
+    Priority class of a request
+
+    Args:
+        method: HTTP method
+        path: URL path
+
+    Returns:
+        'high', 'normal' or 'low'
+    """
+    if method in SAFE_METHODS:
+        if (
+            path in AdmissionConfig.PROBE_PATHS
+            or path.startswith(AdmissionConfig.LOW_PRIORITY_PATHS)
+            or path.endswith(AdmissionConfig.LOW_PRIORITY_SUFFIXES)
+        ):
+            return PRIORITY_LOW
+        return PRIORITY_NORMAL
+
+    if path.startswith(AdmissionConfig.HIGH_PRIORITY_PATHS):
+        return PRIORITY_HIGH
+    return PRIORITY_NORMAL
+
+
+class AdmissionController:
+    """
+    Overload signals and admission decisions for one worker process
+
+    All state is touched from the event loop only, so no locking is needed.
+    """
+
+    def __init__(
+        self,
+        pool,
+        max_in_flight: int = AdmissionConfig.MAX_IN_FLIGHT,
+        latency_window_seconds: float = AdmissionConfig.LATENCY_WINDOW_SECONDS,
+        latency_alpha: float = 0.2
+    ):
+        """
+        Args:
+            pool: Connection pool whose utilization is watched
+            max_in_flight: Hard cap on concurrent requests, for every priority
+            latency_window_seconds: Latency average older than this is ignored
+            latency_alpha: Weight of the newest sample in the moving average
+        """
+        self.pool = pool
+        self.max_in_flight = max_in_flight
+        self.latency_window_seconds = latency_window_seconds
+        self.latency_alpha = latency_alpha
+
+        self.in_flight = 0
+        self.latency_ms = 0.0
+        self._latency_updated_at = 0.0
+        self.admitted = 0
+        self.shed = {PRIORITY_HIGH: 0, PRIORITY_NORMAL: 0, PRIORITY_LOW: 0}
+
+    def record_latency(self, duration_ms: float):
+        """Fold an admitted request's duration into the moving average"""
+        if self._is_latency_stale():
+            self.latency_ms = duration_ms
+        else:
+            self.latency_ms += self.latency_alpha * (duration_ms - self.latency_ms)
+        self._latency_updated_at = time.monotonic()
+
+    def _is_latency_stale(self) -> bool:
+        # Without recent samples (e.g. everything was shed) latency must not keep us overloaded
+        return time.monotonic() - self._latency_updated_at > self.latency_window_seconds
+
+    def signals(self) -> Dict[str, Dict]:
+        """Current value and level of each overload signal"""
+        try:
+            utilization = pool_saturation(self.pool)
+        except Exception:
+            utilization = 0.0
+        latency = 0.0 if self._is_latency_stale() else round(self.latency_ms, 2)
+
+        return {
+            "in_flight": {"value": self.in_flight, "level": threshold_level(self.in_flight, "in_flight")},
+            "db_pool_utilization": {"value": utilization, "level": threshold_level(utilization, "db_pool_utilization")},
+            "request_latency": {"value": latency, "level": threshold_level(latency, "request_latency")},
+        }
+
+    def overload_level(self) -> str:
+        """Worst level among the signals: 'healthy', 'warning' or 'critical'"""
+        return evaluate_health_level(*(signal["level"] for signal in self.signals().values()))
+
+    def admit(self, priority: str) -> bool:
+        """
+        Decide whether a request of the given priority may proceed
+
+        Args:
+            priority: Priority class from classify_request()
+
+        Returns:
+            True if admitted, False if it should be rejected with 503
+        """
+        if self.in_flight >= self.max_in_flight:
+            admitted = False
+        else:
+            shed_levels = SHED_LEVELS[priority]
+            admitted = not shed_levels or self.overload_level() not in shed_levels
+
+        if admitted:
+            self.admitted += 1
+        else:
+            self.shed[priority] += 1
+        return admitted
+
+    def snapshot(self) -> Dict:
+        """State for /health_check"""
+        signals = self.signals()
+        return {
+            "level": evaluate_health_level(*(signal["level"] for signal in signals.values())),
+            "signals": signals,
+            "max_in_flight": self.max_in_flight,
+            "admitted": self.admitted,
+            "shed": dict(self.shed),
+        }
+
+
+# Global controller for this worker. The pool is bound once: engine.pool is
+# only replaced by engine.dispose() at shutdown.
+admission_controller = AdmissionController(engine.pool)
+
+
+class AdmissionControlMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that sheds load by priority with fast 503 responses
+
+    Example usage:
+        app.add_middleware(AdmissionControlMiddleware)
+    """
+
+    def __init__(self, app, controller: AdmissionController = None):
+        """
+        Initialize admission control middleware
+
+        Args:
+            app: FastAPI application
+            controller: Controller holding the signals (default: the worker's global one)
+        """
+        super().__init__(app)
+        self.controller = controller or admission_controller
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Admit or reject the request, and track in-flight count and latency
+
+        Args:
+            request: Incoming HTTP request
+            call_next: Next middleware/handler
+
+        Returns:
+            HTTP response, or 503 with Retry-After when shed
+        """
+        if request.url.path in AdmissionConfig.EXEMPT_PATHS:
+            return await call_next(request)
+
+        priority = classify_request(request.method, request.url.path)
+
+        if not self.controller.admit(priority):
+            logger.warning(
+                f"⚠️ Load shed ({priority} priority): {request.method} {request.url.path} "
+                f"- {self.controller.in_flight} in flight"
+            )
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "detail": "Server is overloaded. Please retry shortly.",
+                    "retry_after": AdmissionConfig.RETRY_AFTER_SECONDS
+                },
+                headers={"Retry-After": str(AdmissionConfig.RETRY_AFTER_SECONDS)}
+            )
+
+        self.controller.in_flight += 1
+        start = time.perf_counter()
+        try:
+            return await call_next(request)
+        finally:
+            self.controller.in_flight -= 1
+            self.controller.record_latency((time.perf_counter() - start) * 1000)
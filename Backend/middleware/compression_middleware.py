@@ -0,0 +1,214 @@
+"""
+Response Compression Middleware
+
+Compresses JSON/text responses with brotli or gzip when the API is served
+without the nginx reverse proxy (e.g. Render runs run_production.py directly).
+
+- Negotiates the encoding from Accept-Encoding (brotli preferred when installed)
+- Only compresses bodies above COMPRESSION_MIN_SIZE bytes
+- Leaves streaming responses and bodies that already have a Content-Encoding alone
+- Keeps pre-compressed variants of hot catalog pages so identical bodies
+  (served from the Redis cache) are not recompressed on every request
+"""
+import gzip
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from config.constants import CompressionConfig
+
+try:
+    import brotli
+except ImportError:  # Optional dependency: fall back to gzip only
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+class CompressedVariantCache:
+    """
+    Bounded LRU of compressed bodies keyed by (encoding, body digest)
+
+    Keying by digest means a stale variant can never be served: when the
+    underlying cached response changes, its digest changes too, and the
+    old entry simply ages out.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def digest(body: bytes) -> bytes:
+        return hashlib.blake2b(body, digest_size=16).digest()
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[bytes]:
+        compressed = self._entries.get(key)
+        if compressed is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return compressed
+
+    def set(self, key: Tuple[str, bytes], compressed: bytes):
+        self._entries[key] = compressed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Pick the best supported encoding from an Accept-Encoding header
+
+    Args:
+        accept_encoding: Raw header value (e.g. "gzip, deflate, br;q=0.9")
+
+    Returns:
+        'br', 'gzip' or None if the client accepts neither
+    """
+    qualities = {}
+    for part in accept_encoding.lower().split(','):
+        coding, _, params = part.strip().partition(';')
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            qualities[coding] = quality
+
+    wildcard = qualities.get('*', 0.0)
+    br_quality = qualities.get('br', wildcard) if brotli is not None else 0.0
+    gzip_quality = qualities.get('gzip', wildcard)
+
+    if br_quality > 0 and br_quality >= gzip_quality:
+        return 'br'
+    if gzip_quality > 0:
+        return 'gzip'
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Compress a body with the given encoding using the configured levels"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=CompressionConfig.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=CompressionConfig.GZIP_LEVEL)
+
+
+class CompressionMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that compresses eligible responses with brotli or gzip
+
+    Example usage:
+        app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    """
+
+    def __init__(
+        self,
+        app,
+        minimum_size: int = CompressionConfig.MIN_SIZE_BYTES,
+        cache_paths: Tuple[str, ...] = CompressionConfig.VARIANT_CACHE_PATHS,
+        cache_max_entries: int = CompressionConfig.VARIANT_CACHE_MAX_ENTRIES
+    ):
+        """
+        Initialize compression middleware
+
+        Args:
+            app: FastAPI application
+            minimum_size: Bodies smaller than this (bytes) are sent uncompressed
+            cache_paths: Path prefixes whose compressed GET bodies are kept for reuse
+            cache_max_entries: Maximum compressed variants kept per worker
+        """
+        super().__init__(app)
+        self.minimum_size = minimum_size
+        self.cache_paths = cache_paths
+        self.variant_cache = CompressedVariantCache(cache_max_entries)
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Process request and compress the response body when worthwhile
+
+        Args:
+            request: Incoming HTTP request
+            call_next: Next middleware/handler
+
+        Returns:
+            Original or compressed HTTP response
+        """
+        encoding = negotiate_encoding(request.headers.get('accept-encoding', ''))
+        response = await call_next(request)
+
+        if encoding is None or not self._is_compressible(response):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+
+        if len(body) < self.minimum_size:
+            return self._build_response(response, body)
+
+        compressed = self._compress(request, body, encoding)
+        return self._build_response(response, compressed, encoding)
+
+    def _is_compressible(self, response: Response) -> bool:
+        """Check headers to decide whether the body may be compressed"""
+        headers = response.headers
+
+        # Already compressed (e.g. a stored gzip body) or nothing to compress
+        if 'content-encoding' in headers or response.status_code in (204, 304):
+            return False
+
+        # Streaming responses (exports) have no length: don't buffer them
+        content_length = headers.get('content-length')
+        if content_length is None or int(content_length) < self.minimum_size:
+            return False
+
+        content_type = headers.get('content-type', '')
+        return content_type.startswith(CompressionConfig.COMPRESSIBLE_TYPES)
+
+    def _compress(self, request: Request, body: bytes, encoding: str) -> bytes:
+        """Compress body, reusing a stored variant for hot catalog pages"""
+        if request.method != 'GET' or not request.url.path.startswith(self.cache_paths):
+            return compress_body(body, encoding)
+
+        key = (encoding, self.variant_cache.digest(body))
+        compressed = self.variant_cache.get(key)
+        if compressed is None:
+            compressed = compress_body(body, encoding)
+            self.variant_cache.set(key, compressed)
+        return compressed
+
+    @staticmethod
+    def _build_response(original: Response, body: bytes, encoding: Optional[str] = None) -> Response:
+        """Rebuild the response around a (possibly compressed) body, keeping all headers"""
+        response = Response(content=body, status_code=original.status_code)
+        raw_headers = [
+            (name, value) for name, value in original.raw_headers
+            if name not in (b'content-length', b'vary')
+        ]
+
+        vary = original.headers.get('vary')
+        if encoding is not None:
+            raw_headers.append((b'content-encoding', encoding.encode('latin-1')))
+            vary = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+        if vary:
+            raw_headers.append((b'vary', vary.encode('latin-1')))
+
+        raw_headers.append((b'content-length', str(len(body)).encode('latin-1')))
+        response.raw_headers = raw_headers
+        response.background = original.background
+        return response
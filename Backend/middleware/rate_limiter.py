@@ -57,12 +57,16 @@ class RateLimiterMiddleware(BaseHTTPMiddleware):
         Returns:
             HTTP response
         """
+        if self.redis_client is None:
+            # Redis may connect after startup (fast boot)
+            self.redis_client = get_redis_client()
+
         # Skip if disabled or Redis unavailable
         if not self.enabled or not self.redis_client:
             return await call_next(request)
 
-        # Skip rate limiting for health check endpoint
-        if request.url.path == "/health_check":
+        # Skip rate limiting for health check and liveness/readiness probes
+        if request.url.path in ("/health_check", "/live", "/ready"):
             return await call_next(request)
 
         # Get client IP
@@ -0,0 +1,94 @@
+"""
+Read Consistency Middleware
+
+Provides read-your-writes stickiness when GET endpoints read from replicas.
+
+After a successful write, the client receives a short stickiness window
+(cookie and X-DB-Sticky-Until header, both a unix timestamp). While the
+window is open, the client's reads are served by the primary, so it always
+sees its own writes even if the replicas are still catching up.
+
+Clients that don't keep cookies (integrations, mobile apps) can echo the
+X-DB-Sticky-Until header on subsequent requests instead.
+"""
+import time
+import logging
+from typing import Callable
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from config.database import STICKY_WINDOW_SECONDS
+
+logger = logging.getLogger(__name__)
+
+STICKY_COOKIE = "db_sticky_until"
+STICKY_HEADER = "X-DB-Sticky-Until"
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadConsistencyMiddleware(BaseHTTPMiddleware):
+    """
+    Middleware that pins recent writers' reads to the primary database
+
+    Sets request.state.read_from_primary, which get_read_db() consults.
+
+    Example usage:
+        app.add_middleware(ReadConsistencyMiddleware, window_seconds=5)
+    """
+
+    def __init__(self, app, window_seconds: int = STICKY_WINDOW_SECONDS):
+        """
+        Initialize read consistency middleware
+
+        Args:
+            app: FastAPI application
+            window_seconds: How long after a write the client reads from the primary
+        """
+        super().__init__(app)
+        self.window_seconds = window_seconds
+
+    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+        """
+        Route reads of recent writers to the primary and open a window after writes
+
+        Args:
+            request: Incoming HTTP request
+            call_next: Next middleware/handler
+
+        Returns:
+            HTTP response (with stickiness cookie/header after writes)
+        """
+        now = time.time()
+        # Windows further out than one period weren't issued by us: ignore them
+        sticky_until = self._sticky_until(request)
+        request.state.read_from_primary = now < sticky_until <= now + self.window_seconds
+
+        response = await call_next(request)
+
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            sticky_until = f"{time.time() + self.window_seconds:.3f}"
+            response.headers[STICKY_HEADER] = sticky_until
+            response.set_cookie(
+                STICKY_COOKIE,
+                sticky_until,
+                max_age=self.window_seconds,
+                httponly=True,
+                samesite="lax",
+            )
+
+        return response
+
+    @staticmethod
+    def _sticky_until(request: Request) -> float:
+        """Get the end of the client's stickiness window (0 if none)"""
+        value = request.headers.get(STICKY_HEADER) or request.cookies.get(STICKY_COOKIE)
+        if not value:
+            return 0.0
+
+        try:
+            return float(value)
+        except ValueError:
+            logger.debug(f"Ignoring malformed {STICKY_HEADER} value: {value!r}")
+            return 0.0
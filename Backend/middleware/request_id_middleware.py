@@ -12,6 +12,8 @@ from starlette.requests import Request
 from starlette.responses import Response
 from typing import Callable
 
+from config.pool_monitor import start_request_tracking, stop_request_tracking
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +31,9 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
     - Returned in response header X-Request-ID
     - Used for tracing requests across services
 
+    The response also carries X-DB-Pool-Wait: the time the request spent
+    waiting for database connections from the pool.
+
     Example usage:
         app.add_middleware(RequestIDMiddleware)
 
@@ -61,6 +66,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
         # Log request start
         start_time = time.time()
+        pool_wait_token = start_request_tracking()
         logger.info(
             f"[{request_id}] → {request.method} {request.url.path} "
             f"(client: {request.client.host if request.client else 'unknown'})"
@@ -72,6 +78,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
             # Calculate request duration
             duration_ms = round((time.time() - start_time) * 1000, 2)
+            pool_wait_ms = round(stop_request_tracking(pool_wait_token), 2)
 
             # Log request completion
             logger.info(
@@ -84,12 +91,14 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
             # Add timing header for performance monitoring
             response.headers['X-Response-Time'] = f"{duration_ms}ms"
+            response.headers['X-DB-Pool-Wait'] = f"{pool_wait_ms}ms"
 
             return response
 
         except Exception as e:
             # Log errors with request ID
             duration_ms = round((time.time() - start_time) * 1000, 2)
+            stop_request_tracking(pool_wait_token)
             logger.error(
                 f"[{request_id}] ✗ {request.method} {request.url.path} "
                 f"- ERROR: {str(e)} ({duration_ms}ms)"
@@ -4,7 +4,7 @@ SqlAlchemy model for products.
 This module defines the ProductModel class which represents a product in the database.
 """
 
-from sqlalchemy import Column, Float, ForeignKey, Integer, String, CheckConstraint
+from sqlalchemy import Column, Float, ForeignKey, Index, Integer, String, CheckConstraint, func, literal_column
 from sqlalchemy.orm import relationship
 
 from models.base_model import BaseModel
@@ -18,6 +18,12 @@ class ProductModel(BaseModel):
     specific to products: name, price, stock, and category_id. It also defines relationships with
     CategoryModel, ReviewModel, and OrderDetailModel.
 
+    rating_count and rating_sum aggregate the product's reviews. They are
+    maintained by ReviewService in the same transaction as each review write.
+
+    stock_shards > 0 marks a hot product whose stock is split across that many
+    product_stock_shards rows; its available stock is stock plus the shards.
+
     Database constraints:
         - stock must be >= 0 (enforced at DB level)
         - price must be > 0 (enforced by Pydantic validation)
@@ -28,12 +34,17 @@ class ProductModel(BaseModel):
     # Table-level constraints
     __table_args__ = (
         CheckConstraint('stock >= 0', name='check_product_stock_non_negative'),
+        # Category listings, keyset paginated by id_key (also serves plain category_id lookups)
+        Index('ix_products_category_id_id_key', 'category_id', 'id_key'),
     )
 
     name = Column(String, index=True)
     price = Column(Float, index=True)
     stock = Column(Integer, default=0, nullable=False, index=True)  # ✅ Added index
-    category_id = Column(Integer, ForeignKey('categories.id_key'), index=True)
+    category_id = Column(Integer, ForeignKey('categories.id_key'))
+    rating_count = Column(Integer, default=0, server_default='0', nullable=False)
+    rating_sum = Column(Float, default=0.0, server_default='0', nullable=False)
+    stock_shards = Column(Integer, default=0, server_default='0', nullable=False)
 
     category = relationship(
         'CategoryModel',
@@ -52,3 +63,10 @@ class ProductModel(BaseModel):
         cascade='all, delete-orphan',
         lazy='select',
     )
+
+
+# Average rating (NULL while unrated). Queries ordering by top-rated must use
+# this exact expression so they can scan ix_products_rating_average.
+RATING_AVERAGE = ProductModel.rating_sum / func.nullif(ProductModel.rating_count, literal_column('0'), type_=Float)
+
+Index('ix_products_rating_average', RATING_AVERAGE, ProductModel.id_key)
@@ -0,0 +1,26 @@
+"""
+Stock shards for hot products
+
+A product with stock_shards = N > 0 keeps most of its stock in N
+product_stock_shards rows. Purchases decrement one shard at a time, so
+concurrent checkouts of the same product lock different rows instead of
+queueing on products.stock. The product's available stock is
+products.stock plus the sum of its shards (see
+repositories/product_repository.py).
+"""
+from sqlalchemy import CheckConstraint, Column, ForeignKey, Integer, UniqueConstraint
+
+from models.base_model import BaseModel
+
+
+class ProductStockShardModel(BaseModel):
+    __tablename__ = "product_stock_shards"
+
+    product_id = Column(Integer, ForeignKey('products.id_key', ondelete='CASCADE'), nullable=False)
+    shard = Column(Integer, nullable=False)
+    stock = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint('product_id', 'shard', name='uq_product_stock_shards_product_shard'),
+        CheckConstraint('stock >= 0', name='check_product_stock_shard_non_negative'),
+    )
@@ -0,0 +1,41 @@
+"""
+Sales rollup tables backing /reports/sales
+
+sales_daily holds one row per (day, product, payment type) with the units
+sold and revenue, so reports aggregate thousands of rollup rows instead of
+millions of order details. Order changes append a mark for their day to
+sales_rollup_dirty_days in the same transaction, and the refresher
+recomputes only those days (see repositories/sales_report_repository.py).
+"""
+from sqlalchemy import Column, Date, Enum, Float, ForeignKey, Index, Integer
+
+from models.base_model import BaseModel, base
+from models.enums import PaymentType
+
+
+class SalesDailyModel(BaseModel):
+    __tablename__ = "sales_daily"
+
+    day = Column(Date, nullable=False)
+    product_id = Column(Integer, ForeignKey('products.id_key'), nullable=False, index=True)
+    payment_type = Column(Enum(PaymentType))  # NULL for orders without a bill
+    quantity = Column(Integer, nullable=False)
+    revenue = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index('ix_sales_daily_day_product', 'day', 'product_id'),
+    )
+
+
+class SalesRollupDirtyDayModel(base):
+    """
+    A mark on a day whose sales_daily rows must be recomputed
+
+    Append-only: every write inserts its own row, so concurrent checkouts on
+    the same day never wait on a shared row. The refresher de-duplicates the
+    days and deletes only the marks it has read.
+    """
+    __tablename__ = "sales_rollup_dirty_days"
+
+    id_key = Column(Integer, primary_key=True, autoincrement=True)
+    day = Column(Date, nullable=False, index=True)
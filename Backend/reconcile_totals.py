@@ -0,0 +1,34 @@
+"""
+Batch reconciliation of order and bill totals.
+
+Order totals are maintained incrementally by order detail writes and bill
+totals by their orders (see OrderDetailService). This job recomputes both
+set-wise in SQL and reports any drift; run it from cron or after a restore.
+
+Usage:
+    python reconcile_totals.py          # report only, exit 1 on drift
+    python reconcile_totals.py --fix    # also rewrite every total
+"""
+import argparse
+import sys
+
+from services.order_service import reconcile_totals
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fix", action="store_true", help="recompute every order and bill total")
+    args = parser.parse_args()
+
+    mismatches = reconcile_totals(fix=args.fix)
+    for table, rows in mismatches.items():
+        print(f"{table}: {len(rows)} out of sync")
+        for id_key, total, expected in rows[:20]:
+            print(f"  {table}[{id_key}] total={total} expected={expected}")
+
+    drifted = any(mismatches.values())
+    return 1 if drifted and not args.fix else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,15 @@
 BaseRepository implementation with best practices and sanitized logging
 """
 import logging
-from typing import Type, List, Optional
+from functools import lru_cache
+from typing import Iterator, Type, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 
 from models.base_model import BaseModel
 from repositories.base_repository import BaseRepository
+from repositories.fieldsets import fieldset_statements, selectable_fields
+from repositories.relationship_loading import loader_options, to_schema
 from schemas.base_schema import BaseSchema
 from utils.logging_utils import log_repository_error, create_user_safe_error, get_sanitized_logger
 
@@ -19,15 +22,80 @@ class InstanceNotFoundError(Exception):
     pass
 
 
+class ModelStatements:
+    """
+    Statements for one model/schema/includes combination, built once and
+    reused on every call
+
+    Values are passed as bound parameters, so each statement object keeps
+    a single memoized cache key and SQLAlchemy's compiled cache is hit
+    without rebuilding or re-traversing the select() each time.
+
+    find is the plain lookup used by writes. find_loaded and find_all are
+    the reads: relationships raise unless listed in includes, which are
+    selectin loaded (see relationship_loading).
+
+    find_all_rows is the ORM-free read path: a Core select of just the
+    columns the schema exposes. It is only usable (projectable) when every
+    schema field is a column, i.e. the schema has no nested relationships.
+    """
+
+    def __init__(self, model: Type[BaseModel], schema: Type[BaseSchema], includes: Tuple[str, ...] = ()):
+        options = loader_options(model, includes)
+        self.find = select(model).where(model.id_key == bindparam("id_key"))
+        self.find_loaded = self.find.options(*options)
+        self.find_all = (
+            select(model)
+            .options(*options)
+            .order_by(model.id_key)
+            .offset(bindparam("skip"))
+            .limit(bindparam("limit"))
+        )
+
+        columns = [column for column in model.__table__.columns if column.key in schema.model_fields]
+        self.column_names = tuple(column.key for column in columns)
+        self.projectable = set(self.column_names) == set(schema.model_fields)
+        self.find_all_rows = (
+            select(*columns)
+            .order_by(model.id_key)
+            .offset(bindparam("skip"))
+            .limit(bindparam("limit"))
+        )
+
+
+@lru_cache(maxsize=None)
+def statements_for(
+    model: Type[BaseModel], schema: Type[BaseSchema], includes: Tuple[str, ...] = ()
+) -> ModelStatements:
+    """Prebuilt statements (one instance per model/schema/includes combination)"""
+    return ModelStatements(model, schema, includes)
+
+
+def rows_to_schemas(schema: Type[BaseSchema], column_names: tuple, rows) -> List[BaseSchema]:
+    """
+    Build schemas straight from row tuples without validation
+
+    Rows come from our own database columns, which already satisfy the
+    schema's types, so model_construct() skips the from_attributes
+    validation that dominates the cost of ORM list reads.
+    """
+    construct = schema.model_construct
+    return [construct(**dict(zip(column_names, row))) for row in rows]
+
+
 class BaseRepositoryImpl(BaseRepository):
     """
     Base Repository Implementation with proper error handling and SQLAlchemy 2.0 patterns
     """
 
+    # Relationships loaded on every read, on top of the requested includes
+    default_include: Tuple[str, ...] = ()
+
     def __init__(self, model: Type[BaseModel], schema: Type[BaseSchema], db: Session):
         self._model = model
         self._schema = schema
         self._session = db
+        self._statements = statements_for(model, schema, self.default_include)
         self.logger = get_sanitized_logger(__name__)  # P11: Sanitized logging
 
     @property
@@ -45,12 +113,22 @@ class BaseRepositoryImpl(BaseRepository):
         """Get the Pydantic schema class"""
         return self._schema
 
-    def find(self, id_key: int) -> BaseSchema:
+    def _statements_for(self, include: Tuple[str, ...]) -> ModelStatements:
+        """Statements loading the default relationships plus `include`"""
+        if not include:
+            return self._statements
+        includes = tuple(sorted(set(self.default_include) | set(include)))
+        return statements_for(self.model, self.schema, includes)
+
+    def find(self, id_key: int, include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()) -> BaseSchema:
         """
         Find a single record by ID
 
         Args:
             id_key: The primary key value
+            include: Relationship names to load (others are omitted)
+            fields: Parsed fieldset (see fieldsets.parse_fields); only these
+                columns are selected and set on the schema
 
         Returns:
             The schema instance
@@ -60,22 +138,35 @@ class BaseRepositoryImpl(BaseRepository):
         """
         try:
             # Use SQLAlchemy 2.0 style query
-            stmt = select(self.model).where(self.model.id_key == id_key)
-            model = self.session.scalars(stmt).first()
+            if fields:
+                row = self.session.execute(
+                    fieldset_statements(self.model, fields).find_row, {"id_key": id_key}
+                ).first()
+                if row is None:
+                    raise InstanceNotFoundError(
+                        f"{self.model.__name__} with id {id_key} not found"
+                    )
+                return rows_to_schemas(self.schema, fields, [row])[0]
+
+            statements = self._statements_for(include)
+            model = self.session.scalars(statements.find_loaded, {"id_key": id_key}).first()
 
             if model is None:
                 raise InstanceNotFoundError(
                     f"{self.model.__name__} with id {id_key} not found"
                 )
 
-            return self.schema.model_validate(model)
+            return to_schema(self.schema, model)
         except InstanceNotFoundError:
             raise
         except Exception as e:
             self.logger.error(f"Error finding {self.model.__name__} with id {id_key}: {e}")
             raise
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[BaseSchema]:
+    def find_all(
+        self, skip: int = 0, limit: int = 100,
+        include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()
+    ) -> List[BaseSchema]:
         """
         Find all records with pagination and input validation
 
@@ -85,6 +176,9 @@ class BaseRepositoryImpl(BaseRepository):
         Args:
             skip: Number of records to skip (must be >= 0)
             limit: Maximum number of records to return (must be 1-1000)
+            include: Relationship names to load, one query each for the
+                whole page (others are omitted)
+            fields: Parsed fieldset; only these columns are selected and set
 
         Returns:
             List of schema instances
@@ -92,7 +186,7 @@ class BaseRepositoryImpl(BaseRepository):
         Raises:
             ValueError: If pagination parameters are invalid
         """
-        from config.constants import PaginationConfig, ErrorMessages
+        from config.constants import PaginationConfig, ErrorMessages, RepositoryConfig
 
         try:
             # Validate skip parameter
@@ -113,9 +207,21 @@ class BaseRepositoryImpl(BaseRepository):
                 )
                 limit = PaginationConfig.MAX_LIMIT
 
-            stmt = select(self.model).offset(skip).limit(limit)
-            models = self.session.scalars(stmt).all()
-            return [self.schema.model_validate(model) for model in models]
+            params = {"skip": skip, "limit": limit}
+
+            if fields:
+                rows = self.session.execute(fieldset_statements(self.model, fields).find_all_rows, params)
+                return rows_to_schemas(self.schema, fields, rows)
+
+            statements = self._statements_for(include)
+
+            if RepositoryConfig.PROJECTED_READS and statements.projectable:
+                # ORM-free: no identity map, no per-row attribute validation
+                rows = self.session.execute(statements.find_all_rows, params)
+                return rows_to_schemas(self.schema, statements.column_names, rows)
+
+            models = self.session.scalars(statements.find_all, params).all()
+            return [to_schema(self.schema, model) for model in models]
 
         except ValueError:
             raise
@@ -123,6 +229,37 @@ class BaseRepositoryImpl(BaseRepository):
             self.logger.error(f"Error finding all {self.model.__name__}: {e}")
             raise
 
+    def stream_rows(self, fields: Tuple[str, ...] = ()) -> Tuple[Tuple[str, ...], Iterator[list]]:
+        """
+        Stream every record's columns from a server-side cursor
+
+        Rows are fetched ExportConfig.BATCH_SIZE at a time and never turned
+        into ORM objects or schemas, so memory stays constant however large
+        the table is. The session must stay open until the iterator is done.
+
+        Args:
+            fields: Parsed fieldset; defaults to every column of the schema
+
+        Returns:
+            The column names and an iterator of row batches (lists of tuples)
+        """
+        from config.constants import ExportConfig
+
+        columns = fields or selectable_fields(self.model, self.schema)
+        result = self.session.execute(
+            fieldset_statements(self.model, columns).stream_rows,
+            execution_options={"yield_per": ExportConfig.BATCH_SIZE},
+        )
+
+        def batches() -> Iterator[list]:
+            try:
+                for partition in result.partitions():
+                    yield partition
+            finally:
+                result.close()
+
+        return columns, batches()
+
     def save(self, model: BaseModel) -> BaseSchema:
         """
         Save a new record to the database
@@ -137,7 +274,7 @@ class BaseRepositoryImpl(BaseRepository):
             self.session.add(model)
             self.session.commit()
             self.session.refresh(model)
-            return self.schema.model_validate(model)
+            return to_schema(self.schema, model)
         except Exception as e:
             self.session.rollback()
             self.logger.error(f"Error saving {self.model.__name__}: {e}")
@@ -170,8 +307,7 @@ class BaseRepositoryImpl(BaseRepository):
         }
 
         try:
-            stmt = select(self.model).where(self.model.id_key == id_key)
-            instance = self.session.scalars(stmt).first()
+            instance = self.session.scalars(self._statements.find, {"id_key": id_key}).first()
 
             if instance is None:
                 raise InstanceNotFoundError(
@@ -225,7 +361,7 @@ class BaseRepositoryImpl(BaseRepository):
 
             self.session.commit()
             self.session.refresh(instance)
-            return self.schema.model_validate(instance)
+            return to_schema(self.schema, instance)
 
         except InstanceNotFoundError:
             raise
@@ -248,8 +384,7 @@ class BaseRepositoryImpl(BaseRepository):
             InstanceNotFoundError: If the record is not found
         """
         try:
-            stmt = select(self.model).where(self.model.id_key == id_key)
-            model = self.session.scalars(stmt).first()
+            model = self.session.scalars(self._statements.find, {"id_key": id_key}).first()
 
             if model is None:
                 raise InstanceNotFoundError(
@@ -283,7 +418,7 @@ class BaseRepositoryImpl(BaseRepository):
             for model in models:
                 self.session.refresh(model)
 
-            return [self.schema.model_validate(model) for model in models]
+            return [to_schema(self.schema, model) for model in models]
         except Exception as e:
             self.session.rollback()
             self.logger.error(f"Error saving multiple {self.model.__name__}: {e}")
@@ -1,13 +1,53 @@
 """Bill repository for database operations."""
+from typing import List
+
+from sqlalchemy import bindparam, func, select, update
 from sqlalchemy.orm import Session
 
 from models.bill import BillModel
+from models.order import OrderModel
 from repositories.base_repository_impl import BaseRepositoryImpl
+from repositories.order_repository import TOTAL_TOLERANCE
 from schemas import BillSchema
 
+# A bill's total as a fresh SUM over its orders (reconciliation only)
+ORDERS_TOTAL = (
+    select(func.coalesce(func.sum(OrderModel.total), 0.0))
+    .where(OrderModel.bill_id == BillModel.id_key)
+    .scalar_subquery()
+)
+ADD_TO_TOTAL = (
+    update(BillModel)
+    .where(BillModel.id_key == bindparam("bill_id"))
+    .values(total=func.coalesce(BillModel.total, 0.0) + bindparam("delta"))
+    .execution_options(synchronize_session=False)
+)
+
 
 class BillRepository(BaseRepositoryImpl):
     """Repository for Bill entity database operations."""
 
     def __init__(self, db: Session):
-        super().__init__(BillModel, BillSchema, db)
\ No newline at end of file
+        super().__init__(BillModel, BillSchema, db)
+
+    def add_to_total(self, bill_id: int, delta: float) -> None:
+        """Add an amount to a bill's total in place (not committed)"""
+        if not delta:
+            return
+        self.session.execute(ADD_TO_TOTAL, {"bill_id": bill_id, "delta": delta})
+
+    def total_mismatches(self) -> List:
+        """(id_key, total, expected) of bills whose total differs from their orders"""
+        expected = ORDERS_TOTAL.label("expected")
+        stmt = (
+            select(BillModel.id_key, BillModel.total, expected)
+            .where(func.abs(func.coalesce(BillModel.total, 0.0) - ORDERS_TOTAL) > TOTAL_TOLERANCE)
+            .order_by(BillModel.id_key)
+        )
+        return self.session.execute(stmt).all()
+
+    def recompute_totals(self) -> None:
+        """Set every bill's total to the sum of its orders' totals (one UPDATE, not committed)"""
+        self.session.execute(
+            update(BillModel).values(total=ORDERS_TOTAL).execution_options(synchronize_session=False)
+        )
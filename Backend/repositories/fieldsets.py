@@ -0,0 +1,78 @@
+"""
+Sparse fieldsets for repository reads
+
+?fields=id_key,name,price selects just those columns (a Core select, no
+ORM objects) and builds schemas with only those fields set, which the
+responses serialize with exclude_unset. Less is read, built and sent for
+list-heavy views that only show a few columns.
+"""
+from functools import lru_cache
+from typing import Optional, Tuple, Type
+
+from sqlalchemy import bindparam, select
+
+from models.base_model import BaseModel
+from schemas.base_schema import BaseSchema
+
+
+@lru_cache(maxsize=None)
+def selectable_fields(model: Type[BaseModel], schema: Type[BaseSchema]) -> Tuple[str, ...]:
+    """Model columns that are also schema fields, in table order"""
+    return tuple(column.key for column in model.__table__.columns if column.key in schema.model_fields)
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel], schema: Type[BaseSchema]) -> Tuple[str, ...]:
+    """
+    Parse a ?fields= value into the columns to select
+
+    Args:
+        fields: Comma separated column names (e.g. "name,price")
+        model: Model whose columns may be selected
+        schema: Schema the columns must also belong to
+
+    Returns:
+        The requested columns plus id_key, in table order (usable as a
+        cache key), or () when no fields were requested
+
+    Raises:
+        ValueError: If a name is not a column of the model and schema
+    """
+    if not fields:
+        return ()
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    allowed = selectable_fields(model, schema)
+    unknown = names - set(allowed)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(sorted(unknown))}; "
+            f"allowed: {', '.join(allowed)}"
+        )
+    names.add("id_key")
+    return tuple(name for name in allowed if name in names)
+
+
+class FieldsetStatements:
+    """Column-projected lookup, page and export statements for one fieldset"""
+
+    def __init__(self, model: Type[BaseModel], fields: Tuple[str, ...]):
+        columns = [model.__table__.c[name] for name in fields]
+        self.find_row = select(*columns).where(model.id_key == bindparam("id_key"))
+        self.find_all_rows = (
+            select(*columns)
+            .order_by(model.id_key)
+            .offset(bindparam("skip"))
+            .limit(bindparam("limit"))
+        )
+        # Whole table through a server-side cursor (see BaseRepositoryImpl.stream_rows)
+        self.stream_rows = (
+            select(*columns)
+            .order_by(model.id_key)
+            .execution_options(stream_results=True)
+        )
+
+
+# Bounded: fieldsets come from query strings
+@lru_cache(maxsize=256)
+def fieldset_statements(model: Type[BaseModel], fields: Tuple[str, ...]) -> FieldsetStatements:
+    """Prebuilt statements for a model and (parsed) fieldset"""
+    return FieldsetStatements(model, fields)
@@ -1,13 +1,163 @@
 """Order repository for database operations."""
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, bindparam, func, or_, select, update
 from sqlalchemy.orm import Session
 
+from models.bill import BillModel
 from models.order import OrderModel
+from models.order_detail import OrderDetailModel
+from models.product import ProductModel
 from repositories.base_repository_impl import BaseRepositoryImpl
 from schemas import OrderSchema
 
+# Totals tolerance: incremental float sums may differ from a fresh SUM()
+# in the last bits, never by a cent
+TOTAL_TOLERANCE = 0.005
+
+# An order's total as a fresh SUM over its details (reconciliation only)
+DETAILS_TOTAL = (
+    select(func.coalesce(func.sum(OrderDetailModel.price * OrderDetailModel.quantity), 0.0))
+    .where(OrderDetailModel.order_id == OrderModel.id_key)
+    .scalar_subquery()
+)
+ADD_TO_TOTAL = (
+    update(OrderModel)
+    .where(OrderModel.id_key == bindparam("order_id"))
+    .values(total=func.coalesce(OrderModel.total, 0.0) + bindparam("delta"))
+    .execution_options(synchronize_session=False)
+)
+ADD_TO_BILL_TOTAL = (
+    update(BillModel)
+    .where(
+        BillModel.id_key == (
+            select(OrderModel.bill_id)
+            .where(OrderModel.id_key == bindparam("order_id"))
+            .scalar_subquery()
+        )
+    )
+    .values(total=func.coalesce(BillModel.total, 0.0) + bindparam("delta"))
+    .execution_options(synchronize_session=False)
+)
+
+FIND_FOR_UPDATE = (
+    select(OrderModel)
+    .where(OrderModel.id_key == bindparam("id_key"))
+    .with_for_update()
+)
+
 
 class OrderRepository(BaseRepositoryImpl):
     """Repository for Order entity database operations."""
 
     def __init__(self, db: Session):
-        super().__init__(OrderModel, OrderSchema, db)
\ No newline at end of file
+        super().__init__(OrderModel, OrderSchema, db)
+
+    def find_for_update(self, id_key: int) -> Optional[OrderModel]:
+        """
+        Load an order row with SELECT ... FOR UPDATE
+
+        Detail writes update the order row before its bill (add_to_total), so
+        while the row is locked its total and bill_id can't change under the
+        caller.
+
+        Args:
+            id_key: Order ID
+
+        Returns:
+            The locked OrderModel, or None if it doesn't exist
+        """
+        return self.session.execute(FIND_FOR_UPDATE, {"id_key": id_key}).scalar_one_or_none()
+
+    def add_to_total(self, order_id: int, delta: float) -> None:
+        """
+        Add an amount to an order's total and its bill's total (not committed)
+
+        Two in-place UPDATE ... SET total = total + :delta statements, run
+        in the caller's transaction, so concurrent detail writes never lose
+        an amount and both totals commit with the detail.
+        """
+        if not delta:
+            return
+        params = {"order_id": order_id, "delta": delta}
+        self.session.execute(ADD_TO_TOTAL, params)
+        self.session.execute(ADD_TO_BILL_TOTAL, params)
+
+    def total_mismatches(self) -> List:
+        """(id_key, total, expected) of orders whose total differs from their details"""
+        expected = DETAILS_TOTAL.label("expected")
+        stmt = (
+            select(OrderModel.id_key, OrderModel.total, expected)
+            .where(func.abs(func.coalesce(OrderModel.total, 0.0) - DETAILS_TOTAL) > TOTAL_TOLERANCE)
+            .order_by(OrderModel.id_key)
+        )
+        return self.session.execute(stmt).all()
+
+    def recompute_totals(self) -> None:
+        """Set every order's total to the sum of its details (one UPDATE, not committed)"""
+        self.session.execute(
+            update(OrderModel).values(total=DETAILS_TOTAL).execution_options(synchronize_session=False)
+        )
+
+    def find_history(
+        self, client_id: int, limit: int, after: Optional[Tuple[Optional[datetime], int]] = None
+    ) -> List:
+        """
+        A page of a client's orders with their details and product names
+
+        One statement: the page of orders (client_id index, keyset on
+        date DESC NULLS LAST, id_key DESC) as a subquery, joined to its
+        details (order_id index) and their products. A page is `limit`
+        orders, however many details each has.
+
+        Args:
+            client_id: Client ID
+            limit: Orders per page
+            after: (date, id_key) of the previous page's last order
+
+        Returns:
+            Rows of order columns plus detail_id, product_id, product_name,
+            quantity and price (None for orders without details), in page
+            order
+        """
+        date, id_key = OrderModel.date, OrderModel.id_key
+        page = select(
+            id_key, date, OrderModel.total, OrderModel.status,
+            OrderModel.delivery_method, OrderModel.bill_id,
+        ).where(OrderModel.client_id == client_id)
+        if after is not None:
+            after_date, after_id = after
+            if after_date is None:
+                page = page.where(date.is_(None), id_key < after_id)
+            else:
+                page = page.where(or_(
+                    date < after_date,
+                    and_(date == after_date, id_key < after_id),
+                    date.is_(None),
+                ))
+        page = page.order_by(date.desc().nulls_last(), id_key.desc()).limit(limit).subquery()
+
+        stmt = (
+            select(
+                page,
+                OrderDetailModel.id_key.label("detail_id"),
+                OrderDetailModel.product_id,
+                ProductModel.name.label("product_name"),
+                OrderDetailModel.quantity,
+                OrderDetailModel.price,
+            )
+            .outerjoin(OrderDetailModel, OrderDetailModel.order_id == page.c.id_key)
+            .outerjoin(ProductModel, ProductModel.id_key == OrderDetailModel.product_id)
+            .order_by(page.c.date.desc().nulls_last(), page.c.id_key.desc(), OrderDetailModel.id_key)
+        )
+        return self.session.execute(stmt).all()
+
+    def client_ids(self, order_ids: Iterable[int]) -> Set[int]:
+        """Clients owning the given orders"""
+        order_ids = {order_id for order_id in order_ids if order_id is not None}
+        if not order_ids:
+            return set()
+        return set(self.session.scalars(
+            select(OrderModel.client_id).where(OrderModel.id_key.in_(order_ids))
+        ).all())
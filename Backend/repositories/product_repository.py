@@ -1,27 +1,165 @@
 """Product repository for database operations."""
-from typing import List
+import random
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, func, select, update
 
-from models.product import ProductModel
-from repositories.base_repository_impl import BaseRepositoryImpl
-from schemas import ProductSchema
+from models.category import CategoryModel
+from models.product import RATING_AVERAGE, ProductModel
+from models.product_stock_shard import ProductStockShardModel
+from repositories.base_repository_impl import BaseRepositoryImpl, InstanceNotFoundError
+from repositories.relationship_loading import to_schema
+from schemas import CategorySchema, ProductSchema
+
+# Built once (see ModelStatements): product list with its category (as ORM
+# objects and as a flat column projection), the top-rated list, the
+# row-locking lookup used for stock changes, the rating increment, the
+# guarded stock decrement used by reservation checkouts, a category's page
+# (keyset on ix_products_category_id_id_key) and the stock shard statements
+# (see models/product_stock_shard.py)
+FIND_ALL_WITH_CATEGORY = (
+    select(ProductModel)
+    .options(joinedload(ProductModel.category))
+    .order_by(ProductModel.id_key)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+PRODUCT_COLUMNS = ("id_key", "name", "price", "stock", "category_id", "rating_count", "rating_sum", "stock_shards")
+FIND_ALL_ROWS_WITH_CATEGORY = (
+    select(
+        *(ProductModel.__table__.c[name] for name in PRODUCT_COLUMNS),
+        CategoryModel.name.label("category_name"),
+    )
+    .outerjoin(CategoryModel, ProductModel.category_id == CategoryModel.id_key)
+    .order_by(ProductModel.id_key)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+FIND_TOP_RATED = (
+    select(ProductModel)
+    .options(joinedload(ProductModel.category))
+    .where(ProductModel.rating_count >= bindparam("min_reviews"))
+    # Same expression and direction as ix_products_rating_average
+    .order_by(RATING_AVERAGE.desc(), ProductModel.id_key.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+FIND_BY_CATEGORY = (
+    select(ProductModel)
+    .where(ProductModel.category_id == bindparam("category_id"), ProductModel.id_key > bindparam("after"))
+    .order_by(ProductModel.id_key)
+    .limit(bindparam("limit"))
+)
+CATEGORY_IDS = select(ProductModel.category_id).where(
+    ProductModel.id_key.in_(bindparam("product_ids", expanding=True))
+)
+FIND_FOR_UPDATE = (
+    select(ProductModel)
+    .where(ProductModel.id_key == bindparam("id_key"))
+    .with_for_update()
+)
+FIND_UNSHARDED_FOR_UPDATE = FIND_FOR_UPDATE.where(ProductModel.stock_shards == 0)
+ADD_RATING = (
+    update(ProductModel)
+    .where(ProductModel.id_key == bindparam("product_id"))
+    .values(
+        rating_count=ProductModel.rating_count + bindparam("count_delta"),
+        rating_sum=ProductModel.rating_sum + bindparam("sum_delta"),
+    )
+    .execution_options(synchronize_session=False)
+)
+TAKE_STOCK = (
+    update(ProductModel)
+    .where(
+        ProductModel.id_key == bindparam("product_id"),
+        ProductModel.stock_shards == 0,
+        ProductModel.stock >= bindparam("quantity"),
+    )
+    .values(stock=ProductModel.stock - bindparam("quantity"))
+    .returning(ProductModel.price)
+    .execution_options(synchronize_session=False)
+)
+FIND_SHARDED = select(ProductModel.price, ProductModel.stock_shards).where(
+    ProductModel.id_key == bindparam("product_id"), ProductModel.stock_shards > 0
+)
+SHARD_STOCK = (
+    select(ProductStockShardModel.product_id, func.sum(ProductStockShardModel.stock))
+    .where(ProductStockShardModel.product_id.in_(bindparam("product_ids", expanding=True)))
+    .group_by(ProductStockShardModel.product_id)
+)
+# A shard with enough units, starting at a random shard and wrapping around
+# (unique (product_id, shard) index). The first attempt skips shards other
+# transactions hold; the second waits for one.
+PICK_SHARD = (
+    select(ProductStockShardModel.id_key)
+    .where(
+        ProductStockShardModel.product_id == bindparam("product_id"),
+        ProductStockShardModel.stock >= bindparam("quantity"),
+    )
+    .order_by(ProductStockShardModel.shard < bindparam("start"), ProductStockShardModel.shard)
+    .limit(1)
+)
+PICK_UNLOCKED_SHARD = PICK_SHARD.with_for_update(skip_locked=True)
+PICK_SHARD = PICK_SHARD.with_for_update()
+TAKE_FROM_SHARD = (
+    update(ProductStockShardModel)
+    .where(ProductStockShardModel.id_key == bindparam("shard_id"))
+    .values(stock=ProductStockShardModel.stock - bindparam("quantity"))
+    .execution_options(synchronize_session=False)
+)
+LOCK_SHARDS = (
+    select(ProductStockShardModel)
+    .where(ProductStockShardModel.product_id == bindparam("product_id"))
+    .order_by(ProductStockShardModel.shard)
+    .with_for_update()
+    # Shards taken from with TAKE_FROM_SHARD earlier in the transaction
+    .execution_options(populate_existing=True)
+)
+# Products' available stock: the row's stock plus, if sharded, its shards
+AVAILABLE_STOCK = ProductModel.stock + case(
+    (
+        ProductModel.stock_shards > 0,
+        select(func.coalesce(func.sum(ProductStockShardModel.stock), 0))
+        .where(ProductStockShardModel.product_id == ProductModel.id_key)
+        .scalar_subquery(),
+    ),
+    else_=0,
+)
 
 
 class ProductRepository(BaseRepositoryImpl):
     """Repository for Product entity database operations."""
 
+    # Products are always returned with their category
+    default_include = ("category",)
+
     def __init__(self, db: Session):
         super().__init__(ProductModel, ProductSchema, db)
 
-    def find_all(self, skip: int = 0, limit: int = 100) -> List[ProductSchema]:
+    def find(self, id_key: int, include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()) -> ProductSchema:
+        """Find a product by ID (stock includes its shards)"""
+        return self._add_shard_stock([super().find(id_key, include, fields)])[0]
+
+    def find_all(
+        self, skip: int = 0, limit: int = 100,
+        include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()
+    ) -> List[ProductSchema]:
         """
         Find all products with pagination and eagerly load categories.
 
         Overrides base method to implement eager loading for the 'category'
         relationship to prevent lazy loading issues during serialization.
+        The category is the schema's only relationship, so `include` adds
+        nothing here. A sparse fieldset leaves the category out and uses the
+        base column projection. Stock includes the shards of sharded products.
         """
-        from config.constants import PaginationConfig
+        return self._add_shard_stock(self._find_all(skip, limit, fields))
+
+    def _find_all(self, skip: int, limit: int, fields: Tuple[str, ...]) -> List[ProductSchema]:
+        if fields:
+            return super().find_all(skip=skip, limit=limit, fields=fields)
+
+        from config.constants import PaginationConfig, RepositoryConfig
 
         # Basic input validation from base class
         if skip < 0:
@@ -33,13 +171,254 @@ class ProductRepository(BaseRepositoryImpl):
         if limit > PaginationConfig.MAX_LIMIT:
             limit = PaginationConfig.MAX_LIMIT
 
+        params = {"skip": skip, "limit": limit}
+
+        if RepositoryConfig.PROJECTED_READS:
+            # One joined row per product, built into schemas without the ORM
+            construct_product = ProductSchema.model_construct
+            construct_category = CategorySchema.model_construct
+            products = []
+            for *values, category_name in self.session.execute(FIND_ALL_ROWS_WITH_CATEGORY, params):
+                fields = dict(zip(PRODUCT_COLUMNS, values))
+                category = None
+                if category_name is not None:
+                    category = construct_category(id_key=fields["category_id"], name=category_name)
+                products.append(construct_product(**fields, category=category))
+            return products
+
         # Eager load the 'category' relationship using joinedload
-        stmt = (
-            select(self.model)
-            .options(joinedload(self.model.category))
-            .offset(skip)
-            .limit(limit)
+        models = self.session.scalars(FIND_ALL_WITH_CATEGORY, params).unique().all()
+        return [self.schema.model_validate(model) for model in models]
+
+    def update(self, id_key: int, changes: dict) -> ProductSchema:
+        """
+        Update a product (see BaseRepositoryImpl.update)
+
+        A new stock for a sharded product is its total: it is spread evenly
+        over the product's shards.
+        """
+        changes = dict(changes)
+        if changes.get("stock") is not None:
+            product = self.find_for_update(id_key)
+            if product is not None and product.stock_shards:
+                self.shard_stock(id_key, product.stock_shards, total=changes.pop("stock"))
+        return self._add_shard_stock([super().update(id_key, changes)])[0]
+
+    def _add_shard_stock(self, products: List[ProductSchema]) -> List[ProductSchema]:
+        """
+        Add the shards of sharded products to their stock (one query, only
+        if the page holds a sharded product or doesn't select stock_shards)
+        """
+        product_ids = [
+            product.id_key for product in products
+            if "stock" in product.model_fields_set
+            and (product.stock_shards or "stock_shards" not in product.model_fields_set)
+        ]
+        if product_ids:
+            shard_stock = dict(self.session.execute(SHARD_STOCK, {"product_ids": product_ids}).all())
+            for product in products:
+                if product.id_key in shard_stock:
+                    product.stock += shard_stock[product.id_key]
+        return products
+
+    def find_for_update(self, id_key: int) -> Optional[ProductModel]:
+        """
+        Load a product row with SELECT ... FOR UPDATE
+
+        The row stays locked until the session's transaction ends, so stock
+        checks and changes made on the returned model are race-free.
+
+        Args:
+            id_key: Product ID
+
+        Returns:
+            The locked ProductModel, or None if it doesn't exist
+        """
+        return self.session.execute(FIND_FOR_UPDATE, {"id_key": id_key}).scalar_one_or_none()
+
+    def find_for_purchase(self, id_key: int) -> Optional[ProductModel]:
+        """
+        Load a product to buy from: locked with SELECT ... FOR UPDATE unless
+        it is sharded (take_sharded_stock then locks one shard instead)
+
+        Returns:
+            The ProductModel, or None if it doesn't exist
+        """
+        product = self.session.execute(FIND_UNSHARDED_FOR_UPDATE, {"id_key": id_key}).scalar_one_or_none()
+        if product is None:
+            product = self.session.get(ProductModel, id_key)
+        return product
+
+    def available_stock(self, product_id: int) -> int:
+        """A product's stock including its shards (0 if it doesn't exist)"""
+        return self.session.execute(
+            select(AVAILABLE_STOCK).where(ProductModel.id_key == product_id)
+        ).scalar() or 0
+
+    def take_sharded_stock(self, product_id: int, quantity: int, shards: int) -> bool:
+        """
+        Take units from a sharded product (not committed)
+
+        Decrements one shard holding enough units, starting at a random one
+        and skipping shards other transactions hold, so concurrent purchases
+        of the product lock different rows. Only when no single shard has
+        enough does it lock the product row and all its shards and take the
+        units across them.
+
+        Returns:
+            False if the product has fewer units left
+        """
+        params = {"product_id": product_id, "quantity": quantity, "start": random.randrange(shards)}
+        for pick in (PICK_UNLOCKED_SHARD, PICK_SHARD):
+            shard_id = self.session.execute(pick, params).scalar()
+            if shard_id is not None:
+                self.session.execute(TAKE_FROM_SHARD, {"shard_id": shard_id, "quantity": quantity})
+                return True
+
+        self.session.flush()
+        product = self.find_for_update(product_id)
+        rows = self.session.scalars(LOCK_SHARDS, {"product_id": product_id}).all()
+        if product is None or product.stock + sum(row.stock for row in rows) < quantity:
+            return False
+        left = quantity
+        for row in sorted(rows, key=lambda row: row.stock, reverse=True):
+            taken = min(row.stock, left)
+            row.stock -= taken
+            left -= taken
+        product.stock -= left
+        return True
+
+    def shard_stock(self, product_id: int, shards: int, total: Optional[int] = None) -> ProductModel:
+        """
+        Split a product's stock evenly over `shards` shard rows (0 merges it
+        back into the product row). Not committed.
+
+        Args:
+            total: New total stock (default: the current one)
+
+        Raises:
+            InstanceNotFoundError: If the product doesn't exist
+        """
+        product = self.find_for_update(product_id)
+        if product is None:
+            raise InstanceNotFoundError(f"ProductModel with id {product_id} not found")
+        rows = self.session.scalars(LOCK_SHARDS, {"product_id": product_id}).all()
+        if total is None:
+            total = product.stock + sum(row.stock for row in rows)
+        for row in rows:
+            self.session.delete(row)
+        self.session.flush()
+
+        per_shard, extra = divmod(total, shards) if shards else (0, 0)
+        self.session.add_all([
+            ProductStockShardModel(product_id=product_id, shard=shard, stock=per_shard + (shard < extra))
+            for shard in range(shards)
+        ])
+        product.stock = 0 if shards else total
+        product.stock_shards = shards
+        return product
+
+    def find_top_rated(self, skip: int = 0, limit: int = 100, min_reviews: int = 1) -> List[ProductSchema]:
+        """
+        Find products by average rating, best first, with their category
+
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            min_reviews: Only products with at least this many reviews (>= 1)
+
+        Returns:
+            List of product schemas
+        """
+        from config.constants import PaginationConfig
+
+        params = {
+            "skip": max(skip, 0),
+            "limit": min(max(limit, PaginationConfig.MIN_LIMIT), PaginationConfig.MAX_LIMIT),
+            "min_reviews": max(min_reviews, 1),
+        }
+        models = self.session.scalars(FIND_TOP_RATED, params).unique().all()
+        return self._add_shard_stock([self.schema.model_validate(model) for model in models])
+
+    def find_by_category(self, category_id: int, limit: int, after: int = 0) -> List[ProductSchema]:
+        """
+        A page of a category's products, by id_key (without the category)
+
+        Keyset paginated: one range scan of ix_products_category_id_id_key,
+        however deep the page.
+
+        Args:
+            category_id: Category ID
+            limit: Products per page
+            after: id_key of the previous page's last product
+        """
+        models = self.session.scalars(
+            FIND_BY_CATEGORY, {"category_id": category_id, "after": after, "limit": limit}
+        ).all()
+        return self._add_shard_stock([to_schema(self.schema, model) for model in models])
+
+    def category_ids(self, product_ids: Iterable[int]) -> Set[int]:
+        """Categories of the given products"""
+        product_ids = list(set(product_ids))
+        if not product_ids:
+            return set()
+        return set(self.session.scalars(CATEGORY_IDS, {"product_ids": product_ids}).all())
+
+    def add_rating(self, product_id: int, count_delta: int, sum_delta: float) -> bool:
+        """
+        Adjust a product's rating aggregates in place (not committed)
+
+        A single UPDATE ... SET rating_count = rating_count + :delta, so
+        concurrent review writes never lose an increment. It runs in the
+        caller's transaction, which commits it with the review.
+
+        Returns:
+            False if the product doesn't exist
+        """
+        result = self.session.execute(
+            ADD_RATING,
+            {"product_id": product_id, "count_delta": count_delta, "sum_delta": sum_delta},
         )
-        
-        models = self.session.scalars(stmt).unique().all()
-        return [self.schema.model_validate(model) for model in models]
\ No newline at end of file
+        return result.rowcount > 0
+
+    def take_stock(self, product_id: int, quantity: int) -> Optional[float]:
+        """
+        Decrement a product's stock if enough is left (not committed)
+
+        A single guarded UPDATE ... WHERE stock >= :quantity RETURNING price:
+        no SELECT ... FOR UPDATE round trip, the row stays locked only until
+        the caller's transaction ends.
+
+        Sharded products take from a shard instead (see take_sharded_stock).
+
+        Returns:
+            The product's price, or None if it doesn't exist or lacks stock
+        """
+        price = self.session.execute(
+            TAKE_STOCK, {"product_id": product_id, "quantity": quantity}
+        ).scalar_one_or_none()
+        if price is None:
+            sharded = self.session.execute(FIND_SHARDED, {"product_id": product_id}).first()
+            if sharded is not None and self.take_sharded_stock(product_id, quantity, sharded.stock_shards):
+                price = sharded.price
+        return price
+
+    def stock_levels(self, product_ids: Optional[List[int]] = None, batch_size: int = 1000) -> Iterator[Dict[int, int]]:
+        """
+        Available stock (shards included) by product id, in batches of
+        `batch_size` products (keyset on id)
+
+        Args:
+            product_ids: Only these products (default: all)
+        """
+        stmt = select(ProductModel.id_key, AVAILABLE_STOCK.label("stock")).order_by(ProductModel.id_key).limit(batch_size)
+        if product_ids is not None:
+            stmt = stmt.where(ProductModel.id_key.in_(product_ids))
+        last_id = None
+        while True:
+            page = stmt if last_id is None else stmt.where(ProductModel.id_key > last_id)
+            rows = self.session.execute(page).all()
+            if not rows:
+                return
+            yield {row.id_key: row.stock for row in rows}
+            last_id = rows[-1].id_key
@@ -0,0 +1,104 @@
+"""
+Relationship loading for repository reads
+
+Read statements load no relationships by default (raiseload), so building
+a schema can never fire one lazy SELECT per row. Callers opt in with
+?include=name,... which maps each name to a selectinload: one extra query
+per relationship per 500 rows of the page (selectinload's IN batch size),
+instead of one per row.
+
+Schemas are built from the loaded state only: a relationship that was not
+loaded is left unset on the schema and omitted from the response.
+"""
+import typing
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import raiseload, selectinload
+
+from models.base_model import BaseModel
+from schemas.base_schema import BaseSchema
+
+
+def _nested_schema(annotation) -> Optional[Type[BaseSchema]]:
+    """The BaseSchema inside an annotation like Optional[List[XSchema]], if any"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseSchema):
+        return annotation
+    for arg in typing.get_args(annotation):
+        nested = _nested_schema(arg)
+        if nested is not None:
+            return nested
+    return None
+
+
+@lru_cache(maxsize=None)
+def relationship_fields(schema: Type[BaseSchema]) -> Dict[str, Type[BaseSchema]]:
+    """Schema fields that hold nested schemas, mapped to the nested schema"""
+    fields = {}
+    for name, field in schema.model_fields.items():
+        nested = _nested_schema(field.annotation)
+        if nested is not None:
+            fields[name] = nested
+    return fields
+
+
+def parse_include(include: Optional[str], schema: Type[BaseSchema]) -> Tuple[str, ...]:
+    """
+    Parse an ?include= value into a sorted tuple of relationship names
+
+    Args:
+        include: Comma separated relationship names (e.g. "addresses,orders")
+        schema: Schema whose relationship fields may be included
+
+    Returns:
+        Sorted, de-duplicated names (usable as a cache key)
+
+    Raises:
+        ValueError: If a name is not a relationship of the schema
+    """
+    if not include:
+        return ()
+    names = {name.strip() for name in include.split(",") if name.strip()}
+    allowed = relationship_fields(schema)
+    unknown = names - set(allowed)
+    if unknown:
+        raise ValueError(
+            f"Cannot include {', '.join(sorted(unknown))}; "
+            f"allowed: {', '.join(sorted(allowed)) or 'none'}"
+        )
+    return tuple(sorted(names))
+
+
+def loader_options(model: Type[BaseModel], includes: Tuple[str, ...]) -> list:
+    """Raise on any relationship access except the included ones (selectin loaded)"""
+    return [raiseload("*")] + [selectinload(getattr(model, name)) for name in includes]
+
+
+def to_schema(schema: Type[BaseSchema], instance: BaseModel) -> BaseSchema:
+    """
+    Build a schema from an ORM instance without triggering any loads
+
+    Column fields are read as usual; relationship fields are only read when
+    already loaded (recursively), otherwise left unset so serializers using
+    exclude_unset omit them.
+    """
+    relationships = relationship_fields(schema)
+    if not relationships:
+        return schema.model_validate(instance)
+
+    unloaded = inspect(instance).unloaded
+    data = {}
+    for name in schema.model_fields:
+        if name not in relationships:
+            data[name] = getattr(instance, name)
+        elif name not in unloaded:
+            value = getattr(instance, name)
+            nested = relationships[name]
+            if value is None:
+                data[name] = None
+            elif isinstance(value, (list, tuple, set)):
+                data[name] = [to_schema(nested, item) for item in value]
+            else:
+                data[name] = to_schema(nested, value)
+    return schema.model_validate(data)
@@ -1,12 +1,48 @@
 """Review repository for database operations."""
+from typing import List
+
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
 from models.review import ReviewModel
 from repositories.base_repository_impl import BaseRepositoryImpl
+from repositories.relationship_loading import to_schema
 from schemas import ReviewSchema
 
+# A product's reviews, newest first (uses the reviews.product_id index)
+FIND_BY_PRODUCT = (
+    select(ReviewModel)
+    .where(ReviewModel.product_id == bindparam("product_id"))
+    .order_by(ReviewModel.id_key.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+
+
 class ReviewRepository(BaseRepositoryImpl):
     """Repository for Review entity database operations."""
 
     def __init__(self, db: Session):
-        super().__init__(ReviewModel, ReviewSchema, db)
\ No newline at end of file
+        super().__init__(ReviewModel, ReviewSchema, db)
+
+    def find_by_product(self, product_id: int, skip: int = 0, limit: int = 100) -> List[ReviewSchema]:
+        """
+        Find a product's reviews with pagination, newest first
+
+        Args:
+            product_id: Product ID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of review schemas (without the product)
+        """
+        from config.constants import PaginationConfig
+
+        params = {
+            "product_id": product_id,
+            "skip": max(skip, 0),
+            "limit": min(max(limit, PaginationConfig.MIN_LIMIT), PaginationConfig.MAX_LIMIT),
+        }
+        rows = self.session.scalars(FIND_BY_PRODUCT, params).all()
+        return [to_schema(self.schema, row) for row in rows]
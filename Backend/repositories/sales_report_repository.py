@@ -0,0 +1,230 @@
+"""Sales rollup maintenance and report queries."""
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Date, delete, distinct, func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from models.bill import BillModel
+from models.category import CategoryModel
+from models.enums import Status
+from models.order import OrderModel
+from models.order_detail import OrderDetailModel
+from models.product import ProductModel
+from models.sales_rollup import SalesDailyModel, SalesRollupDirtyDayModel
+
+# pg_try_advisory_xact_lock key serializing rollup refreshes across workers
+REFRESH_LOCK_KEY = 40_001
+# Marks deleted per statement after a refresh (bind parameter limits)
+MARK_DELETE_BATCH = 1000
+
+
+def _day(value) -> Optional[date]:
+    """Calendar day of an order date (datetime, date or None)"""
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+class SalesReportRepository:
+    """
+    Repository for the sales_daily rollup
+
+    Writers append marks for the days they touch (mark_days / mark_orders)
+    inside their own transaction; refresh() later recomputes only those
+    days from order_details, orders and bills.
+    """
+
+    def __init__(self, db: Session):
+        self._session = db
+
+    @property
+    def session(self) -> Session:
+        return self._session
+
+    # ------------------------------------------------------------------
+    # Dirty-day marks
+    # ------------------------------------------------------------------
+
+    def mark_days(self, days: Iterable) -> None:
+        """
+        Mark days for recomputation (not committed: part of the caller's transaction)
+
+        A plain INSERT of new rows: writers never lock an existing mark, nor
+        wait on a refresh.
+
+        Args:
+            days: Dates or datetimes; None values are ignored
+        """
+        days = {_day(day) for day in days} - {None}
+        if days:
+            self.session.execute(insert(SalesRollupDirtyDayModel), [{"day": day} for day in sorted(days)])
+
+    def mark_orders(self, order_ids: Iterable[int]) -> None:
+        """Mark the days of the given orders"""
+        order_ids = {order_id for order_id in order_ids if order_id is not None}
+        if not order_ids:
+            return
+        dates = self.session.scalars(
+            select(OrderModel.date).where(OrderModel.id_key.in_(order_ids))
+        ).all()
+        self.mark_days(dates)
+
+    def mark_bill(self, bill_id: int) -> None:
+        """Mark the days of the orders paid with a bill"""
+        dates = self.session.scalars(
+            select(OrderModel.date).where(OrderModel.bill_id == bill_id)
+        ).all()
+        self.mark_days(dates)
+
+    def pending_days(self) -> int:
+        """Number of days waiting for a refresh"""
+        return self.session.scalar(select(func.count(distinct(SalesRollupDirtyDayModel.day))))
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self, max_days: int) -> int:
+        """
+        Recompute the rollup for up to `max_days` dirty days and commit
+
+        One refresh runs at a time (a transaction-level advisory lock on
+        PostgreSQL; a refresher that doesn't get it returns 0). Only the
+        marks read here are deleted, so marks made while the refresh runs
+        survive it.
+
+        Returns:
+            Number of days recomputed
+        """
+        if self.session.get_bind().dialect.name == "postgresql" and not self.session.scalar(
+            select(func.pg_try_advisory_xact_lock(REFRESH_LOCK_KEY))
+        ):
+            self.session.rollback()
+            return 0
+
+        days = self.session.scalars(
+            select(SalesRollupDirtyDayModel.day).distinct().order_by(SalesRollupDirtyDayModel.day).limit(max_days)
+        ).all()
+        if not days:
+            self.session.rollback()
+            return 0
+        mark_ids = self.session.scalars(
+            select(SalesRollupDirtyDayModel.id_key).where(SalesRollupDirtyDayModel.day.in_(days))
+        ).all()
+
+        try:
+            self.session.execute(delete(SalesDailyModel).where(SalesDailyModel.day.in_(days)))
+
+            day = func.date(OrderModel.date, type_=Date)
+            aggregate = (
+                select(
+                    day,
+                    OrderDetailModel.product_id,
+                    BillModel.payment_type,
+                    func.sum(OrderDetailModel.quantity),
+                    func.sum(OrderDetailModel.quantity * OrderDetailModel.price),
+                )
+                .join(OrderModel, OrderDetailModel.order_id == OrderModel.id_key)
+                .outerjoin(BillModel, OrderModel.bill_id == BillModel.id_key)
+                .where(
+                    # Range on the indexed column first, then the exact days
+                    OrderModel.date >= datetime.combine(min(days), time.min),
+                    OrderModel.date < datetime.combine(max(days) + timedelta(days=1), time.min),
+                    day.in_(days),
+                    or_(OrderModel.status.is_(None), OrderModel.status != Status.CANCELED),
+                    OrderDetailModel.product_id.is_not(None),
+                )
+                .group_by(day, OrderDetailModel.product_id, BillModel.payment_type)
+            )
+            self.session.execute(
+                insert(SalesDailyModel).from_select(
+                    ["day", "product_id", "payment_type", "quantity", "revenue"], aggregate
+                )
+            )
+
+            for start in range(0, len(mark_ids), MARK_DELETE_BATCH):
+                self.session.execute(
+                    delete(SalesRollupDirtyDayModel).where(
+                        SalesRollupDirtyDayModel.id_key.in_(mark_ids[start:start + MARK_DELETE_BATCH])
+                    )
+                )
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
+        return len(days)
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _in_range(stmt, start: Optional[date], end: Optional[date]):
+        if start is not None:
+            stmt = stmt.where(SalesDailyModel.day >= start)
+        if end is not None:
+            stmt = stmt.where(SalesDailyModel.day <= end)
+        return stmt
+
+    def by_product(self, start: Optional[date], end: Optional[date], limit: int) -> List:
+        """(product_id, product_name, quantity, revenue), best sellers first"""
+        revenue = func.sum(SalesDailyModel.revenue)
+        stmt = (
+            select(
+                SalesDailyModel.product_id,
+                ProductModel.name.label("product_name"),
+                func.sum(SalesDailyModel.quantity).label("quantity"),
+                revenue.label("revenue"),
+            )
+            .join(ProductModel, SalesDailyModel.product_id == ProductModel.id_key)
+            .group_by(SalesDailyModel.product_id, ProductModel.name)
+            .order_by(revenue.desc())
+            .limit(limit)
+        )
+        return self.session.execute(self._in_range(stmt, start, end)).all()
+
+    def by_category(self, start: Optional[date], end: Optional[date], limit: int) -> List:
+        """(category_id, category_name, quantity, revenue), best sellers first"""
+        revenue = func.sum(SalesDailyModel.revenue)
+        stmt = (
+            select(
+                ProductModel.category_id,
+                CategoryModel.name.label("category_name"),
+                func.sum(SalesDailyModel.quantity).label("quantity"),
+                revenue.label("revenue"),
+            )
+            .join(ProductModel, SalesDailyModel.product_id == ProductModel.id_key)
+            .outerjoin(CategoryModel, ProductModel.category_id == CategoryModel.id_key)
+            .group_by(ProductModel.category_id, CategoryModel.name)
+            .order_by(revenue.desc())
+            .limit(limit)
+        )
+        return self.session.execute(self._in_range(stmt, start, end)).all()
+
+    def by_day(self, start: Optional[date], end: Optional[date]) -> List:
+        """(day, quantity, revenue), oldest first"""
+        stmt = (
+            select(
+                SalesDailyModel.day,
+                func.sum(SalesDailyModel.quantity).label("quantity"),
+                func.sum(SalesDailyModel.revenue).label("revenue"),
+            )
+            .group_by(SalesDailyModel.day)
+            .order_by(SalesDailyModel.day)
+        )
+        return self.session.execute(self._in_range(stmt, start, end)).all()
+
+    def by_payment_type(self, start: Optional[date], end: Optional[date]) -> List:
+        """(payment_type, quantity, revenue), highest revenue first"""
+        revenue = func.sum(SalesDailyModel.revenue)
+        stmt = (
+            select(
+                SalesDailyModel.payment_type,
+                func.sum(SalesDailyModel.quantity).label("quantity"),
+                revenue.label("revenue"),
+            )
+            .group_by(SalesDailyModel.payment_type)
+            .order_by(revenue.desc())
+        )
+        return self.session.execute(self._in_range(stmt, start, end)).all()
@@ -0,0 +1,129 @@
+"""
+Write Batcher Module
+
+Group commit for append-mostly entities. Concurrent inserts of one model
+are collected for up to WriteBatchConfig.MAX_DELAY_MS (or MAX_ROWS rows)
+and written as one multi-row INSERT ... RETURNING in one transaction, so
+a burst of N creates pays one commit (and one WAL flush) instead of N.
+
+There is no background thread: the first caller of a batch is its leader.
+It waits for the batch to fill or time out, flushes it on its own thread,
+and resolves every caller's future with its created row.
+"""
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from config.constants import WriteBatchConfig
+from models.base_model import BaseModel
+from repositories.relationship_loading import to_schema
+from schemas.base_schema import BaseSchema
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
+
+
+class WriteBatcher:
+    """
+    Per-worker insert batcher for one model
+
+    Args:
+        model: Model whose rows are inserted
+        schema: Schema the created rows are returned as
+        before_commit: Called with the session and the batch's column values
+            after the INSERT, in the same transaction (e.g. to maintain
+            aggregates). If it raises, the batch is retried row by row.
+
+    Example:
+        review_batcher = WriteBatcher(ReviewModel, ReviewSchema)
+        review = review_batcher.insert(schema)  # Blocks until committed
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        schema: Type[BaseSchema],
+        before_commit: Optional[Callable[[Session, List[dict]], None]] = None,
+        max_rows: int = WriteBatchConfig.MAX_ROWS,
+        max_delay_ms: float = WriteBatchConfig.MAX_DELAY_MS,
+    ):
+        self.model = model
+        self.schema = schema
+        self.before_commit = before_commit
+        self.max_rows = max_rows
+        self.max_delay = max_delay_ms / 1000
+        self.columns = {column.name for column in model.__table__.columns} - {"id_key"}
+        self._pending: List[Tuple[dict, Future]] = []
+        self._filled = threading.Condition()
+
+    def insert(self, schema: BaseSchema) -> BaseSchema:
+        """
+        Insert a row with the next batch and wait for it to commit
+
+        Returns:
+            The created row
+
+        Raises:
+            Whatever inserting this row alone raises (a failed batch is
+            retried row by row, so other callers' errors never surface here)
+        """
+        future = Future()
+        values = schema.model_dump(exclude_unset=True, include=self.columns)
+        with self._filled:
+            self._pending.append((values, future))
+            leader = len(self._pending) == 1
+            if len(self._pending) >= self.max_rows:
+                self._filled.notify()
+            if leader:
+                self._filled.wait_for(lambda: len(self._pending) >= self.max_rows, timeout=self.max_delay)
+                batch, self._pending = self._pending, []
+        if leader:
+            self._flush(batch)
+        return future.result()
+
+    def _flush(self, batch: List[Tuple[dict, Future]]) -> None:
+        """Write a batch in one transaction and resolve its futures"""
+        from config.database import SessionLocal
+
+        try:
+            with SessionLocal() as session:
+                created = self._insert(session, [values for values, _ in batch])
+                session.commit()
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][1].set_exception(e)
+                return
+            logger.warning(
+                f"Batch insert of {len(batch)} {self.model.__name__} rows failed, retrying row by row: {e}"
+            )
+            for item in batch:
+                self._flush([item])
+            return
+
+        for (_, future), row in zip(batch, created):
+            future.set_result(row)
+
+    def _insert(self, session: Session, rows: List[dict]) -> List[BaseSchema]:
+        """
+        Multi-row INSERT ... RETURNING, one statement per distinct set of
+        columns given (rows leaving optional fields unset differ)
+        """
+        groups: Dict[frozenset, List[int]] = {}
+        for index, values in enumerate(rows):
+            groups.setdefault(frozenset(values), []).append(index)
+
+        created: List[Optional[BaseSchema]] = [None] * len(rows)
+        for indexes in groups.values():
+            models = session.scalars(
+                insert(self.model).returning(self.model, sort_by_parameter_order=True),
+                [rows[index] for index in indexes],
+            ).all()
+            for index, model in zip(indexes, models):
+                created[index] = to_schema(self.schema, model)
+
+        if self.before_commit is not None:
+            self.before_commit(session, rows)
+        return created
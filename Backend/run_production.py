@@ -7,7 +7,8 @@ import multiprocessing
 import os
 
 import uvicorn
-from config.database import create_tables
+from config.database_url import resolve_database_uri
+from config.pool_capacity import plan_pool_capacity
 
 # Calculate optimal workers based on CPU cores
 # Formula: (2 x $num_cores) + 1
@@ -28,6 +29,15 @@ LIMIT_CONCURRENCY = int(os.getenv('LIMIT_CONCURRENCY', '1000'))
 LIMIT_MAX_REQUESTS = int(os.getenv('LIMIT_MAX_REQUESTS', '10000'))
 
 if __name__ == "__main__":
+    # Size the per-worker pools against the server before any worker starts
+    pool_plan = plan_pool_capacity(resolve_database_uri(), WORKERS)
+    budget = pool_plan["per_worker_budget"]
+    server_limit = (
+        f"{pool_plan['max_connections']} (budget {budget} per worker)"
+        if budget is not None else "unknown"
+    )
+    pool_warnings = "".join(f"\n⚠️  {warning}" for warning in pool_plan["warnings"])
+
     print(f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║  🚀 FastAPI E-commerce - High Performance Production Mode  ║
@@ -42,8 +52,9 @@ if __name__ == "__main__":
   • Keep-alive timeout: {TIMEOUT_KEEP_ALIVE}s
 
 🔥 Optimized for ~400 concurrent requests
-💾 Database pool: 50 connections + 100 overflow per worker
-⚡ Total capacity: ~{WORKERS * 150} database connections
+💾 Database pool: {pool_plan['pool_size']} connections + {pool_plan['max_overflow']} overflow per worker{' (autosized)' if pool_plan['autosized'] else ''}
+⚡ Total capacity: {pool_plan['total_connections']} database connections
+🗄️  Server max_connections: {server_limit}{pool_warnings}
 
 Starting server...
 """)
@@ -1,10 +1,13 @@
 from schemas.address_schema import AddressSchema
 from schemas.bill_schema import BillSchema
+from schemas.cart_schema import CartItem, CartSchema, CheckoutRequest, ReservationRequest
 from schemas.category_schema import CategorySchema
 from schemas.client_schema import ClientSchema
 from schemas.order_detail_schema import OrderDetailSchema
+from schemas.order_history_schema import ClientOrderHistory, OrderHistoryEntry, OrderHistoryLine
 from schemas.order_schema import OrderSchema
-from schemas.product_schema import ProductSchema
+from schemas.product_schema import CategoryProducts, ProductSchema, StockShardsRequest
+from schemas.report_schema import CategorySales, DailySales, PaymentTypeSales, ProductSales, SalesReport
 from schemas.review_schema import ReviewSchema
 
 AddressSchema.model_rebuild()
@@ -15,3 +18,4 @@ OrderDetailSchema.model_rebuild()
 ReviewSchema.model_rebuild()
 CategorySchema.model_rebuild()
 BillSchema.model_rebuild()
+CategoryProducts.model_rebuild()
@@ -17,7 +17,7 @@ class BillSchema(BaseSchema):
     bill_number: str = Field(..., min_length=1, max_length=50, description="Unique bill number (required)")
     discount: Optional[float] = Field(None, ge=0, description="Discount amount (must be >= 0)")
     date: DateType = Field(..., description="Bill date (required)")
-    total: float = Field(..., ge=0, description="Total amount (must be >= 0, required)")
+    total: float = Field(default=0.0, ge=0, description="Sum of the bill's order totals (computed, read-only)")
     payment_type: PaymentType = Field(..., description="Payment type (required)")
     client_id: int = Field(..., description="Client ID reference (required)")  # ✅ Added
 
@@ -0,0 +1,32 @@
+"""Cart reservation request/response schemas."""
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class CartItem(BaseModel):
+    """Units of a product held for a cart"""
+
+    product_id: int
+    quantity: int = Field(..., gt=0)
+
+
+class CartSchema(BaseModel):
+    """A cart's reservations and when they expire"""
+
+    cart_id: str
+    items: List[CartItem] = []
+    expires_at: Optional[datetime] = Field(None, description="Reservations are released after this (UTC)")
+
+
+class ReservationRequest(BaseModel):
+    """Units of a product to hold for the cart (0 releases them)"""
+
+    quantity: int = Field(..., ge=0, description="Total units wanted, not a delta")
+
+
+class CheckoutRequest(BaseModel):
+    """Order receiving the cart's reservations as order details"""
+
+    order_id: int = Field(..., description="Order ID reference (required)")
@@ -0,0 +1,37 @@
+"""Client order history response schemas."""
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from models.enums import DeliveryMethod, Status
+
+
+class OrderHistoryLine(BaseModel):
+    """One order detail with its product's name"""
+
+    id_key: int
+    product_id: Optional[int] = None
+    product_name: Optional[str] = None
+    quantity: Optional[int] = None
+    price: Optional[float] = None
+
+
+class OrderHistoryEntry(BaseModel):
+    """One order with its details"""
+
+    id_key: int
+    date: Optional[datetime] = None
+    total: Optional[float] = None
+    status: Optional[Status] = None
+    delivery_method: Optional[DeliveryMethod] = None
+    bill_id: Optional[int] = None
+    details: List[OrderHistoryLine] = []
+
+
+class ClientOrderHistory(BaseModel):
+    """A page of a client's orders, newest first"""
+
+    client_id: int
+    orders: List[OrderHistoryEntry]
+    next_cursor: Optional[str] = Field(None, description="Pass as ?cursor= for the next page; null on the last page")
@@ -1,7 +1,8 @@
 """Product schema for request/response validation."""
 from typing import Optional, List, TYPE_CHECKING
-from pydantic import Field
+from pydantic import BaseModel, Field
 
+from config.constants import ValidationConfig
 from schemas.base_schema import BaseSchema
 
 if TYPE_CHECKING:
@@ -17,5 +18,25 @@ class ProductSchema(BaseSchema):
 
     category_id: int = Field(..., description="Category ID reference (required)")
 
+    # Maintained from reviews; ignored on create and update
+    rating_count: int = Field(default=0, ge=0, description="Number of reviews (read-only)")
+    rating_sum: float = Field(default=0.0, ge=0, description="Sum of review ratings (read-only)")
+
+    # Set through PUT /products/{id}/stock-shards; ignored on create and update
+    stock_shards: int = Field(default=0, ge=0, description="Stock shard rows, 0 if not sharded (read-only)")
+
     category: Optional['CategorySchema'] = None
 
+
+class StockShardsRequest(BaseModel):
+    """Number of stock shard rows for a hot product"""
+
+    shards: int = Field(..., ge=0, le=ValidationConfig.MAX_STOCK_SHARDS, description="0 merges the stock back")
+
+
+class CategoryProducts(BaseModel):
+    """A page of a category's products, by id_key"""
+
+    category_id: int
+    products: List[ProductSchema]
+    next_cursor: Optional[str] = Field(None, description="Pass as ?cursor= for the next page; null on the last page")
@@ -0,0 +1,44 @@
+"""Sales report response schemas."""
+from datetime import date as DateType
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, Field
+
+from models.enums import PaymentType
+
+
+class SalesTotals(BaseModel):
+    """Units sold and revenue (sum of quantity x unit price)"""
+
+    quantity: int = Field(..., description="Units sold")
+    revenue: float = Field(..., description="Revenue")
+
+
+class ProductSales(SalesTotals):
+    product_id: int
+    product_name: Optional[str] = None
+
+
+class CategorySales(SalesTotals):
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+
+
+class DailySales(SalesTotals):
+    day: DateType
+
+
+class PaymentTypeSales(SalesTotals):
+    payment_type: Optional[PaymentType] = Field(None, description="None for orders without a bill")
+
+
+RowT = TypeVar("RowT", bound=SalesTotals)
+
+
+class SalesReport(BaseModel, Generic[RowT]):
+    """Report rows plus how stale the rollup they come from is"""
+
+    start: Optional[DateType] = None
+    end: Optional[DateType] = None
+    pending_days: int = Field(..., description="Days with changes not yet in the rollup")
+    rows: List[RowT]
@@ -1,7 +1,7 @@
 """
 Module for Base Service Implementation
 """
-from typing import List, Type
+from typing import Iterator, List, Tuple, Type
 from sqlalchemy.orm import Session
 from models.base_model import BaseModel
 from services.base_service import BaseService
@@ -36,13 +36,22 @@ class BaseServiceImpl(BaseService):
         """SQLAlchemy Model"""
         return self._model
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[BaseSchema]:
-        """Get all data with pagination"""
-        return self.repository.find_all(skip=skip, limit=limit)
+    def get_all(
+        self, skip: int = 0, limit: int = 100,
+        include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()
+    ) -> List[BaseSchema]:
+        """Get all data with pagination, loading `include` or only `fields`"""
+        return self.repository.find_all(skip=skip, limit=limit, include=include, fields=fields)
 
-    def get_one(self, id_key: int) -> BaseSchema:
-        """Get one data"""
-        return self.repository.find(id_key)
+    def get_one(
+        self, id_key: int, include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()
+    ) -> BaseSchema:
+        """Get one data, loading `include` or only `fields`"""
+        return self.repository.find(id_key, include=include, fields=fields)
+
+    def export(self, fields: Tuple[str, ...] = ()) -> Tuple[Tuple[str, ...], Iterator[list]]:
+        """Column names and row batches of every record (streamed, never cached)"""
+        return self.repository.stream_rows(fields)
 
     def save(self, schema: BaseSchema) -> BaseSchema:
         """Save data"""
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Session
 from models.bill import BillModel
 from repositories.bill_repository import BillRepository
+from repositories.sales_report_repository import SalesReportRepository
 from schemas import BillSchema
 from services.base_service_impl import BaseServiceImpl
 
@@ -13,3 +14,24 @@ class BillService(BaseServiceImpl):
             schema=BillSchema,
             db=db
         )
+        self._sales_report_repository = SalesReportRepository(db)
+
+    def save(self, schema: BillSchema) -> BillSchema:
+        """
+        Create a bill
+
+        Its total is the sum of its orders' totals, maintained as their
+        details change, so a new bill starts at zero.
+        """
+        schema.total = 0.0
+        return super().save(schema)
+
+    def update(self, id_key: int, schema: BillSchema) -> BillSchema:
+        """
+        Update a bill, scheduling a sales rollup refresh of its orders' days
+
+        The rollup groups revenue by payment type, so a changed payment
+        type must be reflected there. The total is never taken from input.
+        """
+        self._sales_report_repository.mark_bill(id_key)
+        return self.repository.update(id_key, schema.model_dump(exclude_unset=True, exclude={"total"}))
@@ -36,6 +36,9 @@ class CacheService:
 
     def is_available(self) -> bool:
         """Check if cache is available"""
+        if self.redis_client is None:
+            # Redis may connect after startup (fast boot): pick the client up once it's there
+            self.redis_client = get_redis_client()
         return self.enabled and self.redis_client is not None
 
     def get(self, key: str) -> Optional[Any]:
@@ -204,11 +207,11 @@ class CacheService:
         # Try to get from cache (fast path)
         cached_value = self.get(key)
         if cached_value is not None:
-            logger.debug(f"Cache HIT: {key}")
+            logger.debug("Cache HIT: %s", key)
             return cached_value
 
         # Cache miss - need to recompute with distributed stampede protection
-        logger.debug(f"Cache MISS: {key}")
+        logger.debug("Cache MISS: %s", key)
 
         # Build lock key
         lock_key = f"lock:{key}"
@@ -225,12 +228,12 @@ class CacheService:
 
             if lock_acquired:
                 # We got the lock! Compute and cache the value
-                logger.debug(f"Lock acquired for: {key}")
+                logger.debug("Lock acquired for: %s", key)
                 try:
                     # Double-check cache (another process may have filled it)
                     cached_value = self.get(key)
                     if cached_value is not None:
-                        logger.debug(f"Cache HIT after lock: {key}")
+                        logger.debug("Cache HIT after lock: %s", key)
                         return cached_value
 
                     # Compute value
@@ -250,7 +253,7 @@ class CacheService:
                     # Always release the lock
                     try:
                         self.redis_client.delete(lock_key)
-                        logger.debug(f"Lock released for: {key}")
+                        logger.debug("Lock released for: %s", key)
                     except Exception as e:
                         logger.error(f"Error releasing lock for '{key}': {e}")
 
@@ -258,15 +261,15 @@ class CacheService:
                 # Lock already held by another process/worker
                 # Wait a bit and retry to get cached result
                 logger.debug(
-                    f"Lock held by another process for '{key}', "
-                    f"retry {attempt + 1}/{max_retries}"
+                    "Lock held by another process for '%s', retry %d/%d",
+                    key, attempt + 1, max_retries
                 )
                 time.sleep(retry_delay)
 
                 # Check if cache was filled while waiting
                 cached_value = self.get(key)
                 if cached_value is not None:
-                    logger.debug(f"Cache HIT after waiting: {key}")
+                    logger.debug("Cache HIT after waiting: %s", key)
                     return cached_value
 
         # Failed to acquire lock after all retries
@@ -0,0 +1,193 @@
+"""Cart service: time-limited stock reservations and reservation checkout."""
+import asyncio
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from config.constants import ReservationConfig
+from models.order_detail import OrderDetailModel
+from repositories.order_repository import OrderRepository
+from repositories.product_repository import ProductRepository
+from repositories.relationship_loading import to_schema
+from repositories.sales_report_repository import SalesReportRepository
+from schemas import CartItem, CartSchema, OrderDetailSchema
+from services.client_service import invalidate_order_history
+from services.reservation_store import (
+    InsufficientStockError, ReservationStore, ReservationUnavailableError, reservation_store
+)
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
+
+# Times a reservation re-seeds a product's stock mirror that keeps being
+# invalidated (by concurrent stock writes) before giving up
+SEED_ATTEMPTS = 3
+
+
+class CartService:
+    """
+    Carts hold units in Redis (see reservation_store) until checkout or expiry
+
+    Reserving never touches the products row: availability is decided
+    atomically against the Redis stock mirror, so carts competing for the
+    last units of a hot product are refused immediately instead of at
+    checkout. Checkout then turns the held units into order details in one
+    database transaction.
+    """
+
+    def __init__(self, db: Session, store: ReservationStore = reservation_store):
+        self._session = db
+        self._store = store
+        self._product_repository = ProductRepository(db)
+        self._order_repository = OrderRepository(db)
+        self._sales_report_repository = SalesReportRepository(db)
+
+    def get(self, cart_id: str) -> CartSchema:
+        """A cart's reservations"""
+        items, deadline = self._store.items(cart_id)
+        return CartSchema(
+            cart_id=cart_id,
+            items=[CartItem(product_id=product_id, quantity=quantity) for product_id, quantity in sorted(items.items())],
+            expires_at=datetime.fromtimestamp(deadline, timezone.utc) if deadline is not None else None,
+        )
+
+    def reserve(self, cart_id: str, product_id: int, quantity: int) -> CartSchema:
+        """
+        Hold `quantity` units of a product for the cart (0 releases them)
+
+        Raises:
+            InstanceNotFoundError: If the product doesn't exist
+            InsufficientStockError: If fewer units are left
+            ReservationUnavailableError: If Redis is down, or the product's
+                mirror is invalidated again after every seed
+        """
+        ttl = ReservationConfig.TTL_SECONDS
+        for _ in range(SEED_ATTEMPTS):
+            if self._store.set_quantity(cart_id, product_id, quantity, ttl) is not None:
+                return self.get(cart_id)
+            # Product not mirrored (first reservation, or a stock write
+            # dropped the mirror): mirror its stock, then retry
+            product = self._product_repository.find(product_id)
+            self._store.seed(product_id, product.stock)
+        raise ReservationUnavailableError(
+            f"Stock of product {product_id} changed while reserving it, please retry"
+        )
+
+    def clear(self, cart_id: str) -> None:
+        """Release all of the cart's reservations"""
+        self._store.release(cart_id)
+
+    def checkout(self, cart_id: str, order_id: int) -> List[OrderDetailSchema]:
+        """
+        Turn the cart's reservations into order details of an order
+
+        The details, stock decrements, order/bill totals and sales rollup
+        marks commit in one transaction. On any failure it is rolled back
+        and the units are released.
+
+        Raises:
+            InstanceNotFoundError: If the order doesn't exist
+            ValueError: If the cart holds nothing
+            CheckoutInProgressError: If the cart is already being checked out
+            InsufficientStockError: If the database has less stock than the
+                mirror (drift; the reconciler repairs it)
+        """
+        order = self._order_repository.find(order_id)
+        items = self._store.claim(cart_id, ReservationConfig.CHECKOUT_TIMEOUT_SECONDS)
+        if not items:
+            raise ValueError(f"Cart {cart_id} has no reservations")
+
+        try:
+            details = []
+            for product_id, quantity in sorted(items.items()):
+                price = self._product_repository.take_stock(product_id, quantity)
+                if price is None:
+                    raise InsufficientStockError(product_id, 0)
+                details.append(OrderDetailModel(
+                    order_id=order_id, product_id=product_id, quantity=quantity, price=price
+                ))
+                self._order_repository.add_to_total(order_id, price * quantity)
+            self._sales_report_repository.mark_orders([order_id])
+            self._session.add_all(details)
+            self._session.commit()
+        except Exception as e:
+            self._session.rollback()
+            self._store.abort(cart_id)
+            logger.error(f"❌ Checkout of cart {cart_id} into order {order_id} failed: {e}")
+            raise
+
+        self._store.complete(cart_id)
+        invalidate_order_history([order.client_id])
+        logger.info(f"🛒 Cart {cart_id} checked out into order {order_id} ({len(details)} item(s))")
+        return [to_schema(OrderDetailSchema, detail) for detail in details]
+
+
+def reconcile_reservations(store: ReservationStore = reservation_store) -> dict:
+    """
+    Release expired carts and timed-out checkouts, then repair the stock mirror
+
+    Every mirrored product is reset to products.stock - reserved units, in
+    batches of ReservationConfig.BATCH_SIZE products per Redis pipeline.
+
+    Returns:
+        {"released": carts/checkouts released, "repaired": mirrors corrected}
+    """
+    from config.database import SessionLocal
+
+    batch_size = ReservationConfig.BATCH_SIZE
+    released = 0
+    while True:
+        count = store.release_due(batch_size)
+        released += count
+        if count < batch_size:
+            break
+
+    repaired = 0
+    with SessionLocal() as db:
+        for stocks in ProductRepository(db).stock_levels(batch_size=batch_size):
+            repaired += store.repair(stocks)
+
+    if released or repaired:
+        logger.info(f"🛒 Reservations: released {released} cart(s), repaired {repaired} stock mirror(s)")
+    return {"released": released, "repaired": repaired}
+
+
+class ReservationReconciler:
+    """
+    Background task running reconcile_reservations
+
+    One per worker, started in the app lifespan. Releases are atomic in
+    Redis, so workers reconciling at the same time never return units twice.
+    """
+
+    def __init__(self, interval_seconds: float = ReservationConfig.RECONCILE_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await run_in_threadpool(reconcile_reservations)
+            except ReservationUnavailableError:
+                pass  # Nothing can be reserved without Redis either
+            except Exception as e:
+                logger.error(f"❌ Reservation reconcile failed: {e}")
+
+    def start(self):
+        if self._task is None and ReservationConfig.RECONCILE_ENABLED:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+reservation_reconciler = ReservationReconciler()
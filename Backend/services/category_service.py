@@ -1,6 +1,6 @@
 """Category service with Redis caching integration."""
 import logging
-from typing import List
+from typing import List, Tuple
 from sqlalchemy.orm import Session
 
 from models.category import CategoryModel
@@ -28,11 +28,14 @@ class CategoryService(BaseServiceImpl):
         # Categories change rarely, so longer TTL (1 hour)
         self.cache_ttl = 3600
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[CategorySchema]:
+    def get_all(
+        self, skip: int = 0, limit: int = 100,
+        include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()
+    ) -> List[CategorySchema]:
         """
         Get all categories with long-lived cache
 
-        Cache key pattern: categories:list:skip:{skip}:limit:{limit}
+        Cache key pattern: categories:list:skip:{skip}:limit:{limit}[:fields:{fields}]
         TTL: 1 hour (categories rarely change)
         """
         cache_key = self.cache.build_key(
@@ -41,44 +44,57 @@ class CategoryService(BaseServiceImpl):
             skip=skip,
             limit=limit
         )
+        if fields:
+            cache_key = self.cache.build_key(cache_key, fields=",".join(fields))
 
         # Try cache first
         cached_categories = self.cache.get(cache_key)
         if cached_categories is not None:
-            logger.debug(f"Cache HIT: {cache_key}")
-            return [CategorySchema(**c) for c in cached_categories]
+            logger.debug("Cache HIT: %s", cache_key)
+            return [self._from_cache(c, fields) for c in cached_categories]
 
         # Cache miss
-        logger.debug(f"Cache MISS: {cache_key}")
-        categories = super().get_all(skip, limit)
+        logger.debug("Cache MISS: %s", cache_key)
+        categories = super().get_all(skip, limit, include, fields)
 
         # Cache with longer TTL
-        categories_dict = [self.schema.model_validate(c).model_dump() for c in categories]
+        categories_dict = [c.model_dump(exclude_unset=True) for c in categories]
         self.cache.set(cache_key, categories_dict, ttl=self.cache_ttl)
 
         return categories
 
-    def get_one(self, id_key: int) -> CategorySchema:
+    def get_one(
+        self, id_key: int, include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()
+    ) -> CategorySchema:
         """
         Get single category by ID with caching
 
-        Cache key pattern: categories:id:{id_key}
+        Cache key pattern: categories:id:{id_key}[:fields:{fields}]
         TTL: 1 hour
         """
         cache_key = self.cache.build_key(self.cache_prefix, "id", id=id_key)
+        if fields:
+            cache_key = self.cache.build_key(cache_key, fields=",".join(fields))
 
         cached_category = self.cache.get(cache_key)
         if cached_category is not None:
-            logger.debug(f"Cache HIT: {cache_key}")
-            return CategorySchema(**cached_category)
+            logger.debug("Cache HIT: %s", cache_key)
+            return self._from_cache(cached_category, fields)
 
-        logger.debug(f"Cache MISS: {cache_key}")
-        category = super().get_one(id_key)
+        logger.debug("Cache MISS: %s", cache_key)
+        category = super().get_one(id_key, include, fields)
 
-        self.cache.set(cache_key, self.schema.model_validate(category).model_dump(), ttl=self.cache_ttl)
+        self.cache.set(cache_key, category.model_dump(exclude_unset=True), ttl=self.cache_ttl)
 
         return category
 
+    @staticmethod
+    def _from_cache(data: dict, fields: Tuple[str, ...]) -> CategorySchema:
+        """Rebuild a cached category (fieldsets are partial, so not validated)"""
+        if fields:
+            return CategorySchema.model_construct(**data)
+        return CategorySchema(**data)
+
     def save(self, schema: CategorySchema) -> CategorySchema:
         """Create new category and invalidate cache"""
         category = super().save(schema)
@@ -116,9 +132,10 @@ class CategoryService(BaseServiceImpl):
             raise
 
     def delete(self, id_key: int) -> None:
-        """Delete category and invalidate cache"""
+        """Delete category and invalidate cache (including its product pages)"""
         super().delete(id_key)
         self._invalidate_all_cache()
+        self.cache.delete_pattern(self.cache.build_key("products", "category", id_key, "*"))
 
     def _invalidate_all_cache(self):
         """Invalidate all category caches"""
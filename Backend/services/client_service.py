@@ -1,9 +1,37 @@
+"""Client service with the cached, keyset-paginated order history."""
+from datetime import datetime
+from typing import Iterable, Optional
+
 from sqlalchemy.orm import Session
 
+from config.constants import CacheConfig, WriteBatchConfig
 from models.client import ClientModel
 from repositories.client_repository import ClientRepository
-from schemas import ClientSchema
+from repositories.order_repository import OrderRepository
+from repositories.write_batcher import WriteBatcher
+from schemas import ClientOrderHistory, ClientSchema, OrderHistoryEntry, OrderHistoryLine
 from services.base_service_impl import BaseServiceImpl
+from services.cache_service import cache_service
+from utils.cursors import decode_cursor, encode_cursor
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
+
+# Group commit of concurrent client creates (WriteBatchConfig.ENABLED)
+client_batcher = WriteBatcher(ClientModel, ClientSchema)
+
+ORDER_COLUMNS = ("id_key", "date", "total", "status", "delivery_method", "bill_id")
+LINE_COLUMNS = ("product_id", "product_name", "quantity", "price")
+
+
+def invalidate_order_history(client_ids: Iterable[int]) -> None:
+    """
+    Drop every cached order history page of the given clients
+
+    Called after order and order detail writes commit.
+    """
+    for client_id in set(client_ids) - {None}:
+        cache_service.delete_pattern(cache_service.build_key("clients", "orders", client_id, "*"))
 
 
 class ClientService(BaseServiceImpl):
@@ -14,3 +42,64 @@ class ClientService(BaseServiceImpl):
             schema=ClientSchema,
             db=db
         )
+        self._order_repository = OrderRepository(db)
+        self.cache = cache_service
+
+    def save(self, schema: ClientSchema) -> ClientSchema:
+        """Create a client (group committed with concurrent creates if enabled)"""
+        if WriteBatchConfig.ENABLED:
+            return client_batcher.insert(schema)
+        return super().save(schema)
+
+    def get_order_history(self, client_id: int, cursor: Optional[str] = None, limit: int = 20) -> ClientOrderHistory:
+        """
+        A page of a client's orders with details and product names, newest first
+
+        Cache key pattern: clients:orders:{client_id}:cursor:{cursor}:limit:{limit}
+        (all of a client's pages are dropped when its orders change)
+
+        Raises:
+            InstanceNotFoundError: If the client doesn't exist
+            ValueError: If the cursor is invalid
+        """
+        after = None
+        if cursor:
+            after_date, after_id = decode_cursor(cursor, 2)
+            try:
+                after = (datetime.fromisoformat(after_date) if after_date else None, int(after_id))
+            except (TypeError, ValueError) as e:
+                raise ValueError("Invalid cursor") from e
+
+        cache_key = self.cache.build_key("clients", "orders", client_id, cursor=cursor or "", limit=limit)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Cache HIT: %s", cache_key)
+            return ClientOrderHistory.model_validate(cached)
+
+        logger.debug("Cache MISS: %s", cache_key)
+        # One extra order tells whether there is a next page
+        rows = self._order_repository.find_history(client_id, limit + 1, after)
+        if not rows:
+            self.repository.find(client_id)  # 404 for unknown clients
+
+        orders = {}
+        for row in rows:
+            order = orders.get(row.id_key)
+            if order is None:
+                order = orders[row.id_key] = OrderHistoryEntry(
+                    **{name: getattr(row, name) for name in ORDER_COLUMNS}, details=[]
+                )
+            if row.detail_id is not None:
+                order.details.append(OrderHistoryLine(
+                    id_key=row.detail_id, **{name: getattr(row, name) for name in LINE_COLUMNS}
+                ))
+
+        entries = list(orders.values())
+        next_cursor = None
+        if len(entries) > limit:
+            entries = entries[:limit]
+            next_cursor = encode_cursor(entries[-1].date, entries[-1].id_key)
+
+        history = ClientOrderHistory(client_id=client_id, orders=entries, next_cursor=next_cursor)
+        self.cache.set(cache_key, history.model_dump(mode="json"), ttl=CacheConfig.ORDER_HISTORY_TTL)
+        return history
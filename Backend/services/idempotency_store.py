@@ -0,0 +1,134 @@
+"""
+Idempotency Store Module
+
+Remembers the responses of POST requests sent with an Idempotency-Key
+header, so a client retrying a create (after a timeout, say) gets the
+first response back instead of creating a duplicate bill, order or order
+detail. Replays are served from Redis without touching the database.
+
+Keys ("idempotency:{method}:{path}:{key}") hold either an in-progress
+marker, while the first request runs, or the stored response. Each entry
+also records a hash of the request body, and a key reused with a different
+body is rejected. Without Redis, requests simply run un-deduplicated.
+"""
+import json
+import time
+from typing import NamedTuple, Optional
+
+from config.constants import IdempotencyConfig
+from config.redis_config import get_redis_client
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
+
+IN_PROGRESS = "in_progress"
+DONE = "done"
+
+
+class IdempotencyKeyReusedError(Exception):
+    """The key was already used for a request with a different body"""
+    pass
+
+
+class IdempotencyInProgressError(Exception):
+    """The first request with this key is still running"""
+    pass
+
+
+class StoredResponse(NamedTuple):
+    status_code: int
+    body: bytes
+    media_type: str
+
+
+class IdempotencyStore:
+    """Per-key in-progress markers and stored responses in Redis"""
+
+    def __init__(self, prefix: str = "idempotency"):
+        self.prefix = prefix
+        self.redis_client = get_redis_client()
+
+    def _client(self):
+        """The Redis client, or None (picked up late if Redis connects after startup)"""
+        if self.redis_client is None:
+            self.redis_client = get_redis_client()
+        return self.redis_client
+
+    def _key(self, scope: str, key: str) -> str:
+        return f"{self.prefix}:{scope}:{key}"
+
+    def begin(self, scope: str, key: str, fingerprint: str) -> Optional[StoredResponse]:
+        """
+        Claim a key for a new request, or get the response stored for it
+
+        A concurrent duplicate waits (up to IdempotencyConfig.WAIT_SECONDS)
+        for the first request to finish, then gets its response. If the
+        first request failed, the duplicate claims the key and runs instead.
+
+        Returns:
+            The stored response to replay, or None if the caller must run the
+            request and then complete() or release() the key
+
+        Raises:
+            IdempotencyKeyReusedError: If the key was used with another body
+            IdempotencyInProgressError: If the first request is still running
+        """
+        client = self._client()
+        if client is None:
+            return None
+
+        redis_key = self._key(scope, key)
+        marker = json.dumps({"state": IN_PROGRESS, "fingerprint": fingerprint})
+        deadline = time.monotonic() + IdempotencyConfig.WAIT_SECONDS
+        try:
+            while True:
+                if client.set(redis_key, marker, nx=True, ex=IdempotencyConfig.IN_PROGRESS_TTL_SECONDS):
+                    return None
+                raw = client.get(redis_key)
+                if raw is None:
+                    continue  # The first request failed and released the key: claim it
+                entry = json.loads(raw)
+                if entry["fingerprint"] != fingerprint:
+                    raise IdempotencyKeyReusedError(
+                        f"Idempotency-Key {key} was already used with a different request body"
+                    )
+                if entry["state"] == DONE:
+                    return StoredResponse(entry["status_code"], entry["body"].encode("utf-8"), entry["media_type"])
+                if time.monotonic() >= deadline:
+                    raise IdempotencyInProgressError(f"A request with Idempotency-Key {key} is still in progress")
+                time.sleep(IdempotencyConfig.POLL_SECONDS)
+        except (IdempotencyKeyReusedError, IdempotencyInProgressError):
+            raise
+        except Exception as e:
+            logger.error(f"Idempotency check failed for key '{redis_key}', running the request: {e}")
+            return None
+
+    def complete(self, scope: str, key: str, fingerprint: str, response: StoredResponse) -> None:
+        """Store a claimed key's response for IdempotencyConfig.TTL_SECONDS"""
+        client = self._client()
+        if client is None:
+            return
+        entry = {
+            "state": DONE,
+            "fingerprint": fingerprint,
+            "status_code": response.status_code,
+            "body": response.body.decode("utf-8"),
+            "media_type": response.media_type,
+        }
+        try:
+            client.set(self._key(scope, key), json.dumps(entry), ex=IdempotencyConfig.TTL_SECONDS)
+        except Exception as e:
+            logger.error(f"Failed to store idempotent response for key '{key}': {e}")
+
+    def release(self, scope: str, key: str) -> None:
+        """Drop a claimed key whose request failed, so a retry runs again"""
+        client = self._client()
+        if client is None:
+            return
+        try:
+            client.delete(self._key(scope, key))
+        except Exception as e:
+            logger.error(f"Failed to release idempotency key '{key}': {e}")
+
+
+idempotency_store = IdempotencyStore()
@@ -1,22 +1,33 @@
-"""OrderDetail service with foreign key validation and stock management."""
+"""OrderDetail service with foreign key validation, stock management and order totals."""
 import logging
+from redis.exceptions import RedisError
 from sqlalchemy.orm import Session
 
 from models.order_detail import OrderDetailModel
-from models.product import ProductModel
 from repositories.order_detail_repository import OrderDetailRepository
 from repositories.order_repository import OrderRepository
 from repositories.product_repository import ProductRepository
+from repositories.sales_report_repository import SalesReportRepository
 from repositories.base_repository_impl import InstanceNotFoundError
 from schemas import OrderDetailSchema
 from services.base_service_impl import BaseServiceImpl
+from services.client_service import invalidate_order_history
+from services.reservation_store import (
+    InsufficientStockError, ReservationUnavailableError, reservation_store
+)
 from utils.logging_utils import get_sanitized_logger
 
 logger = get_sanitized_logger(__name__)
 
 
 class OrderDetailService(BaseServiceImpl):
-    """Service for OrderDetail entity with validation and stock management."""
+    """
+    Service for OrderDetail entity with validation and stock management
+
+    Each write also applies its price * quantity delta to the order's total
+    and the order's bill total, in the same transaction. Purchases never
+    take units held by cart reservations (see services/reservation_store).
+    """
 
     def __init__(self, db: Session):
         super().__init__(
@@ -27,6 +38,7 @@ class OrderDetailService(BaseServiceImpl):
         )
         self._order_repository = OrderRepository(db)
         self._product_repository = ProductRepository(db)
+        self._sales_report_repository = SalesReportRepository(db)
 
     def save(self, schema: OrderDetailSchema) -> OrderDetailSchema:
         """
@@ -46,30 +58,25 @@ class OrderDetailService(BaseServiceImpl):
             InstanceNotFoundError: If order or product doesn't exist
             ValueError: If stock is insufficient or validation fails
         """
-        from sqlalchemy import select
-
         # Validate order exists
         try:
-            self._order_repository.find(schema.order_id)
+            order = self._order_repository.find(schema.order_id)
         except InstanceNotFoundError:
             logger.error(f"Order with id {schema.order_id} not found")
             raise InstanceNotFoundError(f"Order with id {schema.order_id} not found")
 
         # Use pessimistic locking to prevent race conditions
         # SELECT FOR UPDATE locks the row until transaction completes
+        # (sharded products lock one of their stock shards instead, below)
         try:
-            stmt = select(ProductModel).where(
-                ProductModel.id_key == schema.product_id
-            ).with_for_update()
-
-            product_model = self._product_repository.session.execute(stmt).scalar_one_or_none()
+            product_model = self._product_repository.find_for_purchase(schema.product_id)
 
             if product_model is None:
                 logger.error(f"Product with id {schema.product_id} not found")
                 raise InstanceNotFoundError(f"Product with id {schema.product_id} not found")
 
             # Validate stock availability (now with exclusive lock)
-            if product_model.stock < schema.quantity:
+            if not product_model.stock_shards and product_model.stock < schema.quantity:
                 logger.error(
                     f"Insufficient stock for product {schema.product_id}: "
                     f"requested {schema.quantity}, available {product_model.stock}"
@@ -94,16 +101,30 @@ class OrderDetailService(BaseServiceImpl):
                     f"Price mismatch. Expected {product_model.price}, got {schema.price}"
                 )
 
+            # Units held in carts are not for sale: take ours from the stock mirror first
+            self._take_unreserved(product_model, schema.quantity)
+
             # Atomically deduct stock and create order detail in same transaction
-            product_model.stock -= schema.quantity
-            logger.info(
-                f"Stock deducted for product {schema.product_id}: "
-                f"new stock = {product_model.stock}"
-            )
+            if product_model.stock_shards:
+                self._take_sharded_stock(product_model, schema.quantity)
+            else:
+                product_model.stock -= schema.quantity
+                logger.info(
+                    f"Stock deducted for product {schema.product_id}: "
+                    f"new stock = {product_model.stock}"
+                )
+
+            # Order and bill totals: add this line (same transaction)
+            self._order_repository.add_to_total(schema.order_id, schema.price * schema.quantity)
+
+            # Sales rollup: recompute the order's day (same transaction)
+            self._sales_report_repository.mark_orders([schema.order_id])
 
             # Create order detail (same transaction)
             logger.info(f"Creating order detail for order {schema.order_id}")
             result = super().save(schema)
+            invalidate_order_history([order.client_id])
+            reservation_store.invalidate(schema.product_id)
 
             # Both operations commit together automatically
             # If either fails, both rollback
@@ -116,11 +137,64 @@ class OrderDetailService(BaseServiceImpl):
         except InstanceNotFoundError:
             raise
         except ValueError:
+            # The mirror may have given up units that weren't sold: re-seed it
+            reservation_store.invalidate(schema.product_id)
             raise
         except Exception as e:
             logger.error(f"Error creating order detail: {e}")
+            reservation_store.invalidate(schema.product_id)
             raise
 
+    def _take_unreserved(self, product_model, quantity: int) -> None:
+        """
+        Take units from the reservation stock mirror, so the units carts hold
+        stay theirs and carts can't reserve the ones being sold
+
+        Without Redis nothing can be reserved either: only the database stock
+        check applies.
+
+        Raises:
+            ValueError: If fewer units are left once cart reservations are deducted
+        """
+        product_id = product_model.id_key
+        stock = (self._product_repository.available_stock(product_id) if product_model.stock_shards
+                 else product_model.stock)
+        try:
+            reservation_store.take(product_id, quantity, stock)
+        except InsufficientStockError as e:
+            logger.error(
+                f"Insufficient unreserved stock for product {product_id}: "
+                f"requested {quantity}, available {e.available}"
+            )
+            raise ValueError(
+                f"Insufficient stock for product {product_id}. "
+                f"Requested: {quantity}, Available: {e.available}"
+            )
+        except ReservationUnavailableError:
+            pass  # Redis not connected: no cart can hold units either
+        except RedisError as e:
+            logger.warning(f"Stock mirror unavailable, checking product {product_id} stock only: {e}")
+
+    def _take_sharded_stock(self, product_model, quantity: int) -> None:
+        """
+        Take units from a sharded product's stock shards
+
+        Raises:
+            ValueError: If the product has fewer units left
+        """
+        product_id = product_model.id_key
+        if not self._product_repository.take_sharded_stock(product_id, quantity, product_model.stock_shards):
+            available = self._product_repository.available_stock(product_id)
+            logger.error(
+                f"Insufficient stock for product {product_id}: "
+                f"requested {quantity}, available {available}"
+            )
+            raise ValueError(
+                f"Insufficient stock for product {product_id}. "
+                f"Requested: {quantity}, Available: {available}"
+            )
+        logger.info(f"Stock deducted for product {product_id}: {quantity} from its stock shards")
+
     def update(self, id_key: int, schema: OrderDetailSchema) -> OrderDetailSchema:
         """
         Update an order detail with validation and atomic stock management
@@ -139,8 +213,6 @@ class OrderDetailService(BaseServiceImpl):
             InstanceNotFoundError: If order detail, order, or product doesn't exist
             ValueError: If validation fails or insufficient stock
         """
-        from sqlalchemy import select
-
         # Get existing order detail to restore stock if quantity changes
         existing = self._repository.find(id_key)
 
@@ -158,11 +230,7 @@ class OrderDetailService(BaseServiceImpl):
 
             # 🔒 Use SELECT FOR UPDATE to lock the product row
             try:
-                stmt = select(ProductModel).where(
-                    ProductModel.id_key == product_id
-                ).with_for_update()
-
-                product_model = self._product_repository.session.execute(stmt).scalar_one_or_none()
+                product_model = self._product_repository.find_for_update(product_id)
 
                 if product_model is None:
                     logger.error(f"Product with id {product_id} not found")
@@ -172,6 +240,11 @@ class OrderDetailService(BaseServiceImpl):
                 if schema.quantity is not None and schema.quantity != existing.quantity:
                     quantity_diff = schema.quantity - existing.quantity
 
+                    # Sharded products take the increase from their stock shards
+                    if quantity_diff > 0 and product_model.stock_shards:
+                        self._take_sharded_stock(product_model, quantity_diff)
+                        quantity_diff = 0
+
                     # Check if we have enough stock for increase (with exclusive lock)
                     if quantity_diff > 0 and product_model.stock < quantity_diff:
                         logger.error(
@@ -198,8 +271,25 @@ class OrderDetailService(BaseServiceImpl):
                 logger.error(f"Error updating stock for product {product_id}: {e}")
                 raise
 
+        # Order and bill totals: apply the line's change (same transaction)
+        order_id = schema.order_id if schema.order_id is not None else existing.order_id
+        price = schema.price if schema.price is not None else existing.price
+        quantity = schema.quantity if schema.quantity is not None else existing.quantity
+        if order_id != existing.order_id:
+            self._order_repository.add_to_total(existing.order_id, -existing.price * existing.quantity)
+            self._order_repository.add_to_total(order_id, price * quantity)
+        else:
+            self._order_repository.add_to_total(order_id, price * quantity - existing.price * existing.quantity)
+
+        # Sales rollup: recompute the old and new order's days (same transaction)
+        self._sales_report_repository.mark_orders([existing.order_id, schema.order_id])
+
         logger.info(f"Updating order detail {id_key}")
-        return super().update(id_key, schema)
+        result = super().update(id_key, schema)
+        invalidate_order_history(self._order_repository.client_ids([existing.order_id, order_id]))
+        for product_id in {existing.product_id, schema.product_id or existing.product_id}:
+            reservation_store.invalidate(product_id)
+        return result
 
     def delete(self, id_key: int) -> None:
         """
@@ -214,18 +304,12 @@ class OrderDetailService(BaseServiceImpl):
         Raises:
             InstanceNotFoundError: If order detail or product doesn't exist
         """
-        from sqlalchemy import select
-
         # Get order detail to restore stock
         order_detail = self._repository.find(id_key)
 
         # 🔒 Use SELECT FOR UPDATE to lock the product row before restoring stock
         try:
-            stmt = select(ProductModel).where(
-                ProductModel.id_key == order_detail.product_id
-            ).with_for_update()
-
-            product_model = self._product_repository.session.execute(stmt).scalar_one_or_none()
+            product_model = self._product_repository.find_for_update(order_detail.product_id)
 
             if product_model is None:
                 logger.error(f"Product with id {order_detail.product_id} not found")
@@ -241,9 +325,19 @@ class OrderDetailService(BaseServiceImpl):
                 f"restored {order_detail.quantity}, new stock = {product_model.stock}"
             )
 
+            # Order and bill totals: remove this line (same transaction)
+            self._order_repository.add_to_total(
+                order_detail.order_id, -order_detail.price * order_detail.quantity
+            )
+
+            # Sales rollup: recompute the order's day (same transaction)
+            self._sales_report_repository.mark_orders([order_detail.order_id])
+
             # Delete order detail (same transaction)
             logger.info(f"Deleting order detail {id_key}")
             super().delete(id_key)
+            invalidate_order_history(self._order_repository.client_ids([order_detail.order_id]))
+            reservation_store.invalidate(order_detail.product_id)
 
             # Both operations commit together automatically
             # If either fails, both rollback
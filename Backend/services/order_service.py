@@ -1,14 +1,19 @@
 """Order service for CRUD operations."""
 from datetime import datetime
+from typing import Dict, List
+
 from sqlalchemy.orm import Session
 
+from models.enums import Status
 from models.order import OrderModel
 from repositories.order_repository import OrderRepository
 from repositories.bill_repository import BillRepository
 from repositories.client_repository import ClientRepository
+from repositories.sales_report_repository import SalesReportRepository
 from repositories.base_repository_impl import InstanceNotFoundError
 from schemas import OrderSchema
 from services.base_service_impl import BaseServiceImpl
+from services.client_service import invalidate_order_history
 from utils.logging_utils import get_sanitized_logger
 
 logger = get_sanitized_logger(__name__)
@@ -26,6 +31,7 @@ class OrderService(BaseServiceImpl):
         )
         self._client_repository = ClientRepository(db)
         self._bill_repository = BillRepository(db)
+        self._sales_report_repository = SalesReportRepository(db)
 
     def save(self, schema: OrderSchema) -> OrderSchema:
         """
@@ -55,13 +61,20 @@ class OrderService(BaseServiceImpl):
             logger.error(f"Bill with id {schema.bill_id} not found")
             raise InstanceNotFoundError(f"Bill with id {schema.bill_id} not found")
 
-        # Set creation date if not provided
-        if schema.date is None:
-            schema.date = datetime.utcnow()
+        # Set creation date and status if not provided; assigning them also
+        # keeps the schema defaults in the exclude_unset dump that builds the
+        # model (order history pages by date)
+        schema.date = schema.date or datetime.utcnow()
+        schema.status = schema.status or Status.PENDING
+
+        # The total is computed from the order details, which come later
+        schema.total = 0.0
 
         # Create order
         logger.info(f"Creating order for client {schema.client_id}")
-        return super().save(schema)
+        order = super().save(schema)
+        invalidate_order_history([schema.client_id])
+        return order
 
     def update(self, id_key: int, schema: OrderSchema) -> OrderSchema:
         """
@@ -93,5 +106,71 @@ class OrderService(BaseServiceImpl):
                 logger.error(f"Bill with id {schema.bill_id} not found")
                 raise InstanceNotFoundError(f"Bill with id {schema.bill_id} not found")
 
+        # Locked, so no detail write can add to the old bill after its total is read
+        existing = self._find_for_update(id_key)
+
+        # Bill totals: an order moved to another bill takes its total along
+        if schema.bill_id is not None and schema.bill_id != existing.bill_id:
+            self._bill_repository.add_to_total(existing.bill_id, -(existing.total or 0.0))
+            self._bill_repository.add_to_total(schema.bill_id, existing.total or 0.0)
+
+        # Sales rollup: date, status or bill changes move revenue between
+        # days and payment types, so recompute the old and new day
+        self._sales_report_repository.mark_orders([id_key])
+        self._sales_report_repository.mark_days([schema.date])
+
+        # The total is maintained from the order details, never taken from input
         logger.info(f"Updating order {id_key}")
-        return super().update(id_key, schema)
+        order = self.repository.update(id_key, schema.model_dump(exclude_unset=True, exclude={"total"}))
+        invalidate_order_history([existing.client_id, order.client_id])
+        return order
+
+    def delete(self, id_key: int) -> None:
+        """
+        Delete an order (and its details), taking its total off its bill and
+        scheduling its day's sales rollup
+
+        Args:
+            id_key: Order ID
+        """
+        order = self._find_for_update(id_key)
+        self._bill_repository.add_to_total(order.bill_id, -(order.total or 0.0))
+        self._sales_report_repository.mark_orders([id_key])
+        super().delete(id_key)
+        invalidate_order_history([order.client_id])
+
+    def _find_for_update(self, id_key: int) -> OrderModel:
+        """The order row, locked until the transaction ends"""
+        order = self._repository.find_for_update(id_key)
+        if order is None:
+            logger.error(f"Order with id {id_key} not found")
+            raise InstanceNotFoundError(f"Order with id {id_key} not found")
+        return order
+
+
+def reconcile_totals(fix: bool = False) -> Dict[str, List]:
+    """
+    Verify the incrementally maintained order and bill totals set-wise in SQL
+
+    Each table is checked with one query comparing every stored total
+    against a fresh SUM (order details for orders, order totals for bills).
+    With fix=True, orders and then bills are recomputed with one UPDATE
+    each, in a single transaction.
+
+    Returns:
+        Mismatches found, as (id_key, total, expected) rows per table
+    """
+    from config.database import SessionLocal
+
+    with SessionLocal() as db:
+        orders, bills = OrderRepository(db), BillRepository(db)
+        mismatches = {"orders": orders.total_mismatches(), "bills": bills.total_mismatches()}
+        if fix and (mismatches["orders"] or mismatches["bills"]):
+            orders.recompute_totals()
+            bills.recompute_totals()
+            db.commit()
+
+    for table, rows in mismatches.items():
+        if rows:
+            logger.warning(f"⚠️ {len(rows)} {table} total(s) out of sync{' (fixed)' if fix else ''}")
+    return mismatches
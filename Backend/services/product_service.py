@@ -1,17 +1,26 @@
 """Product service with Redis caching integration and sanitized logging."""
 import logging
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
 
+from config.constants import CacheConfig
 from models.product import ProductModel
+from repositories.category_repository import CategoryRepository
 from repositories.product_repository import ProductRepository
-from schemas import ProductSchema
+from schemas import CategoryProducts, ProductSchema
 from services.base_service_impl import BaseServiceImpl
 from services.cache_service import cache_service
+from services.reservation_store import reservation_store
+from utils.cursors import decode_cursor, encode_cursor
 from utils.logging_utils import get_sanitized_logger
 
 logger = get_sanitized_logger(__name__)  # P11: Sanitized logging
 
+# Maintained by ReviewService; never taken from client input
+RATING_FIELDS = {"rating_count", "rating_sum"}
+# Also changed only through set_stock_shards
+READ_ONLY_FIELDS = RATING_FIELDS | {"stock_shards"}
+
 
 class ProductService(BaseServiceImpl):
     """Service for Product entity with caching."""
@@ -26,11 +35,14 @@ class ProductService(BaseServiceImpl):
         self.cache = cache_service
         self.cache_prefix = "products"
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> List[ProductSchema]:
+    def get_all(
+        self, skip: int = 0, limit: int = 100,
+        include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()
+    ) -> List[ProductSchema]:
         """
         Get all products with caching
 
-        Cache key pattern: products:list:skip:{skip}:limit:{limit}
+        Cache key pattern: products:list:skip:{skip}:limit:{limit}[:fields:{fields}]
         TTL: 5 minutes (default REDIS_CACHE_TTL)
         """
         # Build cache key
@@ -40,56 +52,145 @@ class ProductService(BaseServiceImpl):
             skip=skip,
             limit=limit
         )
+        if fields:
+            cache_key = self.cache.build_key(cache_key, fields=",".join(fields))
 
         # Try to get from cache
         cached_products = self.cache.get(cache_key)
         if cached_products is not None:
-            logger.debug(f"Cache HIT: {cache_key}")
+            logger.debug("Cache HIT: %s", cache_key)
             # Convert dict list back to ProductSchema list
-            return [ProductSchema(**p) for p in cached_products]
+            return [self._from_cache(p, fields) for p in cached_products]
 
         # Cache miss - get from database
-        logger.debug(f"Cache MISS: {cache_key}")
-        products = super().get_all(skip, limit)
+        logger.debug("Cache MISS: %s", cache_key)
+        products = super().get_all(skip, limit, include, fields)
 
         # Cache the result (convert to dict for JSON serialization)
-        products_dict = [self.schema.model_validate(p).model_dump() for p in products]
+        products_dict = [p.model_dump(exclude_unset=True) for p in products]
         self.cache.set(cache_key, products_dict)
 
         return products
 
-    def get_one(self, id_key: int) -> ProductSchema:
+    def get_one(
+        self, id_key: int, include: Tuple[str, ...] = (), fields: Tuple[str, ...] = ()
+    ) -> ProductSchema:
         """
         Get single product by ID with caching
 
-        Cache key pattern: products:id:{id_key}
+        Cache key pattern: products:id:{id_key}[:fields:{fields}]
         TTL: 5 minutes
         """
         cache_key = self.cache.build_key(self.cache_prefix, "id", id=id_key)
+        if fields:
+            cache_key = self.cache.build_key(cache_key, fields=",".join(fields))
 
         # Try cache first
         cached_product = self.cache.get(cache_key)
         if cached_product is not None:
-            logger.debug(f"Cache HIT: {cache_key}")
-            return ProductSchema(**cached_product)
+            logger.debug("Cache HIT: %s", cache_key)
+            return self._from_cache(cached_product, fields)
 
         # Get from database
-        logger.debug(f"Cache MISS: {cache_key}")
-        product = super().get_one(id_key)
+        logger.debug("Cache MISS: %s", cache_key)
+        product = super().get_one(id_key, include, fields)
 
         # Cache the result
-        self.cache.set(cache_key, self.schema.model_validate(product).model_dump())
+        self.cache.set(cache_key, product.model_dump(exclude_unset=True))
 
         return product
 
+    def get_top_rated(self, skip: int = 0, limit: int = 100, min_reviews: int = 1) -> List[ProductSchema]:
+        """
+        Get products by average rating, best first, with caching
+
+        Cache key pattern: products:list:top_rated:limit:{limit}:min_reviews:{min_reviews}:skip:{skip}
+        (a list key, so product and review writes invalidate it)
+        """
+        cache_key = self.cache.build_key(
+            self.cache_prefix,
+            "list",
+            "top_rated",
+            skip=skip,
+            limit=limit,
+            min_reviews=min_reviews
+        )
+
+        cached_products = self.cache.get(cache_key)
+        if cached_products is not None:
+            logger.debug("Cache HIT: %s", cache_key)
+            return [ProductSchema(**p) for p in cached_products]
+
+        logger.debug("Cache MISS: %s", cache_key)
+        products = self.repository.find_top_rated(skip=skip, limit=limit, min_reviews=min_reviews)
+        self.cache.set(cache_key, [p.model_dump(exclude_unset=True) for p in products])
+
+        return products
+
+    def get_by_category(self, category_id: int, cursor: Optional[str] = None, limit: int = 20) -> CategoryProducts:
+        """
+        A page of a category's products by id_key, with caching
+
+        Cache key pattern: products:category:{category_id}:cursor:{cursor}:limit:{limit}
+        (outside products:list:*; a category's pages are dropped only when
+        one of its products changes)
+
+        Raises:
+            InstanceNotFoundError: If the category doesn't exist
+            ValueError: If the cursor is invalid
+        """
+        after = 0
+        if cursor:
+            after_id, = decode_cursor(cursor, 1)
+            if not isinstance(after_id, int):
+                raise ValueError("Invalid cursor")
+            after = after_id
+
+        cache_key = self.cache.build_key(
+            self.cache_prefix, "category", category_id, cursor=cursor or "", limit=limit
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            logger.debug("Cache HIT: %s", cache_key)
+            return CategoryProducts.model_validate(cached)
+
+        logger.debug("Cache MISS: %s", cache_key)
+        # One extra product tells whether there is a next page
+        products = self.repository.find_by_category(category_id, limit + 1, after)
+        if not products:
+            CategoryRepository(self.repository.session).find(category_id)  # 404 for unknown categories
+
+        next_cursor = None
+        if len(products) > limit:
+            products = products[:limit]
+            next_cursor = encode_cursor(products[-1].id_key)
+
+        page = CategoryProducts(category_id=category_id, products=products, next_cursor=next_cursor)
+        self.cache.set(
+            cache_key, page.model_dump(mode="json", exclude_unset=True), ttl=CacheConfig.CATEGORY_PRODUCTS_TTL
+        )
+        return page
+
+    @staticmethod
+    def _from_cache(data: dict, fields: Tuple[str, ...]) -> ProductSchema:
+        """Rebuild a cached product (fieldsets are partial, so not validated)"""
+        if fields:
+            return ProductSchema.model_construct(**data)
+        return ProductSchema(**data)
+
+    def to_model(self, schema: ProductSchema) -> ProductModel:
+        """Convert schema to model, leaving the rating aggregates at zero and the stock unsharded"""
+        return ProductModel(**schema.model_dump(exclude_unset=True, exclude=READ_ONLY_FIELDS))
+
     def save(self, schema: ProductSchema) -> ProductSchema:
         """
         Create new product and invalidate list cache
         """
         product = super().save(schema)
 
-        # Invalidate list cache (all paginated lists)
+        # Invalidate list cache (all paginated lists) and the category's pages
         self._invalidate_list_cache()
+        self._invalidate_category_cache([product.category_id])
 
         return product
 
@@ -110,14 +211,22 @@ class ProductService(BaseServiceImpl):
         """
         # Build cache keys BEFORE update (prepare for invalidation)
         cache_key = self.cache.build_key(self.cache_prefix, "id", id=id_key)
+        category_ids = self.repository.category_ids([id_key])
 
         try:
-            # Update in database (atomic transaction)
-            product = super().update(id_key, schema)
+            # Update in database (atomic transaction); rating aggregates
+            # are left to ReviewService
+            product = self.repository.update(
+                id_key, schema.model_dump(exclude_unset=True, exclude=READ_ONLY_FIELDS)
+            )
 
             # Only invalidate cache AFTER successful DB commit
-            self.cache.delete(cache_key)
+            self._invalidate_product_cache(cache_key)
             self._invalidate_list_cache()
+            self._invalidate_category_cache(category_ids | {product.category_id})
+            if "stock" in schema.model_fields_set:
+                # Restocks reach carts on the next reservation (re-seeded)
+                reservation_store.invalidate(id_key)
 
             logger.info(f"Product {id_key} updated and cache invalidated successfully")
             return product
@@ -157,14 +266,49 @@ class ProductService(BaseServiceImpl):
 
         # Safe to delete
         logger.info(f"Deleting product {id_key} (no sales history)")
+        category_ids = self._repository.category_ids([id_key])
         super().delete(id_key)
 
         # Invalidate specific product cache
         cache_key = self.cache.build_key(self.cache_prefix, "id", id=id_key)
-        self.cache.delete(cache_key)
+        self._invalidate_product_cache(cache_key)
 
-        # Invalidate list cache
+        # Invalidate list cache and the category's pages
         self._invalidate_list_cache()
+        self._invalidate_category_cache(category_ids)
+        reservation_store.invalidate(id_key)
+
+    def set_stock_shards(self, id_key: int, shards: int) -> ProductSchema:
+        """
+        Split a hot product's stock over `shards` shard rows (0 unshards it)
+
+        Purchases then lock one shard each instead of the product row. The
+        total stock is unchanged.
+
+        Raises:
+            InstanceNotFoundError: If product doesn't exist
+        """
+        try:
+            self.repository.shard_stock(id_key, shards)
+            self.repository.session.commit()
+        except Exception:
+            self.repository.session.rollback()
+            raise
+
+        self.invalidate_cache(id_key)
+        logger.info(f"Product {id_key} stock split over {shards} shard(s)")
+        return self.repository.find(id_key)
+
+    def invalidate_cache(self, id_key: int):
+        """Invalidate a product's cache entries, every product list and its category's pages"""
+        self._invalidate_product_cache(self.cache.build_key(self.cache_prefix, "id", id=id_key))
+        self._invalidate_list_cache()
+        self._invalidate_category_cache(self.repository.category_ids([id_key]))
+
+    def _invalidate_product_cache(self, cache_key: str):
+        """Invalidate a product's cache entry and its fieldset variants"""
+        self.cache.delete(cache_key)
+        self.cache.delete_pattern(f"{cache_key}:fields:*")
 
     def _invalidate_list_cache(self):
         """Invalidate all product list caches"""
@@ -172,3 +316,8 @@ class ProductService(BaseServiceImpl):
         deleted_count = self.cache.delete_pattern(pattern)
         if deleted_count > 0:
             logger.info(f"Invalidated {deleted_count} product list cache entries")
+
+    def _invalidate_category_cache(self, category_ids: Iterable[Optional[int]]):
+        """Invalidate every cached page of the given categories' products"""
+        for category_id in set(category_ids) - {None}:
+            self.cache.delete_pattern(self.cache.build_key(self.cache_prefix, "category", category_id, "*"))
@@ -0,0 +1,348 @@
+"""
+Reservation Store Module
+
+Holds cart stock reservations in Redis. Every state change is one Lua
+script, so it is atomic and costs one round trip. Contention on hot products
+happens here instead of on PostgreSQL row locks.
+
+Keys (prefix "reservations"):
+    stock:{product_id}     Units available to reserve (the stock mirror)
+    reserved               Hash product_id -> units held by carts and checkouts
+    cart:{cart_id}         Hash product_id -> units held by the cart
+    checkout:{cart_id}     A cart being turned into order details
+    expiring               Sorted set of cart ids by reservation deadline
+    checkouts              Sorted set of checkout ids by timeout deadline
+
+Invariant: stock:{id} = products.stock - reserved[id]. The mirror is seeded
+lazily from the database and repaired by the reconciler (see cart_service).
+Scripts build the stock keys they touch from a prefix, so this assumes a
+single Redis instance (not Redis Cluster), like the rest of the app.
+"""
+import time
+from typing import Dict, Optional, Tuple
+
+from config.redis_config import get_redis_client
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
+
+
+class ReservationUnavailableError(Exception):
+    """Redis is not reachable, so nothing can be reserved"""
+    pass
+
+
+class InsufficientStockError(Exception):
+    """Not enough units left to reserve or check out"""
+
+    def __init__(self, product_id: int, available: int):
+        super().__init__(f"Insufficient stock for product {product_id}. Available: {available}")
+        self.product_id = product_id
+        self.available = available
+
+
+class CheckoutInProgressError(Exception):
+    """The cart is already being checked out"""
+    pass
+
+
+# Sets a cart's units of one product. KEYS: stock, cart, reserved, expiring.
+# ARGV: product_id, quantity, deadline, cart_id.
+# Returns {quantity, left}, {-1, available} or {-2, 0} when not mirrored yet.
+SET_QUANTITY = """
+local stock = redis.call('GET', KEYS[1])
+if not stock then return {-2, 0} end
+local held = tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or '0')
+local want = tonumber(ARGV[2])
+local delta = want - held
+if delta > tonumber(stock) then return {-1, tonumber(stock)} end
+local left = redis.call('DECRBY', KEYS[1], delta)
+redis.call('HINCRBY', KEYS[3], ARGV[1], delta)
+if want > 0 then
+    redis.call('HSET', KEYS[2], ARGV[1], want)
+else
+    redis.call('HDEL', KEYS[2], ARGV[1])
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    redis.call('ZADD', KEYS[4], ARGV[3], ARGV[4])
+else
+    redis.call('ZREM', KEYS[4], ARGV[4])
+end
+return {want, left}
+"""
+
+# Seeds the mirror from the database stock if absent. KEYS: stock, reserved.
+# ARGV: product_id, database stock. Returns the mirror's value.
+SEED = """
+local reserved = tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or '0')
+redis.call('SET', KEYS[1], tonumber(ARGV[2]) - reserved, 'NX')
+return tonumber(redis.call('GET', KEYS[1]))
+"""
+
+# Takes units sold outside a cart (direct order details) from the mirror, so
+# carts can no longer reserve them. KEYS: stock, reserved. ARGV: product_id,
+# database stock, quantity. Units held by carts are never available; when not
+# mirrored only the database stock counts. Returns {1, left} or {-1, available}.
+TAKE = """
+local available = tonumber(ARGV[2]) - tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or '0')
+local stock = redis.call('GET', KEYS[1])
+if stock and tonumber(stock) < available then available = tonumber(stock) end
+local want = tonumber(ARGV[3])
+if want > available then return {-1, available} end
+if stock then redis.call('DECRBY', KEYS[1], want) end
+return {1, available - want}
+"""
+
+# Repairs a mirrored product. KEYS: stock, reserved. ARGV: product_id,
+# database stock. Returns the drift corrected (0 if none, nil if not mirrored).
+REPAIR = """
+local current = redis.call('GET', KEYS[1])
+if not current then return nil end
+local expected = tonumber(ARGV[2]) - tonumber(redis.call('HGET', KEYS[2], ARGV[1]) or '0')
+if tonumber(current) ~= expected then
+    redis.call('SET', KEYS[1], expected)
+end
+return tonumber(current) - expected
+"""
+
+# Shared by RELEASE and RELEASE_DUE: returns a hash's units to the mirror
+# (only if mirrored: a fresh seed already accounts for them) and drops it.
+_RELEASE_FUNCTION = """
+local function release(key, id)
+    local items = redis.call('HGETALL', key)
+    for i = 1, #items, 2 do
+        local stock = ARGV[2] .. items[i]
+        if redis.call('EXISTS', stock) == 1 then
+            redis.call('INCRBY', stock, items[i + 1])
+        end
+        redis.call('HINCRBY', KEYS[2], items[i], -tonumber(items[i + 1]))
+    end
+    redis.call('DEL', key)
+    redis.call('ZREM', KEYS[1], id)
+end
+"""
+
+# KEYS: deadlines, reserved. ARGV: hash key prefix, stock key prefix, id.
+RELEASE = _RELEASE_FUNCTION + """
+release(ARGV[1] .. ARGV[3], ARGV[3])
+return 1
+"""
+
+# KEYS: deadlines, reserved. ARGV: hash key prefix, stock key prefix, now,
+# max. Releases up to max ids whose deadline has passed; returns how many.
+RELEASE_DUE = _RELEASE_FUNCTION + """
+local ids = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[3], 'LIMIT', 0, tonumber(ARGV[4]))
+for _, id in ipairs(ids) do
+    release(ARGV[1] .. id, id)
+end
+return #ids
+"""
+
+# Moves a cart to checkout. KEYS: cart, checkout, expiring, checkouts.
+# ARGV: cart_id, checkout deadline. Returns the items, or -1 if a checkout
+# of this cart is already running.
+CLAIM = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return {} end
+if redis.call('RENAMENX', KEYS[1], KEYS[2]) == 0 then return -1 end
+redis.call('ZREM', KEYS[3], ARGV[1])
+redis.call('ZADD', KEYS[4], ARGV[2], ARGV[1])
+return redis.call('HGETALL', KEYS[2])
+"""
+
+# Ends a committed checkout: its units now left products.stock too.
+# KEYS: checkout, reserved, checkouts. ARGV: cart_id.
+COMPLETE = """
+local items = redis.call('HGETALL', KEYS[1])
+for i = 1, #items, 2 do
+    redis.call('HINCRBY', KEYS[2], items[i], -tonumber(items[i + 1]))
+end
+redis.call('DEL', KEYS[1])
+redis.call('ZREM', KEYS[3], ARGV[1])
+return #items / 2
+"""
+
+
+def _pairs(flat) -> Dict[int, int]:
+    """HGETALL reply -> {product_id: quantity}"""
+    return {int(flat[i]): int(flat[i + 1]) for i in range(0, len(flat), 2)}
+
+
+class ReservationStore:
+    """
+    Atomic reserve, release and checkout operations on the Redis stock mirror
+
+    One instance per worker (reservation_store). Scripts are loaded once per
+    Redis client and run with EVALSHA.
+    """
+
+    def __init__(self, prefix: str = "reservations"):
+        self.prefix = prefix
+        self.redis_client = get_redis_client()
+        self._scripts = {}
+        self._scripts_client = None
+
+    def _key(self, *parts) -> str:
+        return ":".join([self.prefix, *map(str, parts)])
+
+    def _client(self):
+        """The Redis client (picked up late if Redis connects after startup)"""
+        if self.redis_client is None:
+            self.redis_client = get_redis_client()
+        if self.redis_client is None:
+            raise ReservationUnavailableError("Reservations are unavailable (Redis not connected)")
+        return self.redis_client
+
+    def _script(self, source: str):
+        client = self._client()
+        if self._scripts_client is not client:
+            self._scripts, self._scripts_client = {}, client
+        script = self._scripts.get(source)
+        if script is None:
+            script = self._scripts[source] = client.register_script(source)
+        return script
+
+    def set_quantity(self, cart_id: str, product_id: int, quantity: int, ttl_seconds: int) -> Optional[int]:
+        """
+        Hold `quantity` units of a product for a cart (0 releases them)
+
+        The cart's deadline moves to now + ttl_seconds on every change.
+
+        Returns:
+            Units left to reserve, or None if the product isn't mirrored yet
+            (seed() it from the database and retry)
+
+        Raises:
+            InsufficientStockError: If fewer units are left than requested
+        """
+        status, value = self._script(SET_QUANTITY)(
+            keys=[self._key("stock", product_id), self._key("cart", cart_id),
+                  self._key("reserved"), self._key("expiring")],
+            args=[product_id, quantity, time.time() + ttl_seconds, cart_id],
+        )
+        if status == -2:
+            return None
+        if status == -1:
+            raise InsufficientStockError(product_id, value)
+        return value
+
+    def seed(self, product_id: int, stock: int) -> int:
+        """Mirror a product's database stock (no-op if already mirrored)"""
+        return self._script(SEED)(
+            keys=[self._key("stock", product_id), self._key("reserved")], args=[product_id, stock]
+        )
+
+    def take(self, product_id: int, quantity: int, stock: int) -> int:
+        """
+        Take units bought without a cart, leaving the units carts hold alone
+
+        Call with the product's database stock (locked), before deducting it;
+        invalidate() the mirror once the purchase commits or fails.
+
+        Returns:
+            Units left to reserve or buy
+
+        Raises:
+            InsufficientStockError: If fewer units are neither held nor sold
+        """
+        status, value = self._script(TAKE)(
+            keys=[self._key("stock", product_id), self._key("reserved")], args=[product_id, stock, quantity]
+        )
+        if status == -1:
+            raise InsufficientStockError(product_id, value)
+        return value
+
+    def invalidate(self, product_id: int) -> None:
+        """Drop a product's mirror after its database stock changed outside checkout"""
+        try:
+            self._client().delete(self._key("stock", product_id))
+        except ReservationUnavailableError:
+            pass
+        except Exception as e:
+            logger.error(f"❌ Failed to invalidate stock mirror for product {product_id}: {e}")
+
+    def items(self, cart_id: str) -> Tuple[Dict[int, int], Optional[float]]:
+        """A cart's held units and its deadline (epoch seconds; None if empty)"""
+        client = self._client()
+        pipe = client.pipeline(transaction=False)
+        pipe.hgetall(self._key("cart", cart_id))
+        pipe.zscore(self._key("expiring"), cart_id)
+        items, deadline = pipe.execute()
+        return {int(k): int(v) for k, v in items.items()}, deadline
+
+    def release(self, cart_id: str) -> None:
+        """Return all of a cart's units"""
+        self._script(RELEASE)(
+            keys=[self._key("expiring"), self._key("reserved")],
+            args=[self._key("cart", ""), self._key("stock", ""), cart_id],
+        )
+
+    def release_due(self, limit: int) -> int:
+        """
+        Return the units of up to `limit` expired carts and, separately, up
+        to `limit` timed-out checkouts
+
+        Returns:
+            Number of carts and checkouts released
+        """
+        now = time.time()
+        released = 0
+        for deadlines, kind in (("expiring", "cart"), ("checkouts", "checkout")):
+            released += self._script(RELEASE_DUE)(
+                keys=[self._key(deadlines), self._key("reserved")],
+                args=[self._key(kind, ""), self._key("stock", ""), now, limit],
+            )
+        return released
+
+    def claim(self, cart_id: str, timeout_seconds: int) -> Dict[int, int]:
+        """
+        Start a checkout: move the cart's units out of reach of expiry and edits
+
+        Returns:
+            The cart's items (empty if the cart holds nothing)
+
+        Raises:
+            CheckoutInProgressError: If the cart is already being checked out
+        """
+        result = self._script(CLAIM)(
+            keys=[self._key("cart", cart_id), self._key("checkout", cart_id),
+                  self._key("expiring"), self._key("checkouts")],
+            args=[cart_id, time.time() + timeout_seconds],
+        )
+        if result == -1:
+            raise CheckoutInProgressError(f"Cart {cart_id} is already being checked out")
+        return _pairs(result)
+
+    def complete(self, cart_id: str) -> None:
+        """End a checkout whose order details were committed"""
+        self._script(COMPLETE)(
+            keys=[self._key("checkout", cart_id), self._key("reserved"), self._key("checkouts")],
+            args=[cart_id],
+        )
+
+    def abort(self, cart_id: str) -> None:
+        """End a failed checkout, returning its units"""
+        self._script(RELEASE)(
+            keys=[self._key("checkouts"), self._key("reserved")],
+            args=[self._key("checkout", ""), self._key("stock", ""), cart_id],
+        )
+
+    def repair(self, stocks: Dict[int, int]) -> int:
+        """
+        Reset drifted mirrors to products.stock - reserved, one pipeline per call
+
+        Args:
+            stocks: Database stock by product id
+
+        Returns:
+            Number of mirrors corrected
+        """
+        client = self._client()
+        script = self._script(REPAIR)
+        pipe = client.pipeline(transaction=False)
+        for product_id, stock in stocks.items():
+            script(keys=[self._key("stock", product_id), self._key("reserved")],
+                   args=[product_id, stock], client=pipe)
+        return sum(1 for drift in pipe.execute() if drift)
+
+
+reservation_store = ReservationStore()
@@ -1,14 +1,46 @@
-"""Review service for CRUD operations."""
+"""Review service for CRUD operations and product rating aggregates."""
+from typing import List
+
 from sqlalchemy.orm import Session
 
+from config.constants import WriteBatchConfig
 from models.review import ReviewModel
+from repositories.base_repository_impl import InstanceNotFoundError
+from repositories.product_repository import ProductRepository
 from repositories.review_repository import ReviewRepository
+from repositories.write_batcher import WriteBatcher
 from schemas import ReviewSchema
 from services.base_service_impl import BaseServiceImpl
+from services.product_service import ProductService
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
+
+
+def _count_ratings(session: Session, rows: List[dict]) -> None:
+    """Add a batch of new reviews to their products' rating aggregates"""
+    ratings = {}
+    for row in rows:
+        count, total = ratings.get(row["product_id"], (0, 0.0))
+        ratings[row["product_id"]] = (count + 1, total + row["rating"])
+    repository = ProductRepository(session)
+    for product_id, (count, total) in ratings.items():
+        if not repository.add_rating(product_id, count, total):
+            raise InstanceNotFoundError(f"Product with id {product_id} not found")
+
+
+# Group commit of concurrent review creates (WriteBatchConfig.ENABLED)
+review_batcher = WriteBatcher(ReviewModel, ReviewSchema, before_commit=_count_ratings)
 
 
 class ReviewService(BaseServiceImpl):
-    """Service for Review entity business logic."""
+    """
+    Service for Review entity business logic
+
+    Every review write also adjusts the product's rating_count and
+    rating_sum with an in-place UPDATE, in the same transaction as the
+    review itself, so the aggregates never drift from the reviews.
+    """
 
     def __init__(self, db: Session):
         super().__init__(
@@ -17,3 +49,59 @@ class ReviewService(BaseServiceImpl):
             schema=ReviewSchema,
             db=db
         )
+        self._product_repository = ProductRepository(db)
+        self._product_service = ProductService(db)
+
+    def get_by_product(self, product_id: int, skip: int = 0, limit: int = 100) -> List[ReviewSchema]:
+        """
+        Get a product's reviews with pagination, newest first
+
+        Raises:
+            InstanceNotFoundError: If the product doesn't exist
+        """
+        self._product_repository.find(product_id)
+        return self.repository.find_by_product(product_id, skip=skip, limit=limit)
+
+    def _add_rating(self, product_id: int, count_delta: int, sum_delta: float) -> None:
+        """Adjust a product's rating aggregates (rolled back with the review on error)"""
+        if not self._product_repository.add_rating(product_id, count_delta, sum_delta):
+            self.repository.session.rollback()
+            logger.error(f"Product with id {product_id} not found")
+            raise InstanceNotFoundError(f"Product with id {product_id} not found")
+
+    def save(self, schema: ReviewSchema) -> ReviewSchema:
+        """Create a review and count it on its product"""
+        if WriteBatchConfig.ENABLED:
+            review = review_batcher.insert(schema)
+        else:
+            self._add_rating(schema.product_id, 1, schema.rating)
+            review = super().save(schema)
+        self._product_service.invalidate_cache(schema.product_id)
+        return review
+
+    def update(self, id_key: int, schema: ReviewSchema) -> ReviewSchema:
+        """Update a review, moving its rating between products if needed"""
+        existing = self._repository.find(id_key)
+        product_id = schema.product_id if schema.product_id is not None else existing.product_id
+        rating = schema.rating if schema.rating is not None else existing.rating
+
+        if product_id != existing.product_id:
+            self._add_rating(existing.product_id, -1, -existing.rating)
+            self._add_rating(product_id, 1, rating)
+        elif rating != existing.rating:
+            self._add_rating(product_id, 0, rating - existing.rating)
+
+        review = super().update(id_key, schema)
+        self._product_service.invalidate_cache(existing.product_id)
+        if product_id != existing.product_id:
+            self._product_service.invalidate_cache(product_id)
+        return review
+
+    def delete(self, id_key: int) -> None:
+        """Delete a review and remove it from its product's rating"""
+        existing = self._repository.find(id_key)
+        if existing.product_id is not None:
+            self._add_rating(existing.product_id, -1, -existing.rating)
+        super().delete(id_key)
+        if existing.product_id is not None:
+            self._product_service.invalidate_cache(existing.product_id)
@@ -0,0 +1,106 @@
+"""Sales report service backed by the incrementally refreshed sales_daily rollup."""
+import asyncio
+from datetime import date
+from typing import Optional
+
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from config.constants import ReportConfig
+from repositories.sales_report_repository import SalesReportRepository
+from schemas import CategorySales, DailySales, PaymentTypeSales, ProductSales, SalesReport
+from utils.logging_utils import get_sanitized_logger
+
+logger = get_sanitized_logger(__name__)
+
+
+class SalesReportService:
+    """Revenue by product, category, day and payment type"""
+
+    def __init__(self, db: Session):
+        self._repository = SalesReportRepository(db)
+
+    @property
+    def repository(self) -> SalesReportRepository:
+        return self._repository
+
+    def _report(self, rows, row_schema, start: Optional[date], end: Optional[date]) -> SalesReport:
+        return SalesReport[row_schema](
+            start=start,
+            end=end,
+            pending_days=self.repository.pending_days(),
+            rows=[row_schema.model_validate(row._mapping) for row in rows],
+        )
+
+    def by_product(self, start: Optional[date] = None, end: Optional[date] = None,
+                   limit: int = ReportConfig.DEFAULT_LIMIT) -> SalesReport:
+        return self._report(self.repository.by_product(start, end, limit), ProductSales, start, end)
+
+    def by_category(self, start: Optional[date] = None, end: Optional[date] = None,
+                    limit: int = ReportConfig.DEFAULT_LIMIT) -> SalesReport:
+        return self._report(self.repository.by_category(start, end, limit), CategorySales, start, end)
+
+    def by_day(self, start: Optional[date] = None, end: Optional[date] = None) -> SalesReport:
+        return self._report(self.repository.by_day(start, end), DailySales, start, end)
+
+    def by_payment_type(self, start: Optional[date] = None, end: Optional[date] = None) -> SalesReport:
+        return self._report(self.repository.by_payment_type(start, end), PaymentTypeSales, start, end)
+
+
+def refresh_sales_rollup(max_days: int = ReportConfig.ROLLUP_REFRESH_MAX_DAYS) -> int:
+    """
+    Recompute every dirty day of the rollup, `max_days` per transaction
+
+    Returns:
+        Number of days recomputed
+    """
+    from config.database import SessionLocal
+
+    total = 0
+    with SessionLocal() as db:
+        repository = SalesReportRepository(db)
+        while True:
+            refreshed = repository.refresh(max_days)
+            total += refreshed
+            if refreshed < max_days:
+                break
+    if total:
+        logger.info(f"📊 Sales rollup refreshed for {total} day(s)")
+    return total
+
+
+class SalesRollupRefresher:
+    """
+    Background task applying dirty days to the sales rollup
+
+    One per worker, started in the app lifespan. Workers never refresh the
+    same day twice, as refresh() skips days locked by another worker.
+    """
+
+    def __init__(self, interval_seconds: float = ReportConfig.ROLLUP_REFRESH_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await run_in_threadpool(refresh_sales_rollup)
+            except Exception as e:
+                logger.error(f"❌ Sales rollup refresh failed: {e}")
+
+    def start(self):
+        if self._task is None and ReportConfig.ROLLUP_REFRESH_ENABLED:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+sales_rollup_refresher = SalesRollupRefresher()
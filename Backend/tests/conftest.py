@@ -1,8 +1,11 @@
 """Pytest configuration and fixtures for testing."""
+import fnmatch
 import os
 import pytest
+from unittest.mock import Mock
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 from datetime import datetime, date
 from typing import Generator
@@ -18,6 +21,7 @@ os.environ['REDIS_PORT'] = '6379'
 
 from models.base_model import base as Base
 from main import create_fastapi_app
+from services.cache_service import cache_service
 
 
 # Test database URL
@@ -338,3 +342,88 @@ def mock_redis(monkeypatch):
             return results
 
     return MockRedis()
+
+
+# Per-test database and cache fixtures for the feature test modules
+@pytest.fixture
+def memory_engine():
+    """Fresh in-memory SQLite database with every table, shared by all sessions."""
+    test_engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(test_engine)
+    yield test_engine
+    test_engine.dispose()
+
+
+def _seed_shop(session: Session) -> None:
+    """Seed the shop of shop_session into any session and commit it."""
+    from models.category import CategoryModel
+    from models.product import ProductModel
+    from models.client import ClientModel
+    from models.bill import BillModel
+    from models.order import OrderModel
+    from models.enums import DeliveryMethod, Status, PaymentType
+
+    category = CategoryModel(name="Tools")
+    client = ClientModel(name="Ada", email="ada@example.com")
+    session.add_all([category, client])
+    session.flush()
+    bill = BillModel(bill_number="B-1", date=date(2024, 3, 1), total=0, payment_type=PaymentType.CARD,
+                     client_id=client.id_key)
+    session.add_all([
+        ProductModel(name="Hammer", price=10.0, stock=10, category_id=category.id_key),
+        ProductModel(name="Hose", price=2.5, stock=100, category_id=category.id_key),
+        bill,
+    ])
+    session.flush()
+    session.add(OrderModel(date=datetime(2024, 3, 1, 12), total=0, status=Status.PENDING,
+                           delivery_method=DeliveryMethod.ON_HAND, client_id=client.id_key, bill_id=bill.id_key))
+    session.commit()
+
+
+@pytest.fixture
+def seed_shop():
+    """Function seeding the shop of shop_session, for modules on their own engine."""
+    return _seed_shop
+
+
+@pytest.fixture
+def shop_session(memory_engine) -> Generator[Session, None, None]:
+    """
+    Session on memory_engine with a small shop, all ids 1 unless noted:
+    category "Tools"; client "Ada"; products "Hammer" (10.0, 10 units) and
+    "Hose" (id 2, 2.5, 100 units); bill "B-1" (card, 2024-03-01, total 0);
+    and Ada's pending order on it (2024-03-01 12:00, total 0).
+
+    Modules add or change only what their tests need.
+    """
+    with Session(memory_engine) as session:
+        _seed_shop(session)
+        yield session
+
+
+@pytest.fixture
+def no_cache(monkeypatch):
+    """Cache that is unavailable: every read misses, writes and deletes are recorded mocks."""
+    monkeypatch.setattr(cache_service, "is_available", Mock(return_value=False))
+    monkeypatch.setattr(cache_service, "get", Mock(return_value=None))
+    monkeypatch.setattr(cache_service, "set", Mock(return_value=True))
+    monkeypatch.setattr(cache_service, "delete", Mock(return_value=True))
+    monkeypatch.setattr(cache_service, "delete_pattern", Mock(return_value=0))
+    return cache_service
+
+
+@pytest.fixture
+def fake_cache(monkeypatch):
+    """In-memory stand-in for Redis: returns the dict of cached keys."""
+    store = {}
+    monkeypatch.setattr(cache_service, "get", lambda key: store.get(key))
+    monkeypatch.setattr(cache_service, "set", lambda key, value, ttl=None: store.__setitem__(key, value))
+    monkeypatch.setattr(cache_service, "delete", lambda key: bool(store.pop(key, None)))
+    monkeypatch.setattr(cache_service, "delete_pattern", lambda pattern: len([
+        store.pop(key) for key in list(store) if fnmatch.fnmatch(key, pattern)
+    ]))
+    return store
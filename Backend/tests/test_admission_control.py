@@ -0,0 +1,160 @@
+"""
+Tests for admission control and priority load shedding
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from middleware.admission_control import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    AdmissionController,
+    AdmissionControlMiddleware,
+    classify_request,
+)
+
+
+class FakePool:
+    """Stands in for engine.pool with a fixed number of checked-out connections"""
+
+    def __init__(self, checked_out: int, size: int = 10, max_overflow: int = 0):
+        self.checked_out = checked_out
+        self._size = size
+        self._max_overflow = max_overflow
+
+    def checkedout(self):
+        return self.checked_out
+
+    def checkedin(self):
+        return max(self._size - self.checked_out, 0)
+
+    def overflow(self):
+        return self.checked_out - self._size
+
+    def size(self):
+        return self._size
+
+
+# ============================================================================
+# PRIORITY CLASSES
+# ============================================================================
+
+class TestClassifyRequest:
+    """Checkout writes outrank everything, catalog reads and probes rank lowest"""
+
+    @pytest.mark.parametrize("method,path,priority", [
+        ("POST", "/orders", PRIORITY_HIGH),
+        ("POST", "/order_details", PRIORITY_HIGH),
+        ("PUT", "/bills/3", PRIORITY_HIGH),
+        ("GET", "/orders/1", PRIORITY_NORMAL),
+        ("POST", "/clients", PRIORITY_NORMAL),
+        ("GET", "/products", PRIORITY_LOW),
+        ("GET", "/categories/2", PRIORITY_LOW),
+        ("GET", "/health_check", PRIORITY_LOW),
+        ("GET", "/", PRIORITY_LOW),
+    ])
+    def test_priority(self, method, path, priority):
+        assert classify_request(method, path) == priority
+
+
+# ============================================================================
+# ADMISSION DECISIONS
+# ============================================================================
+
+class TestAdmissionController:
+    """Shedding follows the health_check thresholds (pool: 70% warning, 90% critical)"""
+
+    def test_everything_admitted_when_healthy(self):
+        controller = AdmissionController(FakePool(checked_out=1))
+
+        assert controller.overload_level() == "healthy"
+        assert all(controller.admit(p) for p in (PRIORITY_LOW, PRIORITY_NORMAL, PRIORITY_HIGH))
+
+    def test_warning_sheds_only_low_priority(self):
+        controller = AdmissionController(FakePool(checked_out=8))
+
+        assert controller.overload_level() == "warning"
+        assert controller.admit(PRIORITY_LOW) is False
+        assert controller.admit(PRIORITY_NORMAL) is True
+        assert controller.shed[PRIORITY_LOW] == 1
+
+    def test_critical_admits_only_high_priority(self):
+        controller = AdmissionController(FakePool(checked_out=10))
+
+        assert controller.overload_level() == "critical"
+        assert controller.admit(PRIORITY_NORMAL) is False
+        assert controller.admit(PRIORITY_HIGH) is True
+
+    def test_overflow_in_use_is_headroom(self):
+        # One overflow connection out of 10: 6 of 15 possible, not a full pool
+        controller = AdmissionController(FakePool(checked_out=6, size=5, max_overflow=10))
+
+        assert controller.signals()["db_pool_utilization"]["value"] == 40.0
+        assert controller.admit(PRIORITY_NORMAL) is True
+
+    def test_overflow_exhausted_is_critical(self):
+        controller = AdmissionController(FakePool(checked_out=14, size=5, max_overflow=10))
+
+        assert controller.overload_level() == "critical"
+        assert controller.admit(PRIORITY_NORMAL) is False
+
+    def test_hard_cap_applies_to_high_priority(self):
+        controller = AdmissionController(FakePool(checked_out=0), max_in_flight=2)
+        controller.in_flight = 2
+
+        assert controller.admit(PRIORITY_HIGH) is False
+
+    def test_slow_requests_raise_latency_level(self):
+        controller = AdmissionController(FakePool(checked_out=0))
+
+        controller.record_latency(5000)
+
+        assert controller.signals()["request_latency"]["level"] == "critical"
+
+    def test_stale_latency_is_ignored(self):
+        controller = AdmissionController(FakePool(checked_out=0), latency_window_seconds=0)
+
+        controller.record_latency(5000)
+
+        assert controller.overload_level() == "healthy"
+
+
+# ============================================================================
+# MIDDLEWARE
+# ============================================================================
+
+class TestAdmissionControlMiddleware:
+    """Shed requests get a fast 503 with Retry-After"""
+
+    @pytest.fixture
+    def pool(self):
+        return FakePool(checked_out=0)
+
+    @pytest.fixture
+    def client(self, pool):
+        app = FastAPI()
+
+        @app.get("/products")
+        def browse():
+            return []
+
+        @app.post("/orders")
+        def checkout():
+            return {"ok": True}
+
+        app.add_middleware(AdmissionControlMiddleware, controller=AdmissionController(pool))
+        return TestClient(app)
+
+    def test_requests_pass_when_healthy(self, client):
+        assert client.get("/products").status_code == 200
+
+    def test_overload_returns_503_with_retry_after(self, client, pool):
+        pool.checked_out = 10
+
+        response = client.get("/products")
+
+        assert response.status_code == 503
+        assert int(response.headers["Retry-After"]) > 0
+        # Checkout is still admitted
+        assert client.post("/orders").status_code == 200
@@ -0,0 +1,383 @@
+"""
+Tests for cart stock reservations (CartService, reconciler and /carts endpoints)
+
+The Lua scripts of services/reservation_store.py run on fakeredis (with
+lupa), installed from requirements-dev.txt.
+"""
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_db
+from controllers.cart_controller import CartController
+from models.bill import BillModel
+from models.order import OrderModel
+from models.order_detail import OrderDetailModel
+from models.product import ProductModel
+from repositories.base_repository_impl import InstanceNotFoundError
+from schemas import OrderDetailSchema
+from services import cart_service, order_detail_service
+from services import reservation_store as reservation_store_module
+from services.cart_service import CartService, reconcile_reservations
+from services.order_detail_service import OrderDetailService
+from services.reservation_store import (
+    CheckoutInProgressError, InsufficientStockError, ReservationStore, ReservationUnavailableError
+)
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(reservation_store_module, "get_redis_client", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def store(redis, monkeypatch):
+    monkeypatch.setattr(cart_service, "invalidate_order_history", lambda client_ids: None)
+    return ReservationStore()
+
+
+@pytest.fixture
+def session(shop_session):
+    shop_session.get(ProductModel, 1).stock = 5  # Few enough Hammers to run out
+    shop_session.commit()
+    return shop_session
+
+
+def _stock(session, product_id):
+    session.expire_all()
+    return session.get(ProductModel, product_id).stock
+
+
+def _mirrors(redis):
+    """{product_id: units left to reserve} of every mirrored product"""
+    prefix = "reservations:stock:"
+    return {int(key[len(prefix):]): int(redis.get(key)) for key in redis.scan_iter(prefix + "*")}
+
+
+def _reserved(redis):
+    return {int(k): int(v) for k, v in redis.hgetall("reservations:reserved").items()}
+
+
+# ============================================================================
+# STORE (LUA SCRIPTS)
+# ============================================================================
+
+class TestReservationStore:
+    """Each operation is one script keeping stock:{id} = products.stock - reserved[id]"""
+
+    def test_reserve(self, store, redis):
+        assert store.set_quantity("a", 1, 2, 60) is None  # Not mirrored yet
+        assert store.seed(1, 5) == 5
+
+        assert store.set_quantity("a", 1, 2, 60) == 3
+        assert store.set_quantity("a", 1, 4, 60) == 1  # Only the difference is taken
+        items, deadline = store.items("a")
+        assert items == {1: 4}
+        assert deadline == pytest.approx(time.time() + 60, abs=5)
+        assert _reserved(redis) == {1: 4}
+
+    def test_insufficient_stock(self, store, redis):
+        store.seed(1, 5)
+        store.set_quantity("a", 1, 4, 60)
+
+        with pytest.raises(InsufficientStockError) as error:
+            store.set_quantity("b", 1, 2, 60)
+
+        assert error.value.available == 1
+        assert store.items("b") == ({}, None)
+        assert _mirrors(redis) == {1: 1}
+
+    def test_seed_accounts_for_reserved_units(self, store, redis):
+        store.seed(1, 5)
+        store.set_quantity("a", 1, 2, 60)
+        store.invalidate(1)
+
+        assert store.seed(1, 5) == 3
+        assert store.seed(1, 100) == 3  # Already mirrored: unchanged
+
+    def test_release(self, store, redis):
+        store.seed(1, 5)
+        store.seed(2, 10)
+        store.set_quantity("a", 1, 2, 60)
+        store.set_quantity("a", 2, 3, 60)
+        store.invalidate(2)  # Its next seed counts the units as returned already
+
+        store.release("a")
+
+        assert store.items("a") == ({}, None)
+        assert _mirrors(redis) == {1: 5}
+        assert _reserved(redis) == {1: 0, 2: 0}
+
+    def test_release_due_sweeps_expired_carts_and_checkouts(self, store, redis):
+        store.seed(1, 10)
+        for cart_id in ("expired", "fresh", "stuck"):
+            store.set_quantity(cart_id, 1, 2, 60)
+        store.claim("stuck", -1)  # Checkout already timed out
+        redis.zadd("reservations:expiring", {"expired": time.time() - 1})
+
+        assert store.release_due(limit=10) == 2
+
+        assert store.items("expired") == ({}, None)
+        assert store.items("fresh")[0] == {1: 2}
+        assert not redis.exists("reservations:checkout:stuck")
+        assert _mirrors(redis) == {1: 8}
+        assert store.release_due(limit=10) == 0
+
+    def test_claim_while_checkout_in_progress(self, store, redis):
+        store.seed(1, 10)
+        store.set_quantity("a", 1, 2, 60)
+
+        assert store.claim("a", 30) == {1: 2}
+        assert store.items("a") == ({}, None)  # Out of reach of expiry
+        assert store.claim("a", 30) == {}
+
+        store.set_quantity("a", 1, 1, 60)
+        with pytest.raises(CheckoutInProgressError):
+            store.claim("a", 30)
+        assert store.items("a")[0] == {1: 1}
+
+    def test_complete_and_abort(self, store, redis):
+        store.seed(1, 10)
+        store.set_quantity("done", 1, 2, 60)
+        store.set_quantity("failed", 1, 3, 60)
+        store.claim("done", 30)
+        store.claim("failed", 30)
+
+        store.complete("done")  # The units left products.stock too
+        store.abort("failed")
+
+        assert _mirrors(redis) == {1: 8}
+        assert _reserved(redis) == {1: 0}
+        assert redis.zcard("reservations:checkouts") == 0
+
+    def test_repair(self, store, redis):
+        store.seed(1, 10)
+        store.seed(2, 10)
+        store.set_quantity("a", 1, 4, 60)
+        redis.set("reservations:stock:2", 99)  # Drifted
+
+        assert store.repair({1: 10, 2: 7, 3: 50}) == 1
+
+        assert _mirrors(redis) == {1: 6, 2: 7}  # 3 isn't mirrored: left alone
+
+
+# ============================================================================
+# RESERVATIONS
+# ============================================================================
+
+class TestReserve:
+    """Units are held against the Redis mirror, never the products row"""
+
+    def test_first_reservation_seeds_the_mirror(self, session, store, redis):
+        cart = CartService(session, store).reserve("a", 1, 3)
+
+        assert [(item.product_id, item.quantity) for item in cart.items] == [(1, 3)]
+        assert cart.expires_at is not None
+        assert _mirrors(redis) == {1: 2}
+        assert _stock(session, 1) == 5
+
+    def test_competing_carts_cannot_oversell(self, session, store, redis):
+        service = CartService(session, store)
+        service.reserve("a", 1, 3)
+
+        with pytest.raises(InsufficientStockError) as error:
+            service.reserve("b", 1, 3)
+        assert error.value.available == 2
+
+        service.reserve("a", 1, 1)
+        service.reserve("b", 1, 4)
+        assert _mirrors(redis) == {1: 0}
+
+    def test_release_and_clear(self, session, store, redis):
+        service = CartService(session, store)
+        service.reserve("a", 1, 3)
+        service.reserve("a", 2, 10)
+
+        assert [item.product_id for item in service.reserve("a", 1, 0).items] == [2]
+        service.clear("a")
+
+        assert service.get("a").items == []
+        assert _mirrors(redis) == {1: 5, 2: 100}
+
+    def test_unknown_product(self, session, store):
+        with pytest.raises(InstanceNotFoundError):
+            CartService(session, store).reserve("a", 99, 1)
+
+    def test_mirror_dropped_after_seed_is_reseeded(self, session, store, redis, monkeypatch):
+        seed, drops = store.seed, []
+
+        def seed_then_drop(product_id, stock):
+            result = seed(product_id, stock)
+            if len(drops) < 1:
+                drops.append(product_id)
+                store.invalidate(product_id)  # A concurrent stock write
+            return result
+
+        monkeypatch.setattr(store, "seed", seed_then_drop)
+        cart = CartService(session, store).reserve("a", 1, 3)
+
+        assert [(item.product_id, item.quantity) for item in cart.items] == [(1, 3)]
+        assert _mirrors(redis) == {1: 2}
+
+    def test_mirror_always_dropped_reserves_nothing(self, session, store, monkeypatch):
+        seed = store.seed
+
+        def seed_then_drop(product_id, stock):
+            seed(product_id, stock)
+            store.invalidate(product_id)
+
+        monkeypatch.setattr(store, "seed", seed_then_drop)
+
+        with pytest.raises(ReservationUnavailableError):
+            CartService(session, store).reserve("a", 1, 3)
+        assert store.items("a") == ({}, None)
+
+
+# ============================================================================
+# CHECKOUT
+# ============================================================================
+
+class TestCheckout:
+    """Reservations become order details, stock and totals in one transaction"""
+
+    def test_checkout(self, session, store, redis):
+        service = CartService(session, store)
+        service.reserve("a", 1, 2)
+        service.reserve("a", 2, 4)
+
+        details = service.checkout("a", 1)
+
+        assert [(d.product_id, d.quantity, d.price) for d in details] == [(1, 2, 10.0), (2, 4, 2.5)]
+        assert (_stock(session, 1), _stock(session, 2)) == (3, 96)
+        assert session.get(OrderModel, 1).total == 30.0
+        assert session.get(BillModel, 1).total == 30.0
+        assert _reserved(redis) == {1: 0, 2: 0}
+        assert _mirrors(redis) == {1: 3, 2: 96}
+        assert service.get("a").items == []
+
+    def test_failed_checkout_rolls_back_and_releases(self, session, store, redis):
+        service = CartService(session, store)
+        service.reserve("a", 1, 2)
+        service.reserve("a", 2, 4)
+        # Drift: the database has fewer hoses than the mirror believes
+        session.get(ProductModel, 2).stock = 1
+        session.commit()
+
+        with pytest.raises(InsufficientStockError):
+            service.checkout("a", 1)
+
+        assert _stock(session, 1) == 5
+        assert session.query(OrderDetailModel).count() == 0
+        assert not redis.exists("reservations:checkout:a", "reservations:checkouts")
+        assert _mirrors(redis) == {1: 5, 2: 100}
+
+    def test_empty_cart_and_unknown_order(self, session, store):
+        service = CartService(session, store)
+
+        with pytest.raises(ValueError):
+            service.checkout("a", 1)
+        service.reserve("a", 1, 1)
+        with pytest.raises(InstanceNotFoundError):
+            service.checkout("a", 99)
+        assert store.items("a")[0] == {1: 1}
+
+
+# ============================================================================
+# DIRECT PURCHASES
+# ============================================================================
+
+class TestDirectPurchase:
+    """POST /order_details sells only units no cart holds"""
+
+    @pytest.fixture
+    def details(self, session, store, no_cache, monkeypatch):
+        monkeypatch.setattr(order_detail_service, "reservation_store", store)
+        return OrderDetailService(session)
+
+    def test_held_cart_keeps_its_units(self, session, store, redis, details):
+        carts = CartService(session, store)
+        carts.reserve("a", 1, 3)
+
+        with pytest.raises(ValueError, match="Available: 2"):
+            details.save(OrderDetailSchema(quantity=3, order_id=1, product_id=1))
+        details.save(OrderDetailSchema(quantity=2, order_id=1, product_id=1))
+
+        assert _stock(session, 1) == 3
+        with pytest.raises(InsufficientStockError):
+            carts.reserve("b", 1, 1)
+        assert [d.quantity for d in carts.checkout("a", 1)] == [3]
+        assert _stock(session, 1) == 0
+
+    def test_unmirrored_product_counts_reserved_units(self, session, store, redis, details):
+        CartService(session, store).reserve("a", 1, 4)
+        store.invalidate(1)  # e.g. an earlier stock write
+
+        with pytest.raises(ValueError, match="Available: 1"):
+            details.save(OrderDetailSchema(quantity=2, order_id=1, product_id=1))
+        assert _stock(session, 1) == 5
+
+    def test_without_redis_only_database_stock_counts(self, session, details, monkeypatch):
+        monkeypatch.setattr(reservation_store_module, "get_redis_client", lambda: None)
+        order_detail_service.reservation_store.redis_client = None
+
+        details.save(OrderDetailSchema(quantity=5, order_id=1, product_id=1))
+
+        assert _stock(session, 1) == 0
+
+
+# ============================================================================
+# RECONCILER
+# ============================================================================
+
+class TestReconcile:
+    """Expired carts are released and drifted mirrors repaired"""
+
+    def test_releases_expired_and_repairs(self, memory_engine, session, store, redis, monkeypatch):
+        monkeypatch.setattr(config.database, "SessionLocal", sessionmaker(bind=memory_engine))
+        service = CartService(session, store)
+        service.reserve("a", 1, 2)
+        service.reserve("b", 2, 4)
+        redis.zadd("reservations:expiring", {"a": time.time() - 1})
+        session.get(ProductModel, 2).stock = 50
+        session.commit()
+
+        assert reconcile_reservations(store) == {"released": 1, "repaired": 1}
+        assert _mirrors(redis) == {1: 5, 2: 46}
+        assert reconcile_reservations(store) == {"released": 0, "repaired": 0}
+
+
+# ============================================================================
+# ENDPOINTS
+# ============================================================================
+
+class TestCartEndpoints:
+
+    @pytest.fixture
+    def client(self, session, store, monkeypatch):
+        monkeypatch.setattr(CartService.__init__, "__defaults__", (store,))
+        app = FastAPI()
+        app.include_router(CartController().router, prefix="/carts")
+        app.dependency_overrides[get_db] = lambda: session
+        return TestClient(app)
+
+    def test_reserve_and_checkout(self, client):
+        assert client.put("/carts/a/items/1", json={"quantity": 3}).json()["items"] == [
+            {"product_id": 1, "quantity": 3}
+        ]
+        assert client.put("/carts/b/items/1", json={"quantity": 3}).status_code == 409
+        assert client.put("/carts/a/items/1", json={"quantity": -1}).status_code == 422
+        assert client.get("/carts/not%20valid").status_code == 422
+
+        response = client.post("/carts/a/checkout", json={"order_id": 1})
+        assert response.status_code == 201
+        assert response.json()[0]["quantity"] == 3
+        assert client.post("/carts/a/checkout", json={"order_id": 1}).status_code == 400
@@ -0,0 +1,126 @@
+"""
+Tests for GET /categories/{id}/products (keyset paging, per-category cache)
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_read_db
+from controllers.category_controller import CategoryController
+from models.category import CategoryModel
+from models.product import ProductModel
+from repositories.base_repository_impl import InstanceNotFoundError
+from schemas import ProductSchema
+from services.product_service import ProductService
+
+
+@pytest.fixture
+def session(fake_cache, shop_session):
+    garden, empty = CategoryModel(name="Garden"), CategoryModel(name="Empty")
+    shop_session.add_all([garden, empty])
+    shop_session.flush()
+    # After the Hammer and Hose, Garden products are interleaved with Tools
+    # ones: Tools holds 1, 2, 4, 6, 8, 10
+    for i in range(3, 11):
+        category_id = 1 if i % 2 == 0 else garden.id_key
+        shop_session.add(ProductModel(name=f"Product {i}", price=10.0 + i, stock=i, category_id=category_id))
+    shop_session.commit()
+    return shop_session
+
+
+@pytest.fixture
+def queries(session):
+    statements = []
+    event.listen(session.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+def _ids(page):
+    return [product.id_key for product in page.products]
+
+
+# ============================================================================
+# PAGING
+# ============================================================================
+
+class TestCategoryProducts:
+    """Keyset pages of one category's products"""
+
+    def test_pages_follow_cursor(self, session):
+        service = ProductService(session)
+
+        first = service.get_by_category(1, limit=2)
+        second = service.get_by_category(1, cursor=first.next_cursor, limit=2)
+        last = service.get_by_category(1, cursor=second.next_cursor, limit=2)
+
+        assert (_ids(first), _ids(second), _ids(last)) == ([1, 2], [4, 6], [8, 10])
+        assert last.next_cursor is None
+        assert "category" not in first.products[0].model_fields_set
+
+    def test_page_is_one_query(self, session, queries):
+        ProductService(session).get_by_category(2, limit=10)
+        assert len(queries) == 1
+
+    def test_unknown_and_empty_categories(self, session):
+        service = ProductService(session)
+        assert service.get_by_category(3).products == []
+        with pytest.raises(InstanceNotFoundError):
+            service.get_by_category(99)
+
+    def test_invalid_cursor(self, session):
+        with pytest.raises(ValueError):
+            ProductService(session).get_by_category(1, cursor="not-a-cursor")
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class TestCategoryProductsCache:
+    """Pages are dropped only when a product of their category changes"""
+
+    def test_hit_skips_database(self, session, fake_cache, queries):
+        service = ProductService(session)
+        page = service.get_by_category(1, limit=2)
+        queries.clear()
+
+        assert service.get_by_category(1, limit=2) == page
+        assert queries == []
+
+    def test_writes_drop_only_their_category(self, session, fake_cache):
+        service = ProductService(session)
+        service.get_by_category(1)
+        service.get_by_category(2)
+
+        service.update(3, ProductSchema.model_construct(price=99.0))  # A Garden product
+        assert list(fake_cache) == ["products:category:1:cursor::limit:20"]
+
+        service.save(ProductSchema(name="Saw", price=5.0, category_id=1))
+        assert list(fake_cache) == []
+        assert _ids(service.get_by_category(1))[-1] == 11
+
+    def test_moving_a_product_drops_both_categories(self, session, fake_cache):
+        service = ProductService(session)
+        service.get_by_category(1)
+        service.get_by_category(2)
+
+        service.update(1, ProductSchema.model_construct(category_id=2))
+
+        assert list(fake_cache) == []
+        assert 1 in _ids(service.get_by_category(2))
+
+    def test_endpoint(self, session, fake_cache):
+        app = FastAPI()
+        app.include_router(CategoryController().router, prefix="/categories")
+        app.dependency_overrides[get_read_db] = lambda: session
+        client = TestClient(app)
+
+        body = client.get("/categories/1/products", params={"limit": 3}).json()
+        assert [product["id_key"] for product in body["products"]] == [1, 2, 4]
+        assert body["products"][0]["stock"] == 10 and "category" not in body["products"][0]
+        following = client.get("/categories/1/products", params={"limit": 3, "cursor": body["next_cursor"]})
+        assert [product["id_key"] for product in following.json()["products"]] == [6, 8, 10]
+        assert client.get("/categories/1/products", params={"cursor": "%%%"}).status_code == 400
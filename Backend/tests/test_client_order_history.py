@@ -0,0 +1,132 @@
+"""
+Tests for GET /clients/{id}/orders (joined query, keyset paging, per-client cache)
+"""
+import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_read_db
+from controllers.client_controller import ClientController
+from models.client import ClientModel
+from models.enums import DeliveryMethod, Status
+from models.order import OrderModel
+from models.order_detail import OrderDetailModel
+from repositories.base_repository_impl import InstanceNotFoundError
+from schemas import OrderDetailSchema, OrderSchema
+from services.client_service import ClientService
+from services.order_detail_service import OrderDetailService
+from services.order_service import OrderService
+
+DAY = datetime.datetime(2024, 3, 1, 12)
+
+
+@pytest.fixture
+def session(fake_cache, shop_session):
+    bob = ClientModel(name="Bob")
+    shop_session.add(bob)
+    shop_session.flush()
+
+    # Ada: the shop's order 1 and another on the same day, three on earlier
+    # days, one undated. Then one of Bob's. Each has one Hammer detail
+    dates = [DAY, DAY - datetime.timedelta(days=1), None, DAY - datetime.timedelta(days=3),
+             DAY - datetime.timedelta(days=2)]
+    orders = [shop_session.get(OrderModel, 1)]
+    for client_id, date in [(1, d) for d in dates] + [(bob.id_key, DAY)]:
+        orders.append(OrderModel(date=date, total=0, status=Status.PENDING, delivery_method=DeliveryMethod.ON_HAND,
+                                 client_id=client_id, bill_id=1))
+    shop_session.add_all(orders)
+    shop_session.flush()
+    shop_session.add_all([
+        OrderDetailModel(order_id=order.id_key, product_id=1, quantity=order.id_key, price=10.0)
+        for order in orders
+    ])
+    shop_session.commit()
+    return shop_session
+
+
+@pytest.fixture
+def statements(session):
+    executed = []
+    listener = lambda *args: executed.append(args[2])  # noqa: E731
+    event.listen(session.get_bind(), "before_cursor_execute", listener)
+    yield executed
+    event.remove(session.get_bind(), "before_cursor_execute", listener)
+
+
+# ============================================================================
+# PAGING
+# ============================================================================
+
+class TestOrderHistoryPaging:
+    """Newest first, keyset on (date, id_key), one statement per page"""
+
+    def test_pages_cover_every_order_once(self, session, statements):
+        service = ClientService(session)
+        seen, cursor = [], None
+        while True:
+            page = service.get_order_history(1, cursor=cursor, limit=2)
+            seen.extend(page.orders)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert [order.id_key for order in seen] == [2, 1, 3, 6, 5, 4]
+        assert len(statements) == 3
+        assert all(len(order.details) == 1 for order in seen)
+        assert seen[0].details[0].product_name == "Hammer"
+        assert seen[0].details[0].quantity == 2
+
+    def test_unknown_client_and_bad_cursor(self, session):
+        service = ClientService(session)
+
+        assert service.get_order_history(2).orders[0].id_key == 7
+        with pytest.raises(InstanceNotFoundError):
+            service.get_order_history(99)
+        with pytest.raises(ValueError):
+            service.get_order_history(1, cursor="not-a-cursor")
+
+    def test_endpoint(self, session):
+        app = FastAPI()
+        app.include_router(ClientController().router, prefix="/clients")
+        app.dependency_overrides[get_read_db] = lambda: session
+        client = TestClient(app)
+
+        body = client.get("/clients/1/orders?limit=5").json()
+        assert body["client_id"] == 1
+        assert len(body["orders"]) == 5
+        assert body["orders"][0]["details"][0]["product_name"] == "Hammer"
+
+        last = client.get(f"/clients/1/orders?limit=5&cursor={body['next_cursor']}").json()
+        assert [order["id_key"] for order in last["orders"]] == [4]
+        assert last["next_cursor"] is None
+
+        assert client.get("/clients/1/orders?cursor=%25%25").status_code == 400
+
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class TestOrderHistoryCache:
+    """Pages are cached per client and dropped when that client's orders change"""
+
+    def test_cache_hit_and_invalidation(self, session, fake_cache, statements):
+        service = ClientService(session)
+        service.get_order_history(1)
+        service.get_order_history(2)
+        statements.clear()
+
+        assert len(service.get_order_history(1).orders) == 6
+        assert statements == []
+
+        OrderService(session).save(OrderSchema(date=DAY, delivery_method=DeliveryMethod.ON_HAND,
+                                               client_id=1, bill_id=1))
+        assert list(fake_cache) == ["clients:orders:2:cursor::limit:20"]
+        assert service.get_order_history(1).orders[0].id_key == 8
+
+        OrderDetailService(session).save(OrderDetailSchema(order_id=8, product_id=1, quantity=1))
+        assert service.get_order_history(1).orders[0].details[0].quantity == 1
@@ -216,7 +216,7 @@ class TestOrderEndpoints:
 
         assert response.status_code == 201
         data = response.json()
-        assert data["total"] == 500.0
+        assert data["total"] == 0.0  # Computed from order details, none yet
         assert data["client_id"] == client.id_key
 
     def test_create_order_invalid_client(self, api_client, seeded_db):
@@ -373,7 +373,7 @@ class TestBillEndpoints:
         assert response.status_code == 201
         data = response.json()
         assert data["bill_number"] == "BILL-TEST-001"
-        assert data["total"] == 850.0
+        assert data["total"] == 0.0  # Computed from its orders, none yet
 
     def test_get_bill_by_id(self, api_client, seeded_db):
         """Test GET /bills/{id}."""
@@ -461,3 +461,108 @@ class TestHealthCheckEndpoint:
         data = response.json()
         assert "status" in data
         assert "checks" in data
+
+
+class TestFastSchemaResponse:
+    """Tests for direct schema serialization (response_model revalidation bypass)."""
+
+    @staticmethod
+    def _app(db_session, fast_response):
+        from fastapi import FastAPI
+        from controllers.base_controller_impl import BaseControllerImpl
+        from schemas import OrderSchema
+        from services.order_service import OrderService
+
+        app = FastAPI()
+        controller = BaseControllerImpl(
+            schema=OrderSchema,
+            service_factory=lambda db: OrderService(db),
+            fast_response=fast_response
+        )
+        app.include_router(controller.router, prefix="/orders")
+
+        def override_get_db():
+            yield db_session
+
+        app.dependency_overrides[get_db] = override_get_db
+        return TestClient(app)
+
+    @pytest.fixture
+    def db_session(self):
+        """Shared in-memory database across the TestClient worker threads."""
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from models.base_model import base
+
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False},
+                               poolclass=StaticPool)
+        base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        yield session
+        session.close()
+        engine.dispose()
+
+    @pytest.fixture
+    def order(self, db_session):
+        from models.client import ClientModel
+        from models.bill import BillModel
+        from models.order import OrderModel
+
+        client = ClientModel(name="Ana", lastname="Lopez", email="ana@example.com")
+        db_session.add(client)
+        db_session.flush()
+        bill = BillModel(bill_number="B-1", date=date(2025, 1, 2), total=50.0,
+                         payment_type=PaymentType.CARD, client_id=client.id_key)
+        db_session.add(bill)
+        db_session.flush()
+        order = OrderModel(date=datetime(2025, 1, 2, 10, 30), total=50.0,
+                           delivery_method=DeliveryMethod.HOME_DELIVERY, status=Status.PENDING,
+                           client_id=client.id_key, bill_id=bill.id_key)
+        db_session.add(order)
+        db_session.commit()
+        return order
+
+    def test_fast_response_matches_validated_response(self, db_session, order):
+        """Direct serialization yields the same JSON as response_model validation."""
+        fast = self._app(db_session, fast_response=True)
+        legacy = self._app(db_session, fast_response=False)
+
+        for url in ("/orders", f"/orders/{order.id_key}"):
+            fast_response = fast.get(url)
+            legacy_response = legacy.get(url)
+
+            assert fast_response.status_code == legacy_response.status_code == 200
+            assert fast_response.json() == legacy_response.json()
+
+        assert fast.get(f"/orders/{order.id_key}").json()["delivery_method"] == 3
+
+    def test_fast_response_keeps_status_codes(self, db_session, order):
+        """Create routes still answer 201 when rendering directly."""
+        fast = self._app(db_session, fast_response=True)
+        payload = {
+            "date": "2025-01-03T09:00:00",
+            "total": 20.0,
+            "delivery_method": 1,
+            "status": 1,
+            "client_id": order.client_id,
+            "bill_id": order.bill_id
+        }
+
+        response = fast.post("/orders", json=payload)
+
+        assert response.status_code == 201
+        assert response.json()["total"] == 0.0
+
+    def test_schema_json_response_renders_lists_and_fallbacks(self):
+        """Lists of schemas use the compiled adapter; other content uses orjson."""
+        from schemas import CategorySchema
+        from utils.responses import SchemaJSONResponse
+
+        categories = [CategorySchema(id_key=1, name="Books"), CategorySchema(id_key=2, name="Toys")]
+
+        assert SchemaJSONResponse(categories).body == (
+            b'[{"id_key":1,"name":"Books"},{"id_key":2,"name":"Toys"}]'
+        )
+        assert SchemaJSONResponse([]).body == b"[]"
+        assert SchemaJSONResponse({"status": "ok"}).body == b'{"status":"ok"}'
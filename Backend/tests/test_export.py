@@ -0,0 +1,118 @@
+"""
+Tests for the streaming NDJSON/CSV export endpoints
+"""
+import csv
+import datetime
+import io
+import json
+import tracemalloc
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_read_db
+from controllers.bill_controller import BillController
+from middleware.admission_control import PRIORITY_LOW, classify_request
+from models.bill import BillModel
+from models.client import ClientModel
+from models.enums import PaymentType
+from repositories.bill_repository import BillRepository
+
+BILL_COUNT = 50
+
+
+@pytest.fixture
+def session(memory_engine):
+    with Session(memory_engine) as db:
+        client = ClientModel(name="Ada", email="ada@example.com")
+        db.add(client)
+        db.flush()
+        db.add_all([
+            BillModel(
+                bill_number=f"B-{i}", discount=None, date=datetime.date(2024, 1, 1 + i % 28),
+                total=10.0 + i, payment_type=PaymentType.CARD, client_id=client.id_key,
+            )
+            for i in range(BILL_COUNT)
+        ])
+        db.commit()
+        yield db
+
+
+@pytest.fixture
+def client(session):
+    app = FastAPI()
+    app.include_router(BillController().router, prefix="/bills")
+    app.dependency_overrides[get_read_db] = lambda: session
+    return TestClient(app)
+
+
+# ============================================================================
+# ENDPOINT
+# ============================================================================
+
+class TestExport:
+    """GET /{entity}/export streams every row"""
+
+    def test_ndjson(self, client):
+        response = client.get("/bills/export")
+
+        lines = response.text.splitlines()
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert 'filename="bills.ndjson"' in response.headers["content-disposition"]
+        assert len(lines) == BILL_COUNT
+        assert json.loads(lines[0]) == {
+            "bill_number": "B-0", "discount": None, "date": "2024-01-01", "total": 10.0,
+            "payment_type": PaymentType.CARD.value, "client_id": 1, "id_key": 1,
+        }
+
+    def test_csv_with_fields(self, client):
+        response = client.get("/bills/export?format=csv&fields=bill_number,payment_type")
+
+        rows = list(csv.reader(io.StringIO(response.text)))
+        assert response.headers["content-type"].startswith("text/csv")
+        assert rows[0] == ["bill_number", "payment_type", "id_key"]
+        assert rows[1] == ["B-0", str(PaymentType.CARD.value), "1"]
+        assert len(rows) == BILL_COUNT + 1
+
+    def test_unknown_format_or_field_is_rejected(self, client):
+        assert client.get("/bills/export?format=xml").status_code == 422
+        assert client.get("/bills/export?fields=secret").status_code == 400
+
+    def test_exports_are_low_priority(self):
+        assert classify_request("GET", "/orders/export") == PRIORITY_LOW
+
+
+# ============================================================================
+# STREAMING
+# ============================================================================
+
+class TestStreamRows:
+    """Rows arrive in batches, without ORM objects"""
+
+    def test_batches_follow_batch_size(self, session, monkeypatch):
+        monkeypatch.setattr("config.constants.ExportConfig.BATCH_SIZE", 20)
+        session.expunge_all()
+
+        columns, batches = BillRepository(session).stream_rows(("total", "id_key"))
+
+        assert columns == ("total", "id_key")
+        assert [len(batch) for batch in batches] == [20, 20, 10]
+        assert len(session.identity_map) == 0
+
+    def test_memory_does_not_grow_with_rows_read(self, session, monkeypatch):
+        monkeypatch.setattr("config.constants.ExportConfig.BATCH_SIZE", 10)
+        _, batches = BillRepository(session).stream_rows()
+        next(batches)
+
+        tracemalloc.start()
+        next(batches)
+        first = tracemalloc.get_traced_memory()[1]
+        for _ in batches:
+            pass
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        assert peak < first * 2
@@ -0,0 +1,97 @@
+"""
+Tests for fast-boot mode and startup phase timing
+"""
+from unittest.mock import Mock, patch
+
+from fastapi.testclient import TestClient
+
+import config.redis_config as redis_config_module
+import main
+from config.redis_config import RedisConfig
+from services.cache_service import CacheService
+from utils.startup_timer import StartupTimer
+
+
+# ============================================================================
+# LAZY REDIS
+# ============================================================================
+
+class TestLazyRedis:
+    """Redis connects in the background and is picked up once available"""
+
+    def _fresh_config(self, monkeypatch):
+        monkeypatch.setattr(RedisConfig, "_instance", None)
+        monkeypatch.setattr(RedisConfig, "_client", None)
+        monkeypatch.setattr(RedisConfig, "_pool", None)
+        return RedisConfig(lazy=True)
+
+    def test_lazy_config_does_not_connect(self, monkeypatch):
+        with patch.object(redis_config_module.redis, "Redis") as mock_redis:
+            config = self._fresh_config(monkeypatch)
+
+        mock_redis.assert_not_called()
+        assert config.get_client() is None
+
+    def test_background_connect_publishes_client_after_ping(self, monkeypatch):
+        client = Mock()
+        config = self._fresh_config(monkeypatch)
+
+        with patch.object(redis_config_module.redis, "Redis", return_value=client):
+            config.connect_in_background().join(timeout=5)
+
+        client.ping.assert_called_once()
+        assert config.get_client() is client
+
+    def test_failed_ping_leaves_redis_unavailable(self, monkeypatch):
+        client = Mock()
+        client.ping.side_effect = redis_config_module.redis.ConnectionError("refused")
+        config = self._fresh_config(monkeypatch)
+
+        with patch.object(redis_config_module.redis, "Redis", return_value=client):
+            config.connect_in_background().join(timeout=5)
+
+        assert config.get_client() is None
+
+    def test_cache_service_picks_up_late_client(self):
+        client = Mock()
+        with patch("services.cache_service.get_redis_client", return_value=None):
+            cache = CacheService()
+        assert cache.redis_client is None
+
+        with patch("services.cache_service.get_redis_client", return_value=client):
+            cache.is_available()
+
+        assert cache.redis_client is client
+
+
+# ============================================================================
+# STARTUP
+# ============================================================================
+
+class TestStartup:
+    """Fast boot skips DDL and blocking Redis, and phases are timed"""
+
+    def test_timer_records_phases(self):
+        timer = StartupTimer()
+
+        with timer.phase("schema"):
+            pass
+        timer.complete()
+
+        report = timer.as_dict()
+        assert "schema" in report["phases_ms"]
+        assert report["total_ms"] >= report["phases_ms"]["schema"]
+
+    def test_fast_boot_skips_create_tables_and_blocking_redis(self):
+        with patch.object(main.StartupConfig, "FAST_BOOT", True), \
+             patch.object(main, "create_tables") as mock_create_tables, \
+             patch.object(main, "check_redis_connection") as mock_check_redis, \
+             patch.object(main.redis_config, "connect_in_background") as mock_connect, \
+             patch.object(main.health_prober, "start"):
+            with TestClient(main.create_fastapi_app()):
+                pass
+
+        mock_create_tables.assert_not_called()
+        mock_check_redis.assert_not_called()
+        mock_connect.assert_called_once()
+        assert {"imports", "create_app", "schema", "redis"} <= set(main.startup_timer.phases)
@@ -0,0 +1,109 @@
+"""
+Tests for the background-probed health snapshot and /live, /ready
+"""
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import controllers.health_check as health_check
+from controllers.health_check import HealthProber, probe_router, router
+
+
+@pytest.fixture
+def prober(monkeypatch):
+    """Fresh prober installed as the module's global one"""
+    fresh = HealthProber(interval_seconds=60)
+    monkeypatch.setattr(health_check, "health_prober", fresh)
+    return fresh
+
+
+@pytest.fixture
+def client(prober):
+    app = FastAPI()
+    app.include_router(router, prefix="/health_check")
+    app.include_router(probe_router)
+    return TestClient(app)
+
+
+def _run_one_probe(prober):
+    """Start the background task, let it probe once, then stop it (keeping the result)"""
+    async def run():
+        prober.start()
+        for _ in range(100):
+            if prober.latest() is not None:
+                break
+            await asyncio.sleep(0.01)
+        prober._task.cancel()
+
+    asyncio.run(run())
+
+
+# ============================================================================
+# SNAPSHOT
+# ============================================================================
+
+class TestHealthSnapshot:
+    """/health_check serves the background probe unless asked to go deep"""
+
+    def test_background_probe_is_served_without_probing(self, prober, client):
+        with patch.object(health_check, "check_connection", return_value=True), \
+             patch.object(health_check, "check_redis_connection", return_value=True):
+            _run_one_probe(prober)
+
+        with patch.object(health_check, "check_connection") as mock_db:
+            response = client.get("/health_check")
+
+        mock_db.assert_not_called()
+        assert response.json()["checks"]["database"]["status"] == "up"
+
+    def test_deep_probes_now(self, prober, client):
+        with patch.object(health_check, "check_connection", return_value=True), \
+             patch.object(health_check, "check_redis_connection", return_value=True):
+            _run_one_probe(prober)
+
+        with patch.object(health_check, "check_connection", return_value=False) as mock_db, \
+             patch.object(health_check, "check_redis_connection", return_value=True):
+            response = client.get("/health_check?deep=true")
+
+        mock_db.assert_called_once()
+        assert response.json()["status"] == "critical"
+
+    def test_without_snapshot_probes_on_demand(self, client):
+        with patch.object(health_check, "check_connection", return_value=True) as mock_db, \
+             patch.object(health_check, "check_redis_connection", return_value=True):
+            response = client.get("/health_check")
+
+        mock_db.assert_called_once()
+        assert response.json()["checks"]["database"]["status"] == "up"
+
+
+# ============================================================================
+# LIVENESS / READINESS
+# ============================================================================
+
+class TestLiveReady:
+    """Cheap probes for orchestrators"""
+
+    def test_live_does_no_io(self, client):
+        with patch.object(health_check, "check_connection") as mock_db:
+            response = client.get("/live")
+
+        assert response.status_code == 200
+        mock_db.assert_not_called()
+
+    def test_ready_when_database_up(self, client):
+        with patch.object(health_check, "check_connection", return_value=True), \
+             patch.object(health_check, "check_redis_connection", return_value=False):
+            response = client.get("/ready")
+
+        assert response.status_code == 200
+
+    def test_not_ready_when_database_down(self, client):
+        with patch.object(health_check, "check_connection", return_value=False), \
+             patch.object(health_check, "check_redis_connection", return_value=True):
+            response = client.get("/ready")
+
+        assert response.status_code == 503
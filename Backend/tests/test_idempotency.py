@@ -0,0 +1,184 @@
+"""
+Tests for Idempotency-Key handling (IdempotencyStore and the create routes)
+
+Redis isn't available here, so FakeRedis implements the few commands the
+store uses.
+"""
+import datetime
+import threading
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.constants import IdempotencyConfig
+from config.database import get_db
+from controllers.client_controller import ClientController
+from controllers.order_controller import OrderController
+from models.bill import BillModel
+from models.client import ClientModel
+from models.enums import PaymentType
+from models.order import OrderModel
+from services.client_service import ClientService
+from services.idempotency_store import (
+    IdempotencyInProgressError, IdempotencyKeyReusedError, StoredResponse, idempotency_store
+)
+
+
+class FakeRedis:
+    """Thread-safe SET (NX/EX), GET and DEL"""
+
+    def __init__(self):
+        self.values = {}
+        self.lock = threading.Lock()
+
+    def set(self, key, value, nx=False, ex=None):
+        with self.lock:
+            if nx and key in self.values:
+                return None
+            self.values[key] = value
+            return True
+
+    def get(self, key):
+        with self.lock:
+            return self.values.get(key)
+
+    def delete(self, key):
+        with self.lock:
+            return int(self.values.pop(key, None) is not None)
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    fake = FakeRedis()
+    monkeypatch.setattr(idempotency_store, "redis_client", fake)
+    monkeypatch.setattr(IdempotencyConfig, "WAIT_SECONDS", 2)
+    monkeypatch.setattr(IdempotencyConfig, "POLL_SECONDS", 0.01)
+    return fake
+
+
+@pytest.fixture
+def session(no_cache, memory_engine):
+    with Session(memory_engine) as db:
+        yield db
+
+
+@pytest.fixture
+def client(session):
+    app = FastAPI()
+    app.include_router(ClientController().router, prefix="/clients")
+    app.include_router(OrderController().router, prefix="/orders")
+    app.dependency_overrides[get_db] = lambda: session
+    return TestClient(app)
+
+
+RESPONSE = StoredResponse(201, b'{"id_key":1}', "application/json")
+
+
+# ============================================================================
+# STORE
+# ============================================================================
+
+class TestIdempotencyStore:
+    """Claiming, replaying and releasing keys"""
+
+    def test_claim_then_replay(self, redis):
+        assert idempotency_store.begin("POST:/clients", "k1", "abc") is None
+        idempotency_store.complete("POST:/clients", "k1", "abc", RESPONSE)
+
+        assert idempotency_store.begin("POST:/clients", "k1", "abc") == RESPONSE
+        assert idempotency_store.begin("POST:/bills", "k1", "abc") is None  # Keys are per route
+
+    def test_key_reused_with_another_body(self, redis):
+        idempotency_store.begin("POST:/clients", "k1", "abc")
+        with pytest.raises(IdempotencyKeyReusedError):
+            idempotency_store.begin("POST:/clients", "k1", "def")
+
+    def test_duplicate_waits_for_first_request(self, redis):
+        idempotency_store.begin("POST:/clients", "k1", "abc")
+        timer = threading.Timer(0.2, idempotency_store.complete, ("POST:/clients", "k1", "abc", RESPONSE))
+        timer.start()
+
+        started = time.perf_counter()
+        assert idempotency_store.begin("POST:/clients", "k1", "abc") == RESPONSE
+        assert time.perf_counter() - started >= 0.1
+        timer.join()
+
+    def test_duplicate_gives_up_while_first_runs(self, redis, monkeypatch):
+        monkeypatch.setattr(IdempotencyConfig, "WAIT_SECONDS", 0.05)
+        idempotency_store.begin("POST:/clients", "k1", "abc")
+        with pytest.raises(IdempotencyInProgressError):
+            idempotency_store.begin("POST:/clients", "k1", "abc")
+
+    def test_released_key_runs_again(self, redis):
+        idempotency_store.begin("POST:/clients", "k1", "abc")
+        idempotency_store.release("POST:/clients", "k1")
+        assert idempotency_store.begin("POST:/clients", "k1", "abc") is None
+
+
+# ============================================================================
+# ENDPOINTS
+# ============================================================================
+
+class TestIdempotentCreate:
+    """POST with an Idempotency-Key creates once and replays the response"""
+
+    def test_retry_replays_first_response(self, client, session, redis):
+        body = {"name": "Ada", "email": "ada@example.com"}
+        first = client.post("/clients", json=body, headers={"Idempotency-Key": "k1"})
+        retry = client.post("/clients", json=body, headers={"Idempotency-Key": "k1"})
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert "Idempotent-Replayed" not in first.headers
+        assert session.query(ClientModel).count() == 1
+
+    def test_key_reused_with_another_body(self, client, redis):
+        client.post("/clients", json={"name": "Ada"}, headers={"Idempotency-Key": "k1"})
+        response = client.post("/clients", json={"name": "Grace"}, headers={"Idempotency-Key": "k1"})
+        assert response.status_code == 422
+
+    def test_failed_create_can_be_retried(self, client, session, redis, monkeypatch):
+        save = ClientService.save
+
+        def fail_once(service, schema):
+            monkeypatch.setattr(ClientService, "save", save)
+            raise RuntimeError("connection reset")
+
+        monkeypatch.setattr(ClientService, "save", fail_once)
+        with pytest.raises(RuntimeError):
+            client.post("/clients", json={"name": "Ada"}, headers={"Idempotency-Key": "k1"})
+
+        assert client.post("/clients", json={"name": "Ada"}, headers={"Idempotency-Key": "k1"}).status_code == 201
+        assert session.query(ClientModel).count() == 1
+
+    def test_without_key_or_redis_every_request_creates(self, client, session, monkeypatch):
+        monkeypatch.setattr(idempotency_store, "redis_client", None)
+        monkeypatch.setattr("services.idempotency_store.get_redis_client", lambda: None)
+
+        client.post("/clients", json={"name": "Ada"})
+        client.post("/clients", json={"name": "Ada"}, headers={"Idempotency-Key": "k1"})
+        client.post("/clients", json={"name": "Ada"}, headers={"Idempotency-Key": "k1"})
+
+        assert session.query(ClientModel).count() == 3
+
+    def test_retry_without_defaulted_fields_replays(self, client, session, redis):
+        # OrderSchema.date defaults to now: only the fields sent are fingerprinted
+        session.add(ClientModel(name="Ada"))
+        session.flush()
+        session.add(BillModel(bill_number="B-1", date=datetime.date(2024, 3, 1), total=0, payment_type=PaymentType.CARD,
+                              client_id=1))
+        session.commit()
+        body = {"delivery_method": 3, "client_id": 1, "bill_id": 1}
+
+        first = client.post("/orders", json=body, headers={"Idempotency-Key": "k1"})
+        retry = client.post("/orders", json=body, headers={"Idempotency-Key": "k1"})
+
+        assert first.status_code == retry.status_code == 201
+        assert retry.json() == first.json()
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert session.query(OrderModel).count() == 1
@@ -0,0 +1,149 @@
+"""
+Tests for the queue-based logging pipeline
+
+Tests verify that records are written by the background listener with the
+same output as direct handlers, and that a full queue drops or blocks
+according to policy while counting lost records.
+"""
+import io
+import queue
+import logging
+
+import pytest
+
+from config.logging_config import (
+    BoundedQueueHandler,
+    RoutingQueueListener,
+    dropped_records,
+)
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+
+
+@pytest.fixture
+def stream_handler():
+    """Handler writing to an in-memory stream with the 'detailed' format"""
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter(FORMAT))
+    return handler
+
+
+@pytest.fixture
+def test_logger():
+    """Isolated logger without propagation"""
+    logger = logging.getLogger("test_queue_logger")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers = []
+    yield logger
+    logger.handlers = []
+
+
+@pytest.fixture(autouse=True)
+def reset_dropped_counter():
+    dropped_records.reset()
+    yield
+    dropped_records.reset()
+
+
+# ============================================================================
+# QUEUE PIPELINE
+# ============================================================================
+
+class TestQueueLoggingPipeline:
+    """Records go through the queue and produce identical output"""
+
+    def test_output_identical_to_direct_handler(self, test_logger, stream_handler):
+        """Queued output matches what the handler writes when called directly"""
+        direct = logging.StreamHandler(io.StringIO())
+        direct.setFormatter(logging.Formatter(FORMAT))
+
+        log_queue = queue.Queue(maxsize=100)
+        listener = RoutingQueueListener(log_queue, {"app": [stream_handler]})
+        listener.start()
+
+        record = test_logger.makeRecord(
+            test_logger.name, logging.INFO, __file__, 42,
+            "Stock deducted for product %s: new stock = %s", (7, 3), None, func="save"
+        )
+        direct.handle(record)
+        BoundedQueueHandler(log_queue, route="app").handle(record)
+        listener.stop()
+
+        assert stream_handler.stream.getvalue() == direct.stream.getvalue()
+        assert "save:42 - Stock deducted for product 7: new stock = 3" in direct.stream.getvalue()
+
+    def test_exception_traceback_preserved(self, test_logger, stream_handler):
+        """Tracebacks formatted on the caller thread reach the file handler"""
+        log_queue = queue.Queue(maxsize=100)
+        listener = RoutingQueueListener(log_queue, {"app": [stream_handler]})
+        test_logger.addHandler(BoundedQueueHandler(log_queue, route="app"))
+        listener.start()
+
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            test_logger.exception("Unhandled exception")
+        listener.stop()
+
+        output = stream_handler.stream.getvalue()
+        assert "Unhandled exception" in output
+        assert "Traceback" in output
+        assert "RuntimeError: boom" in output
+
+    def test_listener_respects_route_and_handler_level(self, test_logger, stream_handler):
+        """Each route only reaches its own handlers, filtered by handler level"""
+        error_handler = logging.StreamHandler(io.StringIO())
+        error_handler.setLevel(logging.ERROR)
+
+        log_queue = queue.Queue(maxsize=100)
+        listener = RoutingQueueListener(
+            log_queue, {"app": [stream_handler, error_handler], "access": []}
+        )
+        test_logger.addHandler(BoundedQueueHandler(log_queue, route="app"))
+        listener.start()
+
+        test_logger.info("info message")
+        test_logger.error("error message")
+        listener.stop()
+
+        assert "info message" in stream_handler.stream.getvalue()
+        assert "info message" not in error_handler.stream.getvalue()
+        assert "error message" in error_handler.stream.getvalue()
+
+
+# ============================================================================
+# FULL QUEUE POLICY
+# ============================================================================
+
+class TestFullQueuePolicy:
+    """A saturated queue never raises into the caller"""
+
+    def test_drop_policy_counts_dropped_records(self, test_logger):
+        """Records beyond maxsize are dropped and counted"""
+        log_queue = queue.Queue(maxsize=2)
+        test_logger.addHandler(BoundedQueueHandler(log_queue, route="app", policy="drop"))
+
+        for i in range(5):
+            test_logger.info("message %d", i)
+
+        assert log_queue.qsize() == 2
+        assert dropped_records.value == 3
+
+    def test_block_policy_gives_up_after_timeout(self, test_logger):
+        """Blocking policy waits for space, then drops and counts"""
+        log_queue = queue.Queue(maxsize=1)
+        test_logger.addHandler(
+            BoundedQueueHandler(log_queue, route="app", policy="block", block_timeout=0.01)
+        )
+
+        test_logger.info("first")
+        test_logger.info("second")
+
+        assert log_queue.qsize() == 1
+        assert dropped_records.value == 1
@@ -4,9 +4,12 @@ Tests for P11: Sanitized Logging Utilities
 Tests verify the implementation of logging sanitization to prevent
 exposure of sensitive information in logs.
 """
+import re
 import pytest
 import logging
+from unittest.mock import patch
 from utils.logging_utils import (
+    SENSITIVE_PATTERNS,
     sanitize_string,
     get_error_id,
     log_error_sanitized,
@@ -480,6 +483,60 @@ class TestP11SanitizedLogger:
         assert hasattr(logger, 'debug')
 
 
+# ============================================================================
+# SANITIZED LOGGER FAST PATH
+# ============================================================================
+
+class TestSanitizedLoggerFastPath:
+    """
+    Level-aware lazy sanitization with a single precompiled pattern
+    """
+
+    def test_disabled_level_skips_sanitization(self, mock_logger):
+        """Disabled levels return before formatting or sanitizing"""
+        mock_logger.setLevel(logging.INFO)
+        sanitized_logger = SanitizedLogger(mock_logger)
+
+        with patch('utils.logging_utils.sanitize_string') as sanitize_mock:
+            sanitized_logger.debug("Cache HIT: %s", "products:list")
+
+        sanitize_mock.assert_not_called()
+
+    def test_lazy_arguments_are_interpolated_and_sanitized(self, mock_logger, caplog):
+        """%-style arguments are merged before redaction"""
+        sanitized_logger = SanitizedLogger(mock_logger)
+
+        with caplog.at_level(logging.INFO):
+            sanitized_logger.info("Login for %s with password=%s", "john", "secret123")
+
+        log_message = caplog.records[0].message
+        assert log_message == "Login for john with [PASSWORD_REDACTED]"
+
+    def test_caller_location_is_reported(self, mock_logger, caplog):
+        """funcName points at the caller, not the wrapper"""
+        sanitized_logger = SanitizedLogger(mock_logger)
+
+        with caplog.at_level(logging.INFO):
+            sanitized_logger.info("located")
+
+        assert caplog.records[0].funcName == "test_caller_location_is_reported"
+
+    def test_single_pass_matches_sequential_passes(self):
+        """Combined alternation gives the same result as one re.sub per pattern"""
+        samples = [
+            "password=secret123 and token: abc",
+            "api-key=sk-1 secret='x' authorization=Bearer",
+            "card 4532 1234 5678 9010, ssn 123-45-6789",
+            "Product 42 updated and cache invalidated successfully",
+        ]
+
+        for sample in samples:
+            expected = sample
+            for pattern, replacement in SENSITIVE_PATTERNS:
+                expected = re.sub(pattern, replacement, expected, flags=re.IGNORECASE)
+            assert sanitize_string(sample) == expected
+
+
 # ============================================================================
 # P11: INTEGRATION TESTS
 # ============================================================================
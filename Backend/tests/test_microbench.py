@@ -0,0 +1,68 @@
+"""
+Tests for the micro-benchmark runner (benchmarks/microbench.py)
+"""
+import json
+import os
+import tempfile
+
+import config.database
+from benchmarks import microbench
+
+
+def _document(**medians):
+    return {"results": {key: {"median_us": median} for key, median in medians.items()}}
+
+
+# ============================================================================
+# RUNNING
+# ============================================================================
+
+class TestRunSuite:
+    """Every case runs against a seeded SQLite database"""
+
+    def test_small_run(self, no_cache, monkeypatch):
+        session_local = config.database.SessionLocal
+        directories = []
+        make_directory = tempfile.TemporaryDirectory
+        monkeypatch.setattr(tempfile, "TemporaryDirectory",
+                            lambda: directories.append(make_directory()) or directories[-1])
+
+        document = microbench.run_suite([20], number=3, repeat=1)
+
+        # Leaves nothing behind: SessionLocal is restored, the database removed
+        assert config.database.SessionLocal is session_local
+        assert not os.path.exists(directories[0].name)
+
+        results = document["results"]
+        assert document["meta"]["dialect"] == "sqlite"
+        assert set(results) == {f"sqlite/20/{case.name}" for case in microbench.CASES}
+        for case in microbench.CASES:
+            result = results[f"sqlite/20/{case.name}"]
+            if case.needs_cache:
+                assert result == {"skipped": "needs Redis"}
+            else:
+                assert result["median_us"] > 0 and result["ops_per_sec"] > 0
+
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+class TestCompare:
+    """Cases slower than the baseline by more than the threshold are regressions"""
+
+    def test_regressions(self):
+        baseline = _document(**{"a": 100.0, "b": 100.0, "c": 100.0})
+        current = _document(**{"a": 120.0, "b": 130.0, "c": 50.0, "new": 10.0})
+        current["results"]["skipped"] = {"skipped": "needs Redis"}
+
+        assert microbench.compare(baseline, current, threshold=0.25) == ["b"]
+        assert microbench.compare(baseline, current, threshold=0.1) == ["a", "b"]
+
+    def test_exit_code(self, tmp_path, monkeypatch):
+        baseline = tmp_path / "baseline.json"
+        baseline.write_text(json.dumps(_document(**{"sqlite/1/x": 100.0})))
+        monkeypatch.setattr(microbench, "run_suite", lambda *args: _document(**{"sqlite/1/x": 200.0}))
+
+        assert microbench.main(["--scales", "1", "--baseline", str(baseline)]) == 1
+        assert microbench.main(["--scales", "1", "--baseline", str(baseline), "--threshold", "1.5"]) == 0
@@ -403,3 +403,103 @@ class TestRateLimiterIntegration:
         # 6th request should be blocked
         response = client.get("/endpoint1")
         assert response.status_code == 429
+
+
+class TestCompressionMiddleware:
+    """Tests for in-app response compression."""
+
+    @staticmethod
+    def _app(**middleware_kwargs):
+        from fastapi.responses import PlainTextResponse, StreamingResponse
+        from middleware.compression_middleware import CompressionMiddleware
+
+        app = FastAPI()
+
+        @app.get("/products")
+        async def products():
+            return [{"id_key": i, "name": f"Product {i}", "price": 9.99} for i in range(200)]
+
+        @app.get("/small")
+        async def small():
+            return {"ok": True}
+
+        @app.get("/encoded")
+        async def encoded():
+            return PlainTextResponse("x" * 5000, headers={"Content-Encoding": "identity"})
+
+        @app.get("/stream")
+        async def stream():
+            return StreamingResponse(iter([b"a" * 5000]), media_type="text/csv")
+
+        app.add_middleware(CompressionMiddleware, **middleware_kwargs)
+        return app
+
+    def test_gzip_applied_above_minimum_size(self):
+        """Large JSON bodies are gzipped when the client accepts gzip."""
+        app = self._app(minimum_size=500)
+        client = TestClient(app)
+
+        response = client.get("/products", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert len(response.json()) == 200  # httpx transparently decodes gzip
+
+    def test_brotli_preferred_when_accepted(self):
+        """Brotli is chosen over gzip when both are accepted."""
+        pytest.importorskip("brotli")
+        app = self._app(minimum_size=500)
+        client = TestClient(app)
+
+        response = client.get("/products", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["content-encoding"] == "br"
+
+    def test_small_bodies_not_compressed(self):
+        """Bodies below the threshold are sent as-is."""
+        app = self._app(minimum_size=500)
+        client = TestClient(app)
+
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+        assert response.json() == {"ok": True}
+
+    def test_already_encoded_and_streaming_responses_skipped(self):
+        """Responses with a Content-Encoding or without a length pass through."""
+        app = self._app(minimum_size=500)
+        client = TestClient(app)
+
+        encoded = client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+        streamed = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert encoded.headers["content-encoding"] == "identity"
+        assert "content-encoding" not in streamed.headers
+        assert streamed.content == b"a" * 5000
+
+    def test_negotiate_encoding(self):
+        """Accept-Encoding q-values are honoured."""
+        from middleware.compression_middleware import negotiate_encoding
+
+        assert negotiate_encoding("") is None
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding("gzip;q=1.0, br;q=0") == "gzip"
+        assert negotiate_encoding("gzip;q=0, deflate") is None
+
+    def test_compressed_variants_reused(self):
+        """Identical catalog bodies are compressed once per encoding."""
+        from middleware.compression_middleware import CompressedVariantCache
+
+        cache = CompressedVariantCache(max_entries=2)
+        body = b'[{"id_key": 1}]'
+        key = ("gzip", cache.digest(body))
+
+        assert cache.get(key) is None
+        cache.set(key, b"compressed")
+        assert cache.get(key) == b"compressed"
+
+        cache.set(("gzip", b"a"), b"1")
+        cache.set(("gzip", b"b"), b"2")
+        assert len(cache) == 2
+        assert cache.get(key) is None  # Evicted as least recently used
@@ -0,0 +1,133 @@
+"""
+Tests for server-computed order and bill totals and their reconciliation
+"""
+import datetime
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import sessionmaker
+
+import config.database  # noqa: F401  (registers every mapped model)
+from models.bill import BillModel
+from models.enums import DeliveryMethod, PaymentType, Status
+from models.order import OrderModel
+from repositories import order_repository
+from repositories.base_repository_impl import InstanceNotFoundError
+from repositories.order_repository import OrderRepository
+from schemas import BillSchema, OrderDetailSchema, OrderSchema
+from services.bill_service import BillService
+from services.order_detail_service import OrderDetailService
+from services.order_service import OrderService, reconcile_totals
+
+
+@pytest.fixture
+def session(shop_session):
+    # The shop has bill 1 and order 1; add a second of each through the services
+    BillService(shop_session).save(BillSchema(bill_number="B-2", date=datetime.date(2024, 3, 1), total=999.0,
+                                              payment_type=PaymentType.CARD, client_id=1))
+    OrderService(shop_session).save(_order(total=999.0))
+    return shop_session
+
+
+def _order(bill_id=1, **values):
+    return OrderSchema(date=datetime.datetime(2024, 3, 1, 12), status=Status.PENDING,
+                       delivery_method=DeliveryMethod.ON_HAND, client_id=1, bill_id=bill_id, **values)
+
+
+def _totals(session):
+    session.expire_all()
+    return (
+        [session.get(OrderModel, id_key).total for id_key in (1, 2)],
+        [session.get(BillModel, id_key).total for id_key in (1, 2)],
+    )
+
+
+# ============================================================================
+# INCREMENTAL TOTALS
+# ============================================================================
+
+class TestIncrementalTotals:
+    """Order detail writes apply price * quantity deltas to order and bill"""
+
+    def test_client_totals_are_ignored(self, session):
+        assert _totals(session) == ([0.0, 0.0], [0.0, 0.0])
+
+        OrderService(session).update(1, _order(total=50.0))
+
+        assert _totals(session) == ([0.0, 0.0], [0.0, 0.0])
+
+    def test_order_detail_writes(self, session):
+        service = OrderDetailService(session)
+
+        first = service.save(OrderDetailSchema(order_id=1, product_id=1, quantity=2))
+        service.save(OrderDetailSchema(order_id=2, product_id=2, quantity=4))
+        assert _totals(session) == ([20.0, 10.0], [30.0, 0.0])
+
+        service.update(first.id_key, OrderDetailSchema(order_id=1, product_id=1, quantity=3))
+        assert _totals(session) == ([30.0, 10.0], [40.0, 0.0])
+
+        service.update(first.id_key, OrderDetailSchema(order_id=2, product_id=1, quantity=3))
+        assert _totals(session) == ([0.0, 40.0], [40.0, 0.0])
+
+        service.delete(first.id_key)
+        assert _totals(session) == ([0.0, 10.0], [10.0, 0.0])
+
+    def test_order_moves_and_deletes_carry_their_total(self, session):
+        OrderDetailService(session).save(OrderDetailSchema(order_id=2, product_id=1, quantity=1))
+        orders = OrderService(session)
+
+        orders.update(2, _order(bill_id=2))
+        assert _totals(session) == ([0.0, 10.0], [0.0, 10.0])
+
+        orders.delete(2)
+        session.expire_all()
+        assert session.get(BillModel, 2).total == 0.0
+
+    def test_order_moves_and_deletes_lock_the_order(self, session, monkeypatch):
+        locked = []
+        find_for_update = OrderRepository.find_for_update
+        monkeypatch.setattr(OrderRepository, "find_for_update",
+                            lambda self, id_key: locked.append(id_key) or find_for_update(self, id_key))
+        orders = OrderService(session)
+
+        orders.update(2, _order(bill_id=2))
+        orders.delete(2)
+        with pytest.raises(InstanceNotFoundError):
+            orders.delete(2)
+
+        assert locked == [2, 2, 2]
+        assert "FOR UPDATE" in str(order_repository.FIND_FOR_UPDATE.compile(dialect=postgresql.dialect()))
+
+
+# ============================================================================
+# RECONCILIATION
+# ============================================================================
+
+class TestReconcileTotals:
+    """The batch job finds and fixes drift with set-wise SQL"""
+
+    @pytest.fixture(autouse=True)
+    def session_local(self, memory_engine, monkeypatch):
+        monkeypatch.setattr(config.database, "SessionLocal", sessionmaker(bind=memory_engine))
+
+    def test_in_sync(self, session):
+        OrderDetailService(session).save(OrderDetailSchema(order_id=1, product_id=2, quantity=3))
+
+        assert reconcile_totals() == {"orders": [], "bills": []}
+
+    def test_reports_and_fixes_drift(self, session):
+        OrderDetailService(session).save(OrderDetailSchema(order_id=1, product_id=1, quantity=2))
+        session.execute(update(OrderModel).where(OrderModel.id_key == 2).values(total=5.0))
+        session.commit()
+
+        mismatches = reconcile_totals()
+
+        assert [tuple(row) for row in mismatches["orders"]] == [(2, 5.0, 0.0)]
+        assert [tuple(row) for row in mismatches["bills"]] == [(1, 20.0, 25.0)]
+        assert _totals(session) == ([20.0, 5.0], [20.0, 0.0])
+
+        reconcile_totals(fix=True)
+
+        assert _totals(session) == ([20.0, 0.0], [20.0, 0.0])
+        assert reconcile_totals() == {"orders": [], "bills": []}
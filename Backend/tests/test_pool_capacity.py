@@ -0,0 +1,132 @@
+"""
+Tests for the connection pool capacity planner and checkout instrumentation
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc
+
+from config.pool_capacity import plan_pool_sizes
+from config.pool_monitor import (
+    InstrumentedQueuePool,
+    pool_wait_stats,
+    start_request_tracking,
+    stop_request_tracking,
+)
+from middleware.request_id_middleware import RequestIDMiddleware
+
+
+# ============================================================================
+# CAPACITY PLANNER
+# ============================================================================
+
+class TestPlanPoolSizes:
+    """Per-worker pools are checked against the server's max_connections"""
+
+    def test_pools_that_fit_are_kept(self):
+        plan = plan_pool_sizes(200, workers=4, pool_size=10, max_overflow=20, reserved=5)
+
+        assert plan["pool_size"] == 10
+        assert plan["max_overflow"] == 20
+        assert plan["total_connections"] == 120
+        assert plan["warnings"] == []
+
+    def test_oversized_pools_warn_without_autosize(self):
+        plan = plan_pool_sizes(100, workers=8, pool_size=50, max_overflow=100, reserved=4)
+
+        assert plan["autosized"] is False
+        assert plan["pool_size"] == 50
+        assert plan["per_worker_budget"] == 12
+        assert "1200" in plan["warnings"][0]
+
+    def test_autosize_fits_budget_and_keeps_ratio(self):
+        plan = plan_pool_sizes(100, workers=8, pool_size=50, max_overflow=100, reserved=4, autosize=True)
+
+        assert plan["autosized"] is True
+        assert plan["pool_size"] + plan["max_overflow"] == 12
+        assert plan["pool_size"] == 4  # 1/3 of the budget, as 50/150
+        assert plan["total_connections"] <= 100 - 4
+
+    def test_unknown_server_limit_is_reported(self):
+        plan = plan_pool_sizes(None, workers=4, pool_size=50, max_overflow=100)
+
+        assert plan["per_worker_budget"] is None
+        assert plan["total_connections"] == 600
+        assert plan["warnings"]
+
+    def test_too_many_workers_are_not_autosized_to_zero(self):
+        plan = plan_pool_sizes(10, workers=8, pool_size=5, max_overflow=5, reserved=5, autosize=True)
+
+        assert plan["autosized"] is False
+        assert "UVICORN_WORKERS" in plan["warnings"][0]
+
+
+# ============================================================================
+# CHECKOUT INSTRUMENTATION
+# ============================================================================
+
+@pytest.fixture
+def tiny_engine(tmp_path):
+    """File SQLite engine with a single pooled connection and a short timeout"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+        connect_args={"check_same_thread": False},
+    )
+    pool_wait_stats.reset()
+    yield engine
+    engine.dispose()
+    pool_wait_stats.reset()
+
+
+class TestInstrumentedQueuePool:
+    """Checkout waits are counted globally and per request"""
+
+    def test_checkouts_are_counted(self, tiny_engine):
+        for _ in range(3):
+            with tiny_engine.connect():
+                pass
+
+        assert pool_wait_stats.snapshot()["checkouts"] == 3
+
+    def test_exhausted_pool_records_wait_and_timeout(self, tiny_engine):
+        held = tiny_engine.connect()
+        try:
+            with pytest.raises(exc.TimeoutError):
+                tiny_engine.connect()
+        finally:
+            held.close()
+
+        stats = pool_wait_stats.snapshot()
+        assert stats["timeouts"] == 1
+        assert stats["max_wait_ms"] >= 50
+
+    def test_request_tracking_accumulates_wait(self, tiny_engine):
+        held = tiny_engine.connect()
+        token = start_request_tracking()
+        try:
+            with pytest.raises(exc.TimeoutError):
+                tiny_engine.connect()
+        finally:
+            held.close()
+            waited_ms = stop_request_tracking(token)
+
+        assert waited_ms >= 50
+
+    def test_response_carries_pool_wait_header(self, tiny_engine):
+        app = FastAPI()
+
+        @app.get("/ping")
+        def ping():
+            with tiny_engine.connect():
+                return {"ok": True}
+
+        app.add_middleware(RequestIDMiddleware)
+
+        response = TestClient(app).get("/ping")
+
+        assert response.headers["X-DB-Pool-Wait"].endswith("ms")
+        assert pool_wait_stats.snapshot()["checkouts"] == 1
@@ -0,0 +1,131 @@
+"""
+Tests for the product rating aggregates, /products/top-rated and /products/{id}/reviews
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_read_db
+from controllers.product_controller import ProductController
+from models.product import ProductModel
+from repositories.base_repository_impl import InstanceNotFoundError
+from repositories.product_repository import FIND_TOP_RATED
+from repositories.review_repository import FIND_BY_PRODUCT
+from schemas import ProductSchema, ReviewSchema
+from services.cache_service import cache_service
+from services.product_service import ProductService
+from services.review_service import ReviewService
+
+
+@pytest.fixture
+def session(no_cache, shop_session):
+    shop_session.add(ProductModel(name="Drill", price=10.0, stock=5, category_id=1))
+    shop_session.commit()
+    return shop_session
+
+
+def _review(product_id, rating):
+    return ReviewSchema(product_id=product_id, rating=rating, comment="Does the job well")
+
+
+def _rating(session, product_id):
+    session.expire_all()
+    product = session.get(ProductModel, product_id)
+    return product.rating_count, product.rating_sum
+
+
+# ============================================================================
+# AGGREGATES
+# ============================================================================
+
+class TestRatingAggregates:
+    """rating_count/rating_sum follow every review write"""
+
+    def test_save_update_delete(self, session):
+        service = ReviewService(session)
+
+        first = service.save(_review(1, 4.0))
+        service.save(_review(1, 2.0))
+        assert _rating(session, 1) == (2, 6.0)
+
+        service.update(first.id_key, _review(1, 5.0))
+        assert _rating(session, 1) == (2, 7.0)
+
+        service.update(first.id_key, _review(2, 5.0))
+        assert _rating(session, 1) == (1, 2.0)
+        assert _rating(session, 2) == (1, 5.0)
+
+        service.delete(first.id_key)
+        assert _rating(session, 2) == (0, 0.0)
+
+    def test_unknown_product_saves_nothing(self, session):
+        with pytest.raises(InstanceNotFoundError):
+            ReviewService(session).save(_review(99, 3.0))
+
+        assert session.scalar(text("SELECT COUNT(*) FROM reviews")) == 0
+
+    def test_product_writes_ignore_rating_fields(self, session):
+        ReviewService(session).save(_review(1, 4.0))
+        service = ProductService(session)
+
+        service.update(1, ProductSchema(name="Hammer", price=12.0, category_id=1, rating_count=50, rating_sum=250))
+        created = service.save(ProductSchema(name="Axe", price=20.0, category_id=1, rating_count=9, rating_sum=45))
+
+        assert _rating(session, 1) == (1, 4.0)
+        assert _rating(session, created.id_key) == (0, 0.0)
+
+    def test_review_writes_invalidate_product_cache(self, session):
+        ReviewService(session).save(_review(1, 4.0))
+
+        cache_service.delete.assert_called_with("products:id:id:1")
+        cache_service.delete_pattern.assert_any_call("products:list:*")
+
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+class TestRatingQueries:
+    """Top-rated ordering and per-product review pages use their indexes"""
+
+    @pytest.fixture
+    def client(self, session):
+        service = ReviewService(session)
+        for product_id, rating in [(1, 3.0), (1, 5.0), (2, 5.0), (3, 1.0), (3, 2.0)]:
+            service.save(_review(product_id, rating))
+        app = FastAPI()
+        app.include_router(ProductController().router, prefix="/products")
+        app.dependency_overrides[get_read_db] = lambda: session
+        return TestClient(app)
+
+    def test_top_rated(self, client):
+        body = client.get("/products/top-rated").json()
+
+        assert [(p["name"], p["rating_count"], p["rating_sum"]) for p in body] == [
+            ("Hose", 1, 5.0), ("Hammer", 2, 8.0), ("Drill", 2, 3.0),
+        ]
+        assert body[0]["category"]["name"] == "Tools"
+        assert [p["name"] for p in client.get("/products/top-rated?min_reviews=2&limit=1").json()] == ["Hammer"]
+
+    def test_reviews_page(self, client, session):
+        body = client.get("/products/1/reviews?skip=1&limit=5").json()
+
+        assert [review["rating"] for review in body] == [3.0]
+        assert "product" not in body[0]
+        with pytest.raises(InstanceNotFoundError):
+            ReviewService(session).get_by_product(99)
+
+    @pytest.mark.parametrize("stmt, params, index", [
+        (FIND_TOP_RATED, {"min_reviews": 1, "skip": 0, "limit": 10}, "ix_products_rating_average"),
+        (FIND_BY_PRODUCT, {"product_id": 1, "skip": 0, "limit": 10}, "ix_reviews_product_id"),
+    ])
+    def test_uses_index(self, session, stmt, params, index):
+        compiled = stmt.compile(session.get_bind())
+        values = compiled.construct_params(params)
+        plan = session.connection().exec_driver_sql(
+            f"EXPLAIN QUERY PLAN {compiled}", tuple(values[name] for name in compiled.positiontup)
+        ).all()
+
+        assert index in " ".join(str(row[-1]) for row in plan)
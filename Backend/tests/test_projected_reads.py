@@ -0,0 +1,80 @@
+"""
+Tests for the ORM-free (column projection) list read path
+"""
+import pytest
+from sqlalchemy.orm import Session
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.constants import RepositoryConfig
+from models.category import CategoryModel
+from models.client import ClientModel
+from models.product import ProductModel
+from repositories.base_repository_impl import statements_for
+from repositories.category_repository import CategoryRepository
+from repositories.product_repository import ProductRepository
+from schemas import CategorySchema, ClientSchema, ProductSchema
+
+
+@pytest.fixture
+def session(memory_engine):
+    with Session(memory_engine) as db:
+        categories = [CategoryModel(name=f"Category {i}") for i in range(2)]
+        db.add_all(categories)
+        db.flush()
+        db.add_all([
+            ProductModel(
+                name=f"Product {i}", price=10.0 + i, stock=i,
+                category_id=categories[i % 2].id_key,
+            )
+            for i in range(4)
+        ])
+        db.commit()
+        db.expunge_all()
+        yield db
+
+
+def _both_paths(monkeypatch, session, read):
+    """Result of `read` with projected reads off, then on (clean session each time)"""
+    results = []
+    for projected in (False, True):
+        monkeypatch.setattr(RepositoryConfig, "PROJECTED_READS", projected)
+        session.expunge_all()
+        results.append([item.model_dump() for item in read()])
+    return results
+
+
+# ============================================================================
+# PROJECTION
+# ============================================================================
+
+class TestProjectedReads:
+    """Projected pages match the ORM path without loading ORM objects"""
+
+    def test_only_column_schemas_are_projectable(self):
+        assert statements_for(CategoryModel, CategorySchema).projectable
+        assert not statements_for(ClientModel, ClientSchema).projectable
+
+    def test_categories_match_orm_path(self, monkeypatch, session):
+        repository = CategoryRepository(session)
+
+        orm, projected = _both_paths(monkeypatch, session, lambda: repository.find_all(skip=1, limit=5))
+
+        assert projected == orm
+        assert projected == [{"id_key": 2, "name": "Category 1"}]
+
+    def test_products_include_category(self, monkeypatch, session):
+        repository = ProductRepository(session)
+
+        orm, projected = _both_paths(monkeypatch, session, repository.find_all)
+
+        assert projected == orm
+        assert projected[1]["category"] == {"id_key": 2, "name": "Category 1"}
+
+    def test_projection_skips_identity_map(self, monkeypatch, session):
+        monkeypatch.setattr(RepositoryConfig, "PROJECTED_READS", True)
+
+        products = ProductRepository(session).find_all()
+
+        assert len(products) == 4
+        assert isinstance(products[0], ProductSchema)
+        assert len(session.identity_map) == 0
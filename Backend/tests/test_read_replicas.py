@@ -0,0 +1,160 @@
+"""
+Tests for read-replica routing with read-your-writes stickiness
+
+Uses two SQLite databases as primary/replica stand-ins: each holds a
+differently named category, so the name read back shows which one served it.
+"""
+import time
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+
+import config.database as database
+from config.database import ReplicaRouter, RoutingSession, get_db, get_read_db
+from middleware.read_consistency_middleware import (
+    ReadConsistencyMiddleware,
+    STICKY_HEADER,
+)
+from models.base_model import base
+from models.category import CategoryModel
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+def _seeded_engine(path, name):
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    base.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(CategoryModel(id_key=1, name=name))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def engines(tmp_path):
+    primary = _seeded_engine(tmp_path / "primary.db", "from-primary")
+    replica = _seeded_engine(tmp_path / "replica.db", "from-replica")
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+@pytest.fixture
+def routed_session_factory(engines, monkeypatch):
+    """RoutingSession factory on the primary with the replica registered"""
+    primary, replica = engines
+    monkeypatch.setattr(database, "replica_router", ReplicaRouter([replica], max_lag_seconds=2))
+    return sessionmaker(bind=primary, class_=RoutingSession)
+
+
+def _category_name(session):
+    return session.scalars(select(CategoryModel.name)).first()
+
+
+# ============================================================================
+# ROUTING SESSION
+# ============================================================================
+
+class TestRoutingSession:
+    """Reads go to a healthy replica, everything else to the primary"""
+
+    def test_flagged_session_reads_from_replica(self, routed_session_factory):
+        with routed_session_factory() as session:
+            session.info["use_replica"] = True
+            assert _category_name(session) == "from-replica"
+
+    def test_unflagged_session_reads_from_primary(self, routed_session_factory):
+        with routed_session_factory() as session:
+            assert _category_name(session) == "from-primary"
+
+    def test_flush_goes_to_primary(self, routed_session_factory, engines):
+        primary, replica = engines
+        with routed_session_factory() as session:
+            session.info["use_replica"] = True
+            session.add(CategoryModel(name="new"))
+            session.commit()
+
+        with Session(primary) as session:
+            assert session.scalars(select(CategoryModel).where(CategoryModel.name == "new")).first()
+        with Session(replica) as session:
+            assert not session.scalars(select(CategoryModel).where(CategoryModel.name == "new")).first()
+
+    def test_lagging_replica_falls_back_to_primary(self, engines, monkeypatch):
+        primary, replica = engines
+        # Any measured lag (0 for SQLite) exceeds a negative maximum
+        router = ReplicaRouter([replica], max_lag_seconds=-1)
+        monkeypatch.setattr(database, "replica_router", router)
+
+        with sessionmaker(bind=primary, class_=RoutingSession)() as session:
+            session.info["use_replica"] = True
+            assert _category_name(session) == "from-primary"
+
+        assert router.status()[0]["healthy"] is False
+
+    def test_unreachable_replica_is_marked_unhealthy(self, tmp_path):
+        broken = create_engine(f"sqlite:///{tmp_path}/missing/replica.db")
+        router = ReplicaRouter([broken])
+
+        assert router.choose() is None
+        assert router.status()[0]["error"]
+
+
+# ============================================================================
+# READ-YOUR-WRITES STICKINESS
+# ============================================================================
+
+class TestReadYourWrites:
+    """Writers read from the primary during their stickiness window"""
+
+    @pytest.fixture
+    def api(self, routed_session_factory):
+        app = FastAPI()
+
+        def override_get_db():
+            db = routed_session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        @app.get("/category")
+        def read(db: Session = Depends(get_read_db)):
+            return {"name": _category_name(db)}
+
+        @app.post("/category")
+        def write():
+            return {"ok": True}
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.add_middleware(ReadConsistencyMiddleware, window_seconds=5)
+        return TestClient(app)
+
+    def test_reads_use_replica_without_recent_write(self, api):
+        assert api.get("/category").json()["name"] == "from-replica"
+
+    def test_write_opens_window_with_cookie_and_header(self, api):
+        response = api.post("/category")
+
+        assert float(response.headers[STICKY_HEADER]) > time.time()
+        assert "db_sticky_until" in response.cookies
+        # TestClient keeps the cookie: the next read sees the primary
+        assert api.get("/category").json()["name"] == "from-primary"
+
+    def test_header_echo_pins_reads_to_primary(self, api):
+        sticky_until = f"{time.time() + 3:.3f}"
+
+        response = api.get("/category", headers={STICKY_HEADER: sticky_until})
+
+        assert response.json()["name"] == "from-primary"
+
+    def test_expired_or_forged_window_is_ignored(self, api):
+        expired = f"{time.time() - 1:.3f}"
+        forged = f"{time.time() + 3600:.3f}"
+
+        assert api.get("/category", headers={STICKY_HEADER: expired}).json()["name"] == "from-replica"
+        assert api.get("/category", headers={STICKY_HEADER: forged}).json()["name"] == "from-replica"
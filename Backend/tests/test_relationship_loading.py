@@ -0,0 +1,159 @@
+"""
+Tests for raiseload-by-default reads and ?include= relationship expansion
+"""
+import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_read_db
+from controllers.client_controller import ClientController
+from models.address import AddressModel
+from models.base_model import base
+from models.bill import BillModel
+from models.client import ClientModel
+from models.enums import PaymentType
+from repositories.bill_repository import BillRepository
+from repositories.client_repository import ClientRepository
+from repositories.relationship_loading import parse_include, relationship_fields
+from schemas import BillSchema, ClientSchema
+
+CLIENT_COUNT = 1000
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    base.metadata.create_all(engine)
+    with Session(engine) as db:
+        clients = [
+            ClientModel(name=f"Client{i}", lastname="Doe", email=f"client{i}@example.com")
+            for i in range(CLIENT_COUNT)
+        ]
+        db.add_all(clients)
+        db.flush()
+        db.add_all([
+            AddressModel(street="Main", number=str(i), city="Town", client_id=client.id_key)
+            for i, client in enumerate(clients)
+        ])
+        db.add(BillModel(
+            bill_number="B-1", date=datetime.date(2024, 1, 1), total=10.0,
+            payment_type=list(PaymentType)[0], client_id=clients[0].id_key,
+        ))
+        db.commit()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as db:
+        yield db
+
+
+@pytest.fixture
+def statements(engine):
+    """SQL statements executed while the test runs"""
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield executed
+    event.remove(engine, "before_cursor_execute", record)
+
+
+# ============================================================================
+# INCLUDE PARSING
+# ============================================================================
+
+class TestParseInclude:
+    """?include= only accepts the schema's relationship fields"""
+
+    def test_relationship_fields(self):
+        assert set(relationship_fields(ClientSchema)) == {"addresses", "orders"}
+        assert set(relationship_fields(BillSchema)) == {"order", "client"}
+
+    def test_names_are_sorted_and_deduplicated(self):
+        assert parse_include("orders, addresses,orders", ClientSchema) == ("addresses", "orders")
+        assert parse_include(None, ClientSchema) == ()
+
+    def test_unknown_name_is_rejected(self):
+        with pytest.raises(ValueError, match="bills"):
+            parse_include("bills", ClientSchema)
+
+
+# ============================================================================
+# QUERY COUNT
+# ============================================================================
+
+class TestRelationshipLoading:
+    """A page costs a bounded number of queries instead of one per row"""
+
+    def test_list_without_include_is_one_query(self, session, statements):
+        clients = ClientRepository(session).find_all(limit=CLIENT_COUNT)
+
+        assert len(clients) == CLIENT_COUNT
+        assert len(statements) == 1
+        assert "addresses" not in clients[0].model_fields_set
+
+    def test_list_with_includes_is_one_query_per_relationship(self, session, statements):
+        clients = ClientRepository(session).find_all(
+            limit=CLIENT_COUNT, include=("addresses", "orders")
+        )
+
+        # selectinload sends the parent keys in IN batches of 500
+        assert len(statements) == 1 + 2 * (CLIENT_COUNT // 500)
+        assert clients[5].addresses[0].number == "5"
+        assert clients[5].orders == []
+
+    def test_nested_relationships_are_not_loaded(self, session, statements):
+        bill = BillRepository(session).find(1, include=("client",))
+
+        assert len(statements) == 2
+        assert bill.client.name == "Client0"
+        assert "addresses" not in bill.client.model_fields_set
+        assert "order" not in bill.model_fields_set
+
+
+# ============================================================================
+# ENDPOINT
+# ============================================================================
+
+class TestIncludeEndpoint:
+    """Responses emit only loaded relationships"""
+
+    @pytest.fixture
+    def client(self, session):
+        app = FastAPI()
+        app.include_router(ClientController().router, prefix="/clients")
+        app.dependency_overrides[get_read_db] = lambda: session
+        return TestClient(app)
+
+    def test_unloaded_relationships_are_omitted(self, client):
+        body = client.get("/clients/1").json()
+
+        assert body["name"] == "Client0"
+        assert "addresses" not in body
+        assert "orders" not in body
+
+    def test_included_relationships_are_emitted(self, client):
+        body = client.get("/clients?limit=2&include=addresses").json()
+
+        assert body[1]["addresses"][0]["number"] == "1"
+        assert "orders" not in body[1]
+
+    def test_unknown_include_is_bad_request(self, client):
+        response = client.get("/clients?include=password")
+
+        assert response.status_code == 400
@@ -0,0 +1,171 @@
+"""
+Tests for the sales rollup and /reports/sales endpoints
+"""
+import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_read_db
+from controllers.report_controller import SalesReportController
+from models.bill import BillModel
+from models.category import CategoryModel
+from models.enums import DeliveryMethod, PaymentType, Status
+from models.order import OrderModel
+from models.order_detail import OrderDetailModel
+from models.product import ProductModel
+from models.sales_rollup import SalesRollupDirtyDayModel
+from repositories.sales_report_repository import SalesReportRepository
+from schemas import OrderDetailSchema
+from services.order_detail_service import OrderDetailService
+from services.sales_report_service import SalesReportService
+
+DAY_1 = datetime.date(2024, 3, 1)
+DAY_2 = datetime.date(2024, 3, 2)
+
+
+@pytest.fixture
+def session(shop_session):
+    # The shop's order 1 is DAY_1's card order. The Hose moves to Garden at 25.0
+    garden = CategoryModel(name="Garden")
+    shop_session.add(garden)
+    shop_session.flush()
+    hose = shop_session.get(ProductModel, 2)
+    hose.category_id, hose.price = garden.id_key, 25.0
+    cash = BillModel(bill_number="B-2", date=DAY_2, total=0, payment_type=PaymentType.CASH, client_id=1)
+    shop_session.add(cash)
+    shop_session.flush()
+
+    def order(status):
+        return OrderModel(date=datetime.datetime.combine(DAY_2, datetime.time(12)), total=0,
+                          delivery_method=DeliveryMethod.ON_HAND, status=status,
+                          client_id=1, bill_id=cash.id_key)
+
+    second, canceled = order(Status.DELIVERED), order(Status.CANCELED)
+    shop_session.add_all([second, canceled])
+    shop_session.flush()
+    shop_session.add_all([
+        OrderDetailModel(order_id=1, product_id=1, quantity=2, price=10.0),
+        OrderDetailModel(order_id=1, product_id=2, quantity=1, price=25.0),
+        OrderDetailModel(order_id=second.id_key, product_id=1, quantity=3, price=10.0),
+        OrderDetailModel(order_id=canceled.id_key, product_id=2, quantity=9, price=25.0),
+    ])
+    shop_session.commit()
+
+    SalesReportRepository(shop_session).mark_days([DAY_1, DAY_2])
+    shop_session.commit()
+    return shop_session
+
+
+def _rows(report):
+    return [row.model_dump() for row in report.rows]
+
+
+# ============================================================================
+# ROLLUP
+# ============================================================================
+
+class TestSalesRollup:
+    """Dirty days are recomputed from order details, excluding canceled orders"""
+
+    def test_refresh_applies_dirty_days(self, session):
+        repository = SalesReportRepository(session)
+
+        assert repository.pending_days() == 2
+        assert repository.refresh(max_days=31) == 2
+        assert repository.pending_days() == 0
+        assert repository.refresh(max_days=31) == 0
+
+    def test_reports(self, session):
+        SalesReportRepository(session).refresh(max_days=31)
+        service = SalesReportService(session)
+
+        assert _rows(service.by_product()) == [
+            {"quantity": 5, "revenue": 50.0, "product_id": 1, "product_name": "Hammer"},
+            {"quantity": 1, "revenue": 25.0, "product_id": 2, "product_name": "Hose"},
+        ]
+        assert _rows(service.by_category(limit=1)) == [
+            {"quantity": 5, "revenue": 50.0, "category_id": 1, "category_name": "Tools"},
+        ]
+        assert _rows(service.by_day(start=DAY_2)) == [{"quantity": 3, "revenue": 30.0, "day": DAY_2}]
+        assert _rows(service.by_payment_type()) == [
+            {"quantity": 3, "revenue": 45.0, "payment_type": PaymentType.CARD},
+            {"quantity": 3, "revenue": 30.0, "payment_type": PaymentType.CASH},
+        ]
+
+    def test_new_order_detail_marks_only_its_day(self, session):
+        repository = SalesReportRepository(session)
+        repository.refresh(max_days=31)
+
+        OrderDetailService(session).save(OrderDetailSchema(order_id=2, product_id=2, quantity=2))
+
+        assert set(session.scalars(select(SalesRollupDirtyDayModel.day)).all()) == {DAY_2}
+        assert repository.refresh(max_days=31) == 1
+        assert _rows(SalesReportService(session).by_day(start=DAY_2))[0]["revenue"] == 80.0
+
+    def test_marks_made_during_refresh_survive_it(self, session):
+        repository = SalesReportRepository(session)
+        original_execute = session.execute
+        marked = []
+
+        def execute_and_mark(stmt, *args, **kwargs):
+            result = original_execute(stmt, *args, **kwargs)
+            if not marked and "INSERT INTO sales_daily" in str(stmt):
+                marked.append(True)
+                repository.mark_days([DAY_1])  # concurrent write to a day being refreshed
+            return result
+
+        with patch.object(session, "execute", side_effect=execute_and_mark):
+            repository.refresh(max_days=31)
+
+        assert session.scalars(select(SalesRollupDirtyDayModel.day)).all() == [DAY_1]
+
+    def test_marks_are_appended(self, session):
+        repository = SalesReportRepository(session)
+        repository.mark_days([DAY_1, datetime.datetime.combine(DAY_1, datetime.time(9)), None])
+        repository.mark_days([DAY_1])
+        session.commit()
+
+        # Every write adds its own rows; the same day is still pending once
+        assert session.scalar(select(func.count()).select_from(SalesRollupDirtyDayModel)) == 4
+        assert repository.pending_days() == 2
+        assert repository.refresh(max_days=1) == 1
+        assert session.scalars(select(SalesRollupDirtyDayModel.day)).all() == [DAY_2]
+
+
+# ============================================================================
+# ENDPOINTS
+# ============================================================================
+
+class TestSalesReportEndpoints:
+    """/reports/sales/* serve the rollup with its staleness"""
+
+    @pytest.fixture
+    def client(self, session):
+        app = FastAPI()
+        app.include_router(SalesReportController().router, prefix="/reports/sales")
+        app.dependency_overrides[get_read_db] = lambda: session
+        return TestClient(app)
+
+    def test_by_day_reports_pending_days(self, client, session):
+        body = client.get("/reports/sales/by-day").json()
+
+        assert body["pending_days"] == 2
+        assert body["rows"] == []
+
+        SalesReportRepository(session).refresh(max_days=31)
+        body = client.get("/reports/sales/by-day?start=2024-03-01&end=2024-03-01").json()
+
+        assert body["pending_days"] == 0
+        assert body["rows"] == [{"quantity": 3, "revenue": 45.0, "day": "2024-03-01"}]
+
+    def test_by_payment_type_serializes_enum(self, client, session):
+        SalesReportRepository(session).refresh(max_days=31)
+
+        body = client.get("/reports/sales/by-payment-type").json()
+
+        assert body["rows"][0]["payment_type"] == PaymentType.CARD.value
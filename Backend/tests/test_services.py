@@ -178,7 +178,7 @@ class TestOrderService:
         result = service.save(schema)
 
         assert result.id_key is not None
-        assert result.total == 500.0
+        assert result.total == 0.0  # Computed from order details, none yet
         assert result.client_id == client.id_key
 
     def test_save_order_invalid_client(self, db_session, seeded_db):
@@ -256,7 +256,7 @@ class TestOrderService:
 
         result = service.update(order.id_key, schema)
 
-        assert result.total == 1000.0
+        assert result.total == order.total  # Client totals are ignored
         assert result.status == Status.IN_PROGRESS
 
 
@@ -480,7 +480,7 @@ class TestBillService:
 
         assert result.id_key is not None
         assert result.bill_number == "BILL-TEST-001"
-        assert result.total == 850.0
+        assert result.total == 0.0  # Computed from its orders, none yet
 
     def test_update_bill(self, db_session, seeded_db):
         """Test updating a bill."""
@@ -499,7 +499,7 @@ class TestBillService:
         result = service.update(bill.id_key, schema)
 
         assert result.discount == 20.0
-        assert result.total == 900.0
+        assert result.total == bill.total  # Client totals are ignored
 
 
 class TestAddressService:
@@ -0,0 +1,99 @@
+"""
+Tests for sparse fieldsets (?fields=)
+"""
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_read_db
+from controllers.product_controller import ProductController
+from models.product import ProductModel
+from repositories.fieldsets import parse_fields
+from repositories.product_repository import ProductRepository
+from schemas import ProductSchema
+from services.product_service import ProductService
+
+
+# ============================================================================
+# PARSING
+# ============================================================================
+
+class TestParseFields:
+    """?fields= is validated against the model's columns"""
+
+    def test_fields_are_in_table_order_with_id_key(self):
+        assert parse_fields("stock, name", ProductModel, ProductSchema) == ("name", "stock", "id_key")
+        assert parse_fields(None, ProductModel, ProductSchema) == ()
+
+    def test_relationships_and_unknown_names_are_rejected(self):
+        with pytest.raises(ValueError, match="category"):
+            parse_fields("name,category", ProductModel, ProductSchema)
+
+
+# ============================================================================
+# REPOSITORY / CACHE
+# ============================================================================
+
+class TestFieldsetReads:
+    """Only the requested columns are selected and set"""
+
+    def test_select_only_requested_columns(self, memory_engine, shop_session):
+        executed = []
+        event.listen(memory_engine, "before_cursor_execute", lambda *args: executed.append(args[2]))
+
+        products = ProductRepository(shop_session).find_all(fields=("name", "price", "id_key"))
+
+        assert [p.model_dump(exclude_unset=True) for p in products][0] == {
+            "id_key": 1, "name": "Hammer", "price": 10.0,
+        }
+        assert "stock" not in executed[0]
+        assert "categories" not in executed[0]
+
+    def test_find_with_fields(self, shop_session):
+        product = ProductRepository(shop_session).find(2, fields=("name", "id_key"))
+
+        assert product.model_dump(exclude_unset=True) == {"id_key": 2, "name": "Hose"}
+
+    def test_fieldset_is_part_of_cache_key(self, shop_session):
+        service = ProductService(shop_session)
+        service.cache = Mock()
+        service.cache.build_key.side_effect = lambda *args, **kwargs: ":".join(
+            [*map(str, args), *(f"{k}:{v}" for k, v in sorted(kwargs.items()))]
+        )
+        service.cache.get.return_value = [{"id_key": 1, "name": "Cached"}]
+
+        products = service.get_all(fields=("name", "id_key"))
+
+        service.cache.get.assert_called_once_with("products:list:limit:100:skip:0:fields:name,id_key")
+        assert products[0].model_dump(exclude_unset=True) == {"id_key": 1, "name": "Cached"}
+
+
+# ============================================================================
+# ENDPOINT
+# ============================================================================
+
+class TestFieldsEndpoint:
+    """Responses carry only the requested columns"""
+
+    @pytest.fixture
+    def client(self, shop_session, monkeypatch):
+        monkeypatch.setattr("services.product_service.cache_service", Mock(get=Mock(return_value=None)))
+        app = FastAPI()
+        app.include_router(ProductController().router, prefix="/products")
+        app.dependency_overrides[get_read_db] = lambda: shop_session
+        return TestClient(app)
+
+    def test_list_with_fields(self, client):
+        body = client.get("/products?fields=name,price,stock").json()
+
+        assert body[0] == {"id_key": 1, "name": "Hammer", "price": 10.0, "stock": 10}
+
+    def test_unknown_field_is_bad_request(self, client):
+        assert client.get("/products?fields=secret").status_code == 400
+
+    def test_fields_with_include_is_bad_request(self, client):
+        assert client.get("/products?fields=name&include=category").status_code == 400
@@ -0,0 +1,71 @@
+"""
+Tests for prebuilt repository statements and the prepared-statement driver option
+"""
+import pytest
+
+import config.database as database
+from models.category import CategoryModel
+from models.product import ProductModel
+from repositories.base_repository_impl import InstanceNotFoundError, statements_for
+from schemas import CategorySchema, ProductSchema
+from repositories.category_repository import CategoryRepository
+from repositories.product_repository import ProductRepository
+
+
+# ============================================================================
+# PREBUILT STATEMENTS
+# ============================================================================
+
+class TestModelStatements:
+    """Statements are built once per model and reused with bound parameters"""
+
+    def test_statements_are_shared_per_model(self, shop_session):
+        first = CategoryRepository(shop_session)
+        second = CategoryRepository(shop_session)
+
+        assert first._statements is second._statements
+        assert statements_for(CategoryModel, CategorySchema) is not statements_for(ProductModel, ProductSchema)
+
+    def test_cache_key_is_stable_across_calls(self, shop_session):
+        stmt = statements_for(ProductModel, ProductSchema).find
+
+        assert stmt._generate_cache_key() == stmt._generate_cache_key()
+
+    def test_find_and_find_all_use_bound_values(self, shop_session):
+        repository = ProductRepository(shop_session)
+
+        assert repository.find(2).name == "Hose"
+        assert [p.name for p in repository.find_all(skip=1, limit=1)] == ["Hose"]
+        with pytest.raises(InstanceNotFoundError):
+            repository.find(999)
+
+    def test_find_for_update(self, shop_session):
+        repository = ProductRepository(shop_session)
+
+        assert repository.find_for_update(1).stock == 10
+        assert repository.find_for_update(999) is None
+
+
+# ============================================================================
+# DRIVER OPTION
+# ============================================================================
+
+class TestDriverOptions:
+    """DB_DRIVER=psycopg switches to psycopg 3 with server-side prepares"""
+
+    def test_default_driver_keeps_url(self, monkeypatch):
+        monkeypatch.setattr(database, "DB_DRIVER", "psycopg2")
+
+        url, connect_args = database._driver_options("postgresql://u:p@db/app")
+
+        assert url == "postgresql://u:p@db/app"
+        assert connect_args == {}
+
+    def test_psycopg_driver_prepares_statements(self, monkeypatch):
+        monkeypatch.setattr(database, "DB_DRIVER", "psycopg")
+        monkeypatch.setattr(database, "PREPARE_THRESHOLD", 3)
+
+        url, connect_args = database._driver_options("postgresql://u:p@db/app")
+
+        assert url == "postgresql+psycopg://u:p@db/app"
+        assert connect_args == {"prepare_threshold": 3}
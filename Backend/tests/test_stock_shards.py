@@ -0,0 +1,142 @@
+"""
+Tests for sharded stock on hot products (shard rows, purchases, reads)
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.database import get_db, get_read_db
+from controllers.product_controller import ProductController
+from models.order import OrderModel
+from models.product import ProductModel
+from models.product_stock_shard import ProductStockShardModel
+from repositories.product_repository import ProductRepository
+from schemas import OrderDetailSchema, ProductSchema
+from services.order_detail_service import OrderDetailService
+from services.product_service import ProductService
+
+
+@pytest.fixture
+def session(no_cache, shop_session):
+    ProductService(shop_session).set_stock_shards(1, 4)
+    return shop_session
+
+
+def _shards(session, product_id=1):
+    session.expire_all()
+    return list(session.scalars(
+        select(ProductStockShardModel.stock)
+        .where(ProductStockShardModel.product_id == product_id)
+        .order_by(ProductStockShardModel.shard)
+    ))
+
+
+def _buy(session, quantity, product_id=1):
+    return OrderDetailService(session).save(OrderDetailSchema(order_id=1, product_id=product_id, quantity=quantity))
+
+
+# ============================================================================
+# SHARDING
+# ============================================================================
+
+class TestShardStock:
+    """Stock moves into N shard rows and back; reads always see the total"""
+
+    def test_split_and_merge(self, session):
+        assert _shards(session) == [3, 3, 2, 2]
+        assert session.get(ProductModel, 1).stock == 0
+
+        product = ProductService(session).set_stock_shards(1, 0)
+
+        assert product.stock == 10
+        assert product.stock_shards == 0
+        assert _shards(session) == []
+        assert session.get(ProductModel, 1).stock == 10
+
+    def test_reads_sum_the_shards(self, session):
+        repository = ProductRepository(session)
+
+        assert repository.find(1).stock == 10
+        assert [p.stock for p in repository.find_all()] == [10, 100]
+        assert [p.stock for p in repository.find_all(fields=("id_key", "stock"))] == [10, 100]
+        assert repository.available_stock(1) == 10
+        assert list(repository.stock_levels()) == [{1: 10, 2: 100}]
+
+    def test_stock_update_is_spread_over_the_shards(self, session):
+        product = ProductService(session).update(1, ProductSchema(name="Hammer", price=10.0, stock=21,
+                                                                  category_id=1, stock_shards=0))
+
+        assert product.stock == 21
+        assert product.stock_shards == 4
+        assert _shards(session) == [6, 5, 5, 5]
+
+
+# ============================================================================
+# PURCHASES
+# ============================================================================
+
+class TestShardedPurchases:
+    """Purchases take from one shard, falling back to several, never overselling"""
+
+    def test_purchase_takes_from_one_shard(self, session):
+        _buy(session, 2)
+
+        shards = _shards(session)
+        assert sum(shards) == 8
+        assert sorted(shards) in ([1, 2, 2, 3], [0, 2, 3, 3])  # 2 units off one shard
+        assert session.get(ProductModel, 1).stock == 0
+        assert session.get(OrderModel, 1).total == 20.0
+
+    def test_large_purchase_spans_shards_and_insufficient_stock_fails(self, session):
+        _buy(session, 9)
+        assert sum(_shards(session)) == 1
+
+        with pytest.raises(ValueError, match="Available: 1"):
+            _buy(session, 2)
+        session.rollback()
+        _buy(session, 1)
+        assert _shards(session) == [0, 0, 0, 0]
+
+    def test_quantity_updates_and_deletes(self, session):
+        service = OrderDetailService(session)
+        detail = _buy(session, 1)
+
+        service.update(detail.id_key, OrderDetailSchema(order_id=1, product_id=1, quantity=4))
+        assert ProductRepository(session).available_stock(1) == 6
+
+        service.delete(detail.id_key)
+        assert ProductRepository(session).available_stock(1) == 10
+
+    def test_checkout_take_stock(self, session):
+        repository = ProductRepository(session)
+
+        assert repository.take_stock(1, 3) == 10.0
+        assert repository.take_stock(2, 3) == 2.5
+        assert repository.take_stock(1, 8) is None
+        session.commit()
+
+        assert repository.available_stock(1) == 7
+        assert repository.available_stock(2) == 97
+
+
+# ============================================================================
+# ENDPOINT
+# ============================================================================
+
+class TestStockShardsEndpoint:
+
+    def test_put_stock_shards(self, session):
+        app = FastAPI()
+        app.include_router(ProductController().router, prefix="/products")
+        app.dependency_overrides[get_db] = lambda: session
+        app.dependency_overrides[get_read_db] = lambda: session
+        client = TestClient(app)
+
+        body = client.put("/products/2/stock-shards", json={"shards": 3}).json()
+        assert (body["stock"], body["stock_shards"]) == (100, 3)
+        assert _shards(session, 2) == [34, 33, 33]
+
+        assert client.put("/products/2/stock-shards", json={"shards": 1000}).status_code == 422
+        assert client.get("/products/2").json()["stock"] == 100
@@ -0,0 +1,120 @@
+"""
+Tests for group-committed inserts (WriteBatcher, review and client creates)
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import config.database  # noqa: F401  (registers every mapped model)
+from config.constants import WriteBatchConfig
+from models.base_model import base
+from models.client import ClientModel
+from models.product import ProductModel
+from models.review import ReviewModel
+from repositories.base_repository_impl import InstanceNotFoundError
+from repositories.write_batcher import WriteBatcher
+from schemas import ClientSchema, ReviewSchema
+from services import review_service
+from services.client_service import ClientService
+from services.review_service import ReviewService
+
+
+@pytest.fixture
+def session_factory(tmp_path, seed_shop, monkeypatch):
+    # A file database: batches are flushed concurrently on their own connections
+    engine = create_engine(f"sqlite:///{tmp_path / 'batch.db'}", connect_args={"timeout": 30})
+    base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    monkeypatch.setattr(config.database, "SessionLocal", session_factory)
+    with session_factory() as db:
+        seed_shop(db)
+    yield session_factory
+    engine.dispose()
+
+
+@pytest.fixture
+def commits(session_factory):
+    count = []
+    engine = session_factory.kw["bind"]
+    event.listen(engine, "commit", lambda connection: count.append(1))
+    return count
+
+
+def _concurrently(function, arguments):
+    with ThreadPoolExecutor(max_workers=len(arguments)) as pool:
+        futures = [pool.submit(function, argument) for argument in arguments]
+    return [future.exception() or future.result() for future in futures]
+
+
+def _review(rating=4.0, product_id=1):
+    return ReviewSchema(rating=rating, product_id=product_id)
+
+
+# ============================================================================
+# BATCHING
+# ============================================================================
+
+class TestWriteBatcher:
+    """Concurrent inserts share a transaction; failures stay with their caller"""
+
+    def test_concurrent_inserts_share_commits(self, session_factory, commits):
+        batcher = WriteBatcher(ReviewModel, ReviewSchema, before_commit=review_service._count_ratings,
+                               max_delay_ms=200)
+
+        reviews = _concurrently(batcher.insert, [_review(rating=1 + i % 5) for i in range(20)])
+
+        assert len({review.id_key for review in reviews}) == 20
+        assert sorted(review.rating for review in reviews) == sorted(1.0 + i % 5 for i in range(20))
+        assert len(commits) < 20
+        with session_factory() as db:
+            product = db.get(ProductModel, 1)
+            assert (product.rating_count, product.rating_sum) == (20, 60.0)
+
+    def test_full_batch_is_written_without_waiting(self, session_factory, commits):
+        batcher = WriteBatcher(ClientModel, ClientSchema, max_rows=4, max_delay_ms=10_000)
+
+        started = time.perf_counter()
+        clients = _concurrently(batcher.insert, [ClientSchema(name=f"Client {i}") for i in range(4)])
+
+        assert time.perf_counter() - started < 5
+        assert sorted(client.name for client in clients) == [f"Client {i}" for i in range(4)]
+        assert len(commits) == 1
+
+    def test_failing_row_is_isolated(self, session_factory):
+        batcher = WriteBatcher(ReviewModel, ReviewSchema, before_commit=review_service._count_ratings,
+                               max_rows=3, max_delay_ms=10_000)
+
+        results = _concurrently(batcher.insert, [_review(), _review(product_id=99), _review()])
+
+        assert sorted(type(result).__name__ for result in results) == [
+            "InstanceNotFoundError", "ReviewSchema", "ReviewSchema"
+        ]
+        with session_factory() as db:
+            assert db.query(ReviewModel).count() == 2
+            assert db.get(ProductModel, 1).rating_count == 2
+
+
+# ============================================================================
+# SERVICES
+# ============================================================================
+
+class TestBatchedServices:
+    """With WRITE_BATCH_ENABLED, review and client creates go through the batchers"""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self, no_cache, monkeypatch):
+        monkeypatch.setattr(WriteBatchConfig, "ENABLED", True)
+
+    def test_review_and_client_creates(self, session_factory, commits):
+        with session_factory() as db:
+            review = ReviewService(db).save(_review(rating=5.0))
+            client = ClientService(db).save(ClientSchema(name="Bob", email="bob@example.com"))
+            with pytest.raises(InstanceNotFoundError):
+                ReviewService(db).save(_review(product_id=99))
+
+            assert review.id_key == 1 and client.id_key == 2
+            assert db.get(ProductModel, 1).rating_count == 1
+            assert db.get(ClientModel, 2).email == "bob@example.com"
@@ -0,0 +1,33 @@
+"""
+Keyset Pagination Cursors
+
+A cursor is the sort key of the last row of a page, encoded as an opaque
+URL-safe string. The next page selects the rows after that key, so deep
+pages cost the same as the first one (no OFFSET scan).
+"""
+import base64
+import binascii
+from typing import Any, List
+
+import orjson
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode a row's sort key (datetimes become ISO strings)"""
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor made by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed or doesn't hold `size` values
+    """
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, orjson.JSONDecodeError, UnicodeEncodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
@@ -0,0 +1,54 @@
+"""
+Streaming Export Writers
+
+Turn the row batches of BaseRepositoryImpl.stream_rows into NDJSON or CSV
+byte chunks for a StreamingResponse. Each batch is encoded and yielded as
+one chunk, so only one batch is ever held in memory.
+"""
+import csv
+import io
+from enum import Enum
+from typing import Dict, Iterable, Iterator, Sequence
+
+import orjson
+
+
+def ndjson_chunks(columns: Sequence[str], batches: Iterable[list]) -> Iterator[bytes]:
+    """One JSON object per row, newline separated"""
+    dumps = orjson.dumps
+    for rows in batches:
+        yield b"".join(dumps(dict(zip(columns, row))) + b"\n" for row in rows)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def csv_chunks(columns: Sequence[str], batches: Iterable[list]) -> Iterator[bytes]:
+    """Header row, then the rows as RFC 4180 CSV"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> bytes:
+        chunk = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return chunk
+
+    writer.writerow(columns)
+    yield flush()
+    for rows in batches:
+        writer.writerows([_csv_value(value) for value in row] for row in rows)
+        yield flush()
+
+
+# format -> (media type, chunk writer)
+EXPORT_FORMATS: Dict[str, tuple] = {
+    "ndjson": ("application/x-ndjson", ndjson_chunks),
+    "csv": ("text/csv", csv_chunks),
+}
+
@@ -0,0 +1,62 @@
+"""
+Health Thresholds
+
+Single source of the warning/critical thresholds used by /health_check to
+report health and by the admission controller to shed load, so both always
+agree on when the worker is overloaded.
+"""
+import os
+
+THRESHOLDS = {
+    "db_latency": {
+        "warning": 100.0,   # ms
+        "critical": 500.0   # ms
+    },
+    "db_pool_utilization": {
+        "warning": 70.0,    # %
+        "critical": 90.0    # %
+    },
+    "request_latency": {
+        "warning": float(os.getenv('ADMISSION_LATENCY_WARNING_MS', '500')),    # ms (recent average)
+        "critical": float(os.getenv('ADMISSION_LATENCY_CRITICAL_MS', '2000'))  # ms
+    },
+    "in_flight": {
+        "warning": int(os.getenv('ADMISSION_IN_FLIGHT_WARNING', '100')),    # requests per worker
+        "critical": int(os.getenv('ADMISSION_IN_FLIGHT_CRITICAL', '200'))  # requests per worker
+    }
+}
+
+
+def threshold_level(value: float, name: str) -> str:
+    """
+    Classify a signal against its thresholds
+
+    Args:
+        value: Measured value (ms, %, or request count)
+        name: Key in THRESHOLDS
+
+    Returns:
+        'healthy', 'warning' or 'critical'
+    """
+    thresholds = THRESHOLDS[name]
+    if value >= thresholds["critical"]:
+        return "critical"
+    if value >= thresholds["warning"]:
+        return "warning"
+    return "healthy"
+
+
+def evaluate_health_level(*statuses):
+    """
+    Determine overall system health.
+
+    Priority:
+    critical > degraded > warning > healthy
+    """
+    if "critical" in statuses:
+        return "critical"
+    if "degraded" in statuses:
+        return "degraded"
+    if "warning" in statuses:
+        return "warning"
+    return "healthy"
@@ -24,6 +24,26 @@ SENSITIVE_PATTERNS = [
 ]
 
 
+# All patterns combined into one precompiled alternation: one scan per message
+# instead of one re.sub pass per pattern. Each alternative is a named group so
+# the matching pattern's replacement can be looked up from match.lastgroup.
+_SENSITIVE_REPLACEMENTS = {
+    f'p{index}': replacement
+    for index, (_, replacement) in enumerate(SENSITIVE_PATTERNS)
+}
+_SENSITIVE_REGEX = re.compile(
+    '|'.join(
+        f'(?P<p{index}>{pattern})'
+        for index, (pattern, _) in enumerate(SENSITIVE_PATTERNS)
+    ),
+    flags=re.IGNORECASE
+)
+
+
+def _redact(match: re.Match) -> str:
+    return _SENSITIVE_REPLACEMENTS[match.lastgroup]
+
+
 def sanitize_string(text: str) -> str:
     """
     Sanitize string by removing sensitive information
@@ -37,12 +57,7 @@ def sanitize_string(text: str) -> str:
     if not isinstance(text, str):
         return str(text)
 
-    sanitized = text
-
-    for pattern, replacement in SENSITIVE_PATTERNS:
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
-
-    return sanitized
+    return _SENSITIVE_REGEX.sub(_redact, text)
 
 
 def get_error_id() -> str:
@@ -166,30 +181,53 @@ def create_user_safe_error(error_id: str, operation: str = "operation") -> dict:
 class SanitizedLogger:
     """
     Wrapper around logging.Logger that automatically sanitizes all messages
+
+    Sanitization only runs when the level is enabled, so disabled debug calls
+    cost a single level check. Supports %-style lazy arguments:
+
+        logger.debug("Cache HIT: %s", cache_key)
+
+    Arguments are interpolated (and the result sanitized) only if the record
+    will actually be emitted.
     """
 
     def __init__(self, logger_instance: logging.Logger):
         self._logger = logger_instance
 
+    def isEnabledFor(self, level: int) -> bool:
+        """Check whether a message of this level would be emitted"""
+        return self._logger.isEnabledFor(level)
+
+    def _log(self, level: int, message: str, args: tuple, kwargs: dict):
+        if not self._logger.isEnabledFor(level):
+            return
+
+        if args:
+            message = message % args
+
+        # Report the caller's function/line, not this wrapper's
+        kwargs.setdefault('stacklevel', 3)
+        self._logger.log(level, sanitize_string(message), **kwargs)
+
     def debug(self, message: str, *args, **kwargs):
         """Log debug message (sanitized)"""
-        self._logger.debug(sanitize_string(message), *args, **kwargs)
+        self._log(logging.DEBUG, message, args, kwargs)
 
     def info(self, message: str, *args, **kwargs):
         """Log info message (sanitized)"""
-        self._logger.info(sanitize_string(message), *args, **kwargs)
+        self._log(logging.INFO, message, args, kwargs)
 
     def warning(self, message: str, *args, **kwargs):
         """Log warning message (sanitized)"""
-        self._logger.warning(sanitize_string(message), *args, **kwargs)
+        self._log(logging.WARNING, message, args, kwargs)
 
     def error(self, message: str, *args, **kwargs):
         """Log error message (sanitized)"""
-        self._logger.error(sanitize_string(message), *args, **kwargs)
+        self._log(logging.ERROR, message, args, kwargs)
 
     def critical(self, message: str, *args, **kwargs):
         """Log critical message (sanitized)"""
-        self._logger.critical(sanitize_string(message), *args, **kwargs)
+        self._log(logging.CRITICAL, message, args, kwargs)
 
 
 def get_sanitized_logger(name: str) -> SanitizedLogger:
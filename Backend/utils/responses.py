@@ -0,0 +1,50 @@
+"""
+Fast JSON Responses
+
+Provides response classes that skip FastAPI's jsonable_encoder and
+response_model revalidation for data the services have already validated.
+"""
+from functools import lru_cache
+from typing import Any, List, Type
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Compiled serializer for List[schema], built once per schema"""
+    return TypeAdapter(List[schema])
+
+
+class SchemaJSONResponse(ORJSONResponse):
+    """
+    JSON response that serializes Pydantic schemas directly in pydantic-core
+
+    Returning a Response instance from a route makes FastAPI skip the
+    response_model validation and jsonable_encoder steps, which are pure
+    overhead when the service already returns validated *Schema objects.
+    The response_model is still used for the OpenAPI documentation.
+
+    Unset fields are excluded: repositories leave relationships that were
+    not loaded unset, so only loaded relationships are emitted.
+
+    Anything that is not a schema (or list of schemas) falls back to orjson.
+
+    Example:
+        return SchemaJSONResponse(service.get_all(skip, limit))
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(exclude_unset=True).encode("utf-8")
+
+        if isinstance(content, list):
+            if not content:
+                return b"[]"
+            schema = type(content[0])
+            if issubclass(schema, BaseModel) and all(type(item) is schema for item in content):
+                return _list_adapter(schema).dump_json(content, exclude_unset=True)
+
+        return super().render(jsonable_encoder(content))
@@ -0,0 +1,50 @@
+"""
+Startup Timer
+
+Measures how long each phase of a worker's startup takes (imports, app
+construction, schema, Redis, ...) so cold starts and worker restarts can
+be tracked. The phases are logged once startup completes and reported
+under "startup" in /health_check.
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Wall-clock duration of named startup phases for this worker"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.total_ms: float = None
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as phase `name` (ms)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    def record(self, name: str, since: float):
+        """Record a phase that started at perf_counter() value `since`"""
+        self.phases[name] = round((time.perf_counter() - since) * 1000, 2)
+
+    def complete(self):
+        """Mark startup as finished and log the per-phase breakdown"""
+        self.total_ms = round((time.perf_counter() - self.started_at) * 1000, 2)
+        breakdown = ", ".join(f"{name}={ms}ms" for name, ms in self.phases.items())
+        logger.info(f"⏱️ Worker {os.getpid()} started in {self.total_ms}ms ({breakdown})")
+
+    def as_dict(self) -> Dict:
+        return {"total_ms": self.total_ms, "phases_ms": dict(self.phases)}
+
+
+# Created on first import, which main.py does before anything else
+startup_timer = StartupTimer()